@@ -33,6 +33,16 @@ def _compare_type(context, inspected_column, metadata_column, inspected_type, me
     return None
 
 
+def _include_object(obj, name, type_, reflected, compare_to):
+    """모델에 매핑하지 않은 PostgreSQL 검색 컬럼·인덱스(attach_search_vector)는 비교하지 않는다."""
+    if reflected and compare_to is None:
+        if type_ == "column" and name == "search_vector":
+            return False
+        if type_ == "index" and name and name.endswith(("_search_vector", "_trgm")):
+            return False
+    return True
+
+
 def run_migrations_offline() -> None:
     url = config.get_main_option("sqlalchemy.url")
     context.configure(
@@ -41,6 +51,7 @@ def run_migrations_offline() -> None:
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
         compare_type=_compare_type,
+        include_object=_include_object,
     )
 
     with context.begin_transaction():
@@ -59,6 +70,7 @@ def run_migrations_online() -> None:
             connection=connection,
             target_metadata=target_metadata,
             compare_type=_compare_type,
+            include_object=_include_object,
         )
 
         with context.begin_transaction():
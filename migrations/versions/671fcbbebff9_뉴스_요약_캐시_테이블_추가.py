@@ -0,0 +1,46 @@
+"""뉴스 요약 캐시 테이블 추가 및 배치 캐시 지표 컬럼
+
+Revision ID: 671fcbbebff9
+Revises: 5365fe70a19c
+Create Date: 2026-10-18 10:12:04.114532
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '671fcbbebff9'
+down_revision = '5365fe70a19c'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('news_summary_cache',
+    sa.Column('id', sa.String(length=36), nullable=False),
+    sa.Column('model', sa.String(length=60), nullable=False),
+    sa.Column('keyword', sa.String(length=100), nullable=False),
+    sa.Column('fingerprint', sa.String(length=64), nullable=False),
+    sa.Column('article_signatures', sa.JSON(), nullable=False),
+    sa.Column('payload', sa.JSON(), nullable=False),
+    sa.Column('token_cost', sa.Integer(), nullable=False),
+    sa.Column('hit_count', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('last_used_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_nsc_model_keyword_fp', 'news_summary_cache', ['model', 'keyword', 'fingerprint'], unique=True)
+    op.create_index('ix_nsc_model_keyword_created', 'news_summary_cache', ['model', 'keyword', 'created_at'], unique=False)
+    op.add_column('news_summary_batches', sa.Column('cache_hits', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('news_summary_batches', sa.Column('cache_partial_hits', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('news_summary_batches', sa.Column('cache_saved_tokens', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column('news_summary_batches', 'cache_saved_tokens')
+    op.drop_column('news_summary_batches', 'cache_partial_hits')
+    op.drop_column('news_summary_batches', 'cache_hits')
+    op.drop_index('ix_nsc_model_keyword_created', table_name='news_summary_cache')
+    op.drop_index('ix_nsc_model_keyword_fp', table_name='news_summary_cache')
+    op.drop_table('news_summary_cache')
@@ -0,0 +1,30 @@
+"""요약 배치 LLM 호출 지표 컬럼 추가
+
+Revision ID: 9b3e4d2a7c10
+Revises: 671fcbbebff9
+Create Date: 2026-10-18 11:02:37.481205
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9b3e4d2a7c10'
+down_revision = '671fcbbebff9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('news_summary_batches', sa.Column('llm_tokens_per_sec', sa.Float(), nullable=True))
+    op.add_column('news_summary_batches', sa.Column('llm_ttft_ms', sa.Integer(), nullable=True))
+    op.add_column('news_summary_batches', sa.Column('llm_queue_ms', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('news_summary_batches', sa.Column('llm_calls', sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('news_summary_batches', 'llm_calls')
+    op.drop_column('news_summary_batches', 'llm_queue_ms')
+    op.drop_column('news_summary_batches', 'llm_ttft_ms')
+    op.drop_column('news_summary_batches', 'llm_tokens_per_sec')
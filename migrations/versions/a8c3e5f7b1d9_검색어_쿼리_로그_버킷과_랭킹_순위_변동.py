@@ -0,0 +1,31 @@
+"""검색어 쿼리 로그 버킷과 랭킹 순위 변동
+
+Revision ID: a8c3e5f7b1d9
+Revises: d7a1f4c8e2b6
+Create Date: 2026-10-19 18:05:17.436021
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a8c3e5f7b1d9'
+down_revision = 'd7a1f4c8e2b6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('search_query_buckets',
+    sa.Column('bucket_start', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('query', sa.String(length=100), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('bucket_start', 'query')
+    )
+    op.add_column('search_rankings', sa.Column('previous_rank', sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('search_rankings', 'previous_rank')
+    op.drop_table('search_query_buckets')
@@ -0,0 +1,32 @@
+"""이슈 랭킹 스냅샷 기간별 시리즈와 순위 변동
+
+Revision ID: a8c4e1f7b2d9
+Revises: f3b9d6e2a4c7
+Create Date: 2026-10-19 14:22:08.617340
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a8c4e1f7b2d9'
+down_revision = 'f3b9d6e2a4c7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('issue_rank_snapshots', sa.Column('period', sa.String(length=8), nullable=False, server_default='24h'))
+    op.add_column('issue_rank_snapshots', sa.Column('related_event_count', sa.Integer(), nullable=False, server_default='0'))
+    op.add_column('issue_rank_snapshots', sa.Column('previous_rank', sa.Integer(), nullable=True))
+    op.drop_index('ix_irs_calculated_rank', table_name='issue_rank_snapshots')
+    op.create_index('ix_irs_period_calculated_rank', 'issue_rank_snapshots', ['period', 'calculated_at', 'rank'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_irs_period_calculated_rank', table_name='issue_rank_snapshots')
+    op.create_index('ix_irs_calculated_rank', 'issue_rank_snapshots', ['calculated_at', 'rank'], unique=False)
+    op.drop_column('issue_rank_snapshots', 'previous_rank')
+    op.drop_column('issue_rank_snapshots', 'related_event_count')
+    op.drop_column('issue_rank_snapshots', 'period')
@@ -0,0 +1,26 @@
+"""출처 엔티티별 발행일 복합 인덱스
+
+Revision ID: b2e6d9a4c7f1
+Revises: a8c3e5f7b1d9
+Create Date: 2026-10-19 18:41:09.552817
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'b2e6d9a4c7f1'
+down_revision = 'a8c3e5f7b1d9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_sources_entity_published', 'sources', ['entity_type', 'entity_id', 'published_at'], unique=False)
+    # 복합 인덱스의 선두 컬럼과 겹치는 단일 인덱스 제거
+    op.drop_index('ix_sources_entity_type', table_name='sources')
+
+
+def downgrade() -> None:
+    op.create_index('ix_sources_entity_type', 'sources', ['entity_type'], unique=False)
+    op.drop_index('ix_sources_entity_published', table_name='sources')
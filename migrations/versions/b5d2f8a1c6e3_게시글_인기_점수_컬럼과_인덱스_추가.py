@@ -0,0 +1,57 @@
+"""게시글 인기 점수 컬럼과 인덱스 추가
+
+Revision ID: b5d2f8a1c6e3
+Revises: a8c4e1f7b2d9
+Create Date: 2026-10-19 15:10:37.204815
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b5d2f8a1c6e3'
+down_revision = 'a8c4e1f7b2d9'
+branch_labels = None
+depends_on = None
+
+HOT_SCORE_GRAVITY = 1.8
+HOT_SCORE_WINDOW = timedelta(days=7)
+
+
+def upgrade() -> None:
+    op.add_column('posts', sa.Column('hot_score', sa.Float(), nullable=False, server_default='0'))
+    op.create_index('ix_posts_hot_score', 'posts', ['hot_score', 'id'], unique=False)
+
+    # 최근 게시글 백필 (이후 community_hot_score 잡이 주기적으로 감쇠 반영)
+    now = datetime.now(timezone.utc)
+    posts = sa.table('posts',
+    sa.column('id', sa.String()),
+    sa.column('like_count', sa.Integer()),
+    sa.column('dislike_count', sa.Integer()),
+    sa.column('comment_count', sa.Integer()),
+    sa.column('created_at', sa.DateTime(timezone=True)),
+    sa.column('hot_score', sa.Float()),
+    )
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.select(posts.c.id, posts.c.like_count, posts.c.dislike_count,
+                  posts.c.comment_count, posts.c.created_at)
+        .where(posts.c.created_at >= now - HOT_SCORE_WINDOW)
+    ).all()
+    for post_id, like_count, dislike_count, comment_count, created_at in rows:
+        if created_at.tzinfo is None:
+            created_at = created_at.replace(tzinfo=timezone.utc)
+        age_hours = max((now - created_at).total_seconds() / 3600, 0.0)
+        points = (like_count - dislike_count) * 2 + comment_count
+        bind.execute(
+            posts.update().where(posts.c.id == post_id)
+            .values(hot_score=round(points / (age_hours + 2) ** HOT_SCORE_GRAVITY, 6))
+        )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_posts_hot_score', table_name='posts')
+    op.drop_column('posts', 'hot_score')
@@ -0,0 +1,24 @@
+"""이슈 랭킹 스냅샷 마지막 업데이트 시각
+
+Revision ID: c6f2a9d3e8b4
+Revises: b2e6d9a4c7f1
+Create Date: 2026-10-19 19:12:33.804216
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c6f2a9d3e8b4'
+down_revision = 'b2e6d9a4c7f1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('issue_rank_snapshots', sa.Column('last_update_at', sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('issue_rank_snapshots', 'last_update_at')
@@ -0,0 +1,37 @@
+"""검색어 토큰 버킷 롤업과 기간별 랭킹
+
+Revision ID: c9e3a7d4f1b8
+Revises: b5d2f8a1c6e3
+Create Date: 2026-10-19 16:02:51.873126
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c9e3a7d4f1b8'
+down_revision = 'b5d2f8a1c6e3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('search_token_buckets',
+    sa.Column('bucket_start', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('token', sa.String(length=100), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('bucket_start', 'token')
+    )
+    op.add_column('search_rankings', sa.Column('period', sa.String(length=10), nullable=False, server_default='daily'))
+    op.create_index('ix_sr_period_calculated_rank', 'search_rankings', ['period', 'calculated_at', 'rank'], unique=False)
+    op.create_index(op.f('ix_events_created_at'), 'events', ['created_at'], unique=False)
+    op.create_index(op.f('ix_issues_updated_at'), 'issues', ['updated_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_issues_updated_at'), table_name='issues')
+    op.drop_index(op.f('ix_events_created_at'), table_name='events')
+    op.drop_index('ix_sr_period_calculated_rank', table_name='search_rankings')
+    op.drop_column('search_rankings', 'period')
+    op.drop_table('search_token_buckets')
@@ -0,0 +1,32 @@
+"""뉴스 요약 스냅샷 테이블 추가
+
+Revision ID: d4f1a8c39e52
+Revises: 9b3e4d2a7c10
+Create Date: 2026-10-18 11:40:15.902318
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd4f1a8c39e52'
+down_revision = '9b3e4d2a7c10'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('news_summary_snapshots',
+    sa.Column('key', sa.String(length=30), nullable=False),
+    sa.Column('batch_id', sa.String(length=36), nullable=True),
+    sa.Column('payload', sa.JSON(), nullable=False),
+    sa.Column('summarized_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('refreshed_at', sa.DateTime(timezone=True), nullable=False),
+    sa.ForeignKeyConstraint(['batch_id'], ['news_summary_batches.id'], ondelete='SET NULL'),
+    sa.PrimaryKeyConstraint('key')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('news_summary_snapshots')
@@ -0,0 +1,49 @@
+"""검색 전문 검색 벡터와 trigram 인덱스
+
+Revision ID: d7a1f4c8e2b6
+Revises: c9e3a7d4f1b8
+Create Date: 2026-10-19 17:12:40.218394
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'd7a1f4c8e2b6'
+down_revision = 'c9e3a7d4f1b8'
+branch_labels = None
+depends_on = None
+
+# (테이블, 제목 컬럼, 본문 컬럼)
+SEARCH_TABLES = (
+    ('events', 'title', 'summary'),
+    ('issues', 'title', 'description'),
+    ('posts', 'title', 'content'),
+)
+
+
+def upgrade() -> None:
+    # tsvector 생성 컬럼과 pg_trgm은 PostgreSQL 전용 (SQLite는 ILIKE 폴백)
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for table, title, body in SEARCH_TABLES:
+        op.execute(
+            f"ALTER TABLE {table} ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ("
+            f"setweight(to_tsvector('simple'::regconfig, coalesce({title}, '')), 'A') || "
+            f"setweight(to_tsvector('simple'::regconfig, coalesce({body}, '')), 'B')"
+            f") STORED"
+        )
+        op.create_index(f'ix_{table}_search_vector', table, ['search_vector'], unique=False, postgresql_using='gin')
+        op.create_index(f'ix_{table}_{title}_trgm', table, [title], unique=False, postgresql_using='gin', postgresql_ops={title: 'gin_trgm_ops'})
+        op.create_index(f'ix_{table}_{body}_trgm', table, [body], unique=False, postgresql_using='gin', postgresql_ops={body: 'gin_trgm_ops'})
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    for table, title, body in reversed(SEARCH_TABLES):
+        op.drop_index(f'ix_{table}_{body}_trgm', table_name=table)
+        op.drop_index(f'ix_{table}_{title}_trgm', table_name=table)
+        op.drop_index(f'ix_{table}_search_vector', table_name=table)
+        op.drop_column(table, 'search_vector')
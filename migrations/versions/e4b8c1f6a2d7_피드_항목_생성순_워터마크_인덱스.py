@@ -0,0 +1,23 @@
+"""피드 항목 생성순 워터마크 인덱스
+
+Revision ID: e4b8c1f6a2d7
+Revises: c6f2a9d3e8b4
+Create Date: 2026-10-19 19:48:06.215873
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'e4b8c1f6a2d7'
+down_revision = 'c6f2a9d3e8b4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_lfi_created_id', 'live_feed_items', ['created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_lfi_created_id', table_name='live_feed_items')
@@ -0,0 +1,29 @@
+"""홈 위젯 스냅샷 테이블 추가
+
+Revision ID: e7a2c5d81f3b
+Revises: d4f1a8c39e52
+Create Date: 2026-10-19 09:12:44.518203
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e7a2c5d81f3b'
+down_revision = 'd4f1a8c39e52'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('home_snapshots',
+    sa.Column('widget', sa.String(length=50), nullable=False),
+    sa.Column('payload', sa.JSON(), nullable=False),
+    sa.Column('built_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('widget')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('home_snapshots')
@@ -0,0 +1,55 @@
+"""사건 일별 집계 롤업 테이블 추가
+
+Revision ID: f3b9d6e2a4c7
+Revises: e7a2c5d81f3b
+Create Date: 2026-10-19 13:05:21.390417
+"""
+
+from collections import defaultdict
+from datetime import timezone
+from zoneinfo import ZoneInfo
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f3b9d6e2a4c7'
+down_revision = 'e7a2c5d81f3b'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    event_daily_counts = op.create_table('event_daily_counts',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('event_count', sa.Integer(), nullable=False),
+    sa.Column('high_count', sa.Integer(), nullable=False),
+    sa.Column('medium_count', sa.Integer(), nullable=False),
+    sa.Column('low_count', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('day')
+    )
+
+    # 기존 사건 백필 (Asia/Seoul 날짜 기준)
+    seoul = ZoneInfo('Asia/Seoul')
+    rows = defaultdict(
+        lambda: {'event_count': 0, 'high_count': 0, 'medium_count': 0, 'low_count': 0}
+    )
+    events = sa.table('events',
+    sa.column('occurred_at', sa.DateTime(timezone=True)),
+    sa.column('importance', sa.String()),
+    )
+    for occurred_at, importance in op.get_bind().execute(
+        sa.select(events.c.occurred_at, events.c.importance)
+    ):
+        if occurred_at.tzinfo is None:
+            occurred_at = occurred_at.replace(tzinfo=timezone.utc)
+        counts = rows[occurred_at.astimezone(seoul).date()]
+        counts['event_count'] += 1
+        counts[f'{importance}_count'] += 1
+    if rows:
+        op.bulk_insert(event_daily_counts, [{'day': day, **counts} for day, counts in rows.items()])
+
+
+def downgrade() -> None:
+    op.drop_table('event_daily_counts')
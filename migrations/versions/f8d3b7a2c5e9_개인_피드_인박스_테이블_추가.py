@@ -0,0 +1,35 @@
+"""개인 피드 인박스 테이블 추가
+
+Revision ID: f8d3b7a2c5e9
+Revises: e4b8c1f6a2d7
+Create Date: 2026-10-19 20:31:44.907362
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f8d3b7a2c5e9'
+down_revision = 'e4b8c1f6a2d7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('feed_inbox_items',
+    sa.Column('user_id', sa.String(length=36), nullable=False),
+    sa.Column('update_id', sa.String(length=36), nullable=False),
+    sa.Column('reason', sa.Enum('tracked_issue', 'keyword', name='feedinboxreason'), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.ForeignKeyConstraint(['update_id'], ['event_updates.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id', 'update_id')
+    )
+    op.create_index('ix_fii_user_created', 'feed_inbox_items', ['user_id', 'created_at', 'update_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_fii_user_created', table_name='feed_inbox_items')
+    op.drop_table('feed_inbox_items')
+    sa.Enum(name='feedinboxreason').drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,173 @@
+"""읽기 전용 엔드포인트 부하 테스트 — sync/async DB 모드 비교.
+
+같은 DB를 바라보는 API 서버를 모드별로 띄워 동일한 부하를 주고
+처리량(RPS)과 지연(p50/p99/max)을 비교한다.
+
+사용법:
+    # 서버를 직접 띄워 두고 한 모드만 측정
+    python scripts/load_test_read.py --base-url http://localhost:8000
+
+    # DB_ASYNC_ENABLED=false/true로 uvicorn을 번갈아 띄워 비교
+    python scripts/load_test_read.py --compare --concurrency 64 --duration 30
+
+    # 동시성을 올려 가며 모드별 최대 RPS 탐색
+    python scripts/load_test_read.py --compare --sweep 16,32,64,128
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+
+import httpx
+
+DEFAULT_PATHS = [
+    "/api/v1/home/breaking-news",
+    "/api/v1/home/hot-posts",
+    "/api/v1/home/search-rankings",
+    "/api/v1/feed/top",
+    "/api/v1/feed/live",
+    "/api/v1/events",
+    "/api/v1/issues",
+    "/api/v1/search?q=%EA%B2%BD%EC%A0%9C",
+]
+
+
+@dataclass
+class LoadResult:
+    concurrency: int
+    duration: float = 0.0
+    latencies_ms: list[float] = field(default_factory=list)
+    errors: int = 0
+
+    @property
+    def rps(self) -> float:
+        return len(self.latencies_ms) / self.duration if self.duration else 0.0
+
+    def percentile(self, p: float) -> float:
+        if not self.latencies_ms:
+            return 0.0
+        ordered = sorted(self.latencies_ms)
+        index = min(len(ordered) - 1, round(p / 100 * (len(ordered) - 1)))
+        return ordered[index]
+
+    def row(self, label: str) -> str:
+        p50 = statistics.median(self.latencies_ms) if self.latencies_ms else 0.0
+        return (
+            f"{label:<6} c={self.concurrency:<4} rps={self.rps:8.1f} "
+            f"p50={p50:7.1f}ms p99={self.percentile(99):7.1f}ms "
+            f"max={max(self.latencies_ms, default=0.0):7.1f}ms errors={self.errors}"
+        )
+
+
+async def run_load(
+    base_url: str, paths: list[str], *, concurrency: int, duration: float
+) -> LoadResult:
+    result = LoadResult(concurrency=concurrency)
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    deadline = time.perf_counter() + duration
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30.0) as client:
+
+        async def worker(offset: int) -> None:
+            i = offset
+            while time.perf_counter() < deadline:
+                path = paths[i % len(paths)]
+                i += 1
+                started = time.perf_counter()
+                try:
+                    resp = await client.get(path)
+                    ok = resp.status_code < 500
+                except httpx.HTTPError:
+                    ok = False
+                if ok:
+                    result.latencies_ms.append((time.perf_counter() - started) * 1000)
+                else:
+                    result.errors += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(n) for n in range(concurrency)))
+        result.duration = time.perf_counter() - started
+    return result
+
+
+def _wait_ready(base_url: str, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"{base_url}/health/live", timeout=1.0).status_code < 500:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.3)
+    raise RuntimeError(f"서버가 {timeout:.0f}초 안에 뜨지 않았습니다: {base_url}")
+
+
+def _start_server(port: int, *, async_enabled: bool, workers: int) -> subprocess.Popen:
+    env = {**os.environ, "DB_ASYNC_ENABLED": "true" if async_enabled else "false"}
+    cmd = [
+        sys.executable, "-m", "uvicorn", "src.main:app",
+        "--port", str(port), "--workers", str(workers), "--log-level", "warning",
+    ]  # fmt: skip
+    return subprocess.Popen(cmd, env=env)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="읽기 엔드포인트 sync/async 부하 비교")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--sweep", default="", help="쉼표 구분 동시성 목록 (예: 16,32,64)")
+    parser.add_argument("--duration", type=float, default=20.0, help="구간별 측정 시간(초)")
+    parser.add_argument("--path", action="append", dest="paths", help="대상 경로 (반복 지정)")
+    parser.add_argument("--compare", action="store_true", help="sync/async 서버를 직접 띄워 비교")
+    parser.add_argument("--port", type=int, default=8765, help="--compare 시 사용할 포트")
+    parser.add_argument("--workers", type=int, default=1, help="--compare 시 uvicorn 워커 수")
+    args = parser.parse_args()
+
+    paths = args.paths or DEFAULT_PATHS
+    levels = [int(v) for v in args.sweep.split(",") if v.strip()] or [args.concurrency]
+
+    def measure(label: str, base_url: str) -> list[LoadResult]:
+        # 워밍업 후 측정 (커넥션 풀/플랜 캐시 채우기)
+        asyncio.run(run_load(base_url, paths, concurrency=levels[0], duration=3.0))
+        results = []
+        for level in levels:
+            result = asyncio.run(
+                run_load(base_url, paths, concurrency=level, duration=args.duration)
+            )
+            print(result.row(label), flush=True)
+            results.append(result)
+        return results
+
+    if not args.compare:
+        measure("run", args.base_url)
+        return
+
+    base_url = f"http://127.0.0.1:{args.port}"
+    summary: dict[str, list[LoadResult]] = {}
+    for label, async_enabled in (("sync", False), ("async", True)):
+        server = _start_server(args.port, async_enabled=async_enabled, workers=args.workers)
+        try:
+            _wait_ready(base_url)
+            summary[label] = measure(label, base_url)
+        finally:
+            server.terminate()
+            server.wait(timeout=10)
+
+    print("\n=== 요약 ===")
+    for label, results in summary.items():
+        best = max(results, key=lambda r: r.rps)
+        print(
+            f"{label:<6} 최대 RPS {best.rps:8.1f} (c={best.concurrency}), "
+            f"p99 {best.percentile(99):.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -2,12 +2,18 @@ from datetime import datetime
 
 from fastapi import APIRouter, Query, Request
 
-from src.utils.dependencies import CurrentAdminUserId, CurrentMemberUserId, DbSession
+from src.utils.dependencies import (
+    CurrentAdminUserId,
+    CurrentMemberUserId,
+    DbSession,
+    ReadDbSession,
+)
 from src.schemas.shared import ErrorResponse, RESPONSE_400, RESPONSE_401, RESPONSE_403_ADMIN
 from src.schemas.events import CreateEventRequest, UpdateEventRequest
 from src.crud.events import EventService
 from src.core.exceptions import AppError
 from src.core.response import success_response
+from src.crud.home import refresh_home_snapshot
 from src.sql.events import EventRepository
 
 router = APIRouter(prefix="/events", tags=["events"])
@@ -18,9 +24,9 @@ router = APIRouter(prefix="/events", tags=["events"])
     summary="사건 목록 조회",
     description="커서 기반 페이지네이션으로 사건 목록을 조회합니다. 중요도, 날짜 범위로 필터링하고 정렬 기준을 지정할 수 있습니다.",
 )
-def list_events(
+async def list_events(
     request: Request,
-    db: DbSession,
+    db: ReadDbSession,
     cursor: str | None = Query(default=None, description="다음 페이지 커서 토큰"),
     limit: int = Query(default=10, ge=1, le=100, description="한 페이지에 조회할 항목 수"),
     importance: str | None = Query(
@@ -31,16 +37,17 @@ def list_events(
     sortBy: str = Query(default="occurredAt", description="정렬 기준 필드 (occurredAt, createdAt)"),
     order: str = Query(default="desc", pattern="^(asc|desc)$", description="정렬 방향 (asc, desc)"),
 ):
-    service = EventService(EventRepository(db))
     sort = f"-{sortBy}" if order == "desc" else sortBy
-    items, next_cursor = service.list_events(
-        size=limit,
-        cursor=cursor,
-        sort=sort,
-        importance=importance,
-        verification_status=None,
-        from_at=startDate,
-        to_at=endDate,
+    items, next_cursor = await db.run(
+        lambda s: EventService(EventRepository(s)).list_events(
+            size=limit,
+            cursor=cursor,
+            sort=sort,
+            importance=importance,
+            verification_status=None,
+            from_at=startDate,
+            to_at=endDate,
+        )
     )
 
     return success_response(
@@ -67,9 +74,8 @@ def list_events(
         },
     },
 )
-def get_event(event_id: str, request: Request, db: DbSession):
-    service = EventService(EventRepository(db))
-    item = service.get_event(event_id)
+async def get_event(event_id: str, request: Request, db: ReadDbSession):
+    item = await db.run(lambda s: EventService(EventRepository(s)).get_event(event_id))
     if item is None:
         raise AppError(code="E_RESOURCE_001", message="사건을 찾을 수 없습니다.", status_code=404)
     return success_response(request=request, data=item, message="조회 성공")
@@ -143,6 +149,7 @@ def create_event(
         source_ids=payload.sourceIds,
     )
 
+    refresh_home_snapshot(db)
     db.commit()
     return success_response(
         request=request, data=created, status_code=201, message="사건 생성 성공"
@@ -183,6 +190,7 @@ def update_event(
     if updated is None:
         raise AppError(code="E_RESOURCE_001", message="사건을 찾을 수 없습니다.", status_code=404)
 
+    refresh_home_snapshot(db)
     db.commit()
     return success_response(
         request=request,
@@ -211,5 +219,6 @@ def delete_event(event_id: str, request: Request, db: DbSession, _: CurrentAdmin
     ok = service.delete_event(event_id=event_id)
     if not ok:
         raise AppError(code="E_RESOURCE_001", message="사건을 찾을 수 없습니다.", status_code=404)
+    refresh_home_snapshot(db)
     db.commit()
     return success_response(request=request, data=None, message="사건 삭제 성공")
@@ -1,11 +1,16 @@
 """Feed 라우터 — 실시간 뉴스 업데이트 피드."""
 
 from fastapi import APIRouter, Query, Request
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
 
+from src.core.exceptions import AppError
 from src.core.response import success_response
 from src.crud.feed import FeedService
+from src.crud.feed_stream import sse_events
 from src.sql.feed import FeedRepository
-from src.utils.dependencies import DbSession
+from src.sql.issues import IssueRepository
+from src.utils.dependencies import OptionalStreamUserId, ReadDbSession, StreamDbSession
 
 router = APIRouter(prefix="/feed", tags=["feed"])
 
@@ -15,9 +20,9 @@ router = APIRouter(prefix="/feed", tags=["feed"])
     summary="Top Stories 조회",
     description="현재 가장 주목받는 이슈 랭킹을 조회합니다. 매시 정각 계산됩니다.",
 )
-def list_top_stories(
+async def list_top_stories(
     request: Request,
-    db: DbSession,
+    db: ReadDbSession,
     limit: int = Query(
         default=10,
         ge=1,
@@ -25,8 +30,9 @@ def list_top_stories(
         description="조회할 항목 수",
     ),
 ):
-    service = FeedService(FeedRepository(db))
-    items, calculated_at = service.list_top_stories(limit=limit)
+    items, calculated_at = await db.run(
+        lambda s: FeedService(FeedRepository(s)).list_top_stories(limit=limit)
+    )
     return success_response(
         request=request,
         data={
@@ -45,9 +51,9 @@ def list_top_stories(
         "`type` 파라미터로 속보(breaking), 주요(major), 전체(all) 필터링이 가능합니다."
     ),
 )
-def list_live_feed(
+async def list_live_feed(
     request: Request,
-    db: DbSession,
+    db: ReadDbSession,
     type: str | None = Query(
         default=None,
         pattern="^(breaking|major|all)$",
@@ -64,11 +70,12 @@ def list_live_feed(
         description="한 번에 조회할 항목 수",
     ),
 ):
-    service = FeedService(FeedRepository(db))
-    items, next_cursor = service.list_live_feed(
-        feed_type=type,
-        cursor=cursor,
-        size=limit,
+    items, next_cursor = await db.run(
+        lambda s: FeedService(FeedRepository(s)).list_live_feed(
+            feed_type=type,
+            cursor=cursor,
+            size=limit,
+        )
     )
     return success_response(
         request=request,
@@ -81,3 +88,47 @@ def list_live_feed(
         },
         message="조회 성공",
     )
+
+
+@router.get(
+    "/stream",
+    summary="실시간 피드 스트림 (SSE)",
+    description=(
+        "새로 저장된 피드 항목을 Server-Sent Events(`event: feed`)로 전달합니다. "
+        "`type`으로 피드 유형을, `tracked=true`로 추적 중인 이슈만 받을 수 있습니다 "
+        "(인증 필요). 추적 목록은 연결 시점 기준이며, 연결이 끊기면 `/feed/live`로 "
+        "따라잡은 뒤 다시 연결합니다."
+    ),
+    response_class=StreamingResponse,
+)
+async def stream_live_feed(
+    request: Request,
+    db: StreamDbSession,
+    user_id: OptionalStreamUserId,
+    type: str | None = Query(
+        default=None,
+        pattern="^(breaking|major|all)$",
+        description="피드 유형 필터 (breaking, major, all). 미지정 시 전체.",
+    ),
+    tracked: bool = Query(
+        default=False,
+        description="추적 중인 이슈의 항목만 받기 (인증 필요)",
+    ),
+):
+    issue_ids = None
+    if tracked:
+        if user_id is None:
+            raise AppError(
+                code="E_AUTH_001",
+                message="인증 토큰이 없습니다",
+                status_code=401,
+            )
+        issue_ids = await run_in_threadpool(
+            lambda: IssueRepository(db).list_tracked_issue_ids(user_id=user_id)
+        )
+
+    return StreamingResponse(
+        sse_events(feed_type=type, issue_ids=issue_ids, is_disconnected=request.is_disconnected),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
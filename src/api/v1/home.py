@@ -1,85 +1,124 @@
 from fastapi import APIRouter, Query, Request
-
-from src.utils.dependencies import DbSession
-from src.core.response import success_response
-from src.sql.home import HomeRepository
+from fastapi.responses import Response
+
+from src.utils.dependencies import ReadDbSession
+from src.core.response import raw_success_response
+from src.crud.home import (
+    HOT_POST_WIDGETS,
+    SEARCH_RANKING_WIDGETS,
+    TRENDING_WIDGETS,
+    load_home_bundle,
+    load_home_widgets,
+)
 
 router = APIRouter(prefix="/home", tags=["home"])
 
+SNAPSHOT_NOTE = (
+    " 사전 계산 스냅샷에서 응답하며, `snapshotAt`은 스냅샷 생성 시각(즉석 계산이면 null)입니다."
+)
+
+
+async def _widget_response(
+    request: Request, db: ReadDbSession, widget: str, limit: int
+) -> Response:
+    """홈 위젯 응답. 메모리 스냅샷이 최신이면 DB 조회 없이 bytes를 그대로 내려준다."""
+    bodies, built_at = await load_home_widgets(db, {widget: limit})
+    return raw_success_response(
+        request=request,
+        data=bodies[widget],
+        message="조회 성공",
+        extra={"snapshotAt": built_at},
+    )
+
 
 @router.get(
-    "/breaking-news",
-    summary="속보 목록",
-    description="최신 속보 사건 목록을 조회합니다. 발생 시간, 제목, 요약, 중요도를 포함합니다.",
+    "/bundle",
+    summary="홈 위젯 묶음",
+    description=(
+        "홈 화면 7개 위젯(속보, 인기 게시글, 검색어 랭킹, 트렌딩, 타임라인 미니맵, 주요 뉴스, "
+        "커뮤니티 미디어)을 한 번에 조회합니다. 위젯별 개수를 지정할 수 있고 0이면 제외합니다. "
+        "모든 위젯은 같은 스냅샷 시점으로 응답합니다."
+    )
+    + SNAPSHOT_NOTE,
 )
-def breaking_news(
+async def bundle(
     request: Request,
-    db: DbSession,
-    limit: int = Query(default=10, ge=1, le=20, description="조회할 속보 수 (1~20)"),
+    db: ReadDbSession,
+    breakingNewsLimit: int = Query(default=10, ge=0, le=20, description="속보 수 (0~20)"),
+    hotPostsLimit: int = Query(default=5, ge=0, le=20, description="인기 게시글 수 (0~20)"),
+    searchRankingsLimit: int = Query(default=10, ge=0, le=20, description="검색어 랭킹 수 (0~20)"),
+    trendingLimit: int = Query(default=10, ge=0, le=20, description="트렌딩 이슈 수 (0~20)"),
+    timelineDays: int = Query(default=7, ge=0, le=30, description="타임라인 미니맵 일수 (0~30)"),
+    featuredNewsLimit: int = Query(default=5, ge=0, le=20, description="주요 뉴스 수 (0~20)"),
+    communityMediaLimit: int = Query(
+        default=6, ge=0, le=20, description="커뮤니티 미디어 게시글 수 (0~20)"
+    ),
 ):
-    repo = HomeRepository(db)
-    items = repo.list_breaking_news(limit=limit)
-    return success_response(
+    limits = {
+        "breaking-news": breakingNewsLimit,
+        "hot-posts": hotPostsLimit,
+        "search-rankings": searchRankingsLimit,
+        "trending": trendingLimit,
+        "timeline-minimap": timelineDays,
+        "featured-news": featuredNewsLimit,
+        "community-media": communityMediaLimit,
+    }
+    body, built_at = await load_home_bundle(db, limits)
+    return raw_success_response(
         request=request,
-        data=[
-            {
-                "id": item.id,
-                "number": idx + 1,
-                "time": item.occurred_at.strftime("%H:%M"),
-                "title": item.title,
-                "summary": item.summary,
-                "tags": [],
-                "importance": item.importance.value,
-            }
-            for idx, item in enumerate(items)
-        ],
+        data=body,
         message="조회 성공",
+        extra={"snapshotAt": built_at},
     )
 
 
+@router.get(
+    "/breaking-news",
+    summary="속보 목록",
+    description="최신 속보 사건 목록을 조회합니다. 발생 시간, 제목, 요약, 중요도를 포함합니다."
+    + SNAPSHOT_NOTE,
+)
+async def breaking_news(
+    request: Request,
+    db: ReadDbSession,
+    limit: int = Query(default=10, ge=1, le=20, description="조회할 속보 수 (1~20)"),
+):
+    return await _widget_response(request, db, "breaking-news", limit)
+
+
 @router.get(
     "/hot-posts",
     summary="인기 게시글 목록",
-    description="특정 기간 내 인기 게시글 목록을 조회합니다. 댓글 수 기준으로 정렬됩니다.",
+    description=(
+        "기간 내 작성된 인기 게시글 목록을 조회합니다. 추천·댓글 수에 시간 감쇠를 적용한 "
+        "인기 점수순으로 정렬됩니다."
+    )
+    + SNAPSHOT_NOTE,
 )
-def hot_posts(
+async def hot_posts(
     request: Request,
-    db: DbSession,
+    db: ReadDbSession,
     limit: int = Query(default=5, ge=1, le=20, description="조회할 게시글 수 (1~20)"),
-    period: str = Query(default="24h", description="집계 기간 (예: 24h, 7d)"),
+    period: str = Query(
+        default="24h", pattern="^(24h|7d)$", description="집계 기간 (24h: 24시간, 7d: 7일)"
+    ),
 ):
-    _ = period
-    repo = HomeRepository(db)
-    items = repo.list_hot_posts(limit=limit)
-    return success_response(
-        request=request,
-        data=[
-            {
-                "id": item.id,
-                "number": idx + 1,
-                "title": item.title,
-                "category": None,
-                "commentCount": item.comment_count,
-                "author": None,
-                "createdAt": item.created_at.isoformat(timespec="milliseconds").replace(
-                    "+00:00", "Z"
-                ),
-                "isHot": True,
-            }
-            for idx, item in enumerate(items)
-        ],
-        message="조회 성공",
-    )
+    return await _widget_response(request, db, HOT_POST_WIDGETS[period], limit)
 
 
 @router.get(
     "/search-rankings",
     summary="검색어 랭킹",
-    description="인기 검색어 랭킹을 조회합니다. 일간/주간 기준으로 집계됩니다.",
+    description=(
+        "인기 검색어 랭킹을 조회합니다. 일간(24시간)/주간(7일) 기준으로 사용자 검색어의 "
+        "10분 단위 집계를 합산하고, 직전 랭킹 대비 순위 변동(`+2`, `-1`, `-`, `new`)을 "
+        "포함합니다."
+    )
+    + SNAPSHOT_NOTE,
 )
-def search_rankings(
+async def search_rankings(
     request: Request,
-    db: DbSession,
+    db: ReadDbSession,
     limit: int = Query(default=10, ge=1, le=20, description="상위 랭킹 수 (1~20)"),
     period: str = Query(
         default="daily",
@@ -87,143 +126,64 @@ def search_rankings(
         description="집계 기간 (daily: 일간, weekly: 주간)",
     ),
 ):
-    _ = period
-    repo = HomeRepository(db)
-    items = repo.list_search_rankings(limit=limit)
-    return success_response(
-        request=request,
-        data=[
-            {
-                "rank": item.rank,
-                "keyword": item.keyword,
-                "count": item.score,
-                "change": "-",
-            }
-            for item in items
-        ],
-        message="조회 성공",
-    )
+    return await _widget_response(request, db, SEARCH_RANKING_WIDGETS[period], limit)
 
 
 @router.get(
     "/trending",
     summary="트렌딩 이슈",
-    description="현재 주목받는 이슈 목록을 조회합니다. 관련 사건 수, 추적자 수 등의 지표를 포함합니다.",
+    description=(
+        "현재 주목받는 이슈 목록을 조회합니다. 관련 사건 수, 추적자 수, 직전 랭킹 대비 "
+        "순위 변동(`+2`, `-1`, `-`, `new`)을 포함합니다. 집계 기간별 랭킹 스냅샷을 사용합니다."
+        + SNAPSHOT_NOTE
+    ),
 )
-def trending(
+async def trending(
     request: Request,
-    db: DbSession,
+    db: ReadDbSession,
     limit: int = Query(default=10, ge=1, le=20, description="조회할 이슈 수 (1~20)"),
-    period: str = Query(default="24h", description="집계 기간 (예: 24h, 7d)"),
+    period: str = Query(
+        default="24h", pattern="^(24h|7d)$", description="집계 기간 (24h: 24시간, 7d: 7일)"
+    ),
 ):
-    _ = period
-    repo = HomeRepository(db)
-    items = repo.list_trending_events(limit=limit)
-    return success_response(
-        request=request,
-        data=[
-            {
-                "rank": idx + 1,
-                "issue": {
-                    "id": item.id,
-                    "title": item.title,
-                    "status": "ongoing",
-                },
-                "relatedEventCount": 0,
-                "trackerCount": 0,
-                "change": "-",
-            }
-            for idx, item in enumerate(items)
-        ],
-        message="조회 성공",
-    )
+    return await _widget_response(request, db, TRENDING_WIDGETS[period], limit)
 
 
 @router.get(
     "/timeline-minimap",
     summary="타임라인 미니맵",
-    description="최근 N일간의 사건 발생 밀도를 날짜별로 조회합니다. 타임라인 시각화에 사용됩니다.",
+    description="최근 N일간의 사건 발생 밀도를 날짜별로 조회합니다. 타임라인 시각화에 사용됩니다."
+    + SNAPSHOT_NOTE,
 )
-def timeline_minimap(
+async def timeline_minimap(
     request: Request,
-    db: DbSession,
+    db: ReadDbSession,
     days: int = Query(default=7, ge=1, le=30, description="조회할 일수 (1~30)"),
 ):
-    repo = HomeRepository(db)
-    items = repo.list_timeline_events(limit=days)
-    return success_response(
-        request=request,
-        data={
-            "dates": [
-                {
-                    "date": item.occurred_at.date().isoformat(),
-                    "eventCount": 1,
-                    "density": "high" if item.importance.value == "high" else "low",
-                }
-                for item in items
-            ]
-        },
-        message="조회 성공",
-    )
+    return await _widget_response(request, db, "timeline-minimap", days)
 
 
 @router.get(
     "/featured-news",
     summary="주요 뉴스",
-    description="편집자가 선별한 주요 뉴스 게시글 목록을 조회합니다.",
+    description="편집자가 선별한 주요 뉴스 게시글 목록을 조회합니다." + SNAPSHOT_NOTE,
 )
-def featured_news(
+async def featured_news(
     request: Request,
-    db: DbSession,
+    db: ReadDbSession,
     limit: int = Query(default=5, ge=1, le=20, description="조회할 뉴스 수 (1~20)"),
 ):
-    repo = HomeRepository(db)
-    items = repo.list_featured_news(limit=limit)
-    return success_response(
-        request=request,
-        data=[
-            {
-                "id": item.id,
-                "author": None,
-                "authorImage": None,
-                "title": item.title,
-                "summary": item.summary,
-                "imageUrl": None,
-                "createdAt": item.created_at.isoformat(timespec="milliseconds").replace(
-                    "+00:00", "Z"
-                ),
-            }
-            for item in items
-        ],
-        message="조회 성공",
-    )
+    return await _widget_response(request, db, "featured-news", limit)
 
 
 @router.get(
     "/community-media",
     summary="커뮤니티 미디어 게시글",
-    description="미디어(이미지 포함) 게시글 목록을 조회합니다.",
+    description="미디어(이미지 포함) 게시글 목록을 조회합니다." + SNAPSHOT_NOTE,
 )
-def community_media(
+async def community_media(
     request: Request,
-    db: DbSession,
+    db: ReadDbSession,
     limit: int = Query(default=6, ge=1, le=20, description="조회할 게시글 수 (1~20)"),
 ):
-    repo = HomeRepository(db)
-    items = repo.list_community_media_posts(limit=limit)
-    return success_response(
-        request=request,
-        data=[
-            {
-                "id": item.id,
-                "title": item.title,
-                "imageUrl": None,
-                "viewCount": 0,
-                "createdAt": item.created_at.isoformat(timespec="milliseconds").replace(
-                    "+00:00", "Z"
-                ),
-            }
-            for item in items
-        ],
-        message="조회 성공",
-    )
+    return await _widget_response(request, db, "community-media", limit)
@@ -2,13 +2,19 @@ from datetime import datetime
 
 from fastapi import APIRouter, Query, Request
 
-from src.utils.dependencies import CurrentAdminUserId, CurrentMemberUserId, DbSession
+from src.utils.dependencies import (
+    CurrentAdminUserId,
+    CurrentMemberUserId,
+    DbSession,
+    ReadDbSession,
+)
 from src.schemas.shared import ErrorResponse, RESPONSE_400, RESPONSE_401, RESPONSE_403_ADMIN
 from src.schemas.issues import CreateIssueRequest, CreateTriggerRequest, UpdateIssueRequest
 from src.crud.issues import IssueService
 from src.crud.feed import FeedService
 from src.core.exceptions import AppError
 from src.core.response import success_response
+from src.crud.home import refresh_home_snapshot
 from src.sql.feed import FeedRepository
 from src.sql.issues import IssueRepository
 
@@ -20,9 +26,9 @@ router = APIRouter(prefix="/issues", tags=["issues"])
     summary="이슈 목록 조회",
     description="페이지 기반 페이지네이션으로 이슈 목록을 조회합니다. 상태, 날짜 범위로 필터링하고 정렬 기준을 지정할 수 있습니다.",
 )
-def list_issues(
+async def list_issues(
     request: Request,
-    db: DbSession,
+    db: ReadDbSession,
     page: int = Query(default=1, ge=1, description="페이지 번호"),
     limit: int = Query(default=10, ge=1, le=100, description="한 페이지에 조회할 항목 수"),
     status: str | None = Query(
@@ -37,24 +43,25 @@ def list_issues(
     ),
     order: str = Query(default="desc", pattern="^(asc|desc)$", description="정렬 방향 (asc, desc)"),
 ):
-    repository = IssueRepository(db)
-    service = IssueService(repository)
     from src.core.pagination import encode_cursor
 
     offset = (page - 1) * limit
     cursor = encode_cursor(offset) if offset > 0 else None
     sort = f"-{sortBy}" if order == "desc" else sortBy
 
-    items, _ = service.list_issues(
-        size=limit,
-        cursor=cursor,
-        sort=sort,
-        status=status,
-        from_at=startDate,
-        to_at=endDate,
-    )
+    def _load(session) -> tuple[list[dict], int]:
+        repository = IssueRepository(session)
+        items, _ = IssueService(repository).list_issues(
+            size=limit,
+            cursor=cursor,
+            sort=sort,
+            status=status,
+            from_at=startDate,
+            to_at=endDate,
+        )
+        return items, repository.count_issues(status=status, from_at=startDate, to_at=endDate)
 
-    total_items = repository.count_issues(status=status, from_at=startDate, to_at=endDate)
+    items, total_items = await db.run(_load)
     total_pages = (total_items + limit - 1) // limit if total_items else 0
     return success_response(
         request=request,
@@ -81,9 +88,8 @@ def list_issues(
         404: {"description": "이슈를 찾을 수 없음 (`E_RESOURCE_002`)", "model": ErrorResponse},
     },
 )
-def get_issue(issue_id: str, request: Request, db: DbSession):
-    service = IssueService(IssueRepository(db))
-    item = service.get_issue(issue_id)
+async def get_issue(issue_id: str, request: Request, db: ReadDbSession):
+    item = await db.run(lambda s: IssueService(IssueRepository(s)).get_issue(issue_id))
     if item is None:
         raise AppError(code="E_RESOURCE_002", message="이슈를 찾을 수 없습니다.", status_code=404)
     return success_response(request=request, data=item, message="조회 성공")
@@ -108,6 +114,7 @@ def create_issue(
         source_ids=payload.sourceIds,
         related_event_ids=payload.relatedEventIds,
     )
+    refresh_home_snapshot(db)
     db.commit()
     return success_response(
         request=request, data=created, status_code=201, message="이슈 생성 성공"
@@ -145,6 +152,7 @@ def update_issue(
     if updated is None:
         raise AppError(code="E_RESOURCE_002", message="이슈를 찾을 수 없습니다.", status_code=404)
 
+    refresh_home_snapshot(db)
     db.commit()
     return success_response(
         request=request,
@@ -173,6 +181,7 @@ def delete_issue(issue_id: str, request: Request, db: DbSession, _: CurrentAdmin
     ok = service.delete_issue(issue_id=issue_id)
     if not ok:
         raise AppError(code="E_RESOURCE_002", message="이슈를 찾을 수 없습니다.", status_code=404)
+    refresh_home_snapshot(db)
     db.commit()
     return success_response(request=request, data=None, message="이슈 삭제 성공")
 
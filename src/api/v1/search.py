@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Query, Request
 
-from src.utils.dependencies import DbSession
-from src.schemas.shared import RESPONSE_400
+from src.utils.dependencies import CurrentAdminUserId, DbSession, ReadDbSession
+from src.schemas.shared import RESPONSE_400, RESPONSE_401, RESPONSE_403_ADMIN
 from src.crud.search import SearchService
 from src.core.response import success_response
 from src.sql.search import SearchRepository
@@ -16,6 +16,7 @@ def _build_search_response(*, items: list[dict], page: int, limit: int) -> dict:
             "type": item["entityType"],
             "title": item["title"],
             "summary": item["summary"],
+            "highlight": item.get("highlight"),
             "date": item["date"],
             "tags": [],
         }
@@ -40,9 +41,9 @@ def _build_search_response(*, items: list[dict], page: int, limit: int) -> dict:
     description="사건, 이슈, 게시글을 통합 검색합니다. `tab` 파라미터로 검색 범위를 지정할 수 있습니다. 페이지 기반 페이지네이션을 사용합니다.",
     responses={**RESPONSE_400},
 )
-def search(
+async def search(
     request: Request,
-    db: DbSession,
+    db: ReadDbSession,
     q: str = Query(min_length=1, description="검색어 (최소 1자)"),
     page: int = Query(default=1, ge=1, description="페이지 번호"),
     limit: int = Query(default=10, ge=1, le=100, description="한 페이지에 조회할 결과 수"),
@@ -55,7 +56,6 @@ def search(
         default="relevance", description="정렬 기준 (relevance: 관련도, createdAt: 작성일)"
     ),
 ):
-    service = SearchService(SearchRepository(db))
     entity_type_map = {
         "all": "all",
         "events": "event",
@@ -70,12 +70,14 @@ def search(
     offset = (page - 1) * limit
     cursor = encode_cursor(offset) if offset > 0 else None
 
-    items, _, total_items = service.search(
-        q=q,
-        entity_type=entity_type,
-        sort=sort,
-        size=limit,
-        cursor=cursor,
+    items, _, total_items, type_counts = await db.run(
+        lambda s: SearchService(SearchRepository(s)).search(
+            q=q,
+            entity_type=entity_type,
+            sort=sort,
+            size=limit,
+            cursor=cursor,
+        )
     )
 
     response_data = _build_search_response(items=items, page=page, limit=limit)
@@ -88,6 +90,12 @@ def search(
         "hasNext": page < total_pages,
         "hasPrev": page > 1,
     }
+    # 탭 배지용 엔티티 종류별 전체 건수
+    response_data["typeCounts"] = {
+        tab_name: type_counts.get(entity, 0)
+        for tab_name, entity in entity_type_map.items()
+        if entity != "all"
+    }
     return success_response(
         request=request,
         data=response_data,
@@ -101,21 +109,22 @@ def search(
     description="사건만을 대상으로 검색합니다. 페이지 기반 페이지네이션을 사용합니다.",
     responses={**RESPONSE_400},
 )
-def search_events(
+async def search_events(
     request: Request,
-    db: DbSession,
+    db: ReadDbSession,
     q: str = Query(min_length=1, description="검색어 (최소 1자)"),
     page: int = Query(default=1, ge=1, description="페이지 번호"),
     limit: int = Query(default=10, ge=1, le=100, description="한 페이지에 조회할 결과 수"),
     sortBy: str = Query(default="relevance", description="정렬 기준 (relevance, createdAt)"),
 ):
-    service = SearchService(SearchRepository(db))
     from src.core.pagination import encode_cursor
 
     offset = (page - 1) * limit
     cursor = encode_cursor(offset) if offset > 0 else None
-    items, _, total_items = service.search(
-        q=q, entity_type="event", sort=f"-{sortBy}", size=limit, cursor=cursor
+    items, _, total_items, _ = await db.run(
+        lambda s: SearchService(SearchRepository(s)).search(
+            q=q, entity_type="event", sort=f"-{sortBy}", size=limit, cursor=cursor
+        )
     )
     response_data = _build_search_response(items=items, page=page, limit=limit)
     total_pages = (total_items + limit - 1) // limit if total_items else 0
@@ -140,21 +149,22 @@ def search_events(
     description="이슈만을 대상으로 검색합니다. 페이지 기반 페이지네이션을 사용합니다.",
     responses={**RESPONSE_400},
 )
-def search_issues(
+async def search_issues(
     request: Request,
-    db: DbSession,
+    db: ReadDbSession,
     q: str = Query(min_length=1, description="검색어 (최소 1자)"),
     page: int = Query(default=1, ge=1, description="페이지 번호"),
     limit: int = Query(default=10, ge=1, le=100, description="한 페이지에 조회할 결과 수"),
     sortBy: str = Query(default="relevance", description="정렬 기준 (relevance, createdAt)"),
 ):
-    service = SearchService(SearchRepository(db))
     from src.core.pagination import encode_cursor
 
     offset = (page - 1) * limit
     cursor = encode_cursor(offset) if offset > 0 else None
-    items, _, total_items = service.search(
-        q=q, entity_type="issue", sort=f"-{sortBy}", size=limit, cursor=cursor
+    items, _, total_items, _ = await db.run(
+        lambda s: SearchService(SearchRepository(s)).search(
+            q=q, entity_type="issue", sort=f"-{sortBy}", size=limit, cursor=cursor
+        )
     )
     response_data = _build_search_response(items=items, page=page, limit=limit)
     total_pages = (total_items + limit - 1) // limit if total_items else 0
@@ -179,21 +189,22 @@ def search_issues(
     description="게시글만을 대상으로 검색합니다. 페이지 기반 페이지네이션을 사용합니다.",
     responses={**RESPONSE_400},
 )
-def search_posts(
+async def search_posts(
     request: Request,
-    db: DbSession,
+    db: ReadDbSession,
     q: str = Query(min_length=1, description="검색어 (최소 1자)"),
     page: int = Query(default=1, ge=1, description="페이지 번호"),
     limit: int = Query(default=10, ge=1, le=100, description="한 페이지에 조회할 결과 수"),
     sortBy: str = Query(default="relevance", description="정렬 기준 (relevance, createdAt)"),
 ):
-    service = SearchService(SearchRepository(db))
     from src.core.pagination import encode_cursor
 
     offset = (page - 1) * limit
     cursor = encode_cursor(offset) if offset > 0 else None
-    items, _, total_items = service.search(
-        q=q, entity_type="post", sort=f"-{sortBy}", size=limit, cursor=cursor
+    items, _, total_items, _ = await db.run(
+        lambda s: SearchService(SearchRepository(s)).search(
+            q=q, entity_type="post", sort=f"-{sortBy}", size=limit, cursor=cursor
+        )
     )
     response_data = _build_search_response(items=items, page=page, limit=limit)
     total_pages = (total_items + limit - 1) // limit if total_items else 0
@@ -210,3 +221,30 @@ def search_posts(
         data=response_data,
         message="검색 성공",
     )
+
+
+@router.get(
+    "/suggestions",
+    summary="검색어 자동완성",
+    description="입력 중인 검색어로 시작하는 제목·급상승 키워드를 인기순으로 반환합니다. 한글은 자모 단위(`트러`, `틀`) 및 초성(`ㅌㄹ`) 입력도 지원합니다.",
+    responses={**RESPONSE_400},
+)
+async def search_suggestions(
+    request: Request,
+    q: str = Query(min_length=1, description="입력 중인 검색어 (최소 1자)"),
+    limit: int = Query(default=10, ge=1, le=20, description="최대 제안 수"),
+):
+    return success_response(request=request, data=SearchService.suggestions(q=q, limit=limit))
+
+
+@router.get(
+    "/cache-stats",
+    summary="검색 캐시 지표",
+    description="검색 결과 캐시의 적중/미스 수와 적중률, 검색어 로그 버퍼 상태(`queryLog`)를 조회합니다. 지표는 API 프로세스 단위로 집계됩니다.",
+    responses={**RESPONSE_401, **RESPONSE_403_ADMIN},
+)
+def search_cache_stats(request: Request, db: DbSession, _: CurrentAdminUserId):
+    return success_response(
+        request=request,
+        data=SearchService(SearchRepository(db)).cache_stats(),
+    )
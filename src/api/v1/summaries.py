@@ -0,0 +1,110 @@
+"""Summaries 라우터 — 뉴스 키워드 요약 조회."""
+
+from fastapi import APIRouter, Query, Request
+
+from src.core.exceptions import AppError
+from src.core.response import success_response
+from src.crud.summaries import SummaryService
+from src.schemas.shared import ErrorResponse
+from src.sql.summaries import SummaryRepository
+from src.utils.dependencies import DbSession
+
+router = APIRouter(prefix="/summaries", tags=["summaries"])
+
+
+@router.get(
+    "/latest",
+    summary="최신 뉴스 요약 조회",
+    description=(
+        "가장 최근 요약 배치의 키워드별 요약을 조회합니다. "
+        "요약 저장 시 미리 계산된 스냅샷을 그대로 반환합니다."
+    ),
+)
+def get_latest_summaries(
+    request: Request,
+    db: DbSession,
+    category: str | None = Query(
+        default=None,
+        pattern="^(politics|economy|society|international|culture|technology)$",
+        description="카테고리 필터",
+    ),
+):
+    service = SummaryService(SummaryRepository(db))
+    data = service.get_latest(category=category)
+    if data is None:
+        data = {"batch": None, "items": [], "refreshedAt": None}
+    return success_response(request=request, data=data, message="조회 성공")
+
+
+@router.get(
+    "/batches",
+    summary="요약 배치 목록 조회",
+    description="요약 배치 목록을 최신순으로 조회합니다. 커서 기반(keyset) 페이지네이션을 사용합니다.",
+)
+def list_summary_batches(
+    request: Request,
+    db: DbSession,
+    cursor: str | None = Query(default=None, description="다음 페이지 커서 토큰"),
+    limit: int = Query(default=20, ge=1, le=100, description="한 번에 조회할 항목 수"),
+):
+    service = SummaryService(SummaryRepository(db))
+    items, next_cursor = service.list_batches(cursor=cursor, size=limit)
+    return success_response(
+        request=request,
+        data={
+            "items": items,
+            "cursor": {
+                "next": next_cursor,
+                "hasMore": next_cursor is not None,
+            },
+        },
+        message="조회 성공",
+    )
+
+
+@router.get(
+    "/batches/{batch_id}",
+    summary="요약 배치 상세 조회",
+    description="배치 ID로 해당 배치의 키워드별 요약을 조회합니다.",
+    responses={
+        404: {
+            "description": "요약 배치를 찾을 수 없음 (`E_RESOURCE_001`)",
+            "model": ErrorResponse,
+        },
+    },
+)
+def get_summary_batch(batch_id: str, request: Request, db: DbSession):
+    service = SummaryService(SummaryRepository(db))
+    data = service.get_batch(batch_id)
+    if data is None:
+        raise AppError(
+            code="E_RESOURCE_001", message="요약 배치를 찾을 수 없습니다.", status_code=404
+        )
+    return success_response(request=request, data=data, message="조회 성공")
+
+
+@router.get(
+    "/keywords/{keyword}",
+    summary="키워드 요약 이력 조회",
+    description="특정 키워드의 요약 이력을 최신순으로 조회합니다. 커서 기반(keyset) 페이지네이션을 사용합니다.",
+)
+def list_keyword_summary_history(
+    keyword: str,
+    request: Request,
+    db: DbSession,
+    cursor: str | None = Query(default=None, description="다음 페이지 커서 토큰"),
+    limit: int = Query(default=20, ge=1, le=100, description="한 번에 조회할 항목 수"),
+):
+    service = SummaryService(SummaryRepository(db))
+    items, next_cursor = service.list_keyword_history(keyword=keyword, cursor=cursor, size=limit)
+    return success_response(
+        request=request,
+        data={
+            "items": items,
+            "cursor": {
+                "next": next_cursor,
+                "hasMore": next_cursor is not None,
+            },
+        },
+        message="조회 성공",
+    )
@@ -77,7 +77,7 @@ def delete_trigger(trigger_id: str, request: Request, db: DbSession, _: CurrentA
     repo.delete_trigger(trigger)
 
     if issue is not None:
-        items, _ = issue_repo.list_triggers(issue_id=issue.id, size=1, offset=0)
+        items, _ = issue_repo.list_triggers(issue_id=issue.id, size=1, cursor=None)
         issue.latest_trigger_at = items[0].occurred_at if items else None
 
     db.commit()
@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Query, Request
 
-from src.utils.dependencies import CurrentMemberUserId, DbSession
+from src.utils.dependencies import CurrentMemberUserId, DbSession, ReadDbSession
 from src.schemas.shared import ErrorResponse, RESPONSE_400, RESPONSE_401
 from src.schemas.users import (
     ChangePasswordRequest,
@@ -13,9 +13,11 @@ from src.schemas.subscription import CreateSubscriptionRequest
 from src.core.exceptions import AppError
 from src.core.response import success_response
 from src.core.security import hash_password, verify_password
+from src.crud.feed import FeedService
 from src.crud.notification import NotificationService
 from src.crud.subscription import SubscriptionService
 from src.sql.auth import AuthRepository
+from src.sql.feed import FeedRepository
 from src.sql.notification import NotificationRepository
 from src.sql.subscription import SubscriptionRepository
 from src.sql.users import UserRepository
@@ -490,6 +492,42 @@ def list_subscription_matches(
     )
 
 
+@me_router.get(
+    "/feed",
+    summary="내 피드",
+    description=(
+        "추적 중인 이슈와 구독 키워드의 새 업데이트를 최신순으로 조회합니다. "
+        "`reason`은 포함 사유(tracked_issue, keyword)입니다."
+    ),
+    responses={**RESPONSE_401},
+)
+async def list_my_feed(
+    request: Request,
+    user_id: CurrentMemberUserId,
+    db: ReadDbSession,
+    cursor: str | None = Query(default=None, description="다음 페이지 커서"),
+    limit: int = Query(default=20, ge=1, le=100, description="한 번에 조회할 항목 수"),
+):
+    items, next_cursor = await db.run(
+        lambda s: FeedService(FeedRepository(s)).list_user_feed(
+            user_id=user_id,
+            cursor=cursor,
+            size=limit,
+        )
+    )
+    return success_response(
+        request=request,
+        data={
+            "items": items,
+            "cursor": {
+                "next": next_cursor,
+                "hasMore": next_cursor is not None,
+            },
+        },
+        message="조회 성공",
+    )
+
+
 users_router = APIRouter(prefix="/users", tags=["users"])
 
 
@@ -18,13 +18,47 @@ class Settings(BaseSettings):
     api_v1_prefix: str = "/api/v1"
 
     database_url: str = Field(..., min_length=10)
+    # 읽기 전용 엔드포인트를 AsyncSession(async psycopg)으로 처리 (opt-in)
+    db_async_enabled: bool = False
+    # 비우면 database_url을 그대로 사용 (create_async_engine이 psycopg async 드라이버 선택)
+    async_database_url: str = ""
+    db_async_pool_size: int = 10
+    db_async_max_overflow: int = 10
 
     access_token_expire_minutes: int = 60
     refresh_token_expire_days: int = 14
     jwt_secret_key: str = Field(default="change-me-in-env", min_length=16)
     jwt_algorithm: str = "HS256"
+    # keyset 커서 서명 키 (미지정 시 jwt_secret_key 사용)
+    cursor_secret_key: str = ""
 
     scheduler_timezone: str = "Asia/Seoul"
+    # 홈 스냅샷 메모리 사본이 DB 갱신 여부를 확인하는 주기 (초)
+    home_snapshot_reload_seconds: int = 10
+    # Top Stories 최신 스냅샷 포인터를 DB에서 재확인하는 주기 (초)
+    feed_top_reload_seconds: int = 60
+    # 피드 스트림(SSE) 알림 경로: auto(PostgreSQL이면 listen, 아니면 local) | listen | poll | local
+    feed_stream_source: str = "auto"
+    feed_stream_poll_seconds: int = 2
+    feed_stream_queue_size: int = 256
+    feed_stream_heartbeat_seconds: int = 15
+    # 개인 피드 인박스: 추적자가 이보다 많은 이슈는 쓰기 fan-out 대신 읽기 시 병합,
+    # 사용자당 보관 상한 (feed_inbox_trim 잡이 초과분 삭제)
+    feed_inbox_enabled: bool = True
+    feed_inbox_fanout_max_trackers: int = 5000
+    feed_inbox_max_items: int = 500
+    # 검색 결과 캐시. URL(redis://...)을 비우면 프로세스 내 LRU 저장소
+    search_cache_enabled: bool = True
+    search_cache_url: str = ""
+    search_cache_ttl_seconds: int = 30
+    search_cache_max_entries: int = 2048
+    # 자동완성 메모리 색인 백그라운드 갱신 주기 (초, 0이면 갱신 스레드 없음)
+    search_suggest_refresh_seconds: int = 60
+    # 검색어 로그: 메모리 버퍼 상한, flush 주기 (0이면 백그라운드 flush 없음), 버킷별 상위 K
+    search_query_log_enabled: bool = True
+    search_query_log_buffer_size: int = 10000
+    search_query_log_flush_seconds: int = 5
+    search_query_log_top_k: int = 100
     auto_create_tables: bool = True
 
     cors_origins: str = "*"
@@ -32,6 +66,17 @@ class Settings(BaseSettings):
     # Pipeline
     ollama_base_url: str = "http://localhost:11434/v1"
     ollama_default_model: str = "gemma3:4b"
+    summary_cache_ttl_hours: int = 24
+    summary_cache_partial_min_overlap: float = 0.5
+    summary_prompt_token_budget: int = 6000
+    llm_connect_timeout_seconds: float = 5.0
+    llm_read_timeout_seconds: float = 120.0
+    llm_request_deadline_seconds: float = 480.0
+    llm_max_retries: int = 2
+    llm_retry_backoff_seconds: float = 2.0
+    llm_circuit_failure_threshold: int = 3
+    llm_circuit_reset_seconds: float = 300.0
+    llm_max_concurrency: int = 1
     news_pipeline_dir: str = ""
 
     # Naver Search API
@@ -49,6 +94,9 @@ class Settings(BaseSettings):
     elasticsearch_url: str = ""
     elasticsearch_index: str = "news_articles"
     elasticsearch_timeout: int = 10
+    # API 검색을 엔티티별 ES 인덱스로 처리 (ES 미설정/장애 시 SQL 검색 폴백)
+    search_es_enabled: bool = False
+    search_es_index_prefix: str = "trend_korea"
 
     # 기사 분류기 임계값
     classifier_score_new: float = 0.45
@@ -1,4 +1,31 @@
+"""커서 페이지네이션.
+
+두 가지 커서를 지원한다.
+
+- offset 커서(레거시): OFFSET 정수를 base64로 감싼 값. 페이지 번호 기반 API와
+  기존 클라이언트 호환을 위해 계속 받는다.
+- keyset 커서: 마지막 항목의 정렬 키 값 + id를 담고 HMAC으로 서명한 값.
+  ``k1.<payload>.<signature>`` 형식이며, 정렬 조건이 바뀌면 무효 처리된다.
+
+keyset 커서는 ``WHERE (정렬키..., id) < (마지막 값...)`` 형태로 다음 페이지를
+찾으므로 깊은 페이지에서도 비용이 일정하고, 새 행이 들어와도 중복/누락이 없다.
+"""
+
+from __future__ import annotations
+
 import base64
+import hashlib
+import hmac
+import json
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from typing import Any
+
+from sqlalchemy import and_, asc, desc, false, or_, true, tuple_
+
+KEYSET_PREFIX = "k1"
 
 
 def encode_cursor(offset: int) -> str:
@@ -15,3 +42,194 @@ def decode_cursor(cursor: str | None) -> int:
         return max(offset, 0)
     except Exception:
         return 0
+
+
+# ── keyset 커서 ──────────────────────────────────────────
+
+
+def _b64encode(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).decode("utf-8").rstrip("=")
+
+
+def _b64decode(value: str) -> bytes:
+    return base64.urlsafe_b64decode(value + "=" * (-len(value) % 4))
+
+
+def _secret() -> bytes:
+    from src.core.config import get_settings
+
+    settings = get_settings()
+    return (settings.cursor_secret_key or settings.jwt_secret_key).encode("utf-8")
+
+
+def _sign(payload: str) -> str:
+    digest = hmac.new(_secret(), payload.encode("utf-8"), hashlib.sha256).digest()
+    return _b64encode(digest[:16])
+
+
+def _serialize_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def _deserialize_value(value: Any) -> Any:
+    if isinstance(value, dict) and "dt" in value:
+        return datetime.fromisoformat(value["dt"])
+    return value
+
+
+def encode_keyset_cursor(values: list, *, signature: str = "") -> str:
+    """정렬 키 값 목록을 서명된 keyset 커서로 인코딩한다.
+
+    Args:
+        values: 마지막 항목의 정렬 키 값 (id 포함)
+        signature: 정렬 조건 식별자. 다른 정렬의 커서를 재사용하지 못하게 한다.
+    """
+    body = json.dumps(
+        {"s": signature, "v": [_serialize_value(v) for v in values]},
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+    payload = _b64encode(body.encode("utf-8"))
+    return f"{KEYSET_PREFIX}.{payload}.{_sign(payload)}"
+
+
+def decode_keyset_cursor(cursor: str | None, *, signature: str = "") -> list | None:
+    """keyset 커서를 검증·디코딩한다. 없거나 위조/형식 오류/정렬 불일치면 None."""
+    if not cursor or not cursor.startswith(f"{KEYSET_PREFIX}."):
+        return None
+    try:
+        _, payload, sig = cursor.split(".")
+        if not hmac.compare_digest(sig, _sign(payload)):
+            return None
+        data = json.loads(_b64decode(payload).decode("utf-8"))
+        if data.get("s") != signature or not isinstance(data.get("v"), list):
+            return None
+        return [_deserialize_value(v) for v in data["v"]]
+    except Exception:
+        return None
+
+
+@dataclass(frozen=True)
+class SortKey:
+    """keyset 정렬 키 1개.
+
+    Attributes:
+        name: 커서 서명용 이름 (API 정렬 필드명)
+        expression: ORDER BY / WHERE에 쓸 컬럼 또는 SQL 표현식
+        descending: 내림차순 여부
+        getter: 조회된 행에서 값을 꺼내는 함수. 기본은 컬럼 이름으로 getattr.
+        nullable: NULL 가능 컬럼이면 True (NULL은 방향과 무관하게 항상 마지막)
+    """
+
+    name: str
+    expression: Any
+    descending: bool = True
+    getter: Callable[[Any], Any] | None = None
+    nullable: bool = False
+
+    def value_of(self, row: Any) -> Any:
+        if self.getter is not None:
+            return self.getter(row)
+        return getattr(row, self.expression.key)
+
+    def order_by(self):
+        clause = desc(self.expression) if self.descending else asc(self.expression)
+        return clause.nulls_last() if self.nullable else clause
+
+    def after(self, value: Any):
+        """이 키 기준으로 value 다음에 오는 행의 조건 (동률 제외)."""
+        if value is None:
+            # NULL은 마지막이므로 NULL 뒤에 오는 값은 없다
+            return false()
+        cond = self.expression < value if self.descending else self.expression > value
+        if self.nullable:
+            return or_(cond, self.expression.is_(None))
+        return cond
+
+    def tie(self, value: Any):
+        if value is None:
+            return self.expression.is_(None)
+        return self.expression == value
+
+
+def parse_sort_keys(
+    sort: str,
+    sort_map: dict[str, Any],
+    *,
+    nullable: set[str] | frozenset[str] = frozenset(),
+) -> list[SortKey]:
+    """"-createdAt,likeScore" 형식의 정렬 문자열을 SortKey 목록으로 바꾼다. 모르는 필드는 무시."""
+    keys: list[SortKey] = []
+    for token in [v.strip() for v in sort.split(",") if v.strip()]:
+        desc_mode = token.startswith("-")
+        name = token[1:] if desc_mode else token
+        column = sort_map.get(name)
+        if column is None:
+            continue
+        keys.append(SortKey(name, column, desc_mode, nullable=name in nullable))
+    return keys
+
+
+class KeysetPaginator:
+    """정렬 키 목록 + 고유 id로 keyset 페이지네이션을 수행한다.
+
+    offset 커서가 들어오면 OFFSET으로 해당 페이지를 찾고, 다음 커서부터는
+    keyset으로 이어준다 (클라이언트가 자연스럽게 keyset으로 옮겨 간다).
+    """
+
+    def __init__(self, keys: list[SortKey], tiebreaker: SortKey) -> None:
+        self.keys = [*keys, tiebreaker]
+
+    @property
+    def signature(self) -> str:
+        return ",".join(f"{'-' if k.descending else ''}{k.name}" for k in self.keys)
+
+    def where_after(self, values: list):
+        """(k1, k2, ..., id) > 커서 값 조건.
+
+        방향이 모두 같고 NULL이 없으면 행 값 비교 한 번으로 표현하고,
+        그렇지 않으면 (k1 > v1) OR (k1 = v1 AND k2 > v2) ... 로 풀어 쓴다.
+        """
+        uniform = len({k.descending for k in self.keys}) == 1
+        if uniform and not any(k.nullable for k in self.keys) and None not in values:
+            left = tuple_(*[k.expression for k in self.keys])
+            right = tuple_(*values)
+            return left < right if self.keys[0].descending else left > right
+
+        clauses = []
+        for i, key in enumerate(self.keys):
+            ties = [self.keys[j].tie(values[j]) for j in range(i)]
+            clauses.append(and_(*ties, key.after(values[i])) if ties else key.after(values[i]))
+        return or_(*clauses) if clauses else true()
+
+    def cursor_for(self, row: Any) -> str:
+        return encode_keyset_cursor(
+            [k.value_of(row) for k in self.keys], signature=self.signature
+        )
+
+    def paginate(
+        self,
+        db,
+        stmt,
+        *,
+        cursor: str | None,
+        size: int,
+        scalars: bool = True,
+    ) -> tuple[list, str | None]:
+        """stmt에 정렬/커서 조건을 붙여 한 페이지를 조회한다. (항목, 다음 커서) 반환."""
+        stmt = stmt.order_by(*[k.order_by() for k in self.keys])
+        values = decode_keyset_cursor(cursor, signature=self.signature)
+        if values is not None and len(values) == len(self.keys):
+            stmt = stmt.where(self.where_after(values))
+        elif cursor:
+            stmt = stmt.offset(decode_cursor(cursor))
+
+        result = db.execute(stmt.limit(size + 1))
+        rows = list(result.scalars().all() if scalars else result.all())
+        items = rows[:size]
+        next_cursor = self.cursor_for(items[-1]) if len(rows) > size and items else None
+        return items, next_cursor
@@ -1,9 +1,10 @@
+import json
 from datetime import datetime, timezone
 from typing import Any
 
 from fastapi import Request
 from fastapi.encoders import jsonable_encoder
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 
 
 def _timestamp() -> str:
@@ -40,6 +41,26 @@ def success_response(
     return JSONResponse(status_code=status_code, content=jsonable_encoder(payload))
 
 
+def raw_success_response(
+    *,
+    data: bytes,
+    request: Request | None,
+    status_code: int = 200,
+    message: str = "요청 성공",
+    extra: dict[str, Any] | None = None,
+) -> Response:
+    """이미 직렬화된 data(JSON bytes)를 다시 인코딩하지 않고 표준 봉투로 감싼다.
+
+    extra는 봉투 최상위에 덧붙일 필드 (예: 스냅샷 시각).
+    """
+    tail: dict[str, Any] = {"message": message, "timestamp": _timestamp(), **(extra or {})}
+    encoded_tail = json.dumps(
+        jsonable_encoder(tail), ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+    body = b'{"success":true,"data":' + data + b"," + encoded_tail[1:]
+    return Response(content=body, status_code=status_code, media_type="application/json")
+
+
 def error_response(
     *,
     code: str,
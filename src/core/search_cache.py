@@ -0,0 +1,247 @@
+"""검색 결과 캐시.
+
+속보 시점에는 같은 검색어가 분당 수천 번 들어오므로 ``SearchService.search``
+결과를 (정규화 검색어, 범위, 정렬, 페이지) 단위로 캐시한다.
+
+무효화는 엔티티별 쓰기 세대(generation) 카운터로 한다. 사건/이슈/게시글 쓰기
+경로가 세션에 ``mark_search_written``으로 표시해 두면 커밋 직후 해당 세대가
+올라가고, 캐시 키에 세대가 들어가므로 이전 결과는 다시 조회되지 않는다
+(남은 항목은 TTL/LRU로 정리된다). 커밋 후에 올리므로 커밋 전 데이터가 새 세대
+키로 캐시되는 경쟁이 없다. 같은 커밋 훅에서 Elasticsearch 검색 인덱스도 증분 반영한다.
+
+저장소는 Redis의 ``get``/``set``/``mget``/``incr`` 부분집합만 쓴다.
+``search_cache_url``을 지정하면 여러 API 워커가 Redis(호환) 서버를 공유하고,
+비우면 프로세스 내 ``LocalCacheBackend``를 쓴다 (테스트도 이 대체 구현 사용).
+로컬 저장소에서는 다른 프로세스(워커/cron)의 쓰기가 전파되지 않으므로 TTL까지
+지연될 수 있다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from functools import lru_cache
+from typing import Any, Protocol, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from src.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+KEY_PREFIX = "search"
+# 세션 info에 커밋 대기 중인 쓰기(엔티티 종류 → id 집합)를 모아 두는 키
+_WRITTEN_KEY = "search_cache_written"
+
+
+class CacheBackend(Protocol):
+    """Redis 클라이언트(redis.Redis)가 그대로 만족하는 최소 인터페이스."""
+
+    def get(self, name: str) -> bytes | None: ...
+
+    def mget(self, keys: list[str]) -> list[bytes | None]: ...
+
+    def set(self, name: str, value: bytes, ex: int | None = None) -> Any: ...
+
+    def incr(self, name: str) -> int: ...
+
+
+class LocalCacheBackend:
+    """프로세스 내 LRU + TTL 저장소. 세대 카운터는 LRU 축출 대상에서 제외한다."""
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float | None, bytes]] = OrderedDict()
+        self._counters: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> bytes | None:
+        with self._lock:
+            if name in self._counters:
+                return str(self._counters[name]).encode()
+            entry = self._entries.get(name)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[name]
+                return None
+            self._entries.move_to_end(name)
+            return value
+
+    def mget(self, keys: list[str]) -> list[bytes | None]:
+        return [self.get(key) for key in keys]
+
+    def set(self, name: str, value: bytes, ex: int | None = None) -> bool:
+        expires_at = time.monotonic() + ex if ex else None
+        with self._lock:
+            self._entries[name] = (expires_at, value)
+            self._entries.move_to_end(name)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return True
+
+    def incr(self, name: str) -> int:
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + 1
+            return self._counters[name]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._counters.clear()
+
+
+@lru_cache(maxsize=1)
+def get_cache_backend() -> CacheBackend:
+    """search_cache_url이 있으면 Redis(호환) 클라이언트, 없으면 로컬 저장소."""
+    settings = get_settings()
+    if settings.search_cache_url:
+        try:
+            import redis
+        except ImportError:
+            logger.warning("redis 패키지가 없어 로컬 검색 캐시를 사용합니다")
+        else:
+            return redis.Redis.from_url(settings.search_cache_url)
+    return LocalCacheBackend(settings.search_cache_max_entries)
+
+
+class SearchResultCache:
+    """쓰기 세대로 무효화되는 검색 결과 캐시. 적중률 지표는 프로세스 단위로 센다."""
+
+    def __init__(self, backend: CacheBackend | None = None) -> None:
+        self._backend = backend
+        self._hits = 0
+        self._misses = 0
+        self._errors = 0
+        self._lock = threading.Lock()
+
+    @property
+    def backend(self) -> CacheBackend:
+        if self._backend is None:
+            self._backend = get_cache_backend()
+        return self._backend
+
+    @staticmethod
+    def _generation_key(entity_type: str) -> str:
+        return f"{KEY_PREFIX}:gen:{entity_type}"
+
+    def _key(self, entity_types: list[str], params: dict) -> str:
+        generations = self.backend.mget([self._generation_key(t) for t in entity_types])
+        stamp = ".".join(str(int(value or 0)) for value in generations)
+        digest = hashlib.sha1(
+            json.dumps([entity_types, params], sort_keys=True, ensure_ascii=False).encode()
+        ).hexdigest()
+        return f"{KEY_PREFIX}:result:{stamp}:{digest}"
+
+    def _count(self, *, hit: bool = False, miss: bool = False, error: bool = False) -> None:
+        with self._lock:
+            self._hits += hit
+            self._misses += miss
+            self._errors += error
+
+    def get_or_load(self, *, entity_types: list[str], params: dict, loader: Callable[[], T]) -> T:
+        """캐시에 있으면 역직렬화해 반환하고, 없으면 loader 결과(JSON 직렬화 가능)를 저장한다.
+
+        저장소 장애 시에는 캐시 없이 loader 결과를 그대로 반환한다.
+        """
+        settings = get_settings()
+        if not settings.search_cache_enabled:
+            return loader()
+        try:
+            key = self._key(entity_types, params)
+            cached = self.backend.get(key)
+        except Exception:
+            logger.warning("검색 캐시 조회 실패", exc_info=True)
+            self._count(error=True)
+            return loader()
+
+        if cached is not None:
+            self._count(hit=True)
+            return json.loads(cached)
+
+        self._count(miss=True)
+        value = loader()
+        try:
+            self.backend.set(
+                key,
+                json.dumps(value, ensure_ascii=False).encode(),
+                ex=settings.search_cache_ttl_seconds,
+            )
+        except Exception:
+            logger.warning("검색 캐시 저장 실패", exc_info=True)
+            self._count(error=True)
+        return value
+
+    def bump(self, entity_types: Iterable[str]) -> None:
+        for entity_type in sorted(set(entity_types)):
+            try:
+                self.backend.incr(self._generation_key(entity_type))
+            except Exception:
+                logger.warning("검색 캐시 세대 갱신 실패: %s", entity_type, exc_info=True)
+                self._count(error=True)
+
+    def stats(self) -> dict:
+        with self._lock:
+            hits, misses, errors = self._hits, self._misses, self._errors
+        lookups = hits + misses
+        backend = self.backend
+        return {
+            "backend": "local" if isinstance(backend, LocalCacheBackend) else "redis",
+            "entries": len(backend) if isinstance(backend, LocalCacheBackend) else None,
+            "hits": hits,
+            "misses": misses,
+            "errors": errors,
+            "hitRatio": round(hits / lookups, 4) if lookups else 0.0,
+        }
+
+    def clear(self) -> None:
+        """지표와 (로컬 저장소면) 항목을 비운다. 테스트 격리용."""
+        with self._lock:
+            self._hits = self._misses = self._errors = 0
+        if isinstance(self._backend, LocalCacheBackend):
+            self._backend.clear()
+
+
+search_cache = SearchResultCache()
+
+
+def mark_search_written(db: Session, entity_type: str, entity_id: str) -> None:
+    """검색 대상 엔티티 쓰기를 표시한다.
+
+    세션 커밋 직후 해당 세대가 올라가고, Elasticsearch 검색 모드면 쓰인 문서가
+    인덱스에 반영된다.
+    """
+    db.info.setdefault(_WRITTEN_KEY, {}).setdefault(entity_type, set()).add(entity_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_written(session: Session) -> None:
+    written = session.info.pop(_WRITTEN_KEY, None)
+    if not written:
+        return
+    search_cache.bump(written)
+    if get_settings().search_es_enabled:
+        from src.utils.elasticsearch.content_index import sync_written_documents
+
+        try:
+            sync_written_documents(session.get_bind(), written)
+        except Exception:
+            # 색인 누락은 재색인 CLI로 복구한다. 커밋된 요청은 실패시키지 않는다.
+            logger.warning("검색 인덱스 증분 반영 실패", exc_info=True)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_written(session: Session) -> None:
+    session.info.pop(_WRITTEN_KEY, None)
@@ -1,5 +1,4 @@
 from src.core.exceptions import AppError
-from src.core.pagination import decode_cursor, encode_cursor
 from src.db.enums import VoteType
 from src.sql.community import CommunityRepository
 
@@ -50,13 +49,10 @@ class CommunityService:
         size: int,
         cursor: str | None,
     ) -> tuple[list[dict], str | None]:
-        offset = decode_cursor(cursor)
-        items, next_offset = self.repository.list_posts(
-            tab=tab, sort=sort, size=size, offset=offset
+        items, next_cursor = self.repository.list_posts(
+            tab=tab, sort=sort, size=size, cursor=cursor
         )
-        return [self._post_to_item(post) for post in items], encode_cursor(
-            next_offset
-        ) if next_offset is not None else None
+        return [self._post_to_item(post) for post in items], next_cursor
 
     def get_post(self, post_id: str) -> dict | None:
         post = self.repository.get_post(post_id)
@@ -128,13 +124,10 @@ class CommunityService:
         size: int,
         cursor: str | None,
     ) -> tuple[list[dict], str | None]:
-        offset = decode_cursor(cursor)
-        comments, next_offset = self.repository.list_comments(
-            post_id=post_id, size=size, offset=offset
+        comments, next_cursor = self.repository.list_comments(
+            post_id=post_id, size=size, cursor=cursor
         )
-        return [self._comment_to_item(comment) for comment in comments], encode_cursor(
-            next_offset
-        ) if next_offset is not None else None
+        return [self._comment_to_item(comment) for comment in comments], next_cursor
 
     def create_comment(
         self,
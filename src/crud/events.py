@@ -1,7 +1,6 @@
 from datetime import datetime, timezone
 
 from src.core.exceptions import AppError
-from src.core.pagination import decode_cursor, encode_cursor
 from src.sql.events import EventRepository
 
 
@@ -26,19 +25,16 @@ class EventService:
         from_at: datetime | None,
         to_at: datetime | None,
     ) -> tuple[list[dict], str | None]:
-        offset = decode_cursor(cursor)
-        items, next_offset = self.repository.list_events(
+        items, next_cursor = self.repository.list_events(
             size=size,
-            offset=offset,
+            cursor=cursor,
             sort=sort,
             importance=importance,
             verification_status=verification_status,
             from_at=from_at,
             to_at=to_at,
         )
-        return [self._to_item(event) for event in items], encode_cursor(
-            next_offset
-        ) if next_offset is not None else None
+        return self._to_items(items), next_cursor
 
     def get_event(self, event_id: str) -> dict | None:
         event = self.repository.get_event(event_id)
@@ -131,11 +127,10 @@ class EventService:
         cursor: str | None,
         sort: str,
     ) -> tuple[list[dict], str | None]:
-        offset = decode_cursor(cursor)
-        items, next_offset = self.repository.list_saved_events(
+        items, next_cursor = self.repository.list_saved_events(
             user_id=user_id,
             size=size,
-            offset=offset,
+            cursor=cursor,
             sort=sort,
         )
         saved_at_by_event = self.repository.list_saved_at_by_event_ids_for_user(
@@ -143,16 +138,21 @@ class EventService:
             event_ids=[event.id for event in items],
         )
 
-        payload = []
-        for event in items:
-            item = self._to_item(event)
+        payload = self._to_items(items)
+        for event, item in zip(items, payload):
             item["savedAt"] = self._to_iso(saved_at_by_event.get(event.id))
-            payload.append(item)
 
-        return payload, encode_cursor(next_offset) if next_offset is not None else None
+        return payload, next_cursor
+
+    def _to_items(self, events) -> list[dict]:
+        """목록 페이지의 출처를 한 번에 읽어 항목으로 변환한다."""
+        sources_by_event = self.repository.list_sources_by_event_ids([e.id for e in events])
+        return [self._build_item(event, sources_by_event.get(event.id, [])) for event in events]
 
     def _to_item(self, event) -> dict:
-        sources = self.repository.list_sources(event.id)
+        return self._to_items([event])[0]
+
+    def _build_item(self, event, sources) -> dict:
         return {
             "id": event.id,
             "occurredAt": self._to_iso(event.occurred_at),
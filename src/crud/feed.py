@@ -1,11 +1,51 @@
 """Feed 비즈니스 로직."""
 
+import threading
+import time
 from datetime import datetime
 
-from src.core.pagination import decode_cursor, encode_cursor
+from src.core.config import get_settings
+from src.db.enums import FeedInboxReason
 from src.sql.feed import FeedRepository
 
 
+class LatestSnapshotPointer:
+    """Top Stories 최신 스냅샷 시각의 프로세스 캐시.
+
+    랭킹 잡은 별도 프로세스(cron)에서 돌기 때문에 무효화 신호 없이 단순 TTL로 동작한다.
+    새 스냅샷은 ``feed_top_reload_seconds`` 주기로 재확인해 반영하고, 그 사이
+    ``/feed/top``은 포인터가 가리키는 스냅샷 한 번의 인덱스 조회로 끝난다.
+    """
+
+    def __init__(self) -> None:
+        self._calculated_at: datetime | None = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def is_fresh(self) -> bool:
+        if self._calculated_at is None:
+            return False
+        interval = get_settings().feed_top_reload_seconds
+        return time.monotonic() - self._checked_at < interval
+
+    def get(self, repository: FeedRepository) -> datetime | None:
+        if self.is_fresh():
+            return self._calculated_at
+        calculated_at = repository.get_latest_top_stories_at()
+        with self._lock:
+            self._calculated_at = calculated_at
+            self._checked_at = time.monotonic()
+        return calculated_at
+
+    def clear(self) -> None:
+        with self._lock:
+            self._calculated_at = None
+            self._checked_at = 0.0
+
+
+top_stories_pointer = LatestSnapshotPointer()
+
+
 class FeedService:
     def __init__(self, repository: FeedRepository) -> None:
         self.repository = repository
@@ -16,6 +56,31 @@ class FeedService:
             return None
         return dt.isoformat(timespec="milliseconds").replace("+00:00", "Z")
 
+    @classmethod
+    def to_feed_item(cls, row: dict) -> dict:
+        """피드 항목 응답 형식. ``/feed/live``와 ``/feed/stream``이 같이 쓴다."""
+        lfi = row["lfi"]
+        eu = row["eu"]
+        ra = row["ra"]
+        return {
+            "id": lfi.id,
+            "issueId": row["issue_id"],
+            "issueTitle": row["issue_title"],
+            "updateType": eu.update_type.value,
+            "updateScore": eu.update_score,
+            "feedType": lfi.feed_type.value,
+            "rankScore": lfi.rank_score,
+            "article": {
+                "title": ra.title,
+                "source": ra.source_name,
+                "publishedAt": cls._to_iso(ra.published_at),
+                "url": ra.original_url,
+            },
+            "majorReasons": eu.major_reasons or [],
+            "diffSummary": eu.diff_summary,
+            "createdAt": cls._to_iso(lfi.created_at),
+        }
+
     def list_live_feed(
         self,
         *,
@@ -24,27 +89,44 @@ class FeedService:
         size: int,
     ) -> tuple[list[dict], str | None]:
         """실시간 피드 목록 조회."""
-        offset = decode_cursor(cursor)
-        items, next_offset = self.repository.list_feed_items(
+        items, next_cursor = self.repository.list_feed_items(
             feed_type=feed_type,
-            offset=offset,
+            cursor=cursor,
+            limit=size,
+        )
+        return [self.to_feed_item(row) for row in items], next_cursor
+
+    def list_user_feed(
+        self,
+        *,
+        user_id: str,
+        cursor: str | None,
+        size: int,
+    ) -> tuple[list[dict], str | None]:
+        """개인 피드. 인박스 + 추적 중인 대형 이슈 업데이트(읽기 시 병합)."""
+        merged_issue_ids = self.repository.list_read_merged_issue_ids(
+            user_id=user_id, min_trackers=get_settings().feed_inbox_fanout_max_trackers
+        )
+        items, next_cursor = self.repository.list_user_feed(
+            user_id=user_id,
+            merged_issue_ids=merged_issue_ids,
+            cursor=cursor,
             limit=size,
         )
 
         payload = []
         for row in items:
-            lfi = row["lfi"]
             eu = row["eu"]
             ra = row["ra"]
+            reason = row["reason"] or FeedInboxReason.TRACKED_ISSUE
             payload.append(
                 {
-                    "id": lfi.id,
-                    "issueId": row["issue_id"],
+                    "updateId": eu.id,
+                    "reason": reason.value,
+                    "issueId": eu.issue_id,
                     "issueTitle": row["issue_title"],
                     "updateType": eu.update_type.value,
                     "updateScore": eu.update_score,
-                    "feedType": lfi.feed_type.value,
-                    "rankScore": lfi.rank_score,
                     "article": {
                         "title": ra.title,
                         "source": ra.source_name,
@@ -53,16 +135,18 @@ class FeedService:
                     },
                     "majorReasons": eu.major_reasons or [],
                     "diffSummary": eu.diff_summary,
-                    "createdAt": self._to_iso(lfi.created_at),
+                    "createdAt": self._to_iso(eu.created_at),
                 }
             )
 
-        next_cursor = encode_cursor(next_offset) if next_offset is not None else None
         return payload, next_cursor
 
     def list_top_stories(self, *, limit: int) -> tuple[list[dict], str | None]:
-        """Top Stories 조회."""
-        rows, calculated_at = self.repository.list_top_stories(limit=limit)
+        """Top Stories 조회. 최신 스냅샷 시각은 프로세스 캐시 포인터에서 읽는다."""
+        calculated_at = top_stories_pointer.get(self.repository)
+        if calculated_at is None:
+            return [], None
+        rows = self.repository.list_top_stories(calculated_at=calculated_at, limit=limit)
 
         payload = []
         for row in rows:
@@ -75,11 +159,11 @@ class FeedService:
                     "score": snapshot.score,
                     "recentUpdates": snapshot.recent_updates,
                     "trackedCount": snapshot.tracked_count,
-                    "lastUpdateAt": self._to_iso(row["last_update_at"]),
+                    "lastUpdateAt": self._to_iso(snapshot.last_update_at),
                 }
             )
 
-        return payload, calculated_at
+        return payload, self._to_iso(calculated_at)
 
     def list_issue_timeline(
         self,
@@ -89,10 +173,9 @@ class FeedService:
         size: int,
     ) -> tuple[list[dict], str | None]:
         """이슈 타임라인 조회."""
-        offset = decode_cursor(cursor)
-        items, next_offset = self.repository.list_issue_updates(
+        items, next_cursor = self.repository.list_issue_updates(
             issue_id=issue_id,
-            offset=offset,
+            cursor=cursor,
             limit=size,
         )
 
@@ -117,5 +200,4 @@ class FeedService:
                 }
             )
 
-        next_cursor = encode_cursor(next_offset) if next_offset is not None else None
         return payload, next_cursor
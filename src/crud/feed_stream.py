@@ -0,0 +1,313 @@
+"""실시간 피드 스트림 (``/feed/stream``, Server-Sent Events).
+
+``persist_results``가 새 ``LiveFeedItem`` id를 ``publish_feed_items``로 알리면
+워커 프로세스마다 하나인 ``FeedBroadcaster``가 항목을 한 번 조회해 구독자
+큐로 나눠 준다. 연결 수와 무관하게 DB 조회는 워커당 알림 배치마다 한 번이다.
+
+알림 경로(``feed_stream_source``):
+
+- ``listen``: PostgreSQL ``NOTIFY live_feed``. 파이프라인 프로세스의 커밋과 함께
+  전달되고, 각 워커의 리스너 스레드가 ``LISTEN``으로 받는다. 리스너 연결이
+  끊기면 마지막으로 전달한 (created_at, id) 워터마크부터 폴링으로 넘어간다.
+- ``poll``: ``feed_stream_poll_seconds``마다 워터마크 이후 항목을 조회한다.
+- ``local``: 같은 프로세스의 세션 커밋 훅에서 바로 전달한다 (SQLite 개발
+  환경과 테스트용 대체 구현). 다른 프로세스의 쓰기는 전달되지 않는다.
+
+``auto``(기본값)는 PostgreSQL이면 ``listen``, 아니면 ``local``이다.
+"""
+
+import asyncio
+import json
+import logging
+import threading
+from collections.abc import AsyncIterator, Awaitable, Callable
+from datetime import datetime, timezone
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from src.core.config import get_settings
+from src.crud.feed import FeedService
+from src.sql.feed import FEED_NOTIFY_CHANNEL, FeedRepository
+
+logger = logging.getLogger(__name__)
+
+# 세션 info에 커밋 대기 중인 피드 항목 id를 모아 두는 키 (local 경로)
+_PENDING_KEY = "feed_stream_pending"
+POLL_BATCH_SIZE = 500
+# LISTEN 대기 중 종료 신호를 확인하는 간격 (초)
+LISTEN_TIMEOUT_SECONDS = 1.0
+# 피드가 비어 있을 때의 폴링 워터마크
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def resolve_source(db: Session) -> str:
+    source = get_settings().feed_stream_source
+    if source != "auto":
+        return source
+    return "listen" if db.get_bind().dialect.name == "postgresql" else "local"
+
+
+def publish_feed_items(db: Session, item_ids: list[str]) -> None:
+    """새 피드 항목을 스트림에 알린다. 전달은 세션 커밋 이후에 일어난다."""
+    if not item_ids:
+        return
+    source = resolve_source(db)
+    if source == "listen":
+        FeedRepository(db).notify_feed_items(item_ids)
+    elif source == "local":
+        db.info.setdefault(_PENDING_KEY, []).extend(item_ids)
+    # poll: 폴링 스레드가 워터마크로 가져간다
+
+
+class FeedSubscription:
+    """연결 하나의 필터와 전달 큐. 큐는 구독한 이벤트 루프에서만 다룬다."""
+
+    def __init__(
+        self,
+        *,
+        feed_type: str | None,
+        issue_ids: set[str] | None,
+        queue_size: int,
+        loop: asyncio.AbstractEventLoop,
+    ) -> None:
+        self.feed_type = None if feed_type == "all" else feed_type
+        self.issue_ids = issue_ids
+        self.queue: asyncio.Queue[dict | None] = asyncio.Queue(maxsize=queue_size)
+        self.overflowed = False
+        self._loop = loop
+
+    def matches(self, item: dict) -> bool:
+        if self.feed_type is not None and item["feedType"] != self.feed_type:
+            return False
+        return self.issue_ids is None or item["issueId"] in self.issue_ids
+
+    def _deliver(self, items: list[dict]) -> None:
+        if self.overflowed:
+            return
+        for item in items:
+            try:
+                self.queue.put_nowait(item)
+            except asyncio.QueueFull:
+                # 느린 소비자는 끊는다. 클라이언트는 재연결 후 /feed/live로 따라잡는다.
+                self.overflowed = True
+                while not self.queue.empty():
+                    self.queue.get_nowait()
+                self.queue.put_nowait(None)
+                return
+
+    def offer(self, items: list[dict]) -> int:
+        """필터에 맞는 항목을 구독 루프로 넘긴다. 어느 스레드에서든 호출할 수 있다."""
+        matched = [item for item in items if self.matches(item)]
+        if matched:
+            self._loop.call_soon_threadsafe(self._deliver, matched)
+        return len(matched)
+
+
+class FeedBroadcaster:
+    """프로세스 단위 구독자 목록과 알림 리스너."""
+
+    def __init__(self) -> None:
+        self._subscriptions: set[FeedSubscription] = set()
+        self._published = 0
+        self._delivered = 0
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._session_factory: Callable[[], Session] | None = None
+        self._watermark: tuple[datetime, str] | None = None
+
+    def configure(self, session_factory: Callable[[], Session]) -> None:
+        """앱 시작 시 알림 경로를 정하고, listen/poll이면 리스너 스레드를 시작한다."""
+        self._session_factory = session_factory
+        with session_factory() as db:
+            source = resolve_source(db)
+        if source == "local" or self._thread is not None:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(
+            target=self._run, args=(source,), name="feed-stream", daemon=True
+        )
+        self._thread.start()
+
+    def subscribe(self, *, feed_type: str | None, issue_ids: set[str] | None) -> FeedSubscription:
+        """현재 이벤트 루프에 묶인 구독을 만든다."""
+        subscription = FeedSubscription(
+            feed_type=feed_type,
+            issue_ids=issue_ids,
+            queue_size=get_settings().feed_stream_queue_size,
+            loop=asyncio.get_running_loop(),
+        )
+        with self._lock:
+            self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: FeedSubscription) -> None:
+        with self._lock:
+            self._subscriptions.discard(subscription)
+
+    @property
+    def has_subscribers(self) -> bool:
+        return bool(self._subscriptions)
+
+    def publish(self, items: list[dict]) -> None:
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+            self._published += len(items)
+        delivered = 0
+        for subscription in subscriptions:
+            try:
+                delivered += subscription.offer(items)
+            except RuntimeError:
+                # 이벤트 루프가 이미 닫힌 연결
+                self.unsubscribe(subscription)
+        with self._lock:
+            self._delivered += delivered
+
+    def _publish_rows(self, rows: list[dict]) -> None:
+        if not rows:
+            return
+        last = rows[-1]["lfi"]
+        self._watermark = (last.created_at, last.id)
+        self.publish([FeedService.to_feed_item(row) for row in rows])
+
+    def dispatch(self, db: Session, item_ids: list[str]) -> int:
+        """id 목록을 한 번에 조회해 구독자에게 전달한다. 구독자가 없으면 조회하지 않는다."""
+        if not item_ids or not self.has_subscribers:
+            return 0
+        rows = FeedRepository(db).list_feed_items_by_ids(item_ids)
+        self._publish_rows(rows)
+        return len(rows)
+
+    def poll(self, db: Session) -> int:
+        """워터마크 이후 생성된 항목을 전달한다. 첫 호출은 워터마크만 잡는다."""
+        repository = FeedRepository(db)
+        if self._watermark is None:
+            self._watermark = repository.get_feed_watermark() or (EPOCH, "")
+            return 0
+        created_at, item_id = self._watermark
+        rows = repository.list_feed_items_after(
+            created_at=created_at, item_id=item_id, limit=POLL_BATCH_SIZE
+        )
+        if self.has_subscribers:
+            self._publish_rows(rows)
+        elif rows:
+            last = rows[-1]["lfi"]
+            self._watermark = (last.created_at, last.id)
+        return len(rows)
+
+    def _run(self, source: str) -> None:
+        # 폴링으로 넘어가도 리스너 시작 시점부터 이어받을 워터마크
+        try:
+            with self._session_factory() as db:
+                self.poll(db)
+        except Exception:
+            logger.warning("피드 워터마크 조회 실패", exc_info=True)
+        if source == "listen":
+            try:
+                self._listen()
+            except Exception:
+                logger.warning("피드 LISTEN 실패 — 폴링으로 전환", exc_info=True)
+        self._poll_loop()
+
+    def _listen(self) -> None:
+        import psycopg
+
+        with self._session_factory() as db:
+            url = db.get_bind().url
+        dsn = url.set(drivername="postgresql").render_as_string(hide_password=False)
+        with psycopg.connect(dsn, autocommit=True) as conn:
+            conn.execute(f"LISTEN {FEED_NOTIFY_CHANNEL}")
+            while not self._stopping.is_set():
+                for notify in conn.notifies(timeout=LISTEN_TIMEOUT_SECONDS):
+                    with self._session_factory() as db:
+                        self.dispatch(db, json.loads(notify.payload))
+                    if self._stopping.is_set():
+                        return
+
+    def _poll_loop(self) -> None:
+        interval = get_settings().feed_stream_poll_seconds
+        while not self._stopping.wait(interval):
+            try:
+                with self._session_factory() as db:
+                    self.poll(db)
+            except Exception:
+                logger.warning("피드 폴링 실패", exc_info=True)
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stopping.set()
+        self._thread.join()
+        self._thread = None
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "subscribers": len(self._subscriptions),
+                "published": self._published,
+                "delivered": self._delivered,
+                "dropped": sum(1 for s in self._subscriptions if s.overflowed),
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._subscriptions.clear()
+            self._published = 0
+            self._delivered = 0
+        self._watermark = None
+
+
+feed_broadcaster = FeedBroadcaster()
+
+
+def _format_event(item: dict) -> str:
+    data = json.dumps(item, ensure_ascii=False)
+    return f"id: {item['id']}\nevent: feed\ndata: {data}\n\n"
+
+
+async def sse_events(
+    *,
+    feed_type: str | None,
+    issue_ids: set[str] | None,
+    is_disconnected: Callable[[], Awaitable[bool]],
+) -> AsyncIterator[str]:
+    """구독 큐를 SSE 프레임으로 내보낸다. 대기 중에는 주기적으로 heartbeat 주석을 보낸다.
+
+    구독은 응답 본문이 시작될 때 만들고 스트림이 끝나면 해제한다. 본문이 시작되지
+    않은 응답은 구독을 남기지 않는다.
+    """
+    heartbeat = get_settings().feed_stream_heartbeat_seconds
+    subscription = feed_broadcaster.subscribe(feed_type=feed_type, issue_ids=issue_ids)
+    try:
+        yield "retry: 3000\n\n"
+        while True:
+            try:
+                item = await asyncio.wait_for(subscription.queue.get(), timeout=heartbeat)
+            except TimeoutError:
+                if await is_disconnected():
+                    return
+                yield ": keep-alive\n\n"
+                continue
+            if item is None:
+                return
+            yield _format_event(item)
+    finally:
+        feed_broadcaster.unsubscribe(subscription)
+
+
+@event.listens_for(Session, "after_commit")
+def _dispatch_pending(session: Session) -> None:
+    item_ids = session.info.pop(_PENDING_KEY, None)
+    if not item_ids or not feed_broadcaster.has_subscribers:
+        return
+    try:
+        with Session(bind=session.get_bind()) as db:
+            feed_broadcaster.dispatch(db, item_ids)
+    except Exception:
+        logger.warning("피드 스트림 전달 실패", exc_info=True)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,352 @@
+"""홈 위젯 조립과 사전 계산 스냅샷.
+
+홈 위젯 데이터는 스케줄러 잡(검색 랭킹, 이슈 랭킹, 뉴스 수집 등)이 돌 때만
+바뀐다. 잡/관리자 쓰기 직후 모든 위젯을 ``home_snapshots``에 저장하고,
+API 프로세스는 이를 항목별 직렬화 bytes로 메모리에 들고 있다가 쿼리 없이
+응답한다. 다른 프로세스(워커/cron)가 갱신한 스냅샷은
+``home_snapshot_reload_seconds`` 주기로 ``max(built_at)`` 한 번만 확인해 반영한다.
+"""
+
+import json
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy.orm import Session
+
+from src.core.config import get_settings
+from src.db.session import ReadSession
+from src.models.events import EventDailyCount
+from src.models.home import HomeSnapshot
+from src.sql.events import event_day
+from src.sql.home import HomeRepository
+
+# 위젯별 스냅샷 보관 개수 (= 각 엔드포인트 limit/days 최댓값)
+HOME_WIDGETS: dict[str, int] = {
+    "breaking-news": 20,
+    "hot-posts": 20,
+    "hot-posts-7d": 20,
+    "search-rankings": 20,
+    "search-rankings-weekly": 20,
+    "trending": 20,
+    "trending-7d": 20,
+    "timeline-minimap": 30,
+    "featured-news": 20,
+    "community-media": 20,
+}
+
+# 인기 게시글 집계 기간 → (작성 시각 기준 윈도우, 위젯)
+HOT_POST_PERIODS: dict[str, timedelta] = {"24h": timedelta(hours=24), "7d": timedelta(days=7)}
+HOT_POST_WIDGETS: dict[str, str] = {"24h": "hot-posts", "7d": "hot-posts-7d"}
+
+# 검색어 랭킹 집계 기간 → 위젯 (기간별 랭킹 스냅샷 시리즈)
+SEARCH_RANKING_WIDGETS: dict[str, str] = {
+    "daily": "search-rankings",
+    "weekly": "search-rankings-weekly",
+}
+
+# 트렌딩 집계 기간 → 위젯 (기간별 랭킹 스냅샷 시리즈)
+TRENDING_WIDGETS: dict[str, str] = {"24h": "trending", "7d": "trending-7d"}
+
+# 응답 data를 객체로 감싸는 위젯 (위젯 → 키)
+HOME_WIDGET_WRAP: dict[str, str] = {"timeline-minimap": "dates"}
+
+# 실행 후 홈 스냅샷을 다시 만드는 스케줄러 잡
+HOME_SNAPSHOT_JOBS = frozenset(
+    {"search_rankings", "issue_rankings", "news_collect", "community_hot_score"}
+)
+
+
+class HomeService:
+    def __init__(self, repository: HomeRepository) -> None:
+        self.repository = repository
+
+    @staticmethod
+    def _to_iso(dt: datetime | None) -> str | None:
+        if dt is None:
+            return None
+        return dt.isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+    def breaking_news(self, *, limit: int) -> list[dict]:
+        return [
+            {
+                "id": item.id,
+                "number": idx + 1,
+                "time": item.occurred_at.strftime("%H:%M"),
+                "title": item.title,
+                "summary": item.summary,
+                "tags": [],
+                "importance": item.importance.value,
+            }
+            for idx, item in enumerate(self.repository.list_breaking_news(limit=limit))
+        ]
+
+    def hot_posts(self, *, limit: int, period: str = "24h") -> list[dict]:
+        since = datetime.now(timezone.utc) - HOT_POST_PERIODS[period]
+        return [
+            {
+                "id": item.id,
+                "number": idx + 1,
+                "title": item.title,
+                "category": None,
+                "commentCount": item.comment_count,
+                "author": None,
+                "createdAt": self._to_iso(item.created_at),
+                "isHot": True,
+            }
+            for idx, item in enumerate(self.repository.list_hot_posts(since=since, limit=limit))
+        ]
+
+    def hot_posts_7d(self, *, limit: int) -> list[dict]:
+        return self.hot_posts(limit=limit, period="7d")
+
+    def search_rankings(self, *, limit: int, period: str = "daily") -> list[dict]:
+        return [
+            {
+                "rank": item.rank,
+                "keyword": item.keyword,
+                "count": item.score,
+                "change": self._rank_change(item.rank, item.previous_rank),
+            }
+            for item in self.repository.list_search_rankings(period=period, limit=limit)
+        ]
+
+    def search_rankings_weekly(self, *, limit: int) -> list[dict]:
+        return self.search_rankings(limit=limit, period="weekly")
+
+    @staticmethod
+    def _rank_change(rank: int, previous_rank: int | None) -> str:
+        if previous_rank is None:
+            return "new"
+        if previous_rank == rank:
+            return "-"
+        return f"{previous_rank - rank:+d}"
+
+    def trending(self, *, limit: int, period: str = "24h") -> list[dict]:
+        return [
+            {
+                "rank": snapshot.rank,
+                "issue": {
+                    "id": issue.id,
+                    "title": issue.title,
+                    "status": issue.status.value,
+                },
+                "relatedEventCount": snapshot.related_event_count,
+                "trackerCount": snapshot.tracked_count,
+                "change": self._rank_change(snapshot.rank, snapshot.previous_rank),
+            }
+            for snapshot, issue in self.repository.list_trending_issues(period=period, limit=limit)
+        ]
+
+    def trending_7d(self, *, limit: int) -> list[dict]:
+        return self.trending(limit=limit, period="7d")
+
+    @staticmethod
+    def _density(row: EventDailyCount | None) -> str:
+        if row is None or row.event_count <= 0:
+            return "none"
+        if row.high_count > 0 or row.event_count >= 5:
+            return "high"
+        if row.medium_count > 0 or row.event_count >= 2:
+            return "medium"
+        return "low"
+
+    @staticmethod
+    def _max_importance(row: EventDailyCount | None) -> str | None:
+        if row is None:
+            return None
+        for level in ("high", "medium", "low"):
+            if getattr(row, f"{level}_count") > 0:
+                return level
+        return None
+
+    def timeline_minimap(self, *, limit: int) -> list[dict]:
+        """오늘(Asia/Seoul)부터 limit일 전까지 날짜별 사건 밀도. 최신 날짜가 먼저, 빈 날은 0."""
+        today = event_day(datetime.now(timezone.utc))
+        rows = {
+            row.day: row
+            for row in self.repository.list_daily_counts(from_day=today - timedelta(days=limit - 1))
+        }
+        dates = []
+        for offset in range(limit):
+            day = today - timedelta(days=offset)
+            row = rows.get(day)
+            dates.append(
+                {
+                    "date": day.isoformat(),
+                    "eventCount": max(row.event_count, 0) if row else 0,
+                    "maxImportance": self._max_importance(row),
+                    "density": self._density(row),
+                }
+            )
+        return dates
+
+    def featured_news(self, *, limit: int) -> list[dict]:
+        return [
+            {
+                "id": item.id,
+                "author": None,
+                "authorImage": None,
+                "title": item.title,
+                "summary": item.summary,
+                "imageUrl": None,
+                "createdAt": self._to_iso(item.created_at),
+            }
+            for item in self.repository.list_featured_news(limit=limit)
+        ]
+
+    def community_media(self, *, limit: int) -> list[dict]:
+        return [
+            {
+                "id": item.id,
+                "title": item.title,
+                "imageUrl": None,
+                "viewCount": 0,
+                "createdAt": self._to_iso(item.created_at),
+            }
+            for item in self.repository.list_community_media_posts(limit=limit)
+        ]
+
+    def build_widget(self, widget: str, *, limit: int) -> list[dict]:
+        return getattr(self, widget.replace("-", "_"))(limit=limit)
+
+    def rebuild_snapshot(self) -> datetime:
+        """모든 위젯을 다시 계산해 저장한다. 커밋은 호출부 책임."""
+        built_at = datetime.now(timezone.utc)
+        widgets = {
+            widget: self.build_widget(widget, limit=limit) for widget, limit in HOME_WIDGETS.items()
+        }
+        self.repository.save_snapshots(widgets, built_at=built_at)
+        home_snapshot_mirror.invalidate()
+        return built_at
+
+
+def refresh_home_snapshot(db: Session) -> datetime:
+    """스케줄러 잡/관리자 쓰기 직후 홈 스냅샷을 갱신한다. 커밋은 호출부 책임."""
+    db.flush()
+    return HomeService(HomeRepository(db)).rebuild_snapshot()
+
+
+def _encode(item: dict) -> bytes:
+    return json.dumps(item, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _widget_body(widget: str, encoded_items: list[bytes]) -> bytes:
+    body = b"[" + b",".join(encoded_items) + b"]"
+    key = HOME_WIDGET_WRAP.get(widget)
+    return body if key is None else b'{"' + key.encode("utf-8") + b'":' + body + b"}"
+
+
+def _bundle_body(bodies: dict[str, bytes]) -> bytes:
+    """위젯별 본문을 {"breakingNews": ..., "hotPosts": ...} 객체로 묶는다."""
+    parts = []
+    for widget, body in bodies.items():
+        head, *rest = widget.split("-")
+        key = head + "".join(word.capitalize() for word in rest)
+        parts.append(b'"' + key.encode("utf-8") + b'":' + body)
+    return b"{" + b",".join(parts) + b"}"
+
+
+class HomeSnapshotMirror:
+    """home_snapshots의 프로세스 메모리 사본. 위젯 항목을 미리 직렬화해 둔다."""
+
+    def __init__(self) -> None:
+        self._items: dict[str, list[bytes]] = {}
+        self._built_at: datetime | None = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def is_fresh(self) -> bool:
+        if not self._items:
+            return False
+        interval = get_settings().home_snapshot_reload_seconds
+        return time.monotonic() - self._checked_at < interval
+
+    def load(self, snapshots: list[HomeSnapshot]) -> None:
+        items = {row.widget: [_encode(item) for item in row.payload] for row in snapshots}
+        built_at = max((row.built_at for row in snapshots), default=None)
+        with self._lock:
+            self._items = items
+            self._built_at = built_at
+            self._checked_at = time.monotonic()
+
+    def sync(self, repository: HomeRepository) -> bool:
+        """DB 스냅샷이 바뀌었을 때만 다시 읽는다. 스냅샷이 하나도 없으면 False."""
+        built_at = repository.get_snapshot_built_at()
+        if built_at is None:
+            self.clear()
+            return False
+        if self._items and built_at == self._built_at:
+            self._checked_at = time.monotonic()
+            return True
+        self.load(repository.list_snapshots())
+        return True
+
+    def render_bundle(
+        self, limits: dict[str, int]
+    ) -> tuple[dict[str, bytes], datetime | None] | None:
+        """여러 위젯을 같은 스냅샷 시점으로 렌더링한다. 하나라도 없으면 None."""
+        with self._lock:
+            items, built_at = self._items, self._built_at
+        if not all(widget in items for widget in limits):
+            return None
+        bodies = {
+            widget: _widget_body(widget, items[widget][:limit]) for widget, limit in limits.items()
+        }
+        return bodies, built_at
+
+    def invalidate(self) -> None:
+        self._checked_at = 0.0
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items = {}
+            self._built_at = None
+            self._checked_at = 0.0
+
+
+home_snapshot_mirror = HomeSnapshotMirror()
+
+
+def render_home_widgets(
+    db: Session, limits: dict[str, int]
+) -> tuple[dict[str, bytes], datetime | None]:
+    """메모리 사본이 오래됐을 때만 호출된다: 스냅샷을 동기화해 렌더링한다.
+
+    스냅샷이 아직 없으면(배포 직후 등) 위젯을 즉석 계산하고 스냅샷 시각은 None.
+    """
+    repository = HomeRepository(db)
+    if home_snapshot_mirror.sync(repository):
+        rendered = home_snapshot_mirror.render_bundle(limits)
+        if rendered is not None:
+            return rendered
+    service = HomeService(repository)
+    bodies = {
+        widget: _widget_body(
+            widget, [_encode(item) for item in service.build_widget(widget, limit=limit)]
+        )
+        for widget, limit in limits.items()
+    }
+    return bodies, None
+
+
+async def load_home_widgets(
+    db: ReadSession, limits: dict[str, int]
+) -> tuple[dict[str, bytes], datetime | None]:
+    """메모리 사본이 최신이면 DB 조회 없이, 아니면 세션 한 번으로 위젯 본문을 만든다."""
+    rendered = None
+    if home_snapshot_mirror.is_fresh():
+        rendered = home_snapshot_mirror.render_bundle(limits)
+    if rendered is None:
+        rendered = await db.run(lambda s: render_home_widgets(s, limits))
+    return rendered
+
+
+async def load_home_bundle(
+    db: ReadSession, limits: dict[str, int]
+) -> tuple[bytes, datetime | None]:
+    """/home/bundle 응답 data. limit이 0인 위젯은 제외한다."""
+    bodies, built_at = await load_home_widgets(
+        db, {widget: limit for widget, limit in limits.items() if limit > 0}
+    )
+    return _bundle_body(bodies), built_at
@@ -1,7 +1,6 @@
 from datetime import datetime, timezone
 
 from src.core.exceptions import AppError
-from src.core.pagination import decode_cursor, encode_cursor
 from src.sql.issues import IssueRepository
 
 
@@ -25,18 +24,15 @@ class IssueService:
         from_at: datetime | None,
         to_at: datetime | None,
     ) -> tuple[list[dict], str | None]:
-        offset = decode_cursor(cursor)
-        items, next_offset = self.repository.list_issues(
+        items, next_cursor = self.repository.list_issues(
             size=size,
-            offset=offset,
+            cursor=cursor,
             sort=sort,
             status=status,
             from_at=from_at,
             to_at=to_at,
         )
-        return [self._to_item(issue) for issue in items], encode_cursor(
-            next_offset
-        ) if next_offset is not None else None
+        return self._to_items(items), next_cursor
 
     def get_issue(self, issue_id: str) -> dict | None:
         issue = self.repository.get_issue(issue_id)
@@ -120,34 +116,26 @@ class IssueService:
         size: int,
         cursor: str | None,
     ) -> tuple[list[dict], str | None]:
-        offset = decode_cursor(cursor)
-        items, next_offset = self.repository.list_triggers(
-            issue_id=issue_id, size=size, offset=offset
+        items, next_cursor = self.repository.list_triggers(
+            issue_id=issue_id, size=size, cursor=cursor
         )
-        payload = []
-        for trigger in items:
-            sources = self.repository.list_trigger_sources(trigger.id)
-            payload.append(
-                {
-                    "id": trigger.id,
-                    "issueId": trigger.issue_id,
-                    "occurredAt": self._to_iso(trigger.occurred_at),
-                    "summary": trigger.summary,
-                    "type": trigger.type.value,
-                    "sources": [
-                        {
-                            "url": source.url,
-                            "title": source.title,
-                            "publisher": source.publisher,
-                            "publishedAt": self._to_iso(source.published_at),
-                        }
-                        for source in sources
-                    ],
-                    "createdAt": self._to_iso(trigger.created_at),
-                    "updatedAt": self._to_iso(trigger.updated_at),
-                }
-            )
-        return payload, encode_cursor(next_offset) if next_offset is not None else None
+        sources_by_trigger = self.repository.list_sources_by_trigger_ids(
+            [trigger.id for trigger in items]
+        )
+        payload = [
+            {
+                "id": trigger.id,
+                "issueId": trigger.issue_id,
+                "occurredAt": self._to_iso(trigger.occurred_at),
+                "summary": trigger.summary,
+                "type": trigger.type.value,
+                "sources": self._sources_to_items(sources_by_trigger.get(trigger.id, [])),
+                "createdAt": self._to_iso(trigger.created_at),
+                "updatedAt": self._to_iso(trigger.updated_at),
+            }
+            for trigger in items
+        ]
+        return payload, next_cursor
 
     def track_issue(self, *, user_id: str, issue_id: str) -> tuple[bool, str | None]:
         tracked = self.repository.track_for_user(user_id=user_id, issue_id=issue_id)
@@ -175,22 +163,14 @@ class IssueService:
             trigger_type=trigger_type,
         )
         self.repository.attach_sources_to_trigger(trigger_id=trigger.id, source_ids=source_ids)
-        sources = self.repository.list_trigger_sources(trigger.id)
+        sources = self.repository.list_sources_by_trigger_ids([trigger.id]).get(trigger.id, [])
         return {
             "id": trigger.id,
             "issueId": trigger.issue_id,
             "occurredAt": self._to_iso(trigger.occurred_at),
             "summary": trigger.summary,
             "type": trigger.type.value,
-            "sources": [
-                {
-                    "url": source.url,
-                    "title": source.title,
-                    "publisher": source.publisher,
-                    "publishedAt": self._to_iso(source.published_at),
-                }
-                for source in sources
-            ],
+            "sources": self._sources_to_items(sources),
         }
 
     def list_tracked_issues(
@@ -201,11 +181,10 @@ class IssueService:
         cursor: str | None,
         sort: str,
     ) -> tuple[list[dict], str | None]:
-        offset = decode_cursor(cursor)
-        items, next_offset = self.repository.list_tracked_issues(
+        items, next_cursor = self.repository.list_tracked_issues(
             user_id=user_id,
             size=size,
-            offset=offset,
+            cursor=cursor,
             sort=sort,
         )
         latest_by_issue = self.repository.list_latest_triggers_by_issue_ids(
@@ -235,10 +214,28 @@ class IssueService:
                 }
             )
 
-        return payload, encode_cursor(next_offset) if next_offset is not None else None
+        return payload, next_cursor
+
+    def _sources_to_items(self, sources) -> list[dict]:
+        return [
+            {
+                "url": source.url,
+                "title": source.title,
+                "publisher": source.publisher,
+                "publishedAt": self._to_iso(source.published_at),
+            }
+            for source in sources
+        ]
+
+    def _to_items(self, issues) -> list[dict]:
+        """목록 페이지의 출처를 한 번에 읽어 항목으로 변환한다."""
+        sources_by_issue = self.repository.list_sources_by_issue_ids([i.id for i in issues])
+        return [self._build_item(issue, sources_by_issue.get(issue.id, [])) for issue in issues]
 
     def _to_item(self, issue) -> dict:
-        sources = self.repository.list_sources(issue.id)
+        return self._to_items([issue])[0]
+
+    def _build_item(self, issue, sources) -> dict:
         return {
             "id": issue.id,
             "title": issue.title,
@@ -248,15 +245,7 @@ class IssueService:
             "triggers": [],
             "trackerCount": issue.tracker_count,
             "relatedEventIds": [],
-            "sources": [
-                {
-                    "url": source.url,
-                    "title": source.title,
-                    "publisher": source.publisher,
-                    "publishedAt": self._to_iso(source.published_at),
-                }
-                for source in sources
-            ],
+            "sources": self._sources_to_items(sources),
             "latestTriggerAt": self._to_iso(issue.latest_trigger_at),
             "createdAt": self._to_iso(issue.created_at),
             "updatedAt": self._to_iso(issue.updated_at),
@@ -3,7 +3,6 @@
 from datetime import datetime, timezone
 from uuid import uuid4
 
-from src.core.pagination import decode_cursor, encode_cursor
 from src.models.notification import Notification, UserAlertRule
 from src.sql.notification import NotificationRepository
 
@@ -70,15 +69,13 @@ class NotificationService:
         cursor: str | None,
         size: int,
     ) -> tuple[list[dict], str | None]:
-        offset = decode_cursor(cursor)
-        items, next_offset = self.repository.list_notifications(
+        items, next_cursor = self.repository.list_notifications(
             user_id=user_id,
-            offset=offset,
+            cursor=cursor,
             limit=size,
         )
 
         payload = [self._notification_to_dict(n) for n in items]
-        next_cursor = encode_cursor(next_offset) if next_offset is not None else None
         return payload, next_cursor
 
     def mark_read(self, *, notification_id: str, user_id: str) -> dict | None:
@@ -1,10 +1,20 @@
 from src.core.pagination import decode_cursor, encode_cursor
-from src.sql.search import SearchRepository
+from src.core.search_cache import SearchResultCache, search_cache
+from src.crud.search_query_log import SearchQueryLog, search_query_log
+from src.crud.search_suggest import suggestion_index
+from src.sql.search import SearchRepository, search_entity_types
 
 
 class SearchService:
-    def __init__(self, repository: SearchRepository) -> None:
+    def __init__(
+        self,
+        repository: SearchRepository,
+        cache: SearchResultCache = search_cache,
+        query_log: SearchQueryLog = search_query_log,
+    ) -> None:
         self.repository = repository
+        self.cache = cache
+        self.query_log = query_log
 
     def search(
         self,
@@ -14,19 +24,34 @@ class SearchService:
         sort: str,
         size: int,
         cursor: str | None,
-    ) -> tuple[list[dict], str | None, int]:
+    ) -> tuple[list[dict], str | None, int, dict[str, int]]:
         offset = decode_cursor(cursor)
-        items, next_offset, total_count = self.repository.search(
-            q=q,
-            entity_type=entity_type,
-            sort=sort,
-            size=size,
-            offset=offset,
+        # 다음 페이지 조회는 같은 검색의 연속이므로 첫 페이지만 검색어 로그에 남긴다
+        if offset == 0:
+            self.query_log.record(q)
+        # 검색은 대소문자를 구분하지 않으므로 앞뒤 공백 제거 + casefold로 키를 정규화
+        params = {"q": q.strip().casefold(), "sort": sort, "size": size, "offset": offset}
+        items, next_offset, total_count, type_counts = self.cache.get_or_load(
+            entity_types=search_entity_types(entity_type),
+            params=params,
+            loader=lambda: self.repository.search(
+                q=q,
+                entity_type=entity_type,
+                sort=sort,
+                size=size,
+                offset=offset,
+            ),
         )
-        return items, encode_cursor(next_offset) if next_offset is not None else None, total_count
+        next_cursor = encode_cursor(next_offset) if next_offset is not None else None
+        return items, next_cursor, total_count, type_counts
 
-    def suggestions(self, *, q: str, limit: int = 10) -> list[str]:
-        return self.repository.suggestions(q=q, limit=limit)
+    @staticmethod
+    def suggestions(*, q: str, limit: int = 10) -> list[str]:
+        """메모리 접두 색인에서 찾는다. DB 세션 없이 호출한다 (색인은 백그라운드 스레드가 갱신)."""
+        return suggestion_index.lookup(q, limit=limit)
 
     def rankings(self, *, limit: int = 10) -> list[dict]:
         return self.repository.rankings(limit=limit)
+
+    def cache_stats(self) -> dict:
+        return {**self.cache.stats(), "queryLog": self.query_log.stats()}
@@ -0,0 +1,219 @@
+"""검색어 쿼리 로그.
+
+``/search`` 요청은 정규화한 검색어를 메모리 버퍼(deque)에 넣기만 하고 바로
+응답한다. 백그라운드 flush 스레드가 ``search_query_log_flush_seconds``마다
+(또는 버퍼가 ``FLUSH_BATCH_SIZE``만큼 차면) 버퍼를 한 번에 비워 10분 버킷별
+Count-Min 스케치에 더하고, 스케치 추정치로 버킷의 상위 K개 검색어
+(heavy hitter)를 유지한다. 버킷이 닫히면 상위 K개만 ``search_query_buckets``에
+더해 넣고 버킷 상태를 버린다.
+
+메모리는 검색량과 무관하게 버퍼 크기 + 열린 버킷 수 × (스케치 폭 × 깊이 + K)로
+고정된다. 버퍼가 가득 차면 새 검색어는 버리고 dropped로 센다.
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from datetime import datetime, timezone
+
+from sqlalchemy.orm import Session
+
+from src.core.config import get_settings
+from src.sql.search import SearchRepository
+
+logger = logging.getLogger(__name__)
+
+# search_jobs.BUCKET과 같은 10분 버킷
+BUCKET_SECONDS = 600
+SKETCH_WIDTH = 2048
+SKETCH_DEPTH = 4
+FLUSH_BATCH_SIZE = 1000
+# search_query_buckets.query 컬럼 길이
+QUERY_MAX_LENGTH = 100
+
+
+def normalize_query(q: str) -> str:
+    """대소문자·공백 차이를 없앤 집계 키."""
+    return " ".join(q.casefold().split())[:QUERY_MAX_LENGTH]
+
+
+class CountMinSketch:
+    """깊이 × 폭 카운터 배열. 추정치는 실제 빈도 이상이며 총량/폭에 비례해 과대 추정된다."""
+
+    def __init__(self, width: int = SKETCH_WIDTH, depth: int = SKETCH_DEPTH) -> None:
+        self.width = width
+        self.depth = depth
+        self.rows = [[0] * width for _ in range(depth)]
+
+    def _columns(self, item: str) -> list[int]:
+        digest = hashlib.blake2b(item.encode(), digest_size=8 * self.depth).digest()
+        return [
+            int.from_bytes(digest[idx * 8 : idx * 8 + 8], "little") % self.width
+            for idx in range(self.depth)
+        ]
+
+    def add(self, item: str, count: int = 1) -> int:
+        """더한 뒤의 추정치를 반환한다."""
+        estimate = None
+        for row, column in zip(self.rows, self._columns(item)):
+            row[column] += count
+            estimate = row[column] if estimate is None else min(estimate, row[column])
+        return estimate
+
+    def estimate(self, item: str) -> int:
+        return min(row[column] for row, column in zip(self.rows, self._columns(item)))
+
+
+class HeavyHitters:
+    """스케치 추정치 기준 상위 capacity개 후보. 하한보다 큰 새 항목이 최솟값을 밀어낸다."""
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self.counts: dict[str, int] = {}
+
+    def offer(self, item: str, estimate: int) -> None:
+        if item in self.counts or len(self.counts) < self.capacity:
+            self.counts[item] = estimate
+            return
+        floor_item = min(self.counts, key=self.counts.__getitem__)
+        if estimate > self.counts[floor_item]:
+            del self.counts[floor_item]
+            self.counts[item] = estimate
+
+    def top(self) -> list[tuple[str, int]]:
+        return sorted(self.counts.items(), key=lambda pair: (-pair[1], pair[0]))
+
+
+class QueryBucket:
+    """10분 버킷 하나의 스케치와 상위 검색어."""
+
+    def __init__(self, top_k: int) -> None:
+        self.sketch = CountMinSketch()
+        self.heavy_hitters = HeavyHitters(top_k)
+
+    def add(self, query: str, count: int = 1) -> None:
+        self.heavy_hitters.offer(query, self.sketch.add(query, count))
+
+
+def bucket_start(timestamp: float) -> datetime:
+    return datetime.fromtimestamp(timestamp - timestamp % BUCKET_SECONDS, tz=timezone.utc)
+
+
+class SearchQueryLog:
+    """프로세스 단위 검색어 로그. record는 버퍼에 넣기만 한다."""
+
+    def __init__(self) -> None:
+        self._buffer: deque[tuple[float, str]] = deque()
+        self._buckets: dict[datetime, QueryBucket] = {}
+        self._dropped = 0
+        self._persisted = 0
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._session_factory: Callable[[], Session] | None = None
+
+    def record(self, q: str, *, at: float | None = None) -> None:
+        settings = get_settings()
+        if not settings.search_query_log_enabled:
+            return
+        query = normalize_query(q)
+        if not query:
+            return
+        if len(self._buffer) >= settings.search_query_log_buffer_size:
+            self._dropped += 1
+            return
+        self._buffer.append((at if at is not None else time.time(), query))
+        if len(self._buffer) >= FLUSH_BATCH_SIZE:
+            self._wake.set()
+
+    def _drain(self) -> None:
+        top_k = get_settings().search_query_log_top_k
+        while self._buffer:
+            at, query = self._buffer.popleft()
+            start = bucket_start(at)
+            bucket = self._buckets.get(start)
+            if bucket is None:
+                bucket = self._buckets[start] = QueryBucket(top_k)
+            bucket.add(query)
+
+    def _take_closed(self, now: float, *, include_open: bool) -> dict[datetime, QueryBucket]:
+        current = bucket_start(now)
+        closed = [start for start in self._buckets if include_open or start < current]
+        return {start: self._buckets.pop(start) for start in closed}
+
+    def flush(self, db: Session, *, now: float | None = None, include_open: bool = False) -> int:
+        """버퍼를 버킷 스케치에 반영하고 닫힌 버킷의 상위 검색어를 저장한다 (커밋은 호출자).
+
+        저장한 행 수를 반환한다. 저장에 실패한 버킷은 메모리 상한을 위해 버린다.
+        """
+        with self._lock:
+            self._drain()
+            closed = self._take_closed(
+                now if now is not None else time.time(), include_open=include_open
+            )
+        repository = SearchRepository(db)
+        persisted = 0
+        for start, bucket in sorted(closed.items()):
+            counts = dict(bucket.heavy_hitters.top())
+            repository.add_query_counts(bucket_start=start, counts=counts)
+            persisted += len(counts)
+        self._persisted += persisted
+        return persisted
+
+    def _flush_with_session(self, *, include_open: bool = False) -> None:
+        try:
+            with self._session_factory() as db:
+                self.flush(db, include_open=include_open)
+                db.commit()
+        except Exception:
+            logger.warning("검색어 로그 저장 실패", exc_info=True)
+
+    def _run(self, interval: int) -> None:
+        while not self._stopping.is_set():
+            self._wake.wait(interval)
+            self._wake.clear()
+            self._flush_with_session()
+
+    def start(self, session_factory: Callable[[], Session]) -> None:
+        """백그라운드 flush 스레드를 시작한다. flush 주기가 0이면 시작하지 않는다 (수동 flush)."""
+        interval = get_settings().search_query_log_flush_seconds
+        if interval <= 0 or self._thread is not None:
+            return
+        self._session_factory = session_factory
+        self._stopping.clear()
+        self._thread = threading.Thread(
+            target=self._run, args=(interval,), name="search-query-log", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """스레드를 멈추고 열린 버킷까지 저장한다 (종료 시 유실 최소화)."""
+        if self._thread is None:
+            return
+        self._stopping.set()
+        self._wake.set()
+        self._thread.join()
+        self._thread = None
+        self._flush_with_session(include_open=True)
+
+    def stats(self) -> dict:
+        return {
+            "buffered": len(self._buffer),
+            "openBuckets": len(self._buckets),
+            "dropped": self._dropped,
+            "persisted": self._persisted,
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._buffer.clear()
+            self._buckets.clear()
+            self._dropped = 0
+            self._persisted = 0
+
+
+search_query_log = SearchQueryLog()
@@ -0,0 +1,364 @@
+"""검색어 자동완성 접두 색인.
+
+타이핑마다 DB를 읽지 않도록 사건/이슈/게시글 제목과 최근 급상승 키워드
+(crawled_keywords)를 프로세스 메모리의 정렬 배열에 올려 두고 이분 탐색으로
+접두 일치를 찾는다. 키는 한글 음절을 자모로 분해한 문자열이라 입력 중인
+"트러"·"틀"도 "트럼프"에 일치하고, 초성만 입력한 "ㅌㄹ"은 초성 키로 찾는다.
+제목은 단어 시작 위치마다 키를 만들어 중간 단어로도 찾을 수 있다.
+
+백그라운드 스레드가 ``search_suggest_refresh_seconds`` 주기로 직전 갱신 이후
+바뀐 행만 읽어 점수가 바뀐 문자열의 키만 정렬 배열에 병합하고, 삭제를 반영하기
+위해 ``FULL_REBUILD_SECONDS``마다 전체 재구성한다. 요청은 DB에 접근하지 않는다.
+"""
+
+import heapq
+import logging
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy.orm import Session
+
+from src.core.config import get_settings
+from src.sql.search import SearchRepository
+
+logger = logging.getLogger(__name__)
+
+HANGUL_BASE = 0xAC00
+HANGUL_COUNT = 11172
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+JONGSEONG = ("", *"ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ")
+# 겹모음·겹받침은 키 입력 순서대로 풀어 입력 중간 상태와도 일치하게 한다
+COMPOUND_JAMO = str.maketrans(
+    {
+        "ㅘ": "ㅗㅏ",
+        "ㅙ": "ㅗㅐ",
+        "ㅚ": "ㅗㅣ",
+        "ㅝ": "ㅜㅓ",
+        "ㅞ": "ㅜㅔ",
+        "ㅟ": "ㅜㅣ",
+        "ㅢ": "ㅡㅣ",
+        "ㄳ": "ㄱㅅ",
+        "ㄵ": "ㄴㅈ",
+        "ㄶ": "ㄴㅎ",
+        "ㄺ": "ㄹㄱ",
+        "ㄻ": "ㄹㅁ",
+        "ㄼ": "ㄹㅂ",
+        "ㄽ": "ㄹㅅ",
+        "ㄾ": "ㄹㅌ",
+        "ㄿ": "ㄹㅍ",
+        "ㅀ": "ㄹㅎ",
+        "ㅄ": "ㅂㅅ",
+    }
+)
+_CHOSEONG_SET = frozenset(CHOSEONG)
+_KEY_END = "\U0010ffff"
+
+SUGGEST_MAX_LIMIT = 20
+# 이 길이 이하 접두는 상위 SUGGEST_MAX_LIMIT개를 미리 계산해 둔다 (범위가 넓은 접두)
+TOP_PREFIX_LEN = 2
+FULL_REBUILD_SECONDS = 3600
+# 바뀐 문자열이 이 비율을 넘으면 병합 대신 전체 재구성한다
+MERGE_MAX_CHANGED_RATIO = 0.25
+# 증분 갱신 워터마크 겹침 (늦게 커밋된 쓰기 보정)
+REFRESH_OVERLAP = timedelta(minutes=1)
+# 게시글 제목과 급상승 키워드는 최근 것만 올린다
+POST_TITLE_WINDOW = timedelta(days=30)
+KEYWORD_WINDOW = timedelta(hours=24)
+
+
+def decompose(text: str) -> str:
+    """소문자화 후 한글 음절을 (초성, 중성, 종성) 호환 자모로 분해한다."""
+    parts = []
+    for char in text.casefold():
+        code = ord(char) - HANGUL_BASE
+        if 0 <= code < HANGUL_COUNT:
+            parts.append(CHOSEONG[code // 588] + JUNGSEONG[code % 588 // 28] + JONGSEONG[code % 28])
+        else:
+            parts.append(char)
+    return "".join(parts).translate(COMPOUND_JAMO)
+
+
+def initials(text: str) -> str:
+    """한글 음절은 초성만 남긴 문자열 ("트럼프" → "ㅌㄹㅍ")."""
+    parts = []
+    for char in text.casefold():
+        code = ord(char) - HANGUL_BASE
+        parts.append(CHOSEONG[code // 588] if 0 <= code < HANGUL_COUNT else char)
+    return "".join(parts)
+
+
+def _is_initials_query(query: str) -> bool:
+    return any(char in _CHOSEONG_SET for char in query) and all(
+        char in _CHOSEONG_SET or char.isspace() for char in query
+    )
+
+
+def _word_starts(text: str) -> list[str]:
+    """제목 전체와 각 단어 시작 위치부터의 접미 문자열."""
+    words = text.split()
+    return [" ".join(words[idx:]) for idx in range(len(words))]
+
+
+def _rank(score: int, text: str) -> tuple[int, int, str]:
+    """인기순 정렬 키 (작을수록 상위)."""
+    return (-score, len(text), text)
+
+
+def _text_keys(text: str) -> list[tuple[bool, str]]:
+    """문자열 하나의 (초성 키 여부, 키) 목록."""
+    keys = []
+    for suffix in _word_starts(text):
+        keys.append((False, decompose(suffix)))
+        keys.append((True, initials(suffix)))
+    return keys
+
+
+def _prefixes(key: str) -> range:
+    return range(1, min(TOP_PREFIX_LEN, len(key)) + 1)
+
+
+@dataclass(frozen=True)
+class _Arrays:
+    """정렬 배열 묶음. entry 번호는 texts/ranks 위치이고 순위는 ranks로 비교한다."""
+
+    texts: list[str]
+    ranks: list[tuple[int, int, str]]
+    entry_of: dict[str, int]
+    keys: list[str]
+    key_entries: list[int]
+    initial_keys: list[str]
+    initial_entries: list[int]
+    top: dict[tuple[bool, str], list[int]] = field(default_factory=dict)
+
+    def sorted_keys(self, is_initial: bool) -> tuple[list[str], list[int]]:
+        if is_initial:
+            return self.initial_keys, self.initial_entries
+        return self.keys, self.key_entries
+
+    def top_entries(self, is_initial: bool, prefix: str) -> list[int]:
+        """접두 범위 안의 상위 SUGGEST_MAX_LIMIT개를 정렬 배열에서 다시 구한다."""
+        keys, key_entries = self.sorted_keys(is_initial)
+        lo = bisect_left(keys, prefix)
+        hi = bisect_left(keys, prefix + _KEY_END, lo)
+        return heapq.nsmallest(
+            SUGGEST_MAX_LIMIT, set(key_entries[lo:hi]), key=self.ranks.__getitem__
+        )
+
+
+def _build_arrays(scores: dict[str, int]) -> _Arrays:
+    texts = sorted(scores, key=lambda text: _rank(scores[text], text))
+    ranks = [_rank(scores[text], text) for text in texts]
+    pairs: dict[bool, list[tuple[str, int]]] = {False: [], True: []}
+    for entry, text in enumerate(texts):
+        for is_initial, key in _text_keys(text):
+            pairs[is_initial].append((key, entry))
+
+    top: dict[tuple[bool, str], set[int]] = {}
+    for is_initial, keyed in pairs.items():
+        keyed.sort()
+        for key, entry in keyed:
+            for length in _prefixes(key):
+                top.setdefault((is_initial, key[:length]), set()).add(entry)
+
+    return _Arrays(
+        texts=texts,
+        ranks=ranks,
+        entry_of={text: entry for entry, text in enumerate(texts)},
+        keys=[key for key, _ in pairs[False]],
+        key_entries=[entry for _, entry in pairs[False]],
+        initial_keys=[key for key, _ in pairs[True]],
+        initial_entries=[entry for _, entry in pairs[True]],
+        top={
+            prefix: heapq.nsmallest(SUGGEST_MAX_LIMIT, entries, key=ranks.__getitem__)
+            for prefix, entries in top.items()
+        },
+    )
+
+
+def _merge_arrays(
+    arrays: _Arrays, old_scores: dict[str, int], scores: dict[str, int]
+) -> _Arrays | None:
+    """점수가 바뀐 문자열만 기존 배열 사본에 병합한다. 바뀐 것이 많으면 None.
+
+    조회는 잠금 없이 이전 묶음을 읽으므로 배열은 복사한 뒤 고친다. 복사는 정렬·자모
+    분해 없는 메모리 복사라 전체 재구성보다 훨씬 싸다. 삭제된 문자열의 entry 자리는
+    다음 전체 재구성 때까지 비워 둔다.
+    """
+    changed = [text for text, score in scores.items() if old_scores.get(text) != score]
+    removed = [text for text in old_scores if text not in scores]
+    if not changed and not removed:
+        return arrays
+    if len(changed) + len(removed) > len(scores) * MERGE_MAX_CHANGED_RATIO:
+        return None
+
+    merged = _Arrays(
+        texts=list(arrays.texts),
+        ranks=list(arrays.ranks),
+        entry_of=dict(arrays.entry_of),
+        keys=list(arrays.keys),
+        key_entries=list(arrays.key_entries),
+        initial_keys=list(arrays.initial_keys),
+        initial_entries=list(arrays.initial_entries),
+        top=dict(arrays.top),
+    )
+    # 접두 → 상위 목록에 더할 entry. None이면 범위에서 다시 구한다 (순위 하락·삭제)
+    dirty: dict[tuple[bool, str], set[int] | None] = {}
+
+    def _touch(is_initial: bool, key: str, entry: int, *, lowered: bool) -> None:
+        for length in _prefixes(key):
+            prefix = (is_initial, key[:length])
+            if lowered:
+                if entry in merged.top.get(prefix, ()):
+                    dirty[prefix] = None
+            elif dirty.get(prefix, set()) is not None:
+                dirty.setdefault(prefix, set()).add(entry)
+
+    for text in removed:
+        entry = merged.entry_of.pop(text)
+        for is_initial, key in _text_keys(text):
+            keys, key_entries = merged.sorted_keys(is_initial)
+            lo = bisect_left(keys, key)
+            idx = key_entries.index(entry, lo, bisect_right(keys, key, lo))
+            del keys[idx], key_entries[idx]
+            _touch(is_initial, key, entry, lowered=True)
+
+    for text in changed:
+        rank = _rank(scores[text], text)
+        entry = merged.entry_of.get(text)
+        if entry is None:
+            entry = merged.entry_of[text] = len(merged.texts)
+            merged.texts.append(text)
+            merged.ranks.append(rank)
+            for is_initial, key in _text_keys(text):
+                keys, key_entries = merged.sorted_keys(is_initial)
+                idx = bisect_right(keys, key)
+                keys.insert(idx, key)
+                key_entries.insert(idx, entry)
+                _touch(is_initial, key, entry, lowered=False)
+        else:
+            lowered = rank > merged.ranks[entry]
+            merged.ranks[entry] = rank
+            for is_initial, key in _text_keys(text):
+                _touch(is_initial, key, entry, lowered=lowered)
+
+    for prefix, entries in dirty.items():
+        if entries is None:
+            top = merged.top_entries(*prefix)
+        else:
+            top = heapq.nsmallest(
+                SUGGEST_MAX_LIMIT,
+                set(merged.top.get(prefix, ())) | entries,
+                key=merged.ranks.__getitem__,
+            )
+        if top:
+            merged.top[prefix] = top
+        else:
+            merged.top.pop(prefix, None)
+    return merged
+
+
+class SuggestionIndex:
+    """프로세스 메모리 자동완성 색인. 조회는 잠금 없이 배열 묶음 하나만 읽는다."""
+
+    def __init__(self) -> None:
+        self._arrays: _Arrays | None = None
+        self._scores: dict[str, int] = {}
+        self._titles: dict[tuple[str, str], tuple[str, int]] = {}
+        self._watermark: datetime | None = None
+        self._rebuilt_at = 0.0
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._session_factory: Callable[[], Session] | None = None
+
+    def refresh(self, repository: SearchRepository, *, now: datetime | None = None) -> None:
+        """직전 워터마크 이후 바뀐 제목만 반영한다. 처음이거나 재구성 주기가 지나면 전체."""
+        with self._lock:
+            self._refresh(repository, now=now or datetime.now(timezone.utc))
+
+    def _refresh(self, repository: SearchRepository, *, now: datetime) -> None:
+        full = self._arrays is None or (time.monotonic() - self._rebuilt_at >= FULL_REBUILD_SECONDS)
+        since = None if full else self._watermark
+        titles = {} if full else dict(self._titles)
+        for entity_type, entity_id, title, popularity in repository.list_suggestion_titles(
+            since=since, post_since=now - POST_TITLE_WINDOW
+        ):
+            titles[(entity_type, entity_id)] = (title, popularity)
+        keywords = repository.trending_keyword_counts(since=now - KEYWORD_WINDOW)
+
+        scores: dict[str, int] = dict(keywords)
+        for title, popularity in titles.values():
+            scores[title] = scores.get(title, 0) + popularity
+        arrays = None if full else _merge_arrays(self._arrays, self._scores, scores)
+        if arrays is None:
+            arrays = _build_arrays(scores)
+        if full:
+            self._rebuilt_at = time.monotonic()
+
+        self._titles, self._scores, self._arrays = titles, scores, arrays
+        self._watermark = now - REFRESH_OVERLAP
+
+    def _refresh_with_session(self) -> None:
+        try:
+            with self._session_factory() as db:
+                self.refresh(SearchRepository(db))
+        except Exception:
+            logger.warning("자동완성 색인 갱신 실패", exc_info=True)
+
+    def _run(self, interval: int) -> None:
+        self._refresh_with_session()
+        while not self._stopping.wait(interval):
+            self._refresh_with_session()
+
+    def start(self, session_factory: Callable[[], Session]) -> None:
+        """백그라운드 갱신 스레드를 시작한다. 갱신 주기가 0이면 시작하지 않는다 (수동 refresh)."""
+        interval = get_settings().search_suggest_refresh_seconds
+        if interval <= 0 or self._thread is not None:
+            return
+        self._session_factory = session_factory
+        self._stopping.clear()
+        self._thread = threading.Thread(
+            target=self._run, args=(interval,), name="search-suggest", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stopping.set()
+        self._thread.join()
+        self._thread = None
+
+    def lookup(self, prefix: str, *, limit: int = 10) -> list[str]:
+        arrays = self._arrays
+        query = " ".join(prefix.casefold().split())
+        if arrays is None or not query:
+            return []
+        limit = min(limit, SUGGEST_MAX_LIMIT)
+
+        is_initial = _is_initials_query(query)
+        key = query if is_initial else decompose(query)
+        if len(key) <= TOP_PREFIX_LEN:
+            entries = arrays.top.get((is_initial, key), [])[:limit]
+        else:
+            keys, key_entries = arrays.sorted_keys(is_initial)
+            lo = bisect_left(keys, key)
+            hi = bisect_left(keys, key + _KEY_END, lo)
+            entries = heapq.nsmallest(limit, set(key_entries[lo:hi]), key=arrays.ranks.__getitem__)
+        return [arrays.texts[entry] for entry in entries]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._arrays = None
+            self._scores = {}
+            self._titles = {}
+            self._watermark = None
+            self._rebuilt_at = 0.0
+
+
+suggestion_index = SuggestionIndex()
@@ -0,0 +1,121 @@
+"""뉴스 요약 비즈니스 로직."""
+
+from datetime import datetime, timezone
+
+from src.models.news_summary import NewsKeywordSummary, NewsSummaryBatch
+from src.sql.summaries import SummaryRepository
+
+LATEST_SNAPSHOT_KEY = "latest"
+
+
+class SummaryService:
+    def __init__(self, repository: SummaryRepository) -> None:
+        self.repository = repository
+
+    @staticmethod
+    def _to_iso(dt: datetime | None) -> str | None:
+        if dt is None:
+            return None
+        return dt.isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+    @staticmethod
+    def _aggregate_tags(summary: NewsKeywordSummary) -> list[str]:
+        """키워드 요약의 태그를 대소문자 무시 중복 제거 후 등록 순서대로 반환한다."""
+        seen: set[str] = set()
+        tags: list[str] = []
+        for tag in summary.tags:
+            key = tag.tag.strip().lower()
+            if key and key not in seen:
+                seen.add(key)
+                tags.append(tag.tag.strip())
+        return tags
+
+    def _summary_to_item(self, summary: NewsKeywordSummary) -> dict:
+        return {
+            "id": summary.id,
+            "batchId": summary.batch_id,
+            "keyword": summary.keyword,
+            "summary": summary.summary,
+            "keyPoints": summary.key_points or [],
+            "sentiment": summary.sentiment,
+            "category": summary.category,
+            "articleCount": summary.article_count,
+            "tags": self._aggregate_tags(summary),
+            "articles": summary.articles or [],
+            "createdAt": self._to_iso(summary.created_at),
+        }
+
+    def _batch_to_item(self, batch: NewsSummaryBatch) -> dict:
+        return {
+            "id": batch.id,
+            "provider": batch.provider,
+            "model": batch.model,
+            "totalKeywords": batch.total_keywords,
+            "totalArticles": batch.total_articles,
+            "summarizedAt": self._to_iso(batch.summarized_at),
+        }
+
+    def build_batch_payload(self, batch: NewsSummaryBatch) -> dict:
+        """배치 1건을 키워드 요약 목록이 포함된 응답 payload로 만든다."""
+        return {
+            "batch": self._batch_to_item(batch),
+            "items": [self._summary_to_item(s) for s in batch.summaries],
+        }
+
+    def refresh_latest_snapshot(self, batch: NewsSummaryBatch) -> bool:
+        """최신 배치 스냅샷을 갱신한다. 더 최신 배치가 이미 반영돼 있으면 건너뛴다.
+
+        커밋은 호출부 책임 (배치 저장과 같은 트랜잭션).
+        """
+        current = self.repository.get_snapshot(LATEST_SNAPSHOT_KEY)
+        if current is not None and current.summarized_at.replace(
+            tzinfo=None
+        ) > batch.summarized_at.replace(tzinfo=None):
+            return False
+        self.repository.upsert_snapshot(
+            key=LATEST_SNAPSHOT_KEY,
+            batch_id=batch.id,
+            payload=self.build_batch_payload(batch),
+            summarized_at=batch.summarized_at,
+            refreshed_at=datetime.now(timezone.utc),
+        )
+        return True
+
+    def get_latest(self, *, category: str | None = None) -> dict | None:
+        """최신 배치 요약. 스냅샷이 없으면(마이그레이션 직후 등) 최신 배치에서 계산한다."""
+        snapshot = self.repository.get_snapshot(LATEST_SNAPSHOT_KEY)
+        if snapshot is not None:
+            payload = dict(snapshot.payload)
+            payload["refreshedAt"] = self._to_iso(snapshot.refreshed_at)
+        else:
+            batch = self.repository.get_latest_batch()
+            if batch is None:
+                return None
+            payload = self.build_batch_payload(batch)
+            payload["refreshedAt"] = None
+
+        if category:
+            payload["items"] = [i for i in payload["items"] if i["category"] == category]
+        return payload
+
+    def get_batch(self, batch_id: str) -> dict | None:
+        batch = self.repository.get_batch(batch_id)
+        if batch is None:
+            return None
+        return self.build_batch_payload(batch)
+
+    def list_batches(self, *, cursor: str | None, size: int) -> tuple[list[dict], str | None]:
+        rows, next_cursor = self.repository.list_batches(cursor=cursor, limit=size)
+        return [self._batch_to_item(b) for b in rows], next_cursor
+
+    def list_keyword_history(
+        self,
+        *,
+        keyword: str,
+        cursor: str | None,
+        size: int,
+    ) -> tuple[list[dict], str | None]:
+        rows, next_cursor = self.repository.list_keyword_history(
+            keyword=keyword, cursor=cursor, limit=size
+        )
+        return [self._summary_to_item(s) for s in rows], next_cursor
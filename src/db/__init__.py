@@ -2,8 +2,9 @@ from src.db.base import Base
 
 from src.models.auth import RefreshToken
 from src.models.community import Comment, CommentLike, Post, PostVote, post_tags
-from src.models.events import Event, event_tags, user_saved_events
-from src.models.feed import EventUpdate, LiveFeedItem
+from src.models.events import Event, EventDailyCount, event_tags, user_saved_events
+from src.models.feed import EventUpdate, FeedInboxItem, LiveFeedItem
+from src.models.home import HomeSnapshot
 from src.models.issues import (
     Issue,
     IssueKeywordAlias,
@@ -13,7 +14,13 @@ from src.models.issues import (
     issue_tags,
     user_tracked_issues,
 )
-from src.models.news_summary import NewsSummaryBatch, NewsKeywordSummary, NewsSummaryTag
+from src.models.news_summary import (
+    NewsKeywordSummary,
+    NewsSummaryBatch,
+    NewsSummaryCache,
+    NewsSummarySnapshot,
+    NewsSummaryTag,
+)
 from src.models.notification import Notification, UserAlertRule
 from src.models.pipeline import (
     CrawledKeyword,
@@ -23,7 +30,7 @@ from src.models.pipeline import (
     RawArticle,
 )
 from src.models.scheduler import JobRun
-from src.models.search import SearchRanking
+from src.models.search import SearchQueryBucket, SearchRanking, SearchTokenBucket
 from src.models.sources import NewsChannel, Source
 from src.models.subscription import KeywordMatch, KeywordSubscription
 from src.models.tags import Tag
@@ -37,6 +44,7 @@ __all__ = [
     "RefreshToken",
     "Tag",
     "Event",
+    "EventDailyCount",
     "Issue",
     "IssueKeywordState",
     "IssueKeywordAlias",
@@ -49,12 +57,16 @@ __all__ = [
     "Source",
     "NewsChannel",
     "SearchRanking",
+    "SearchTokenBucket",
+    "SearchQueryBucket",
     "JobRun",
     "CrawledKeyword",
     "KeywordIntersection",
     "NewsSummaryBatch",
     "NewsKeywordSummary",
     "NewsSummaryTag",
+    "NewsSummaryCache",
+    "NewsSummarySnapshot",
     "event_tags",
     "issue_tags",
     "issue_events",
@@ -66,6 +78,8 @@ __all__ = [
     "RawArticle",
     "EventUpdate",
     "LiveFeedItem",
+    "FeedInboxItem",
+    "HomeSnapshot",
     "UserAlertRule",
     "Notification",
     "KeywordSubscription",
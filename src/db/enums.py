@@ -80,6 +80,11 @@ class FeedType(str, Enum):
     ALL = "all"
 
 
+class FeedInboxReason(str, Enum):
+    TRACKED_ISSUE = "tracked_issue"
+    KEYWORD = "keyword"
+
+
 class NotificationType(str, Enum):
     MAJOR_UPDATE = "major_update"
     TRIGGER_UPDATE = "trigger_update"
@@ -1,15 +1,23 @@
-from collections.abc import Generator
+from collections.abc import Callable, Generator
+from typing import TypeVar
 
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
+from starlette.concurrency import run_in_threadpool
 
 from src.core.config import get_settings
 
+T = TypeVar("T")
+
 settings = get_settings()
 
 engine = create_engine(settings.database_url, pool_pre_ping=True)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# async 엔진은 db_async_enabled일 때 첫 요청에서 생성 (sync 전용 배포/테스트에 영향 없음)
+_async_sessionmaker: async_sessionmaker[AsyncSession] | None = None
+
 
 def get_db() -> Generator[Session, None, None]:
     db = SessionLocal()
@@ -17,3 +25,39 @@ def get_db() -> Generator[Session, None, None]:
         yield db
     finally:
         db.close()
+
+
+def get_async_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    global _async_sessionmaker
+    if _async_sessionmaker is None:
+        async_engine = create_async_engine(
+            settings.async_database_url or settings.database_url,
+            pool_pre_ping=True,
+            pool_size=settings.db_async_pool_size,
+            max_overflow=settings.db_async_max_overflow,
+        )
+        _async_sessionmaker = async_sessionmaker(
+            async_engine, autoflush=False, expire_on_commit=False
+        )
+    return _async_sessionmaker
+
+
+class ReadSession:
+    """읽기 전용 엔드포인트용 세션 핸들.
+
+    sync 리포지토리 코드를 그대로 재사용한다. AsyncSession이면 ``run_sync``로
+    greenlet 위에서 실행되어 쿼리 대기 중 이벤트 루프를 막지 않고 스레드도
+    점유하지 않는다. sync Session이면 요청당 한 번 스레드풀에서 실행한다.
+    """
+
+    def __init__(self, session: Session | AsyncSession) -> None:
+        self.session = session
+
+    @property
+    def is_async(self) -> bool:
+        return isinstance(self.session, AsyncSession)
+
+    async def run(self, fn: Callable[[Session], T]) -> T:
+        if isinstance(self.session, AsyncSession):
+            return await self.session.run_sync(fn)
+        return await run_in_threadpool(fn, self.session)
@@ -10,14 +10,18 @@ from src.api.v1.feed import router as feed_router
 from src.core.config import get_settings
 from src.core.logging import configure_logging
 from src.core.response import success_response
+from src.crud.feed_stream import feed_broadcaster
+from src.crud.search_query_log import search_query_log
+from src.crud.search_suggest import suggestion_index
 from src.db import Base
-from src.db.session import engine
+from src.db.session import SessionLocal, engine
 from src.api.v1.events import router as events_router
 from src.api.v1.home import router as home_router
 from src.api.v1.issues import router as issues_router
 from src.api.v1.search import router as search_router
 from src.utils.error_handlers import register_exception_handlers
 from src.api.v1.sources import router as sources_router
+from src.api.v1.summaries import router as summaries_router
 from src.api.v1.tags import router as tags_router
 from src.api.v1.tracking import router as tracking_router
 from src.api.v1.triggers import router as triggers_router
@@ -30,7 +34,13 @@ settings = get_settings()
 async def lifespan(_: FastAPI):
     if settings.auto_create_tables:
         Base.metadata.create_all(bind=engine)
+    search_query_log.start(SessionLocal)
+    suggestion_index.start(SessionLocal)
+    feed_broadcaster.configure(SessionLocal)
     yield
+    feed_broadcaster.stop()
+    suggestion_index.stop()
+    search_query_log.stop()
 
 
 app = FastAPI(
@@ -103,6 +113,7 @@ app = FastAPI(
         {"name": "sources", "description": "출처 · 출처 목록 조회, 관리자 등록/삭제"},
         {"name": "triggers", "description": "트리거 · 트리거 수정/삭제 (관리자 전용)"},
         {"name": "feed", "description": "피드 · 실시간 뉴스 업데이트 피드"},
+        {"name": "summaries", "description": "요약 · 최신 뉴스 키워드 요약, 배치/키워드 이력"},
     ],
     servers=[{"url": "/", "description": "현재 서버"}],
     license_info={"name": "Private"},
@@ -152,6 +163,7 @@ app.include_router(tags_router, prefix=settings.api_v1_prefix)
 app.include_router(sources_router, prefix=settings.api_v1_prefix)
 app.include_router(triggers_router, prefix=settings.api_v1_prefix)
 app.include_router(feed_router, prefix=settings.api_v1_prefix)
+app.include_router(summaries_router, prefix=settings.api_v1_prefix)
 
 
 def run() -> None:
@@ -7,7 +7,9 @@ from sqlalchemy import (
     Boolean,
     Column,
     DateTime,
+    Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Table,
@@ -17,6 +19,7 @@ from sqlalchemy import (
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.db.base import Base
+from src.models.search import attach_search_vector
 
 if TYPE_CHECKING:
     from src.models.users import User
@@ -31,6 +34,7 @@ post_tags = Table(
 
 class Post(Base):
     __tablename__ = "posts"
+    __table_args__ = (Index("ix_posts_hot_score", "hot_score", "id"),)
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True)
     author_id: Mapped[str] = mapped_column(
@@ -42,6 +46,8 @@ class Post(Base):
     like_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     dislike_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     comment_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # 시간 감쇠 인기 점수. 추천/댓글 쓰기 시 갱신, community_hot_score 잡이 주기적으로 감쇠 반영
+    hot_score: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, index=True
     )
@@ -50,6 +56,9 @@ class Post(Base):
     author: Mapped["User"] = relationship("User", lazy="joined")
 
 
+attach_search_vector(Post.__table__, "title", "content")
+
+
 class Comment(Base):
     __tablename__ = "comments"
 
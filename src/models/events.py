@@ -1,10 +1,11 @@
-from datetime import datetime
+from datetime import date, datetime
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Table, Text
+from sqlalchemy import Column, Date, DateTime, ForeignKey, Integer, String, Table, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.db.base import Base, ValueEnum
 from src.db.enums import Importance, VerificationStatus
+from src.models.search import attach_search_vector
 
 event_tags = Table(
     "event_tags",
@@ -38,5 +39,26 @@ class Event(Base):
         default=VerificationStatus.UNVERIFIED,
     )
     source_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, index=True
+    )
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+
+attach_search_vector(Event.__table__, "title", "summary")
+
+
+class EventDailyCount(Base):
+    """사건 일별 집계 롤업 (Asia/Seoul 기준 날짜).
+
+    사건 생성/수정/삭제 시 EventRepository가 증분 갱신한다. 타임라인 미니맵은
+    사건 수와 무관하게 기간 일수만큼의 행만 읽는다.
+    """
+
+    __tablename__ = "event_daily_counts"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    event_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    high_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    medium_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    low_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
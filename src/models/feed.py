@@ -3,6 +3,7 @@
 테이블 구조:
   event_updates   — 기사별 분류 결과 (NEW/MINOR_UPDATE/MAJOR_UPDATE/DUP)
   live_feed_items — 피드 노출용 사전 계산된 항목 (breaking/major/all)
+  feed_inbox_items — 사용자별 개인 피드 (추적 이슈·구독 키워드 업데이트 fan-out)
 """
 
 from datetime import datetime
@@ -11,7 +12,7 @@ from sqlalchemy import DateTime, Float, ForeignKey, Index, JSON, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.db.base import Base, ValueEnum
-from src.db.enums import FeedType, UpdateType
+from src.db.enums import FeedInboxReason, FeedType, UpdateType
 
 
 class EventUpdate(Base):
@@ -52,6 +53,8 @@ class LiveFeedItem(Base):
             "rank_score",
             "created_at",
         ),
+        # 피드 스트림 폴링의 (created_at, id) 워터마크 조회
+        Index("ix_lfi_created_id", "created_at", "id"),
     )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True)
@@ -70,3 +73,23 @@ class LiveFeedItem(Base):
     feed_type: Mapped[FeedType] = mapped_column(ValueEnum(FeedType), nullable=False)
     rank_score: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+
+class FeedInboxItem(Base):
+    """개인 피드 항목. 업데이트 저장 시 추적자/구독자별로 미리 써 둔다 (fan-out-on-write).
+
+    created_at은 원본 업데이트 시각이라 읽기 시 병합하는 대형 이슈 업데이트와 같은
+    기준으로 정렬된다.
+    """
+
+    __tablename__ = "feed_inbox_items"
+    __table_args__ = (Index("ix_fii_user_created", "user_id", "created_at", "update_id"),)
+
+    user_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    update_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("event_updates.id", ondelete="CASCADE"), primary_key=True
+    )
+    reason: Mapped[FeedInboxReason] = mapped_column(ValueEnum(FeedInboxReason), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
@@ -0,0 +1,20 @@
+from datetime import datetime
+
+from sqlalchemy import JSON, DateTime, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.db.base import Base
+
+
+class HomeSnapshot(Base):
+    """홈 위젯 사전 계산 스냅샷 (위젯당 1행).
+
+    스케줄러 잡/관리자 쓰기 직후 모든 위젯을 한 번에 다시 만들어 같은
+    built_at으로 저장한다. payload는 응답 data 그대로의 항목 목록이다.
+    """
+
+    __tablename__ = "home_snapshots"
+
+    widget: Mapped[str] = mapped_column(String(50), primary_key=True)
+    payload: Mapped[list] = mapped_column(JSON, nullable=False)
+    built_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
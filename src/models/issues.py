@@ -15,6 +15,7 @@ from sqlalchemy.orm import Mapped, mapped_column
 
 from src.db.base import Base, ValueEnum
 from src.db.enums import IssueStatus, KeywordLinkStatus
+from src.models.search import attach_search_vector
 
 issue_tags = Table(
     "issue_tags",
@@ -51,7 +52,12 @@ class Issue(Base):
         DateTime(timezone=True), nullable=True, index=True
     )
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
-    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, index=True
+    )
+
+
+attach_search_vector(Issue.__table__, "title", "description")
 
 
 class IssueKeywordState(Base):
@@ -95,6 +101,12 @@ class IssueKeywordAlias(Base):
 
 
 class IssueRankSnapshot(Base):
+    """이슈 랭킹 스냅샷. 집계 기간(period)별로 별도 시리즈를 쌓는다.
+
+    related_event_count, previous_rank, last_update_at은 스냅샷 계산 시점에 저장해
+    트렌딩/Top Stories 조회가 최신 스냅샷 한 번의 인덱스 조회로 끝나게 한다.
+    """
+
     __tablename__ = "issue_rank_snapshots"
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True)
@@ -106,7 +118,11 @@ class IssueRankSnapshot(Base):
     recent_updates: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     tracked_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     saved_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    period: Mapped[str] = mapped_column(String(8), nullable=False, default="24h")
+    related_event_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    previous_rank: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    last_update_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     calculated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
 
-    __table_args__ = (Index("ix_irs_calculated_rank", "calculated_at", "rank"),)
+    __table_args__ = (Index("ix_irs_period_calculated_rank", "period", "calculated_at", "rank"),)
@@ -1,15 +1,18 @@
 """뉴스 키워드 요약 결과 저장 모델.
 
 테이블 구조:
-  news_summary_batches     — 요약 실행 단위 (1회 LLM 호출 = 1 배치)
+  news_summary_batches     — 요약 실행 단위 (1회 실행 = 1 배치)
   news_keyword_summaries   — 키워드별 요약 결과
   news_summary_tags        — 요약별 자동생성 태그 (정규화)
+  news_summary_cache       — (모델, 키워드, 기사 지문) 단위 요약 캐시
+  news_summary_snapshots   — 최신 배치 읽기용 사전 계산 스냅샷
 """
 
 from datetime import datetime
 
 from sqlalchemy import (
     DateTime,
+    Float,
     ForeignKey,
     Index,
     Integer,
@@ -23,7 +26,7 @@ from src.db.base import Base
 
 
 class NewsSummaryBatch(Base):
-    """요약 실행 배치. 1회 LLM 호출 단위."""
+    """요약 실행 배치. 1회 요약 실행 단위 (토큰 예산에 따라 LLM 호출 여러 번)."""
 
     __tablename__ = "news_summary_batches"
 
@@ -34,6 +37,15 @@ class NewsSummaryBatch(Base):
     total_articles: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     prompt_tokens: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     completion_tokens: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # 요약 캐시 지표: 적중률 = cache_hits / total_keywords
+    cache_hits: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    cache_partial_hits: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    cache_saved_tokens: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # LLM 호출 지표 (모델 호스트 용량 산정용). llm_calls는 호출별 상세 목록
+    llm_tokens_per_sec: Mapped[float | None] = mapped_column(Float, nullable=True)
+    llm_ttft_ms: Mapped[int | None] = mapped_column(Integer, nullable=True)  # 호출 평균
+    llm_queue_ms: Mapped[int] = mapped_column(Integer, nullable=False, default=0)  # 합계
+    llm_calls: Mapped[list | None] = mapped_column(JSON, nullable=True)
     summarized_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, index=True
     )
@@ -95,3 +107,49 @@ class NewsSummaryTag(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
 
     summary: Mapped["NewsKeywordSummary"] = relationship(back_populates="tags")
+
+
+class NewsSummaryCache(Base):
+    """키워드 요약 캐시.
+
+    fingerprint는 프롬프트에 포함된 기사(URL + 본문 앞부분) 집합의 해시다.
+    같은 지문이면 LLM 호출 없이 payload를 재사용하고, 기사 일부만 바뀌었으면
+    article_signatures와 비교해 신규 기사만 다시 요약한다.
+    """
+
+    __tablename__ = "news_summary_cache"
+    __table_args__ = (
+        Index("ix_nsc_model_keyword_fp", "model", "keyword", "fingerprint", unique=True),
+        Index("ix_nsc_model_keyword_created", "model", "keyword", "created_at"),
+    )
+
+    id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    model: Mapped[str] = mapped_column(String(60), nullable=False)
+    keyword: Mapped[str] = mapped_column(String(100), nullable=False)
+    fingerprint: Mapped[str] = mapped_column(String(64), nullable=False)
+    article_signatures: Mapped[list] = mapped_column(JSON, nullable=False)  # [sig, ...]
+    payload: Mapped[dict] = mapped_column(JSON, nullable=False)  # {summary, key_points, ...}
+    token_cost: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    hit_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    last_used_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+
+class NewsSummarySnapshot(Base):
+    """최신 배치 요약의 사전 계산 스냅샷.
+
+    save_to_db 커밋과 같은 트랜잭션에서 갱신된다. 읽기 API는 PK 조회 한 번으로
+    키워드별 요약 + 태그가 합쳐진 응답 payload를 그대로 내려준다.
+    """
+
+    __tablename__ = "news_summary_snapshots"
+
+    key: Mapped[str] = mapped_column(String(30), primary_key=True)  # "latest"
+    batch_id: Mapped[str | None] = mapped_column(
+        String(36),
+        ForeignKey("news_summary_batches.id", ondelete="SET NULL"),
+        nullable=True,
+    )
+    payload: Mapped[dict] = mapped_column(JSON, nullable=False)
+    summarized_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    refreshed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
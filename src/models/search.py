@@ -1,11 +1,33 @@
 from datetime import datetime
 
-from sqlalchemy import DateTime, Integer, String
+from sqlalchemy import DDL, DateTime, Index, Integer, String, Table, event
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.db.base import Base
 
 
+def attach_search_vector(table: Table, title: str, body: str) -> None:
+    """PostgreSQL에서 ``create_all``로 테이블을 만들 때 검색 컬럼·인덱스를 함께 만든다.
+
+    마이그레이션 d7a1f4c8e2b6과 같은 ``search_vector`` tsvector 생성 컬럼, GIN 인덱스,
+    제목/본문 trigram 인덱스다. SQLite에는 만들지 않으므로 ORM 매핑에는 넣지 않고
+    ``src.sql.search``가 컬럼을 직접 참조한다.
+    """
+    name = table.name
+    statements = (
+        "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+        f"ALTER TABLE {name} ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ("
+        f"setweight(to_tsvector('simple'::regconfig, coalesce({title}, '')), 'A') || "
+        f"setweight(to_tsvector('simple'::regconfig, coalesce({body}, '')), 'B')"
+        f") STORED",
+        f"CREATE INDEX ix_{name}_search_vector ON {name} USING gin (search_vector)",
+        f"CREATE INDEX ix_{name}_{title}_trgm ON {name} USING gin ({title} gin_trgm_ops)",
+        f"CREATE INDEX ix_{name}_{body}_trgm ON {name} USING gin ({body} gin_trgm_ops)",
+    )
+    for statement in statements:
+        event.listen(table, "after_create", DDL(statement).execute_if(dialect="postgresql"))
+
+
 class SearchRanking(Base):
     __tablename__ = "search_rankings"
 
@@ -13,6 +35,40 @@ class SearchRanking(Base):
     keyword: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
     rank: Mapped[int] = mapped_column(Integer, nullable=False)
     score: Mapped[int] = mapped_column(Integer, nullable=False)
+    # 집계 기간 (daily: 24시간, weekly: 7일) — 기간마다 별도 스냅샷 시리즈
+    period: Mapped[str] = mapped_column(String(10), nullable=False, default="daily")
+    # 같은 기간 시리즈의 직전 스냅샷(직전 버킷) 순위. 새로 진입했으면 None
+    previous_rank: Mapped[int | None] = mapped_column(Integer, nullable=True)
     calculated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, index=True
     )
+
+    __table_args__ = (Index("ix_sr_period_calculated_rank", "period", "calculated_at", "rank"),)
+
+
+class SearchTokenBucket(Base):
+    """검색어 랭킹용 토큰 버킷 롤업 (10분 단위).
+
+    search_rankings 잡이 새로 닫힌 버킷만 토큰화해 쌓고, 일간/주간 랭킹은
+    기간 안 버킷 합계로 계산한다.
+    """
+
+    __tablename__ = "search_token_buckets"
+
+    bucket_start: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True)
+    token: Mapped[str] = mapped_column(String(100), primary_key=True)
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+class SearchQueryBucket(Base):
+    """사용자 검색어 버킷 롤업 (10분 단위).
+
+    API 워커가 버킷별 Count-Min 스케치로 센 상위 검색어(heavy hitter)만 버킷이
+    닫힐 때 더해 넣는다. 워커가 여럿이면 같은 행에 합산된다.
+    """
+
+    __tablename__ = "search_query_buckets"
+
+    bucket_start: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True)
+    query: Mapped[str] = mapped_column(String(100), primary_key=True)
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
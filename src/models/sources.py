@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, String, Text
+from sqlalchemy import Boolean, DateTime, Index, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.db.base import Base, ValueEnum
@@ -12,7 +12,7 @@ class Source(Base):
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True)
     entity_type: Mapped[SourceEntityType] = mapped_column(
-        ValueEnum(SourceEntityType), nullable=False, index=True
+        ValueEnum(SourceEntityType), nullable=False
     )
     entity_id: Mapped[str] = mapped_column(String(36), nullable=False, index=True)
     url: Mapped[str] = mapped_column(String(500), nullable=False)
@@ -20,6 +20,11 @@ class Source(Base):
     publisher: Mapped[str] = mapped_column(String(100), nullable=False)
     published_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
 
+    # 목록 출처 일괄 조회 (entity_type, entity_id IN ...) ORDER BY published_at
+    __table_args__ = (
+        Index("ix_sources_entity_published", "entity_type", "entity_id", "published_at"),
+    )
+
 
 class NewsChannel(Base):
     __tablename__ = "news_channels"
@@ -49,6 +49,10 @@ JOB_REGISTRY: dict[str, tuple[str, str]] = {
         "src.scheduler.jobs.feed_jobs:calculate_issue_rankings",
         "이슈 랭킹 스냅샷 계산 (Top Stories)",
     ),
+    "feed_inbox_trim": (
+        "src.scheduler.jobs.feed_jobs:trim_feed_inboxes",
+        "개인 피드 인박스 사용자당 상한 정리",
+    ),
 }
 
 
@@ -1,6 +1,6 @@
 from src.scheduler.jobs.auth_jobs import cleanup_refresh_tokens
 from src.scheduler.jobs.community_jobs import recalculate_community_hot_score
-from src.scheduler.jobs.feed_jobs import calculate_issue_rankings
+from src.scheduler.jobs.feed_jobs import calculate_issue_rankings, trim_feed_inboxes
 from src.scheduler.jobs.issue_jobs import reconcile_issue_status
 from src.scheduler.jobs.pipeline_jobs import (
     cleanup_keyword_states,
@@ -20,4 +20,5 @@ __all__ = [
     "run_news_collect_cycle",
     "cleanup_keyword_states",
     "calculate_issue_rankings",
+    "trim_feed_inboxes",
 ]
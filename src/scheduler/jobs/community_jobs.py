@@ -1,20 +1,140 @@
-from sqlalchemy import func, select
+"""커뮤니티 스케줄러 잡.
+
+- community_hot_score: 10분마다 — 댓글 수 보정 + 인기 점수 시간 감쇠 반영
+
+댓글 수 보정은 직전 성공 실행(워터마크) 이후 댓글이 달린 게시글만 대상으로
+한 번의 집합 UPDATE로 처리한다. PostgreSQL은 ``UPDATE ... FROM``,
+그 외(SQLite 테스트)는 상관 서브쿼리 UPDATE를 쓴다.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import bindparam, func, select, update
 from sqlalchemy.orm import Session
 
 from src.models.community import Comment, Post
+from src.models.scheduler import JobRun
+from src.sql.community import HOT_SCORE_GRAVITY, HOT_SCORE_WINDOW, compute_hot_score
+
+JOB_NAME = "community_hot_score"
+
+# 워터마크 직전에 생성됐지만 늦게 커밋된 댓글을 놓치지 않기 위한 겹침 구간
+WATERMARK_OVERLAP = timedelta(minutes=1)
+
+
+def _watermark(db: Session) -> datetime | None:
+    """직전 성공 실행 시작 시각 - 겹침. 첫 실행이면 None (전체 보정)."""
+    last_started = db.execute(
+        select(func.max(JobRun.started_at)).where(
+            JobRun.job_name == JOB_NAME, JobRun.status == "success"
+        )
+    ).scalar_one_or_none()
+    return None if last_started is None else last_started - WATERMARK_OVERLAP
+
+
+def _sync_comment_counts(db: Session, since: datetime | None) -> tuple[int, int]:
+    """since 이후 댓글이 달린 게시글의 comment_count를 실제 값으로 맞춘다.
+
+    (대상 게시글 수, 값이 바뀐 게시글 수) 반환.
+    """
+    active = select(Comment.post_id).distinct()
+    if since is not None:
+        active = active.where(Comment.created_at >= since)
+    scanned = db.execute(select(func.count()).select_from(active.subquery())).scalar_one()
+    if scanned == 0:
+        return 0, 0
+
+    if db.get_bind().dialect.name == "postgresql":
+        counts = (
+            select(Comment.post_id, func.count(Comment.id).label("cnt"))
+            .where(Comment.post_id.in_(active))
+            .group_by(Comment.post_id)
+            .subquery()
+        )
+        stmt = (
+            update(Post)
+            .values(comment_count=counts.c.cnt)
+            .where(Post.id == counts.c.post_id, Post.comment_count != counts.c.cnt)
+        )
+    else:
+        actual = select(func.count(Comment.id)).where(Comment.post_id == Post.id).scalar_subquery()
+        stmt = (
+            update(Post)
+            .values(comment_count=actual)
+            .where(Post.id.in_(active), Post.comment_count != actual)
+        )
+    updated = db.execute(stmt.execution_options(synchronize_session=False)).rowcount
+    return int(scanned), int(updated)
+
+
+def _refresh_hot_scores(db: Session, now: datetime) -> tuple[int, int]:
+    """최근 게시글 인기 점수에 감쇠를 반영하고 기간 밖 게시글은 0으로 내린다.
+
+    (갱신 수, 만료 수) 반환.
+    """
+    cutoff = now - HOT_SCORE_WINDOW
+    if db.get_bind().dialect.name == "postgresql":
+        age_hours = func.extract("epoch", now - Post.created_at) / 3600
+        points = (Post.like_count - Post.dislike_count) * 2 + Post.comment_count
+        refreshed = db.execute(
+            update(Post)
+            .where(Post.created_at >= cutoff)
+            .values(hot_score=func.round(points / func.power(age_hours + 2, HOT_SCORE_GRAVITY), 6))
+            .execution_options(synchronize_session=False)
+        ).rowcount
+    else:
+        rows = db.execute(
+            select(
+                Post.id, Post.like_count, Post.dislike_count, Post.comment_count, Post.created_at
+            ).where(Post.created_at >= cutoff)
+        ).all()
+        if rows:
+            db.execute(
+                update(Post.__table__)
+                .where(Post.__table__.c.id == bindparam("post_id"))
+                .values(hot_score=bindparam("score")),
+                [
+                    {
+                        "post_id": post_id,
+                        "score": compute_hot_score(
+                            like_count=like_count,
+                            dislike_count=dislike_count,
+                            comment_count=comment_count,
+                            created_at=created_at,
+                            now=now,
+                        ),
+                    }
+                    for post_id, like_count, dislike_count, comment_count, created_at in rows
+                ],
+            )
+        refreshed = len(rows)
 
+    expired = db.execute(
+        update(Post)
+        .where(Post.created_at < cutoff, Post.hot_score != 0)
+        .values(hot_score=0)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    return int(refreshed), int(expired)
 
-def recalculate_community_hot_score(db: Session) -> str:
-    posts = db.execute(select(Post)).scalars().all()
-    updated = 0
 
-    for post in posts:
-        comment_count = db.execute(
-            select(func.count(Comment.id)).where(Comment.post_id == post.id)
-        ).scalar_one()
+def recalculate_community_hot_score(db: Session) -> tuple[str, dict]:
+    now = datetime.now(timezone.utc)
+    since = _watermark(db)
 
-        if post.comment_count != comment_count:
-            post.comment_count = int(comment_count)
-            updated += 1
+    scanned, updated = _sync_comment_counts(db, since)
+    refreshed, expired = _refresh_hot_scores(db, now)
+    db.flush()
 
-    return f"posts_updated={updated}"
+    metrics = {
+        "watermark": since.isoformat() if since is not None else None,
+        "comment_posts_scanned": scanned,
+        "comment_counts_updated": updated,
+        "hot_refreshed": refreshed,
+        "hot_expired": expired,
+    }
+    detail = (
+        f"posts_scanned={scanned}, posts_updated={updated}, "
+        f"hot_refreshed={refreshed}, hot_expired={expired}"
+    )
+    return detail, metrics
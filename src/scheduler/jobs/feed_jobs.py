@@ -1,6 +1,11 @@
 """피드 관련 스케줄러 잡.
 
-- issue_rankings: 매시 정각 — 활성 이슈별 랭킹 스냅샷 계산
+- issue_rankings: 매시 정각 — 활성 이슈별 랭킹 스냅샷 계산 (집계 기간별 시리즈)
+- feed_inbox_trim: 10분마다 — 개인 피드 인박스를 사용자당 상한까지 정리
+
+활성 이슈 지표(기간 내 업데이트 수, 저장 수, 소스 다양성, 연관 사건 수)와
+점수는 기간마다 CTE 쿼리 한 번으로 계산하고 상위 N개만 가져온다.
+이슈 수와 무관하게 쿼리 수가 일정하다.
 """
 
 from __future__ import annotations
@@ -9,13 +14,15 @@ import logging
 from datetime import datetime, timedelta, timezone
 from uuid import uuid4
 
-from sqlalchemy import delete, func, select
+from sqlalchemy import Select, case, delete, func, insert, select, tuple_
 from sqlalchemy.orm import Session
 
+from src.core.config import get_settings
 from src.db.enums import IssueStatus, UpdateType
 from src.models.events import user_saved_events
-from src.models.feed import EventUpdate
-from src.models.issues import Issue, IssueRankSnapshot
+from src.models.feed import EventUpdate, FeedInboxItem
+from src.models.issues import Issue, IssueRankSnapshot, issue_events
+from src.models.pipeline import RawArticle
 
 logger = logging.getLogger(__name__)
 
@@ -28,90 +35,130 @@ W_SOURCE_WEIGHT = 0.2
 TOP_N = 20
 RETENTION_DAYS = 7
 
+# 집계 기간 → 지표 윈도우. 기간마다 별도 스냅샷 시리즈(period)를 쌓는다.
+RANKING_PERIODS: dict[str, timedelta] = {
+    "24h": timedelta(hours=24),
+    "7d": timedelta(days=7),
+}
 
-def calculate_issue_rankings(db: Session) -> str | None:
-    """활성 이슈별 최근 24시간 지표를 집계하여 상위 20개 랭킹 스냅샷을 저장한다."""
-    now = datetime.now(timezone.utc)
-    since_24h = now - timedelta(hours=24)
 
-    # 활성 이슈 목록
-    active_issues = db.execute(
-        select(Issue.id, Issue.tracker_count).where(
-            Issue.status.in_([IssueStatus.ONGOING, IssueStatus.REIGNITED])
-        )
-    ).all()
+def _capped_ratio(value, cap: float):
+    """min(value / cap, 1.0) — SQLite/PostgreSQL 공통 CASE 식."""
+    return case((value >= cap, 1.0), else_=value / cap)
 
-    if not active_issues:
-        logger.info("[issue_rankings] 활성 이슈 없음")
-        return "active_issues=0"
 
-    scored: list[tuple[str, float, int, int, int]] = []
+def ranking_query(*, since: datetime, limit: int = TOP_N) -> Select:
+    """활성 이슈 전체의 지표와 점수를 한 번에 계산해 상위 limit개를 반환하는 쿼리.
 
-    for issue_id, tracker_count in active_issues:
-        # 최근 24시간 event_updates 수 (DUP 제외)
-        recent_updates = db.execute(
-            select(func.count(EventUpdate.id)).where(
-                EventUpdate.issue_id == issue_id,
-                EventUpdate.update_type != UpdateType.DUP,
-                EventUpdate.created_at >= since_24h,
-            )
-        ).scalar_one()
-
-        # 저장 수 (user_saved_events에서 이슈에 연결된 이벤트의 저장 수)
-        saved_count = db.execute(
-            select(func.count(user_saved_events.c.user_id)).where(
-                user_saved_events.c.event_id.in_(
-                    select(EventUpdate.article_id).where(EventUpdate.issue_id == issue_id)
-                )
-            )
-        ).scalar_one()
-
-        # 다양한 소스 수 (source diversity → source_weight)
-        from src.models.pipeline import RawArticle
-
-        source_count = db.execute(
-            select(func.count(func.distinct(RawArticle.source_name)))
-            .join(EventUpdate, EventUpdate.article_id == RawArticle.id)
-            .where(
-                EventUpdate.issue_id == issue_id,
-                EventUpdate.created_at >= since_24h,
-                EventUpdate.update_type != UpdateType.DUP,
-            )
-        ).scalar_one()
+    컬럼: issue_id, tracked_count, recent_updates, saved_count, source_count,
+    related_event_count, last_update_at, score (내림차순).
+    """
+    active = (
+        select(Issue.id.label("issue_id"), Issue.tracker_count.label("tracked_count"))
+        .where(Issue.status.in_([IssueStatus.ONGOING, IssueStatus.REIGNITED]))
+        .cte("active")
+    )
+    # 기간 내 업데이트 수와 소스 다양성 (DUP 제외)
+    updates = (
+        select(
+            EventUpdate.issue_id.label("issue_id"),
+            func.count(EventUpdate.id).label("recent_updates"),
+            func.count(func.distinct(RawArticle.source_name)).label("source_count"),
+        )
+        .outerjoin(RawArticle, EventUpdate.article_id == RawArticle.id)
+        .where(
+            EventUpdate.issue_id.in_(select(active.c.issue_id)),
+            EventUpdate.update_type != UpdateType.DUP,
+            EventUpdate.created_at >= since,
+        )
+        .group_by(EventUpdate.issue_id)
+        .cte("updates")
+    )
+    # 이슈에 연결된 사건(issue_events)의 저장 수
+    saved = (
+        select(
+            issue_events.c.issue_id.label("issue_id"),
+            func.count(user_saved_events.c.user_id).label("saved_count"),
+        )
+        .join(user_saved_events, user_saved_events.c.event_id == issue_events.c.event_id)
+        .where(issue_events.c.issue_id.in_(select(active.c.issue_id)))
+        .group_by(issue_events.c.issue_id)
+        .cte("saved")
+    )
+    related = (
+        select(
+            issue_events.c.issue_id.label("issue_id"),
+            func.count(issue_events.c.event_id).label("related_event_count"),
+        )
+        .where(issue_events.c.issue_id.in_(select(active.c.issue_id)))
+        .group_by(issue_events.c.issue_id)
+        .cte("related")
+    )
+
+    # 마지막 업데이트 시각 (기간 무관). Top Stories 조회가 이슈별로 다시 찾지 않도록 저장한다.
+    latest = (
+        select(
+            EventUpdate.issue_id.label("issue_id"),
+            func.max(EventUpdate.created_at).label("last_update_at"),
+        )
+        .where(
+            EventUpdate.issue_id.in_(select(active.c.issue_id)),
+            EventUpdate.update_type != UpdateType.DUP,
+        )
+        .group_by(EventUpdate.issue_id)
+        .cte("latest")
+    )
 
+    recent_updates = func.coalesce(updates.c.recent_updates, 0)
+    source_count = func.coalesce(updates.c.source_count, 0)
+    saved_count = func.coalesce(saved.c.saved_count, 0)
+    score = (
+        W_RECENT_UPDATES * _capped_ratio(recent_updates, 10.0)
+        + W_SAVED_COUNT * _capped_ratio(saved_count, 50.0)
+        + W_TRACKED_COUNT * _capped_ratio(active.c.tracked_count, 100.0)
         # source_weight: 1~5개 소스는 0.2~1.0 비례
-        source_weight = min(source_count / 5.0, 1.0)
+        + W_SOURCE_WEIGHT * _capped_ratio(source_count, 5.0)
+    ).label("score")
 
-        score = (
-            W_RECENT_UPDATES * min(recent_updates / 10.0, 1.0)
-            + W_SAVED_COUNT * min(saved_count / 50.0, 1.0)
-            + W_TRACKED_COUNT * min(tracker_count / 100.0, 1.0)
-            + W_SOURCE_WEIGHT * source_weight
+    return (
+        select(
+            active.c.issue_id,
+            active.c.tracked_count,
+            recent_updates.label("recent_updates"),
+            saved_count.label("saved_count"),
+            source_count.label("source_count"),
+            func.coalesce(related.c.related_event_count, 0).label("related_event_count"),
+            latest.c.last_update_at,
+            score,
         )
+        .select_from(active)
+        .outerjoin(updates, updates.c.issue_id == active.c.issue_id)
+        .outerjoin(saved, saved.c.issue_id == active.c.issue_id)
+        .outerjoin(related, related.c.issue_id == active.c.issue_id)
+        .outerjoin(latest, latest.c.issue_id == active.c.issue_id)
+        .order_by(score.desc(), active.c.issue_id)
+        .limit(limit)
+    )
 
-        scored.append((issue_id, score, recent_updates, tracker_count, saved_count))
-
-    # 점수 기준 내림차순 정렬 → 상위 TOP_N
-    scored.sort(key=lambda x: x[1], reverse=True)
-    top = scored[:TOP_N]
-
-    # 스냅샷 저장
-    for rank_idx, (issue_id, score, recent_updates, tracked_count, saved_count) in enumerate(
-        top, start=1
-    ):
-        db.add(
-            IssueRankSnapshot(
-                id=str(uuid4()),
-                issue_id=issue_id,
-                rank=rank_idx,
-                score=round(score, 4),
-                recent_updates=recent_updates,
-                tracked_count=tracked_count,
-                saved_count=saved_count,
-                calculated_at=now,
-                created_at=now,
-            )
+
+def calculate_issue_rankings(db: Session) -> str | None:
+    """활성 이슈별 지표를 집계 기간마다 계산하여 상위 20개 랭킹 스냅샷을 저장한다."""
+    now = datetime.now(timezone.utc)
+
+    active_count = db.execute(
+        select(func.count(Issue.id)).where(
+            Issue.status.in_([IssueStatus.ONGOING, IssueStatus.REIGNITED])
         )
+    ).scalar_one()
+
+    if not active_count:
+        logger.info("[issue_rankings] 활성 이슈 없음")
+        return "active_issues=0"
+
+    tops = {
+        period: _save_period_snapshot(db, period=period, since=now - window, now=now)
+        for period, window in RANKING_PERIODS.items()
+    }
 
     # 7일 이전 스냅샷 삭제
     cutoff = now - timedelta(days=RETENTION_DAYS)
@@ -121,6 +168,97 @@ def calculate_issue_rankings(db: Session) -> str | None:
 
     db.flush()
 
-    detail = f"issues={len(active_issues)}, top={len(top)}, deleted_old={deleted}"
+    top_detail = ", ".join(f"top_{period}={count}" for period, count in tops.items())
+    detail = f"issues={active_count}, {top_detail}, deleted_old={deleted}"
     logger.info(f"[issue_rankings] {detail}")
     return detail
+
+
+def _previous_ranks(db: Session, *, period: str, before: datetime) -> dict[str, int]:
+    """같은 기간 시리즈의 직전 스냅샷 순위 (issue_id → rank)."""
+    previous_at = (
+        select(func.max(IssueRankSnapshot.calculated_at))
+        .where(
+            IssueRankSnapshot.period == period,
+            IssueRankSnapshot.calculated_at < before,
+        )
+        .scalar_subquery()
+    )
+    return dict(
+        db.execute(
+            select(IssueRankSnapshot.issue_id, IssueRankSnapshot.rank).where(
+                IssueRankSnapshot.period == period,
+                IssueRankSnapshot.calculated_at == previous_at,
+            )
+        ).all()
+    )
+
+
+def _save_period_snapshot(db: Session, *, period: str, since: datetime, now: datetime) -> int:
+    """since 이후 지표로 한 기간의 랭킹 스냅샷을 저장한다. 저장한 이슈 수 반환."""
+    top = db.execute(ranking_query(since=since)).all()
+    if not top:
+        return 0
+    previous = _previous_ranks(db, period=period, before=now)
+
+    # previous_rank가 None인 행도 한 번의 executemany로 (render_nulls)
+    db.execute(
+        insert(IssueRankSnapshot).execution_options(render_nulls=True),
+        [
+            {
+                "id": str(uuid4()),
+                "issue_id": row.issue_id,
+                "rank": rank_idx,
+                "score": round(float(row.score), 4),
+                "recent_updates": row.recent_updates,
+                "tracked_count": row.tracked_count,
+                "saved_count": row.saved_count,
+                "period": period,
+                "related_event_count": row.related_event_count,
+                "previous_rank": previous.get(row.issue_id),
+                "last_update_at": row.last_update_at,
+                "calculated_at": now,
+                "created_at": now,
+            }
+            for rank_idx, row in enumerate(top, start=1)
+        ],
+    )
+    return len(top)
+
+
+def trim_feed_inboxes(db: Session) -> str:
+    """상한(feed_inbox_max_items)을 넘은 사용자의 인박스에서 오래된 항목을 지운다.
+
+    상한 초과 사용자만 골라 사용자별 최신순 순번을 매기고, 상한 밖 행을 DELETE 한 번으로
+    지운다.
+    """
+    max_items = get_settings().feed_inbox_max_items
+    over_users = (
+        select(FeedInboxItem.user_id)
+        .group_by(FeedInboxItem.user_id)
+        .having(func.count() > max_items)
+    )
+    ranked = (
+        select(
+            FeedInboxItem.user_id,
+            FeedInboxItem.update_id,
+            func.row_number()
+            .over(
+                partition_by=FeedInboxItem.user_id,
+                order_by=(FeedInboxItem.created_at.desc(), FeedInboxItem.update_id.desc()),
+            )
+            .label("position"),
+        )
+        .where(FeedInboxItem.user_id.in_(over_users))
+        .subquery()
+    )
+    stale = select(ranked.c.user_id, ranked.c.update_id).where(ranked.c.position > max_items)
+    deleted = db.execute(
+        delete(FeedInboxItem).where(
+            tuple_(FeedInboxItem.user_id, FeedInboxItem.update_id).in_(stale)
+        )
+    ).rowcount
+
+    detail = f"max_items={max_items}, deleted={deleted or 0}"
+    logger.info(f"[feed_inbox_trim] {detail}")
+    return detail
@@ -1,54 +1,171 @@
+"""검색어 랭킹 스케줄러 잡.
+
+- search_rankings: 10분마다 — 일간(24시간)/주간(7일) 랭킹을 10분 버킷 합계로
+  계산하고 직전 스냅샷(직전 버킷) 대비 순위를 함께 저장한다.
+
+랭킹 원천은 API 워커가 쌓는 사용자 검색어 버킷(search_query_buckets)이다.
+기간 안에 검색어 로그가 없으면(신규 배포 등) 콘텐츠 제목 토큰 버킷으로 대신한다.
+토큰 버킷은 새로 닫힌 10분 버킷만 토큰화해 쌓으며, 제목 컬럼만 서버 사이드
+커서(yield_per)로 읽는다. 대상 시각은 사건 등록 시각, 이슈 갱신 시각, 게시글
+작성 시각이다.
+"""
+
 import re
-from collections import Counter
+from collections import Counter, defaultdict
 from datetime import datetime, timedelta, timezone
 from uuid import uuid4
 
-from sqlalchemy import delete, select
+from sqlalchemy import delete, desc, func, insert, select
 from sqlalchemy.orm import Session
 
 from src.models.community import Post
 from src.models.events import Event
 from src.models.issues import Issue
-from src.models.search import SearchRanking
+from src.models.search import SearchQueryBucket, SearchRanking, SearchTokenBucket
 
 TOKEN_PATTERN = re.compile(r"[0-9A-Za-z가-힣]{2,}")
 
+BUCKET = timedelta(minutes=10)
+STREAM_BATCH_SIZE = 1000
+TOP_N = 20
+
+# 집계 기간 → 윈도우. 롤업은 가장 긴 윈도우만큼 보관한다.
+RANKING_PERIODS: dict[str, timedelta] = {
+    "daily": timedelta(hours=24),
+    "weekly": timedelta(days=7),
+}
+RETENTION = max(RANKING_PERIODS.values())
+
 
 def _tokens(text: str) -> list[str]:
     return [token.lower() for token in TOKEN_PATTERN.findall(text)]
 
 
-def recalculate_search_rankings(db: Session) -> str:
-    now = datetime.now(timezone.utc)
-    from_at = now - timedelta(hours=24)
+def _utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
 
-    counter: Counter[str] = Counter()
+def bucket_of(value: datetime) -> datetime:
+    """시각이 속한 10분 버킷 시작 시각 (UTC)."""
+    value = _utc(value).astimezone(timezone.utc)
+    return value.replace(minute=value.minute - value.minute % 10, second=0, microsecond=0)
 
-    events = db.execute(select(Event).where(Event.occurred_at >= from_at)).scalars().all()
-    for event in events:
-        counter.update(_tokens(event.title))
 
-    issues = db.execute(select(Issue).where(Issue.updated_at >= from_at)).scalars().all()
-    for issue in issues:
-        counter.update(_tokens(issue.title))
+def _tokenize_range(db: Session, start: datetime, end: datetime) -> dict[datetime, Counter]:
+    """[start, end) 구간의 제목을 스트리밍으로 읽어 버킷별 토큰 수를 센다."""
+    buckets: dict[datetime, Counter] = defaultdict(Counter)
+    sources = (
+        (Event.title, Event.created_at),
+        (Issue.title, Issue.updated_at),
+        (Post.title, Post.created_at),
+    )
+    for title_column, at_column in sources:
+        stmt = (
+            select(title_column, at_column)
+            .where(at_column >= start, at_column < end)
+            .execution_options(yield_per=STREAM_BATCH_SIZE)
+        )
+        for title, at in db.execute(stmt):
+            buckets[bucket_of(at)].update(_tokens(title))
+    return buckets
 
-    posts = db.execute(select(Post).where(Post.created_at >= from_at)).scalars().all()
-    for post in posts:
-        counter.update(_tokens(post.title))
 
-    top_10 = counter.most_common(10)
+def _top_counts(db: Session, bucket_model, key_column, *, since: datetime) -> list:
+    total = func.sum(bucket_model.count).label("total")
+    return db.execute(
+        select(key_column, total)
+        .where(bucket_model.bucket_start >= since)
+        .group_by(key_column)
+        .order_by(desc(total), key_column)
+        .limit(TOP_N)
+    ).all()
 
-    db.execute(delete(SearchRanking).where(SearchRanking.calculated_at < now - timedelta(days=7)))
 
-    for index, (keyword, score) in enumerate(top_10, start=1):
-        db.add(
-            SearchRanking(
-                id=str(uuid4()),
-                keyword=keyword,
-                rank=index,
-                score=score,
-                calculated_at=now,
+def _previous_ranks(db: Session, *, period: str, before: datetime) -> dict[str, int]:
+    """같은 기간 시리즈의 직전 스냅샷 순위 (keyword → rank)."""
+    previous_at = (
+        select(func.max(SearchRanking.calculated_at))
+        .where(SearchRanking.period == period, SearchRanking.calculated_at < before)
+        .scalar_subquery()
+    )
+    return dict(
+        db.execute(
+            select(SearchRanking.keyword, SearchRanking.rank).where(
+                SearchRanking.period == period,
+                SearchRanking.calculated_at == previous_at,
             )
+        ).all()
+    )
+
+
+def _save_rankings(db: Session, *, period: str, since: datetime, now: datetime) -> tuple[int, str]:
+    """한 기간의 랭킹 스냅샷을 저장한다. (저장한 검색어 수, 원천) 반환."""
+    source = "queries"
+    top = _top_counts(db, SearchQueryBucket, SearchQueryBucket.query, since=since)
+    if not top:
+        source = "tokens"
+        top = _top_counts(db, SearchTokenBucket, SearchTokenBucket.token, since=since)
+    if top:
+        previous = _previous_ranks(db, period=period, before=now)
+        # previous_rank가 None인 행도 한 번의 executemany로 (render_nulls)
+        db.execute(
+            insert(SearchRanking).execution_options(render_nulls=True),
+            [
+                {
+                    "id": str(uuid4()),
+                    "keyword": keyword,
+                    "rank": index,
+                    "score": int(score),
+                    "period": period,
+                    "previous_rank": previous.get(keyword),
+                    "calculated_at": now,
+                }
+                for index, (keyword, score) in enumerate(top, start=1)
+            ],
         )
+    return len(top), source
+
+
+def recalculate_search_rankings(db: Session) -> tuple[str, dict]:
+    now = datetime.now(timezone.utc)
+    current = bucket_of(now)
+    oldest = current - RETENTION
+
+    # 이미 쌓인 마지막 버킷 다음부터, 아직 열려 있는 현재 버킷 직전까지만 토큰화
+    last = db.execute(select(func.max(SearchTokenBucket.bucket_start))).scalar_one_or_none()
+    start = max(_utc(last) + BUCKET, oldest) if last is not None else oldest
+
+    buckets = _tokenize_range(db, start, current) if start < current else {}
+    rows = [
+        {"bucket_start": bucket_start, "token": token, "count": count}
+        for bucket_start, counter in buckets.items()
+        for token, count in counter.items()
+    ]
+    if rows:
+        db.execute(insert(SearchTokenBucket), rows)
+
+    # 윈도우 밖으로 밀려난 버킷과 오래된 랭킹 정리
+    expired = db.execute(
+        delete(SearchTokenBucket).where(SearchTokenBucket.bucket_start < oldest)
+    ).rowcount
+    expired_queries = db.execute(
+        delete(SearchQueryBucket).where(SearchQueryBucket.bucket_start < oldest)
+    ).rowcount
+    db.execute(delete(SearchRanking).where(SearchRanking.calculated_at < now - RETENTION))
+
+    ranked = {
+        period: _save_rankings(db, period=period, since=current - window, now=now)
+        for period, window in RANKING_PERIODS.items()
+    }
+    db.flush()
 
-    return f"ranked_keywords={len(top_10)}"
+    metrics = {
+        "buckets_tokenized": len(buckets),
+        "bucket_rows_inserted": len(rows),
+        "bucket_rows_expired": expired,
+        "query_rows_expired": expired_queries,
+        **{f"ranked_{period}": count for period, (count, _) in ranked.items()},
+        **{f"source_{period}": source for period, (_, source) in ranked.items()},
+    }
+    detail = ", ".join(f"{key}={value}" for key, value in metrics.items())
+    return detail, metrics
@@ -7,7 +7,8 @@ from sqlalchemy.orm import Session
 from src.db.session import SessionLocal
 
 
-def run_job(job_name: str, handler: Callable[[Session], str | None]) -> None:
+def run_job(job_name: str, handler: Callable[[Session], str | tuple[str, dict] | None]) -> None:
+    from src.crud.home import HOME_SNAPSHOT_JOBS, refresh_home_snapshot
     from src.models.scheduler import JobRun
 
     started_at = datetime.now(timezone.utc)
@@ -20,6 +21,11 @@ def run_job(job_name: str, handler: Callable[[Session], str | None]) -> None:
             result = handler(db)
             db.commit()
 
+            # 홈 위젯에 반영되는 잡은 끝난 직후 홈 스냅샷 재생성
+            if job_name in HOME_SNAPSHOT_JOBS:
+                refresh_home_snapshot(db)
+                db.commit()
+
             # 핸들러가 tuple (detail, metrics)를 반환하면 metrics 추출
             if isinstance(result, tuple):
                 detail, metrics = result
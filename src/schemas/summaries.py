@@ -0,0 +1,39 @@
+"""Summaries 관련 Pydantic V2 스키마."""
+
+from pydantic import BaseModel, Field
+
+
+class SummaryArticleResponse(BaseModel):
+    """요약 근거 기사."""
+
+    title: str = Field(description="기사 제목")
+    url: str = Field(description="기사 URL")
+    channel: str | None = Field(default=None, description="수집 채널")
+    confidence: float = Field(default=0, description="키워드 매칭 신뢰도")
+
+
+class KeywordSummaryResponse(BaseModel):
+    """키워드별 요약."""
+
+    id: str = Field(description="요약 ID")
+    batchId: str = Field(description="요약 배치 ID")
+    keyword: str = Field(description="키워드")
+    summary: str = Field(description="요약 본문")
+    keyPoints: list[str] = Field(default_factory=list, description="핵심 포인트")
+    sentiment: str = Field(description="감성 (positive, negative, neutral, mixed)")
+    category: str = Field(description="카테고리")
+    articleCount: int = Field(description="관련 기사 수")
+    tags: list[str] = Field(default_factory=list, description="키워드 태그 (중복 제거)")
+    articles: list[SummaryArticleResponse] = Field(default_factory=list, description="관련 기사")
+    createdAt: str = Field(description="생성 일시")
+
+
+class SummaryBatchResponse(BaseModel):
+    """요약 배치."""
+
+    id: str = Field(description="배치 ID")
+    provider: str = Field(description="LLM 제공자")
+    model: str = Field(description="LLM 모델명")
+    totalKeywords: int = Field(description="키워드 수")
+    totalArticles: int = Field(description="기사 수")
+    summarizedAt: str = Field(description="요약 일시")
@@ -1,13 +1,38 @@
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from uuid import uuid4
 
-from sqlalchemy import asc, delete, desc, insert, select
+from sqlalchemy import delete, insert, select
 from sqlalchemy.orm import Session
 
+from src.core.pagination import KeysetPaginator, SortKey, parse_sort_keys
+from src.core.search_cache import mark_search_written
 from src.db.enums import VoteType
 from src.models.community import Comment, CommentLike, Post, PostVote, post_tags
 from src.models.tags import Tag
 
+# 인기 점수 시간 감쇠 지수 (클수록 빨리 식는다)
+HOT_SCORE_GRAVITY = 1.8
+# 이 기간보다 오래된 게시글은 인기 점수 갱신 대상에서 빠지고 0으로 고정된다
+HOT_SCORE_WINDOW = timedelta(days=7)
+
+
+def compute_hot_score(
+    *,
+    like_count: int,
+    dislike_count: int,
+    comment_count: int,
+    created_at: datetime,
+    now: datetime,
+) -> float:
+    """(추천 - 비추천) * 2 + 댓글 수를 (경과 시간 + 2) ^ gravity로 나눈 인기 점수."""
+    if created_at.tzinfo is None:
+        created_at = created_at.replace(tzinfo=timezone.utc)
+    if now - created_at > HOT_SCORE_WINDOW:
+        return 0.0
+    age_hours = max((now - created_at).total_seconds() / 3600, 0.0)
+    points = (like_count - dislike_count) * 2 + comment_count
+    return round(points / (age_hours + 2) ** HOT_SCORE_GRAVITY, 6)
+
 
 class CommunityRepository:
     def __init__(self, db: Session) -> None:
@@ -17,30 +42,20 @@ class CommunityRepository:
         stmt = select(Tag.id).where(Tag.id.in_(tag_ids))
         return set(self.db.execute(stmt).scalars().all())
 
-    def _apply_sort(self, stmt, *, tab: str, sort: str):
-        hot_score = (Post.like_count - Post.dislike_count) * 2 + Post.comment_count
-
+    def _paginator(self, *, tab: str, sort: str) -> KeysetPaginator:
         if tab == "popular":
-            return stmt.order_by(desc(Post.like_count), desc(Post.created_at))
-        if tab == "hot":
-            return stmt.order_by(desc(hot_score), desc(Post.created_at))
-
-        sort_map = {
-            "createdAt": Post.created_at,
-            "likeScore": Post.like_count,
-            "commentCount": Post.comment_count,
-        }
-        orders = []
-        for token in [v.strip() for v in sort.split(",") if v.strip()]:
-            desc_mode = token.startswith("-")
-            key = token[1:] if desc_mode else token
-            column = sort_map.get(key)
-            if not column:
-                continue
-            orders.append(desc(column) if desc_mode else asc(column))
-        if not orders:
-            orders = [desc(Post.created_at)]
-        return stmt.order_by(*orders)
+            keys = [SortKey("likeScore", Post.like_count), SortKey("createdAt", Post.created_at)]
+        elif tab == "hot":
+            # ix_posts_hot_score (hot_score, id) 인덱스 역순 스캔
+            keys = [SortKey("hotScore", Post.hot_score)]
+        else:
+            sort_map = {
+                "createdAt": Post.created_at,
+                "likeScore": Post.like_count,
+                "commentCount": Post.comment_count,
+            }
+            keys = parse_sort_keys(sort, sort_map) or [SortKey("createdAt", Post.created_at)]
+        return KeysetPaginator(keys, SortKey("id", Post.id, keys[0].descending))
 
     def list_posts(
         self,
@@ -48,15 +63,10 @@ class CommunityRepository:
         tab: str,
         sort: str,
         size: int,
-        offset: int,
-    ) -> tuple[list[Post], int | None]:
-        stmt = select(Post)
-        stmt = self._apply_sort(stmt, tab=tab, sort=sort)
-        rows = self.db.execute(stmt.offset(offset).limit(size + 1)).scalars().all()
-        has_next = len(rows) > size
-        items = rows[:size]
-        next_offset = offset + size if has_next else None
-        return items, next_offset
+        cursor: str | None,
+    ) -> tuple[list[Post], str | None]:
+        paginator = self._paginator(tab=tab, sort=sort)
+        return paginator.paginate(self.db, select(Post), cursor=cursor, size=size)
 
     def get_post(self, post_id: str) -> Post | None:
         stmt = select(Post).where(Post.id == post_id)
@@ -83,6 +93,7 @@ class CommunityRepository:
         )
         self.db.add(post)
         self.db.flush()
+        mark_search_written(self.db, "post", post.id)
 
         if tag_ids:
             self.db.execute(
@@ -112,11 +123,13 @@ class CommunityRepository:
                     [{"post_id": post.id, "tag_id": tag_id} for tag_id in tag_ids],
                 )
         post.updated_at = datetime.now(timezone.utc)
+        mark_search_written(self.db, "post", post.id)
         self.db.flush()
         return post
 
     def delete_post(self, post: Post) -> None:
         self.db.delete(post)
+        mark_search_written(self.db, "post", post.id)
         self.db.flush()
 
     def list_comments(
@@ -124,14 +137,14 @@ class CommunityRepository:
         *,
         post_id: str,
         size: int,
-        offset: int,
-    ) -> tuple[list[Comment], int | None]:
-        stmt = select(Comment).where(Comment.post_id == post_id).order_by(asc(Comment.created_at))
-        rows = self.db.execute(stmt.offset(offset).limit(size + 1)).scalars().all()
-        has_next = len(rows) > size
-        items = rows[:size]
-        next_offset = offset + size if has_next else None
-        return items, next_offset
+        cursor: str | None,
+    ) -> tuple[list[Comment], str | None]:
+        stmt = select(Comment).where(Comment.post_id == post_id)
+        paginator = KeysetPaginator(
+            [SortKey("createdAt", Comment.created_at, descending=False)],
+            SortKey("id", Comment.id, descending=False),
+        )
+        return paginator.paginate(self.db, stmt, cursor=cursor, size=size)
 
     def get_comment(self, comment_id: str) -> Comment | None:
         stmt = select(Comment).where(Comment.id == comment_id)
@@ -157,6 +170,7 @@ class CommunityRepository:
         )
         self.db.add(comment)
         post.comment_count += 1
+        self.refresh_hot_score(post)
         self.db.flush()
         return comment
 
@@ -171,6 +185,7 @@ class CommunityRepository:
         self.db.delete(comment)
         if post and post.comment_count > 0:
             post.comment_count -= 1
+            self.refresh_hot_score(post)
         self.db.flush()
 
     def like_comment(self, *, comment: Comment, user_id: str) -> tuple[Comment, bool]:
@@ -223,6 +238,7 @@ class CommunityRepository:
                 post.like_count += 1
             else:
                 post.dislike_count += 1
+            self.refresh_hot_score(post)
             self.db.flush()
             return vote
 
@@ -240,5 +256,16 @@ class CommunityRepository:
         else:
             post.dislike_count += 1
 
+        self.refresh_hot_score(post)
         self.db.flush()
         return existing
+
+    def refresh_hot_score(self, post: Post, *, now: datetime | None = None) -> None:
+        """추천/댓글 변경 직후 인기 점수를 현재 시각 기준으로 다시 계산한다."""
+        post.hot_score = compute_hot_score(
+            like_count=post.like_count,
+            dislike_count=post.dislike_count,
+            comment_count=post.comment_count,
+            created_at=post.created_at,
+            now=now or datetime.now(timezone.utc),
+        )
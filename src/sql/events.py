@@ -1,48 +1,81 @@
-from datetime import datetime, timezone
+from collections import defaultdict
+from datetime import date, datetime, timezone
 from uuid import uuid4
+from zoneinfo import ZoneInfo
 
-from sqlalchemy import asc, delete, desc, func, insert, select, update
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
 
-from src.db.enums import Importance, VerificationStatus
-from src.models.events import Event, event_tags, user_saved_events
+from src.core.pagination import KeysetPaginator, SortKey, parse_sort_keys
+from src.core.search_cache import mark_search_written
+from src.db.enums import Importance, SourceEntityType, VerificationStatus
+from src.models.events import Event, EventDailyCount, event_tags, user_saved_events
 from src.models.sources import Source
 from src.models.tags import Tag
+from src.sql.sources import SourceRepository
+
+# 일별 롤업 날짜 기준 타임존
+EVENT_DAY_TZ = ZoneInfo("Asia/Seoul")
+
+
+def event_day(occurred_at: datetime) -> date:
+    """사건 발생 시각의 Asia/Seoul 날짜. tz 정보가 없으면(SQLite) UTC로 간주한다."""
+    if occurred_at.tzinfo is None:
+        occurred_at = occurred_at.replace(tzinfo=timezone.utc)
+    return occurred_at.astimezone(EVENT_DAY_TZ).date()
+
+
+def rebuild_event_daily_counts(db) -> int:
+    """events 전체에서 일별 롤업을 다시 만든다 (백필/시드용). 저장한 날짜 수 반환."""
+    rows: dict[date, dict[str, int]] = defaultdict(lambda: defaultdict(int))
+    for occurred_at, importance in db.execute(select(Event.occurred_at, Event.importance)):
+        counts = rows[event_day(occurred_at)]
+        counts["event_count"] += 1
+        counts[f"{Importance(importance).value}_count"] += 1
+
+    db.execute(delete(EventDailyCount))
+    if rows:
+        db.execute(
+            insert(EventDailyCount),
+            [
+                {
+                    "day": day,
+                    "event_count": counts["event_count"],
+                    "high_count": counts["high_count"],
+                    "medium_count": counts["medium_count"],
+                    "low_count": counts["low_count"],
+                }
+                for day, counts in rows.items()
+            ],
+        )
+    return len(rows)
 
 
 class EventRepository:
     def __init__(self, db: Session) -> None:
         self.db = db
 
-    def _apply_sort(self, stmt, sort: str):
+    def _paginator(self, sort: str) -> KeysetPaginator:
         sort_map = {
             "occurredAt": Event.occurred_at,
             "importance": Event.importance,
             "createdAt": Event.created_at,
         }
-        orders = []
-        for token in [v.strip() for v in sort.split(",") if v.strip()]:
-            desc_mode = token.startswith("-")
-            key = token[1:] if desc_mode else token
-            column = sort_map.get(key)
-            if column is None:
-                continue
-            orders.append(desc(column) if desc_mode else asc(column))
-        if not orders:
-            orders = [desc(Event.occurred_at)]
-        return stmt.order_by(*orders)
+        keys = parse_sort_keys(sort, sort_map) or [SortKey("occurredAt", Event.occurred_at)]
+        return KeysetPaginator(keys, SortKey("id", Event.id, keys[0].descending))
 
     def list_events(
         self,
         *,
         size: int,
-        offset: int,
+        cursor: str | None,
         sort: str,
         importance: str | None,
         verification_status: str | None,
         from_at: datetime | None,
         to_at: datetime | None,
-    ) -> tuple[list[Event], int | None]:
+    ) -> tuple[list[Event], str | None]:
         stmt = select(Event)
         if importance:
             stmt = stmt.where(Event.importance == Importance(importance))
@@ -52,24 +85,16 @@ class EventRepository:
             stmt = stmt.where(Event.occurred_at >= from_at)
         if to_at:
             stmt = stmt.where(Event.occurred_at <= to_at)
-        stmt = self._apply_sort(stmt, sort)
-        rows = self.db.execute(stmt.offset(offset).limit(size + 1)).scalars().all()
-        has_next = len(rows) > size
-        items = rows[:size]
-        next_offset = offset + size if has_next else None
-        return items, next_offset
+        return self._paginator(sort).paginate(self.db, stmt, cursor=cursor, size=size)
 
     def get_event(self, event_id: str) -> Event | None:
         stmt = select(Event).where(Event.id == event_id)
         return self.db.execute(stmt).scalar_one_or_none()
 
-    def list_sources(self, event_id: str) -> list[Source]:
-        stmt = (
-            select(Source)
-            .where(Source.entity_type == "event", Source.entity_id == event_id)
-            .order_by(desc(Source.published_at))
+    def list_sources_by_event_ids(self, event_ids: list[str]) -> dict[str, list[Source]]:
+        return SourceRepository(self.db).list_sources_by_entity_ids(
+            SourceEntityType.EVENT, event_ids
         )
-        return self.db.execute(stmt).scalars().all()
 
     def save_for_user(self, *, user_id: str, event_id: str) -> bool:
         exists_stmt = select(user_saved_events.c.user_id).where(
@@ -122,6 +147,8 @@ class EventRepository:
         )
         self.db.add(event)
         self.db.flush()
+        self.bump_daily_count(event.occurred_at, event.importance, 1)
+        mark_search_written(self.db, "event", event.id)
 
         if tag_ids:
             self.db.execute(
@@ -154,8 +181,10 @@ class EventRepository:
             event.title = title
         if summary is not None:
             event.summary = summary
-        if importance is not None:
+        if importance is not None and Importance(importance) != event.importance:
+            self.bump_daily_count(event.occurred_at, event.importance, -1)
             event.importance = Importance(importance)
+            self.bump_daily_count(event.occurred_at, event.importance, 1)
         if verification_status is not None:
             event.verification_status = VerificationStatus(verification_status)
 
@@ -177,21 +206,41 @@ class EventRepository:
             event.source_count = len(source_ids)
 
         event.updated_at = datetime.now(timezone.utc)
+        mark_search_written(self.db, "event", event.id)
         self.db.flush()
         return event
 
     def delete_event(self, event: Event) -> None:
+        self.bump_daily_count(event.occurred_at, event.importance, -1)
         self.db.delete(event)
+        mark_search_written(self.db, "event", event.id)
         self.db.flush()
 
+    def bump_daily_count(self, occurred_at: datetime, importance: Importance, delta: int) -> None:
+        """사건 일별 롤업을 증분 갱신한다 (생성 +1, 삭제 -1, 중요도 변경 -1/+1)."""
+        column = f"{importance.value}_count"
+        values = {"day": event_day(occurred_at), "high_count": 0, "medium_count": 0, "low_count": 0}
+        values.update({"event_count": delta, column: delta})
+
+        dialect = postgresql if self.db.get_bind().dialect.name == "postgresql" else sqlite
+        stmt = dialect.insert(EventDailyCount).values(**values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[EventDailyCount.day],
+            set_={
+                "event_count": EventDailyCount.event_count + delta,
+                column: getattr(EventDailyCount, column) + delta,
+            },
+        )
+        self.db.execute(stmt)
+
     def list_saved_events(
         self,
         *,
         user_id: str,
         size: int,
-        offset: int,
+        cursor: str | None,
         sort: str,
-    ) -> tuple[list[Event], int | None]:
+    ) -> tuple[list[Event], str | None]:
         stmt = (
             select(Event)
             .join(
@@ -200,12 +249,7 @@ class EventRepository:
             )
             .where(user_saved_events.c.user_id == user_id)
         )
-        stmt = self._apply_sort(stmt, sort)
-        rows = self.db.execute(stmt.offset(offset).limit(size + 1)).scalars().all()
-        has_next = len(rows) > size
-        items = rows[:size]
-        next_offset = offset + size if has_next else None
-        return items, next_offset
+        return self._paginator(sort).paginate(self.db, stmt, cursor=cursor, size=size)
 
     def list_saved_at_by_event_ids_for_user(
         self, *, user_id: str, event_ids: list[str]
@@ -1,27 +1,32 @@
 """Feed 데이터 액세스 계층."""
 
-from sqlalchemy import desc, func, select
+import json
+from datetime import datetime
+
+from sqlalchemy import func, null, select, tuple_, union_all
 from sqlalchemy.orm import Session
 
+from src.core.pagination import KeysetPaginator, SortKey
 from src.db.enums import FeedType, UpdateType
-from src.models.feed import EventUpdate, LiveFeedItem
-from src.models.issues import Issue, IssueRankSnapshot
+from src.models.feed import EventUpdate, FeedInboxItem, LiveFeedItem
+from src.models.issues import Issue, IssueRankSnapshot, user_tracked_issues
 from src.models.pipeline import RawArticle
 
+# Top Stories가 읽는 랭킹 스냅샷 시리즈
+TOP_STORIES_PERIOD = "24h"
+# 새 피드 항목 id를 알리는 LISTEN/NOTIFY 채널. NOTIFY 페이로드 상한(8000바이트) 안에
+# 들어가도록 id를 나눠 보낸다.
+FEED_NOTIFY_CHANNEL = "live_feed"
+NOTIFY_CHUNK_SIZE = 100
+
 
 class FeedRepository:
     def __init__(self, db: Session) -> None:
         self.db = db
 
-    def list_feed_items(
-        self,
-        *,
-        feed_type: str | None,
-        offset: int,
-        limit: int,
-    ) -> tuple[list[dict], int | None]:
-        """피드 항목 목록 조회. JOIN으로 관련 데이터를 한번에 가져온다."""
-        stmt = (
+    @staticmethod
+    def _feed_item_select():
+        return (
             select(
                 LiveFeedItem,
                 EventUpdate,
@@ -34,32 +39,88 @@ class FeedRepository:
             .outerjoin(Issue, LiveFeedItem.issue_id == Issue.id)
         )
 
+    @staticmethod
+    def _to_feed_rows(rows) -> list[dict]:
+        return [
+            {
+                "lfi": lfi,
+                "eu": eu,
+                "ra": ra,
+                "issue_id": issue_id_ref,
+                "issue_title": issue_title,
+            }
+            for lfi, eu, ra, issue_id_ref, issue_title in rows
+        ]
+
+    def list_feed_items(
+        self,
+        *,
+        feed_type: str | None,
+        cursor: str | None,
+        limit: int,
+    ) -> tuple[list[dict], str | None]:
+        """피드 항목 목록 조회. JOIN으로 관련 데이터를 한번에 가져온다."""
+        stmt = self._feed_item_select()
+
         if feed_type and feed_type != "all":
             stmt = stmt.where(LiveFeedItem.feed_type == FeedType(feed_type))
 
-        stmt = stmt.order_by(
-            desc(LiveFeedItem.rank_score),
-            desc(LiveFeedItem.created_at),
+        # 새 항목이 계속 들어오는 피드라 OFFSET이면 중복/누락이 생긴다 → keyset
+        paginator = KeysetPaginator(
+            [
+                SortKey("rankScore", LiveFeedItem.rank_score, getter=lambda r: r[0].rank_score),
+                SortKey("createdAt", LiveFeedItem.created_at, getter=lambda r: r[0].created_at),
+            ],
+            SortKey("id", LiveFeedItem.id, getter=lambda r: r[0].id),
+        )
+        items, next_cursor = paginator.paginate(
+            self.db, stmt, cursor=cursor, size=limit, scalars=False
         )
 
-        rows = self.db.execute(stmt.offset(offset).limit(limit + 1)).all()
-        has_next = len(rows) > limit
-        items = rows[:limit]
-        next_offset = offset + limit if has_next else None
+        return self._to_feed_rows(items), next_cursor
 
-        result = []
-        for lfi, eu, ra, issue_id_ref, issue_title in items:
-            result.append(
-                {
-                    "lfi": lfi,
-                    "eu": eu,
-                    "ra": ra,
-                    "issue_id": issue_id_ref,
-                    "issue_title": issue_title,
-                }
-            )
+    def list_feed_items_by_ids(self, ids: list[str]) -> list[dict]:
+        """id 목록의 피드 항목을 생성 순으로 한 번에 조회 (스트림 전달용)."""
+        if not ids:
+            return []
+        stmt = (
+            self._feed_item_select()
+            .where(LiveFeedItem.id.in_(ids))
+            .order_by(LiveFeedItem.created_at, LiveFeedItem.id)
+        )
+        return self._to_feed_rows(self.db.execute(stmt).all())
 
-        return result, next_offset
+    def list_feed_items_after(
+        self, *, created_at: datetime, item_id: str, limit: int
+    ) -> list[dict]:
+        """(created_at, id) 워터마크 이후 생성된 피드 항목 (ix_lfi_created_id)."""
+        stmt = (
+            self._feed_item_select()
+            .where(tuple_(LiveFeedItem.created_at, LiveFeedItem.id) > (created_at, item_id))
+            .order_by(LiveFeedItem.created_at, LiveFeedItem.id)
+            .limit(limit)
+        )
+        return self._to_feed_rows(self.db.execute(stmt).all())
+
+    def get_feed_watermark(self) -> tuple[datetime, str] | None:
+        """가장 마지막에 생성된 피드 항목의 (created_at, id)."""
+        row = self.db.execute(
+            select(LiveFeedItem.created_at, LiveFeedItem.id)
+            .order_by(LiveFeedItem.created_at.desc(), LiveFeedItem.id.desc())
+            .limit(1)
+        ).first()
+        return (row.created_at, row.id) if row else None
+
+    def notify_feed_items(self, ids: list[str]) -> None:
+        """새 피드 항목 id를 NOTIFY한다 (PostgreSQL). 트랜잭션이 커밋될 때 전달된다."""
+        for start in range(0, len(ids), NOTIFY_CHUNK_SIZE):
+            self.db.execute(
+                select(
+                    func.pg_notify(
+                        FEED_NOTIFY_CHANNEL, json.dumps(ids[start : start + NOTIFY_CHUNK_SIZE])
+                    )
+                )
+            )
 
     def count_feed_items(self, *, feed_type: str | None) -> int:
         """피드 항목 전체 개수."""
@@ -68,53 +129,102 @@ class FeedRepository:
             stmt = stmt.where(LiveFeedItem.feed_type == FeedType(feed_type))
         return int(self.db.execute(stmt).scalar_one())
 
-    def list_top_stories(self, *, limit: int) -> tuple[list[dict], str | None]:
-        """최신 랭킹 스냅샷에서 Top Stories를 조회한다."""
-        # 가장 최근 calculated_at 시각 조회
-        latest_at = self.db.execute(
-            select(func.max(IssueRankSnapshot.calculated_at))
+    def get_latest_top_stories_at(self) -> datetime | None:
+        """Top Stories 시리즈의 최신 스냅샷 시각 (ix_irs_period_calculated_rank)."""
+        return self.db.execute(
+            select(func.max(IssueRankSnapshot.calculated_at)).where(
+                IssueRankSnapshot.period == TOP_STORIES_PERIOD
+            )
         ).scalar_one_or_none()
 
-        if latest_at is None:
-            return [], None
-
+    def list_top_stories(self, *, calculated_at: datetime, limit: int) -> list[dict]:
+        """한 스냅샷의 Top Stories. 마지막 업데이트 시각은 스냅샷에 저장된 값을 쓴다."""
         stmt = (
             select(IssueRankSnapshot, Issue.title.label("issue_title"))
             .join(Issue, IssueRankSnapshot.issue_id == Issue.id)
-            .where(IssueRankSnapshot.calculated_at == latest_at)
+            .where(
+                IssueRankSnapshot.period == TOP_STORIES_PERIOD,
+                IssueRankSnapshot.calculated_at == calculated_at,
+            )
             .order_by(IssueRankSnapshot.rank)
             .limit(limit)
         )
-        rows = self.db.execute(stmt).all()
+        return [
+            {"snapshot": snapshot, "issue_title": issue_title}
+            for snapshot, issue_title in self.db.execute(stmt)
+        ]
 
-        # 각 이슈의 마지막 업데이트 시각 조회
-        result = []
-        for snapshot, issue_title in rows:
-            last_update = self.db.execute(
-                select(func.max(EventUpdate.created_at)).where(
-                    EventUpdate.issue_id == snapshot.issue_id,
-                    EventUpdate.update_type != UpdateType.DUP,
-                )
-            ).scalar_one_or_none()
-
-            result.append(
-                {
-                    "snapshot": snapshot,
-                    "issue_title": issue_title,
-                    "last_update_at": last_update,
-                }
+    def list_read_merged_issue_ids(self, *, user_id: str, min_trackers: int) -> list[str]:
+        """사용자가 추적하는 이슈 중 인박스 fan-out 대상이 아닌 대형 이슈 (읽기 시 병합)."""
+        stmt = (
+            select(Issue.id)
+            .join(user_tracked_issues, user_tracked_issues.c.issue_id == Issue.id)
+            .where(
+                user_tracked_issues.c.user_id == user_id,
+                Issue.tracker_count > min_trackers,
             )
+        )
+        return list(self.db.execute(stmt).scalars())
 
-        calculated_at_iso = latest_at.isoformat(timespec="milliseconds").replace("+00:00", "Z")
-        return result, calculated_at_iso
+    def list_user_feed(
+        self,
+        *,
+        user_id: str,
+        merged_issue_ids: list[str],
+        cursor: str | None,
+        limit: int,
+    ) -> tuple[list[dict], str | None]:
+        """개인 피드. 인박스 행에 대형 이슈 업데이트를 UNION ALL로 합쳐 한 번에 페이지를 자른다.
+
+        읽기 병합분은 reason이 NULL이며, 이미 인박스에 있는 업데이트(키워드 매칭 등)는 제외한다.
+        """
+        inbox = select(
+            FeedInboxItem.update_id.label("update_id"),
+            FeedInboxItem.reason.label("reason"),
+            FeedInboxItem.created_at.label("created_at"),
+        ).where(FeedInboxItem.user_id == user_id)
+        if merged_issue_ids:
+            merged = select(
+                EventUpdate.id,
+                null(),
+                EventUpdate.created_at,
+            ).where(
+                EventUpdate.issue_id.in_(merged_issue_ids),
+                EventUpdate.update_type != UpdateType.DUP,
+                EventUpdate.id.not_in(
+                    select(FeedInboxItem.update_id).where(FeedInboxItem.user_id == user_id)
+                ),
+            )
+            entries = union_all(inbox, merged).subquery("entries")
+        else:
+            entries = inbox.subquery("entries")
+
+        stmt = (
+            select(entries.c.reason, EventUpdate, RawArticle, Issue.title.label("issue_title"))
+            .select_from(entries)
+            .join(EventUpdate, EventUpdate.id == entries.c.update_id)
+            .join(RawArticle, EventUpdate.article_id == RawArticle.id)
+            .outerjoin(Issue, EventUpdate.issue_id == Issue.id)
+        )
+        paginator = KeysetPaginator(
+            [SortKey("createdAt", entries.c.created_at, getter=lambda r: r[1].created_at)],
+            SortKey("id", entries.c.update_id, getter=lambda r: r[1].id),
+        )
+        items, next_cursor = paginator.paginate(
+            self.db, stmt, cursor=cursor, size=limit, scalars=False
+        )
+        return [
+            {"reason": reason, "eu": eu, "ra": ra, "issue_title": issue_title}
+            for reason, eu, ra, issue_title in items
+        ], next_cursor
 
     def list_issue_updates(
         self,
         *,
         issue_id: str,
-        offset: int,
+        cursor: str | None,
         limit: int,
-    ) -> tuple[list[dict], int | None]:
+    ) -> tuple[list[dict], str | None]:
         """이슈 타임라인 조회. EventUpdate + RawArticle JOIN."""
         stmt = (
             select(EventUpdate, RawArticle)
@@ -123,16 +233,17 @@ class FeedRepository:
                 EventUpdate.issue_id == issue_id,
                 EventUpdate.update_type != UpdateType.DUP,
             )
-            .order_by(desc(EventUpdate.created_at))
         )
-
-        rows = self.db.execute(stmt.offset(offset).limit(limit + 1)).all()
-        has_next = len(rows) > limit
-        items = rows[:limit]
-        next_offset = offset + limit if has_next else None
+        paginator = KeysetPaginator(
+            [SortKey("createdAt", EventUpdate.created_at, getter=lambda r: r[0].created_at)],
+            SortKey("id", EventUpdate.id, getter=lambda r: r[0].id),
+        )
+        items, next_cursor = paginator.paginate(
+            self.db, stmt, cursor=cursor, size=limit, scalars=False
+        )
 
         result = []
         for eu, ra in items:
             result.append({"eu": eu, "ra": ra})
 
-        return result, next_offset
+        return result, next_cursor
@@ -1,8 +1,12 @@
-from sqlalchemy import desc, select
+from datetime import date, datetime
+
+from sqlalchemy import desc, func, select
 from sqlalchemy.orm import Session
 
 from src.models.community import Post
-from src.models.events import Event
+from src.models.events import Event, EventDailyCount
+from src.models.home import HomeSnapshot
+from src.models.issues import Issue, IssueRankSnapshot
 from src.models.search import SearchRanking
 
 
@@ -14,20 +18,59 @@ class HomeRepository:
         stmt = select(Event).order_by(desc(Event.occurred_at)).limit(limit)
         return self.db.execute(stmt).scalars().all()
 
-    def list_hot_posts(self, *, limit: int = 5) -> list[Post]:
-        stmt = select(Post).order_by(desc(Post.like_count), desc(Post.comment_count)).limit(limit)
+    def list_hot_posts(self, *, since: datetime, limit: int = 5) -> list[Post]:
+        """since 이후 작성된 게시글을 저장된 인기 점수순으로 (ix_posts_hot_score)."""
+        stmt = (
+            select(Post)
+            .where(Post.created_at >= since)
+            .order_by(desc(Post.hot_score), desc(Post.id))
+            .limit(limit)
+        )
         return self.db.execute(stmt).scalars().all()
 
-    def list_search_rankings(self, *, limit: int = 10) -> list[SearchRanking]:
-        stmt = select(SearchRanking).order_by(desc(SearchRanking.score)).limit(limit)
+    def list_search_rankings(self, *, period: str, limit: int = 10) -> list[SearchRanking]:
+        """기간 시리즈의 최신 검색어 랭킹 스냅샷."""
+        latest_at = (
+            select(func.max(SearchRanking.calculated_at))
+            .where(SearchRanking.period == period)
+            .scalar_subquery()
+        )
+        stmt = (
+            select(SearchRanking)
+            .where(SearchRanking.period == period, SearchRanking.calculated_at == latest_at)
+            .order_by(SearchRanking.rank)
+            .limit(limit)
+        )
         return self.db.execute(stmt).scalars().all()
 
-    def list_trending_events(self, *, limit: int = 10) -> list[Event]:
-        stmt = select(Event).order_by(desc(Event.importance), desc(Event.occurred_at)).limit(limit)
-        return self.db.execute(stmt).scalars().all()
+    def list_trending_issues(
+        self, *, period: str, limit: int = 10
+    ) -> list[tuple[IssueRankSnapshot, Issue]]:
+        """기간 시리즈의 최신 랭킹 스냅샷 (period, calculated_at, rank 인덱스 조회)."""
+        latest_at = (
+            select(func.max(IssueRankSnapshot.calculated_at))
+            .where(IssueRankSnapshot.period == period)
+            .scalar_subquery()
+        )
+        stmt = (
+            select(IssueRankSnapshot, Issue)
+            .join(Issue, IssueRankSnapshot.issue_id == Issue.id)
+            .where(
+                IssueRankSnapshot.period == period,
+                IssueRankSnapshot.calculated_at == latest_at,
+            )
+            .order_by(IssueRankSnapshot.rank)
+            .limit(limit)
+        )
+        return self.db.execute(stmt).all()
 
-    def list_timeline_events(self, *, limit: int = 10) -> list[Event]:
-        stmt = select(Event).order_by(desc(Event.occurred_at)).limit(limit)
+    def list_daily_counts(self, *, from_day: date) -> list[EventDailyCount]:
+        """from_day 이후 일별 사건 롤업 (최대 기간 일수만큼의 행)."""
+        stmt = (
+            select(EventDailyCount)
+            .where(EventDailyCount.day >= from_day)
+            .order_by(desc(EventDailyCount.day))
+        )
         return self.db.execute(stmt).scalars().all()
 
     def list_featured_news(self, *, limit: int = 6) -> list[Event]:
@@ -37,3 +80,20 @@ class HomeRepository:
     def list_community_media_posts(self, *, limit: int = 6) -> list[Post]:
         stmt = select(Post).order_by(desc(Post.created_at)).limit(limit)
         return self.db.execute(stmt).scalars().all()
+
+    def get_snapshot_built_at(self) -> datetime | None:
+        return self.db.execute(select(func.max(HomeSnapshot.built_at))).scalar_one_or_none()
+
+    def list_snapshots(self) -> list[HomeSnapshot]:
+        return self.db.execute(select(HomeSnapshot)).scalars().all()
+
+    def save_snapshots(self, widgets: dict[str, list], *, built_at: datetime) -> None:
+        existing = {row.widget: row for row in self.list_snapshots()}
+        for widget, payload in widgets.items():
+            row = existing.get(widget)
+            if row is None:
+                row = HomeSnapshot(widget=widget)
+                self.db.add(row)
+            row.payload = payload
+            row.built_at = built_at
+        self.db.flush()
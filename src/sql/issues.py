@@ -1,49 +1,46 @@
 from datetime import datetime, timezone
 from uuid import uuid4
 
-from sqlalchemy import asc, delete, desc, func, insert, select, update
+from sqlalchemy import delete, func, insert, select, update
 from sqlalchemy.orm import Session
 
+from src.core.pagination import KeysetPaginator, SortKey, parse_sort_keys
+from src.core.search_cache import mark_search_written
 from src.db.enums import IssueStatus, SourceEntityType
 from src.db.enums import TriggerType
 from src.models.issues import Issue, issue_events, issue_tags, user_tracked_issues
 from src.models.sources import Source
 from src.models.tags import Tag
 from src.models.triggers import Trigger
+from src.sql.sources import SourceRepository
 
 
 class IssueRepository:
     def __init__(self, db: Session) -> None:
         self.db = db
 
-    def _apply_sort(self, stmt, sort: str):
+    def _paginator(self, sort: str) -> KeysetPaginator:
         sort_map = {
             "latestTriggerAt": Issue.latest_trigger_at,
             "trackerCount": Issue.tracker_count,
             "createdAt": Issue.created_at,
         }
-        orders = []
-        for token in [v.strip() for v in sort.split(",") if v.strip()]:
-            desc_mode = token.startswith("-")
-            key = token[1:] if desc_mode else token
-            column = sort_map.get(key)
-            if column is None:
-                continue
-            orders.append(desc(column) if desc_mode else asc(column))
-        if not orders:
-            orders = [desc(Issue.latest_trigger_at), desc(Issue.created_at)]
-        return stmt.order_by(*orders)
+        keys = parse_sort_keys(sort, sort_map, nullable={"latestTriggerAt"}) or [
+            SortKey("latestTriggerAt", Issue.latest_trigger_at, nullable=True),
+            SortKey("createdAt", Issue.created_at),
+        ]
+        return KeysetPaginator(keys, SortKey("id", Issue.id, keys[0].descending))
 
     def list_issues(
         self,
         *,
         size: int,
-        offset: int,
+        cursor: str | None,
         sort: str,
         status: str | None,
         from_at: datetime | None,
         to_at: datetime | None,
-    ) -> tuple[list[Issue], int | None]:
+    ) -> tuple[list[Issue], str | None]:
         stmt = select(Issue)
         if status:
             stmt = stmt.where(Issue.status == IssueStatus(status))
@@ -51,12 +48,7 @@ class IssueRepository:
             stmt = stmt.where(Issue.updated_at >= from_at)
         if to_at:
             stmt = stmt.where(Issue.updated_at <= to_at)
-        stmt = self._apply_sort(stmt, sort)
-        rows = self.db.execute(stmt.offset(offset).limit(size + 1)).scalars().all()
-        has_next = len(rows) > size
-        items = rows[:size]
-        next_offset = offset + size if has_next else None
-        return items, next_offset
+        return self._paginator(sort).paginate(self.db, stmt, cursor=cursor, size=size)
 
     def count_issues(
         self,
@@ -78,37 +70,28 @@ class IssueRepository:
         stmt = select(Issue).where(Issue.id == issue_id)
         return self.db.execute(stmt).scalar_one_or_none()
 
-    def list_sources(self, issue_id: str) -> list[Source]:
-        stmt = (
-            select(Source)
-            .where(Source.entity_type == "issue", Source.entity_id == issue_id)
-            .order_by(desc(Source.published_at))
+    def list_sources_by_issue_ids(self, issue_ids: list[str]) -> dict[str, list[Source]]:
+        return SourceRepository(self.db).list_sources_by_entity_ids(
+            SourceEntityType.ISSUE, issue_ids
         )
-        return self.db.execute(stmt).scalars().all()
 
     def list_triggers(
         self,
         *,
         issue_id: str,
         size: int,
-        offset: int,
-    ) -> tuple[list[Trigger], int | None]:
-        stmt = (
-            select(Trigger).where(Trigger.issue_id == issue_id).order_by(desc(Trigger.occurred_at))
+        cursor: str | None,
+    ) -> tuple[list[Trigger], str | None]:
+        stmt = select(Trigger).where(Trigger.issue_id == issue_id)
+        paginator = KeysetPaginator(
+            [SortKey("occurredAt", Trigger.occurred_at)], SortKey("id", Trigger.id)
         )
-        rows = self.db.execute(stmt.offset(offset).limit(size + 1)).scalars().all()
-        has_next = len(rows) > size
-        items = rows[:size]
-        next_offset = offset + size if has_next else None
-        return items, next_offset
+        return paginator.paginate(self.db, stmt, cursor=cursor, size=size)
 
-    def list_trigger_sources(self, trigger_id: str) -> list[Source]:
-        stmt = (
-            select(Source)
-            .where(Source.entity_type == SourceEntityType.TRIGGER, Source.entity_id == trigger_id)
-            .order_by(desc(Source.published_at))
+    def list_sources_by_trigger_ids(self, trigger_ids: list[str]) -> dict[str, list[Source]]:
+        return SourceRepository(self.db).list_sources_by_entity_ids(
+            SourceEntityType.TRIGGER, trigger_ids
         )
-        return self.db.execute(stmt).scalars().all()
 
     def track_for_user(self, *, user_id: str, issue_id: str) -> bool:
         exists_stmt = select(user_tracked_issues.c.user_id).where(
@@ -169,6 +152,7 @@ class IssueRepository:
         )
         self.db.add(issue)
         self.db.flush()
+        mark_search_written(self.db, "issue", issue.id)
 
         if tag_ids:
             self.db.execute(
@@ -238,11 +222,13 @@ class IssueRepository:
                 )
 
         issue.updated_at = datetime.now(timezone.utc)
+        mark_search_written(self.db, "issue", issue.id)
         self.db.flush()
         return issue
 
     def delete_issue(self, issue: Issue) -> None:
         self.db.delete(issue)
+        mark_search_written(self.db, "issue", issue.id)
         self.db.flush()
 
     def list_latest_triggers_by_issue_ids(self, issue_ids: list[str]) -> dict[str, Trigger]:
@@ -312,6 +298,7 @@ class IssueRepository:
         if issue is not None:
             issue.latest_trigger_at = occurred_at
             issue.updated_at = now
+            mark_search_written(self.db, "issue", issue.id)
 
         self.db.flush()
         return trigger
@@ -321,9 +308,9 @@ class IssueRepository:
         *,
         user_id: str,
         size: int,
-        offset: int,
+        cursor: str | None,
         sort: str,
-    ) -> tuple[list[Issue], int | None]:
+    ) -> tuple[list[Issue], str | None]:
         stmt = (
             select(Issue)
             .join(
@@ -332,12 +319,13 @@ class IssueRepository:
             )
             .where(user_tracked_issues.c.user_id == user_id)
         )
-        stmt = self._apply_sort(stmt, sort)
-        rows = self.db.execute(stmt.offset(offset).limit(size + 1)).scalars().all()
-        has_next = len(rows) > size
-        items = rows[:size]
-        next_offset = offset + size if has_next else None
-        return items, next_offset
+        return self._paginator(sort).paginate(self.db, stmt, cursor=cursor, size=size)
+
+    def list_tracked_issue_ids(self, *, user_id: str) -> set[str]:
+        stmt = select(user_tracked_issues.c.issue_id).where(
+            user_tracked_issues.c.user_id == user_id
+        )
+        return set(self.db.execute(stmt).scalars())
 
     def count_tags_by_ids(self, tag_ids: list[str]) -> int:
         if not tag_ids:
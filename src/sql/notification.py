@@ -3,6 +3,7 @@
 from sqlalchemy import desc, select, update
 from sqlalchemy.orm import Session
 
+from src.core.pagination import KeysetPaginator, SortKey
 from src.models.notification import Notification, UserAlertRule
 
 
@@ -69,20 +70,14 @@ class NotificationRepository:
         self,
         *,
         user_id: str,
-        offset: int,
+        cursor: str | None,
         limit: int,
-    ) -> tuple[list[Notification], int | None]:
-        stmt = (
-            select(Notification)
-            .where(Notification.user_id == user_id)
-            .order_by(desc(Notification.created_at))
+    ) -> tuple[list[Notification], str | None]:
+        stmt = select(Notification).where(Notification.user_id == user_id)
+        paginator = KeysetPaginator(
+            [SortKey("createdAt", Notification.created_at)], SortKey("id", Notification.id)
         )
-        rows = self.db.execute(stmt.offset(offset).limit(limit + 1)).scalars().all()
-        rows = list(rows)
-        has_next = len(rows) > limit
-        items = rows[:limit]
-        next_offset = offset + limit if has_next else None
-        return items, next_offset
+        return paginator.paginate(self.db, stmt, cursor=cursor, size=limit)
 
     def get_notification(self, *, notification_id: str, user_id: str) -> Notification | None:
         stmt = select(Notification).where(
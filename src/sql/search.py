@@ -1,10 +1,157 @@
-from sqlalchemy import desc, select
-from sqlalchemy.orm import Session
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from datetime import datetime
 
+from sqlalchemy import Select, case, func, literal, literal_column, null, or_, select, union_all
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.dialects.postgresql import REGCONFIG, TSVECTOR
+from sqlalchemy.orm import InstrumentedAttribute, Session
+
+from src.core.config import get_settings
 from src.models.community import Post
 from src.models.events import Event
-from src.models.search import SearchRanking
+from src.models.search import SearchQueryBucket, SearchRanking
 from src.models.issues import Issue
+from src.models.pipeline import CrawledKeyword
+
+# 한국어 사전이 없으므로 공백 단위 토큰화('simple'), 부분 일치는 pg_trgm이 보완한다
+SEARCH_TS_CONFIG = "simple"
+# 제목 trigram 유사도를 ts_rank에 더할 때의 가중치
+TRGM_SIMILARITY_WEIGHT = 0.5
+SEARCH_HEADLINE_OPTIONS = (
+    "StartSel=<mark>, StopSel=</mark>, MaxWords=20, MinWords=5, MaxFragments=1"
+)
+
+
+@dataclass(frozen=True)
+class SearchTarget:
+    """검색 대상 엔티티. PostgreSQL에서는 ``search_vector`` 생성 컬럼을 쓴다.
+
+    컬럼은 마이그레이션 또는 ``attach_search_vector``(create_all)가 만든다.
+    """
+
+    entity_type: str
+    table: str
+    id: InstrumentedAttribute
+    title: InstrumentedAttribute
+    body: InstrumentedAttribute
+    date: InstrumentedAttribute
+    summarize: Callable[[str], str] = lambda body: body
+
+    @property
+    def search_vector(self):
+        return literal_column(f"{self.table}.search_vector", TSVECTOR)
+
+
+SEARCH_TARGETS: tuple[SearchTarget, ...] = (
+    SearchTarget("event", "events", Event.id, Event.title, Event.summary, Event.occurred_at),
+    SearchTarget("issue", "issues", Issue.id, Issue.title, Issue.description, Issue.updated_at),
+    SearchTarget(
+        "post",
+        "posts",
+        Post.id,
+        Post.title,
+        Post.content,
+        Post.created_at,
+        summarize=lambda body: body[:120],
+    ),
+)
+SEARCH_TARGETS_BY_TYPE = {target.entity_type: target for target in SEARCH_TARGETS}
+
+
+def search_entity_types(entity_type: str) -> list[str]:
+    """검색 범위(all/event/issue/post) → 대상 엔티티 종류 목록."""
+    return list(SEARCH_TARGETS_BY_TYPE) if entity_type == "all" else [entity_type]
+
+
+def _tsquery(keyword: str):
+    return func.websearch_to_tsquery(literal(SEARCH_TS_CONFIG, REGCONFIG), keyword)
+
+
+def _candidates(target: SearchTarget, keyword: str, *, postgres: bool) -> Select:
+    """한 엔티티의 일치 행. 컬럼: entity_type, id, title, body, date, score.
+
+    PostgreSQL은 ``search_vector @@ websearch_to_tsquery`` (GIN) 또는 제목/본문
+    ``ILIKE``·제목 ``%`` 유사도(gin_trgm_ops)로 찾고 ts_rank + 제목 유사도로 점수를 매긴다.
+    그 외는 ILIKE로 찾고 제목 접두 일치에 2점, 나머지 1점.
+    """
+    q_like = f"%{keyword}%"
+    if postgres:
+        tsquery = _tsquery(keyword)
+        condition = or_(
+            target.search_vector.op("@@")(tsquery),
+            target.title.ilike(q_like),
+            target.body.ilike(q_like),
+            target.title.op("%")(keyword),
+        )
+        score = func.ts_rank(target.search_vector, tsquery) + TRGM_SIMILARITY_WEIGHT * (
+            func.similarity(target.title, keyword)
+        )
+    else:
+        condition = target.title.ilike(q_like) | target.body.ilike(q_like)
+        score = case((target.title.ilike(f"{keyword}%"), 2.0), else_=1.0)
+    return select(
+        literal(target.entity_type).label("entity_type"),
+        target.id.label("id"),
+        target.title.label("title"),
+        target.body.label("body"),
+        target.date.label("date"),
+        score.label("score"),
+    ).where(condition)
+
+
+def _ordering(columns, sort: str) -> list:
+    if sort == "-createdAt":
+        keys = [columns.date.desc(), columns.score.desc()]
+    else:
+        keys = [columns.score.desc(), columns.date.desc()]
+    return [*keys, columns.entity_type, columns.id]
+
+
+def _matches(keyword: str, entity_types: list[str], *, postgres: bool):
+    selects = [
+        _candidates(SEARCH_TARGETS_BY_TYPE[entity_type], keyword, postgres=postgres)
+        for entity_type in entity_types
+    ]
+    return (union_all(*selects) if len(selects) > 1 else selects[0]).subquery("matches")
+
+
+def search_query(
+    *,
+    keyword: str,
+    entity_types: list[str],
+    sort: str,
+    limit: int,
+    offset: int,
+    postgres: bool,
+) -> Select:
+    """엔티티별 일치 행을 UNION ALL로 합쳐 DB에서 정렬·페이지 절단까지 하는 쿼리.
+
+    한 페이지(limit 행)만 전송된다. PostgreSQL은 ts_headline 발췌를 절단된
+    페이지 행에만 계산한다.
+    """
+    matches = _matches(keyword, entity_types, postgres=postgres)
+    page = (
+        select(matches)
+        .order_by(*_ordering(matches.c, sort))
+        .limit(limit)
+        .offset(offset)
+        .subquery("page")
+    )
+    if postgres:
+        config = literal(SEARCH_TS_CONFIG, REGCONFIG)
+        highlight = func.ts_headline(
+            config, page.c.body, _tsquery(keyword), SEARCH_HEADLINE_OPTIONS
+        )
+    else:
+        highlight = null()
+    return select(page, highlight.label("highlight")).order_by(*_ordering(page.c, sort))
+
+
+def search_count_query(*, keyword: str, entity_types: list[str], postgres: bool) -> Select:
+    """엔티티 종류별 일치 건수 (entity_type, count)."""
+    matches = _matches(keyword, entity_types, postgres=postgres)
+    return select(matches.c.entity_type, func.count()).group_by(matches.c.entity_type)
 
 
 class SearchRepository:
@@ -19,125 +166,170 @@ class SearchRepository:
         sort: str,
         size: int,
         offset: int,
-    ) -> tuple[list[dict], int | None, int]:
+    ) -> tuple[list[dict], int | None, int, dict[str, int]]:
+        """(항목, 다음 offset, 전체 건수, 엔티티 종류별 건수).
+
+        search_es_enabled면 Elasticsearch로 찾고, ES 미설정/장애 시 SQL로 폴백한다.
+        """
         keyword = q.strip()
         if not keyword:
-            return [], None, 0
-
-        q_like = f"%{keyword}%"
-        results: list[dict] = []
+            return [], None, 0, {}
 
-        if entity_type in {"all", "event"}:
-            events = (
-                self.db.execute(
-                    select(Event)
-                    .where((Event.title.ilike(q_like)) | (Event.summary.ilike(q_like)))
-                    .limit(100)
-                )
-                .scalars()
-                .all()
+        entity_types = search_entity_types(entity_type)
+        if get_settings().search_es_enabled:
+            found = self._search_elasticsearch(
+                keyword=keyword, entity_types=entity_types, sort=sort, size=size, offset=offset
             )
-            for event in events:
-                score = 2 if event.title.lower().startswith(keyword.lower()) else 1
-                results.append(
-                    {
-                        "entityType": "event",
-                        "id": event.id,
-                        "title": event.title,
-                        "summary": event.summary,
-                        "date": event.occurred_at.isoformat(),
-                        "score": score,
-                    }
-                )
-
-        if entity_type in {"all", "issue"}:
-            issues = (
-                self.db.execute(
-                    select(Issue)
-                    .where((Issue.title.ilike(q_like)) | (Issue.description.ilike(q_like)))
-                    .limit(100)
-                )
-                .scalars()
-                .all()
+            if found is not None:
+                return found
+
+        # PostgreSQL은 tsvector/pg_trgm 인덱스 백엔드, 그 외(SQLite 테스트)는 ILIKE 폴백
+        postgres = self.db.get_bind().dialect.name == "postgresql"
+        rows = self.db.execute(
+            search_query(
+                keyword=keyword,
+                entity_types=entity_types,
+                sort=sort,
+                limit=size + 1,
+                offset=offset,
+                postgres=postgres,
             )
-            for issue in issues:
-                score = 2 if issue.title.lower().startswith(keyword.lower()) else 1
-                results.append(
-                    {
-                        "entityType": "issue",
-                        "id": issue.id,
-                        "title": issue.title,
-                        "summary": issue.description,
-                        "date": issue.updated_at.isoformat(),
-                        "score": score,
-                    }
-                )
-
-        if entity_type in {"all", "post"}:
-            posts = (
+        ).all()
+        has_next = len(rows) > size
+        rows = rows[:size]
+        next_offset = offset + size if has_next else None
+
+        # 단일 엔티티 검색의 마지막 페이지면 건수가 확정되므로 COUNT 쿼리를 생략한다
+        last_page = (rows and not has_next) or (not rows and offset == 0)
+        if len(entity_types) == 1 and last_page:
+            type_counts = {entity_types[0]: offset + len(rows)}
+        else:
+            type_counts = dict(
                 self.db.execute(
-                    select(Post)
-                    .where((Post.title.ilike(q_like)) | (Post.content.ilike(q_like)))
-                    .limit(100)
-                )
-                .scalars()
-                .all()
+                    search_count_query(
+                        keyword=keyword, entity_types=entity_types, postgres=postgres
+                    )
+                ).all()
             )
-            for post in posts:
-                score = 2 if post.title.lower().startswith(keyword.lower()) else 1
-                results.append(
-                    {
-                        "entityType": "post",
-                        "id": post.id,
-                        "title": post.title,
-                        "summary": post.content[:120],
-                        "date": post.created_at.isoformat(),
-                        "score": score,
-                    }
-                )
-
-        if sort == "-createdAt":
-            results.sort(key=lambda item: item["date"], reverse=True)
-        elif sort == "-popularity":
-            results.sort(key=lambda item: item.get("score", 0), reverse=True)
-        else:
-            results.sort(key=lambda item: item.get("score", 0), reverse=True)
 
-        total_count = len(results)
-        paged = results[offset : offset + size + 1]
-        has_next = len(paged) > size
-        items = paged[:size]
-        next_offset = offset + size if has_next else None
+        items = [
+            {
+                "entityType": row.entity_type,
+                "id": row.id,
+                "title": row.title,
+                "summary": SEARCH_TARGETS_BY_TYPE[row.entity_type].summarize(row.body),
+                "highlight": row.highlight,
+                "date": row.date.isoformat(),
+            }
+            for row in rows
+        ]
+        return items, next_offset, sum(type_counts.values()), type_counts
 
-        for item in items:
-            item.pop("score", None)
+    def _search_elasticsearch(
+        self, *, keyword: str, entity_types: list[str], sort: str, size: int, offset: int
+    ) -> tuple[list[dict], int | None, int, dict[str, int]] | None:
+        from src.utils.elasticsearch.content_index import search_documents
+
+        found = search_documents(
+            keyword=keyword, entity_types=entity_types, sort=sort, size=size, offset=offset
+        )
+        if found is None:
+            return None
+        items = [
+            {
+                "entityType": hit["entityType"],
+                "id": hit["id"],
+                "title": hit["title"],
+                "summary": SEARCH_TARGETS_BY_TYPE[hit["entityType"]].summarize(hit["body"]),
+                "highlight": hit["highlight"],
+                "date": hit["date"],
+            }
+            for hit in found["hits"]
+        ]
+        next_offset = offset + size if offset + size < found["total"] else None
+        return items, next_offset, found["total"], found["typeCounts"]
 
-        return items, next_offset, total_count
+    def list_search_documents(self, entity_type: str, *, ids: Iterable[str]) -> list[dict]:
+        """검색 인덱스용 {id, title, body, date} 문서 (ids에 해당하는 남아 있는 행)."""
+        target = SEARCH_TARGETS_BY_TYPE[entity_type]
+        rows = self.db.execute(
+            select(target.id, target.title, target.body, target.date).where(
+                target.id.in_(list(ids))
+            )
+        ).all()
+        return [
+            {"id": row_id, "title": title, "body": body, "date": date}
+            for row_id, title, body, date in rows
+        ]
 
-    def suggestions(self, *, q: str, limit: int = 10) -> list[str]:
-        keyword = q.strip()
-        if not keyword:
-            return []
+    def iter_search_documents(self, entity_type: str, *, batch_size: int) -> Iterator[list[dict]]:
+        """전체 재색인용으로 문서를 batch_size개씩 스트리밍한다."""
+        target = SEARCH_TARGETS_BY_TYPE[entity_type]
+        result = self.db.execute(
+            select(target.id, target.title, target.body, target.date).execution_options(
+                yield_per=batch_size
+            )
+        )
+        for partition in result.partitions():
+            yield [
+                {"id": row_id, "title": title, "body": body, "date": date}
+                for row_id, title, body, date in partition
+            ]
 
-        q_like = f"{keyword}%"
-        values: list[str] = []
+    def list_suggestion_titles(
+        self, *, since: datetime | None, post_since: datetime
+    ) -> list[tuple[str, str, str, int]]:
+        """자동완성 색인용 (엔티티 종류, id, 제목, 인기도). since가 있으면 그 이후 수정분만.
 
-        for model, field in ((Event, Event.title), (Issue, Issue.title), (Post, Post.title)):
-            rows = (
-                self.db.execute(select(field).where(field.ilike(q_like)).limit(limit))
-                .scalars()
-                .all()
+        인기도: 사건은 출처 수, 이슈는 추적자 수, 게시글은 추천 + 댓글 수.
+        """
+        sources = (
+            ("event", Event, Event.source_count),
+            ("issue", Issue, Issue.tracker_count),
+            ("post", Post, Post.like_count + Post.comment_count),
+        )
+        rows: list[tuple[str, str, str, int]] = []
+        for entity_type, model, popularity in sources:
+            stmt = select(model.id, model.title, popularity)
+            if since is not None:
+                stmt = stmt.where(model.updated_at >= since)
+            if model is Post:
+                stmt = stmt.where(Post.created_at >= post_since)
+            rows.extend(
+                (entity_type, entity_id, title, int(score or 0))
+                for entity_id, title, score in self.db.execute(stmt)
             )
-            for row in rows:
-                if row not in values:
-                    values.append(row)
-                if len(values) >= limit:
-                    return values
-        return values
+        return rows
+
+    def trending_keyword_counts(self, *, since: datetime) -> dict[str, int]:
+        """since 이후 수집된 급상승 키워드별 언급 수 합계."""
+        rows = self.db.execute(
+            select(CrawledKeyword.keyword, func.sum(CrawledKeyword.count))
+            .where(CrawledKeyword.crawled_at >= since)
+            .group_by(CrawledKeyword.keyword)
+        ).all()
+        return {keyword: int(total) for keyword, total in rows}
+
+    def add_query_counts(self, *, bucket_start: datetime, counts: dict[str, int]) -> None:
+        """버킷의 검색어별 횟수를 기존 행에 더한다 (여러 API 워커가 같은 버킷을 합산)."""
+        if not counts:
+            return
+        dialect = postgresql if self.db.get_bind().dialect.name == "postgresql" else sqlite
+        stmt = dialect.insert(SearchQueryBucket).values(
+            [
+                {"bucket_start": bucket_start, "query": query, "count": count}
+                for query, count in counts.items()
+            ]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[SearchQueryBucket.bucket_start, SearchQueryBucket.query],
+            set_={"count": SearchQueryBucket.count + stmt.excluded.count},
+        )
+        self.db.execute(stmt)
 
     def rankings(self, *, limit: int = 10) -> list[dict]:
         latest = self.db.execute(
-            select(SearchRanking.calculated_at).order_by(desc(SearchRanking.calculated_at)).limit(1)
+            select(func.max(SearchRanking.calculated_at)).where(SearchRanking.period == "daily")
         ).scalar_one_or_none()
 
         if latest is None:
@@ -146,7 +338,7 @@ class SearchRepository:
         rows = (
             self.db.execute(
                 select(SearchRanking)
-                .where(SearchRanking.calculated_at == latest)
+                .where(SearchRanking.period == "daily", SearchRanking.calculated_at == latest)
                 .order_by(SearchRanking.rank.asc())
                 .limit(limit)
             )
@@ -1,7 +1,9 @@
+from collections import defaultdict
+from collections.abc import Iterable
 from datetime import datetime
 from uuid import uuid4
 
-from sqlalchemy import asc, select
+from sqlalchemy import asc, desc, select
 from sqlalchemy.orm import Session
 
 from src.db.enums import SourceEntityType
@@ -30,6 +32,27 @@ class SourceRepository:
         end = start + limit
         return rows[start:end], total
 
+    def list_sources_by_entity_ids(
+        self, entity_type: SourceEntityType, ids: Iterable[str]
+    ) -> dict[str, list[Source]]:
+        """엔티티 id별 출처 목록 (최신 발행순). 목록 한 페이지를 한 번의 쿼리로 읽는다.
+
+        ix_sources_entity_published (entity_type, entity_id, published_at) 인덱스 조회.
+        출처가 없는 id는 결과에 없으므로 호출부에서 빈 목록으로 다룬다.
+        """
+        ids = list(dict.fromkeys(ids))
+        if not ids:
+            return {}
+        stmt = (
+            select(Source)
+            .where(Source.entity_type == entity_type, Source.entity_id.in_(ids))
+            .order_by(Source.entity_id, desc(Source.published_at))
+        )
+        grouped: dict[str, list[Source]] = defaultdict(list)
+        for source in self.db.execute(stmt).scalars():
+            grouped[source.entity_id].append(source)
+        return dict(grouped)
+
     def create_source(
         self,
         *,
@@ -0,0 +1,90 @@
+"""뉴스 요약 데이터 액세스 계층."""
+
+from datetime import datetime
+
+from sqlalchemy import desc, select
+from sqlalchemy.orm import Session, selectinload
+
+from src.core.pagination import KeysetPaginator, SortKey
+from src.models.news_summary import (
+    NewsKeywordSummary,
+    NewsSummaryBatch,
+    NewsSummarySnapshot,
+)
+
+
+class SummaryRepository:
+    def __init__(self, db: Session) -> None:
+        self.db = db
+
+    def get_snapshot(self, key: str) -> NewsSummarySnapshot | None:
+        return self.db.get(NewsSummarySnapshot, key)
+
+    def upsert_snapshot(
+        self,
+        *,
+        key: str,
+        batch_id: str,
+        payload: dict,
+        summarized_at: datetime,
+        refreshed_at: datetime,
+    ) -> NewsSummarySnapshot:
+        snapshot = self.db.get(NewsSummarySnapshot, key)
+        if snapshot is None:
+            snapshot = NewsSummarySnapshot(key=key)
+            self.db.add(snapshot)
+        snapshot.batch_id = batch_id
+        snapshot.payload = payload
+        snapshot.summarized_at = summarized_at
+        snapshot.refreshed_at = refreshed_at
+        self.db.flush()
+        return snapshot
+
+    def get_batch(self, batch_id: str) -> NewsSummaryBatch | None:
+        stmt = (
+            select(NewsSummaryBatch)
+            .where(NewsSummaryBatch.id == batch_id)
+            .options(selectinload(NewsSummaryBatch.summaries).selectinload(NewsKeywordSummary.tags))
+        )
+        return self.db.execute(stmt).scalar_one_or_none()
+
+    def get_latest_batch(self) -> NewsSummaryBatch | None:
+        stmt = (
+            select(NewsSummaryBatch)
+            .order_by(desc(NewsSummaryBatch.summarized_at), desc(NewsSummaryBatch.id))
+            .options(selectinload(NewsSummaryBatch.summaries).selectinload(NewsKeywordSummary.tags))
+            .limit(1)
+        )
+        return self.db.execute(stmt).scalar_one_or_none()
+
+    def list_batches(
+        self,
+        *,
+        cursor: str | None,
+        limit: int,
+    ) -> tuple[list[NewsSummaryBatch], str | None]:
+        """배치 목록 (summarized_at, id) 내림차순 keyset 조회."""
+        paginator = KeysetPaginator(
+            [SortKey("summarizedAt", NewsSummaryBatch.summarized_at)],
+            SortKey("id", NewsSummaryBatch.id),
+        )
+        return paginator.paginate(self.db, select(NewsSummaryBatch), cursor=cursor, size=limit)
+
+    def list_keyword_history(
+        self,
+        *,
+        keyword: str,
+        cursor: str | None,
+        limit: int,
+    ) -> tuple[list[NewsKeywordSummary], str | None]:
+        """키워드별 요약 이력 (created_at, id) 내림차순 keyset 조회. ix_nks_keyword_created 사용."""
+        stmt = (
+            select(NewsKeywordSummary)
+            .where(NewsKeywordSummary.keyword == keyword)
+            .options(selectinload(NewsKeywordSummary.tags))
+        )
+        paginator = KeysetPaginator(
+            [SortKey("createdAt", NewsKeywordSummary.created_at)],
+            SortKey("id", NewsKeywordSummary.id),
+        )
+        return paginator.paginate(self.db, stmt, cursor=cursor, size=limit)
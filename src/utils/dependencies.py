@@ -1,20 +1,37 @@
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 from typing import Annotated
 
 from fastapi import Depends, Header, Request
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from src.core.exceptions import AppError
 from src.core.security import decode_token
 from src.sql.auth import AuthRepository
-from src.db.session import get_db
+from src.core.config import get_settings
+from src.db.session import ReadSession, SessionLocal, get_async_sessionmaker, get_db
 
 
 def get_db_session() -> Generator[Session, None, None]:
     yield from get_db()
 
 
+async def get_read_session() -> AsyncGenerator[ReadSession, None]:
+    """조회 전용 세션. db_async_enabled면 AsyncSession, 아니면 sync Session."""
+    if get_settings().db_async_enabled:
+        async with get_async_sessionmaker()() as db:
+            yield ReadSession(db)
+        return
+
+    db = SessionLocal()
+    try:
+        yield ReadSession(db)
+    finally:
+        await run_in_threadpool(db.close)
+
+
 DbSession = Annotated[Session, Depends(get_db_session)]
+ReadDbSession = Annotated[ReadSession, Depends(get_read_session)]
 
 
 def get_current_user_id(
@@ -91,3 +108,20 @@ def _require_admin(
 CurrentUserId = Annotated[str, Depends(get_current_user_id)]
 CurrentMemberUserId = Annotated[str, Depends(_require_member_or_admin)]
 CurrentAdminUserId = Annotated[str, Depends(_require_admin)]
+
+# 스트리밍 응답용 세션: 핸들러가 끝나면 (응답 전송 전에) 닫아 연결을 오래 붙잡지 않는다
+StreamDbSession = Annotated[Session, Depends(get_db_session, scope="function")]
+
+
+def get_optional_stream_user_id(
+    request: Request,
+    db: StreamDbSession,
+    authorization: Annotated[str | None, Header()] = None,
+) -> str | None:
+    """토큰이 있으면 검증해 사용자 id를, 없으면 None을 반환한다."""
+    if authorization is None:
+        return None
+    return get_current_user_id(request, authorization, db)
+
+
+OptionalStreamUserId = Annotated[str | None, Depends(get_optional_stream_user_id)]
@@ -0,0 +1,70 @@
+"""API 검색 인덱스(사건/이슈/게시글) 전체 재색인 CLI.
+
+증분 색인(커밋 훅)이 놓친 문서나 매핑 변경을 복구할 때 쓴다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+
+from src.utils.elasticsearch.content_index import (
+    CONTENT_ENTITY_TYPES,
+    ensure_content_indices,
+    index_documents,
+)
+
+
+def reindex(entity_types: list[str], *, batch_size: int, recreate: bool) -> dict[str, int]:
+    """엔티티별 전체 문서를 batch_size개씩 벌크 색인한다. {엔티티 종류: 색인 수} 반환."""
+    from src.db.session import SessionLocal
+    from src.sql.search import SearchRepository
+
+    if not ensure_content_indices(recreate=recreate):
+        raise RuntimeError("Elasticsearch 인덱스를 준비할 수 없습니다 (ELASTICSEARCH_URL 확인)")
+
+    counts: dict[str, int] = {}
+    with SessionLocal() as db:
+        repository = SearchRepository(db)
+        for entity_type in entity_types:
+            counts[entity_type] = sum(
+                index_documents(entity_type, batch)
+                for batch in repository.iter_search_documents(entity_type, batch_size=batch_size)
+            )
+    return counts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="API 검색 인덱스를 DB에서 전체 재색인합니다")
+    parser.add_argument(
+        "--entity",
+        choices=[*CONTENT_ENTITY_TYPES, "all"],
+        default="all",
+        help="재색인 대상 (default: all)",
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=500, help="벌크 요청당 문서 수 (default: 500)"
+    )
+    parser.add_argument("--recreate", action="store_true", help="인덱스를 삭제 후 다시 생성")
+    args = parser.parse_args()
+
+    log = logging.getLogger(__name__)
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+    )
+
+    entity_types = list(CONTENT_ENTITY_TYPES) if args.entity == "all" else [args.entity]
+    try:
+        counts = reindex(entity_types, batch_size=args.batch_size, recreate=args.recreate)
+    except Exception as exc:
+        log.error("재색인 실패: %s", exc)
+        sys.exit(1)
+
+    summary = ", ".join(f"{entity_type} {count}건" for entity_type, count in counts.items())
+    print(f"[완료] {summary}")
+
+
+if __name__ == "__main__":
+    main()
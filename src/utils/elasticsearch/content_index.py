@@ -0,0 +1,199 @@
+"""API 검색용 사건/이슈/게시글 인덱스.
+
+엔티티별 인덱스(``{search_es_index_prefix}_events`` 등)에 파이프라인 인덱스와
+같은 nori 분석기 설정을 쓴다. 검색은 세 인덱스를 한 번에 조회해 관련도 점수,
+하이라이트, 엔티티 종류별 집계를 한 쿼리로 받는다. ES 미설정/장애 시 None을
+반환하고 호출부(SearchRepository)가 SQL 백엔드로 폴백한다.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable
+from datetime import datetime
+
+from elasticsearch.helpers import bulk
+
+from src.core.config import get_settings
+from src.utils.elasticsearch.client import INDEX_SETTINGS, get_es_client
+
+logger = logging.getLogger(__name__)
+
+CONTENT_ENTITY_TYPES = ("event", "issue", "post")
+CONTENT_INDEX_SETTINGS = {
+    "settings": INDEX_SETTINGS["settings"],
+    "mappings": {
+        "properties": {
+            "entity_type": {"type": "keyword"},
+            "title": {"type": "text", "analyzer": "nori_analyzer"},
+            "body": {"type": "text", "analyzer": "nori_analyzer"},
+            "date": {"type": "date"},
+        }
+    },
+}
+TITLE_BOOST = 2
+HIGHLIGHT = {
+    "pre_tags": ["<mark>"],
+    "post_tags": ["</mark>"],
+    "fields": {
+        "body": {"fragment_size": 120, "number_of_fragments": 1},
+        "title": {"number_of_fragments": 0},
+    },
+}
+
+
+def content_index_name(entity_type: str) -> str:
+    return f"{get_settings().search_es_index_prefix}_{entity_type}s"
+
+
+def ensure_content_indices(*, recreate: bool = False) -> bool:
+    """엔티티별 인덱스가 없으면 nori 매핑으로 생성. recreate면 삭제 후 생성."""
+    client = get_es_client()
+    if client is None:
+        return False
+    for entity_type in CONTENT_ENTITY_TYPES:
+        index_name = content_index_name(entity_type)
+        try:
+            if recreate:
+                client.indices.delete(index=index_name, ignore_unavailable=True)
+            if not client.indices.exists(index=index_name):
+                client.indices.create(index=index_name, body=CONTENT_INDEX_SETTINGS)
+                logger.info("ES 인덱스 생성: %s", index_name)
+        except Exception:
+            logger.exception("ES 인덱스 생성 실패: %s", index_name)
+            return False
+    return True
+
+
+def _iso(value: datetime | str | None) -> str | None:
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def index_documents(entity_type: str, documents: Iterable[dict]) -> int:
+    """{id, title, body, date} 문서를 벌크 색인한다. 엔티티 id를 _id로 써서 갱신도 겸한다."""
+    client = get_es_client()
+    if client is None:
+        return 0
+    index_name = content_index_name(entity_type)
+    actions = [
+        {
+            "_index": index_name,
+            "_id": doc["id"],
+            "_source": {
+                "entity_type": entity_type,
+                "title": doc["title"],
+                "body": doc["body"],
+                "date": _iso(doc["date"]),
+            },
+        }
+        for doc in documents
+    ]
+    if not actions:
+        return 0
+    try:
+        success, errors = bulk(client, actions, raise_on_error=False)
+        if errors:
+            logger.warning("ES 검색 인덱스 색인 일부 실패: %s %d건", entity_type, len(errors))
+        return success
+    except Exception:
+        logger.exception("ES 검색 인덱스 색인 실패: %s", entity_type)
+        return 0
+
+
+def delete_documents(entity_type: str, ids: Iterable[str]) -> int:
+    client = get_es_client()
+    if client is None:
+        return 0
+    index_name = content_index_name(entity_type)
+    actions = [{"_op_type": "delete", "_index": index_name, "_id": doc_id} for doc_id in ids]
+    if not actions:
+        return 0
+    try:
+        # 이미 없는 문서(404)는 실패로 보지 않는다
+        success, _ = bulk(client, actions, raise_on_error=False, raise_on_exception=False)
+        return success
+    except Exception:
+        logger.exception("ES 검색 인덱스 삭제 실패: %s", entity_type)
+        return 0
+
+
+def build_search_body(*, keyword: str, sort: str, size: int, offset: int) -> dict:
+    """client.search 키워드 인자. 관련도 점수·하이라이트·엔티티 종류별 집계를 한 번에."""
+    if sort == "-createdAt":
+        order: list = [{"date": "desc"}, "_score"]
+    else:
+        order = ["_score", {"date": "desc"}]
+    return {
+        "query": {
+            "multi_match": {
+                "query": keyword,
+                "fields": [f"title^{TITLE_BOOST}", "body"],
+                "type": "best_fields",
+                "operator": "and",
+            }
+        },
+        "highlight": HIGHLIGHT,
+        "aggs": {"entity_types": {"terms": {"field": "entity_type"}}},
+        "sort": order,
+        "from_": offset,
+        "size": size,
+        "track_total_hits": True,
+    }
+
+
+def search_documents(
+    *, keyword: str, entity_types: list[str], sort: str, size: int, offset: int
+) -> dict | None:
+    """엔티티별 인덱스를 한 번에 검색한다. ES 미설정/장애면 None.
+
+    반환: {"hits": [{entityType, id, title, body, date, highlight}], "total", "typeCounts"}
+    """
+    client = get_es_client()
+    if client is None:
+        return None
+    try:
+        resp = client.search(
+            index=",".join(content_index_name(t) for t in entity_types),
+            **build_search_body(keyword=keyword, sort=sort, size=size, offset=offset),
+        )
+    except Exception:
+        logger.warning("ES 검색 실패 — SQL 검색으로 폴백", exc_info=True)
+        return None
+
+    hits = []
+    for hit in resp["hits"]["hits"]:
+        source = hit["_source"]
+        fragments = hit.get("highlight", {})
+        highlight = (fragments.get("body") or fragments.get("title") or [None])[0]
+        hits.append(
+            {
+                "entityType": source["entity_type"],
+                "id": hit["_id"],
+                "title": source["title"],
+                "body": source["body"],
+                "date": source["date"],
+                "highlight": highlight,
+            }
+        )
+    buckets = resp.get("aggregations", {}).get("entity_types", {}).get("buckets", [])
+    return {
+        "hits": hits,
+        "total": resp["hits"]["total"]["value"],
+        "typeCounts": {bucket["key"]: bucket["doc_count"] for bucket in buckets},
+    }
+
+
+def sync_written_documents(bind, written: dict[str, set[str]]) -> None:
+    """커밋된 쓰기를 인덱스에 반영한다. 남아 있는 행은 재색인, 사라진 행은 삭제."""
+    from sqlalchemy.orm import Session
+
+    from src.sql.search import SearchRepository
+
+    with Session(bind=bind) as db:
+        repository = SearchRepository(db)
+        for entity_type, ids in written.items():
+            if not ids:
+                continue
+            documents = repository.list_search_documents(entity_type, ids=ids)
+            index_documents(entity_type, documents)
+            delete_documents(entity_type, ids - {doc["id"] for doc in documents})
@@ -0,0 +1,244 @@
+"""요약 결과 캐시.
+
+10분 주기 사이클마다 대부분 같은 키워드·기사가 다시 들어오므로,
+(모델, 키워드, 기사 지문) 단위로 LLM 요약을 저장해 두고 재사용한다.
+
+- 완전 적중: 프롬프트에 들어갈 기사 집합이 같거나 기존 집합의 부분집합 → LLM 호출 생략
+- 부분 적중: 기존 기사와 충분히 겹치고 일부만 추가됨 → 기존 요약 + 신규 기사만 전송
+- 미스: 전체 기사로 새로 요약
+"""
+
+from __future__ import annotations
+
+import hashlib
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+
+from src.core.config import get_settings
+from src.utils.news_summarizer.prompt_builder import (
+    MAX_CONTENT_CHARS,
+    estimate_tokens,
+    select_articles,
+)
+
+SIGNATURE_CONTENT_CHARS = 200
+PAYLOAD_FIELDS = ("summary", "key_points", "sentiment", "category", "tags")
+
+
+def article_signature(article: dict) -> str:
+    """기사 1건의 지문. 정규화 URL + 본문 앞부분 해시."""
+    from src.utils.pipeline.update_classifier import normalize_url
+
+    url = article.get("url") or article.get("original_link") or article.get("link") or ""
+    base = normalize_url(url) if url else article.get("title", "")
+    prefix = (article.get("content_text") or "")[:SIGNATURE_CONTENT_CHARS].strip()
+    return hashlib.sha256(f"{base}|{prefix}".encode()).hexdigest()[:16]
+
+
+def compute_fingerprint(signatures: list[str]) -> str:
+    """기사 지문 집합(순서 무관)의 해시."""
+    return hashlib.sha256("\n".join(sorted(set(signatures))).encode()).hexdigest()
+
+
+def _article_tokens(article: dict) -> int:
+    content = (article.get("content_text") or "")[:MAX_CONTENT_CHARS]
+    return estimate_tokens(f"{article.get('title', '')}\n{content}")
+
+
+@dataclass
+class CacheLookup:
+    """캐시 조회 결과."""
+
+    hits: dict[str, dict] = field(default_factory=dict)  # keyword -> payload
+    partial: dict[str, dict] = field(default_factory=dict)  # keyword -> 이전 payload
+    new_articles: dict[str, list[dict]] = field(default_factory=dict)  # 부분 적중 신규 기사
+    misses: list[str] = field(default_factory=list)
+    saved_tokens: int = 0
+
+
+class SummaryCache:
+    """news_summary_cache 테이블 기반 요약 캐시. 커밋은 호출부 책임."""
+
+    def __init__(
+        self,
+        db: Session,
+        *,
+        ttl_hours: int | None = None,
+        partial_min_overlap: float | None = None,
+    ) -> None:
+        settings = get_settings()
+        self.db = db
+        self.ttl = timedelta(
+            hours=ttl_hours if ttl_hours is not None else settings.summary_cache_ttl_hours
+        )
+        self.partial_min_overlap = (
+            partial_min_overlap
+            if partial_min_overlap is not None
+            else settings.summary_cache_partial_min_overlap
+        )
+
+    def lookup(self, model: str, groups: dict[str, list[dict]]) -> CacheLookup:
+        """키워드 그룹별로 캐시를 조회해 적중/부분 적중/미스로 분류한다."""
+        from src.models.news_summary import NewsSummaryCache
+
+        result = CacheLookup()
+        if not groups:
+            return result
+
+        now = datetime.now(timezone.utc)
+        rows = (
+            self.db.execute(
+                select(NewsSummaryCache)
+                .where(
+                    NewsSummaryCache.model == model,
+                    NewsSummaryCache.keyword.in_(list(groups)),
+                    NewsSummaryCache.created_at >= now - self.ttl,
+                )
+                .order_by(NewsSummaryCache.created_at.desc())
+            )
+            .scalars()
+            .all()
+        )
+        by_keyword: dict[str, list[NewsSummaryCache]] = {}
+        for row in rows:
+            by_keyword.setdefault(row.keyword, []).append(row)
+
+        for keyword, articles in groups.items():
+            selected = select_articles(articles)
+            signatures = [article_signature(a) for a in selected]
+            fingerprint = compute_fingerprint(signatures)
+            candidates = by_keyword.get(keyword, [])
+
+            exact = next((c for c in candidates if c.fingerprint == fingerprint), None)
+            latest = candidates[0] if candidates else None
+            if exact is None and latest is not None:
+                cached_sigs = set(latest.article_signatures or [])
+                fresh = [a for a, s in zip(selected, signatures) if s not in cached_sigs]
+                if not fresh:
+                    # 기사가 빠지기만 했으면 요약 내용은 여전히 유효
+                    exact = latest
+                elif selected:
+                    overlap = 1 - len(fresh) / len(selected)
+                    if overlap >= self.partial_min_overlap:
+                        result.partial[keyword] = dict(latest.payload)
+                        result.new_articles[keyword] = fresh
+                        result.saved_tokens += sum(
+                            _article_tokens(a)
+                            for a, s in zip(selected, signatures)
+                            if s in cached_sigs
+                        )
+                        continue
+
+            if exact is not None:
+                exact.hit_count += 1
+                exact.last_used_at = now
+                result.hits[keyword] = dict(exact.payload)
+                result.saved_tokens += exact.token_cost
+            else:
+                result.misses.append(keyword)
+
+        self.db.flush()
+        return result
+
+    def store(self, model: str, entries: dict[str, tuple[list[dict], dict, int]]) -> int:
+        """새로 요약한 결과를 저장한다.
+
+        Args:
+            entries: keyword -> (그룹 기사 목록, 요약 payload, 추정 토큰 비용)
+
+        Returns:
+            저장(또는 갱신)된 항목 수
+        """
+        from src.models.news_summary import NewsSummaryCache
+
+        now = datetime.now(timezone.utc)
+        stored = 0
+        for keyword, (articles, payload, token_cost) in entries.items():
+            if not payload.get("summary"):
+                continue
+            signatures = [article_signature(a) for a in select_articles(articles)]
+            fingerprint = compute_fingerprint(signatures)
+            clean = {k: payload.get(k) for k in PAYLOAD_FIELDS if k in payload}
+
+            existing = self.db.execute(
+                select(NewsSummaryCache).where(
+                    NewsSummaryCache.model == model,
+                    NewsSummaryCache.keyword == keyword,
+                    NewsSummaryCache.fingerprint == fingerprint,
+                )
+            ).scalar_one_or_none()
+            if existing is not None:
+                existing.payload = clean
+                existing.article_signatures = signatures
+                existing.token_cost = token_cost
+                existing.created_at = now
+                existing.last_used_at = now
+            else:
+                self.db.add(
+                    NewsSummaryCache(
+                        id=str(uuid.uuid4()),
+                        model=model,
+                        keyword=keyword[:100],
+                        fingerprint=fingerprint,
+                        article_signatures=signatures,
+                        payload=clean,
+                        token_cost=token_cost,
+                        hit_count=0,
+                        created_at=now,
+                        last_used_at=now,
+                    )
+                )
+            stored += 1
+
+        self.purge_expired(now=now)
+        self.db.flush()
+        return stored
+
+    def store_now(
+        self, model: str, keyword: str, articles: list[dict], payload: dict, token_cost: int
+    ) -> None:
+        """스트리밍 중 완성된 요약 1건을 즉시 저장하고 커밋한다.
+
+        생성 도중 LLM 호출이 실패해도 이미 받은 요약은 다음 사이클에서 재사용된다.
+        """
+        self.store(model, {keyword: (articles, payload, token_cost)})
+        self.db.commit()
+
+    def purge_expired(self, *, now: datetime | None = None) -> int:
+        """TTL이 지난 캐시 항목을 삭제한다."""
+        from src.models.news_summary import NewsSummaryCache
+
+        now = now or datetime.now(timezone.utc)
+        result = self.db.execute(
+            delete(NewsSummaryCache).where(NewsSummaryCache.created_at < now - self.ttl)
+        )
+        return result.rowcount or 0
+
+
+@contextmanager
+def open_summary_cache(db_url: str | None = None) -> Iterator[SummaryCache]:
+    """전용 세션으로 SummaryCache를 열고, 블록 종료 시 커밋한다."""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+
+    if db_url:
+        engine = create_engine(db_url, pool_pre_ping=True)
+        SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    else:
+        from src.db.session import SessionLocal
+
+    session = SessionLocal()
+    try:
+        yield SummaryCache(session)
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
@@ -4,6 +4,7 @@ Usage:
     uv run trend-korea-summarize-news --input news_crawl_results.json
     uv run trend-korea-summarize-news --input results.json --model llama3:8b
     uv run trend-korea-summarize-news --input results.json --save-db
+    uv run trend-korea-summarize-news --input results.json --save-db --use-cache
 """
 
 from __future__ import annotations
@@ -15,7 +16,7 @@ from src.utils.news_summarizer.summarizer import run_summarize, save_to_db
 
 def main() -> None:
     parser = argparse.ArgumentParser(
-        description="뉴스 크롤링 결과를 Ollama LLM으로 키워드별 요약 (1회 통합 요청)"
+        description="뉴스 크롤링 결과를 Ollama LLM으로 키워드별 요약 (토큰 예산 단위 통합 요청)"
     )
     parser.add_argument("--input", required=True, help="뉴스 크롤링 결과 JSON/JSONL 파일 경로")
     parser.add_argument("--out", default=None, help="출력 JSON 파일 경로")
@@ -24,13 +25,24 @@ def main() -> None:
     parser.add_argument(
         "--db-url", default=None, help="DB URL (미지정 시 .env의 DATABASE_URL 사용)"
     )
+    parser.add_argument(
+        "--use-cache",
+        action="store_true",
+        help="DB 요약 캐시 사용 (기사 집합이 같은 키워드는 LLM 호출 생략)",
+    )
     args = parser.parse_args()
 
     out_file = args.out or args.input.replace(".json", "_summaries.json").replace(
         ".jsonl", "_summaries.json"
     )
 
-    result = run_summarize(args.input, out_file, args.model)
+    if args.use_cache:
+        from src.utils.news_summarizer.cache import open_summary_cache
+
+        with open_summary_cache(args.db_url) as cache:
+            result = run_summarize(args.input, out_file, args.model, cache=cache)
+    else:
+        result = run_summarize(args.input, out_file, args.model)
 
     tokens = result["total_tokens"]
     print(
@@ -40,6 +52,15 @@ def main() -> None:
     print(
         f"  총 토큰: {tokens['total']} (prompt: {tokens['prompt']}, completion: {tokens['completion']})"
     )
+    cache_stats = result.get("cache", {})
+    if args.use_cache:
+        print(
+            f"  캐시: 적중 {cache_stats.get('hits', 0)}, 부분 {cache_stats.get('partial_hits', 0)}, "
+            f"절감 추정 {cache_stats.get('saved_tokens', 0)} tokens"
+        )
+    prompt_stats = result.get("prompt", {})
+    if prompt_stats.get("dropped_articles"):
+        print(f"  예산 초과로 제외된 기사: {prompt_stats['dropped_articles']}건")
     print(f"  출력: {out_file}")
 
     if args.save_db:
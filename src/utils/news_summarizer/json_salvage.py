@@ -0,0 +1,159 @@
+"""깨지거나 잘린 LLM JSON 응답에서 완성된 키워드 객체를 복구한다.
+
+경량 모델은 따옴표 하나, 쉼표 하나 때문에 전체 응답이 json.loads에 실패하거나
+max_tokens에 걸려 배열이 중간에 끊기는 일이 잦다. 응답 전체를 버리는 대신
+문자 단위로 괄호 깊이와 문자열 상태를 추적하면서, 배열(또는 최상위)에 놓인
+객체가 닫힐 때마다 개별적으로 파싱한다. 이스케이프되지 않은 따옴표로 문자열
+상태가 어긋나면 다음 "},{" 경계에서 새 객체로 다시 맞춘다.
+
+스트리밍 응답에도 그대로 쓸 수 있도록 feed()로 조각을 받아 새로 완성된
+객체만 돌려준다.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+
+_TRAILING_COMMA_RE = re.compile(r",\s*([}\]])")
+_SMART_QUOTES = str.maketrans({"“": '"', "”": '"'})
+
+
+def _loads_tolerant(text: str) -> object | None:
+    """객체 1개 분량의 텍스트를 관대하게 파싱한다. 실패 시 None."""
+    for candidate in (text, _TRAILING_COMMA_RE.sub(r"\1", text)):
+        try:
+            # strict=False: 문자열 안의 raw 줄바꿈/탭 허용
+            return json.loads(candidate, strict=False)
+        except json.JSONDecodeError:
+            continue
+    # 키/값 구분 따옴표를 스마트 따옴표로 쓴 경우
+    repaired = _TRAILING_COMMA_RE.sub(r"\1", text.translate(_SMART_QUOTES))
+    try:
+        return json.loads(repaired, strict=False)
+    except json.JSONDecodeError:
+        return None
+
+
+def _boundary_close(text: str, start: int, i: int) -> int | None:
+    """text[i]의 "{" 앞이 "}," 경계이면 그 "}" 위치를 돌려준다."""
+    j = i - 1
+    while j > start and text[j].isspace():
+        j -= 1
+    if j <= start or text[j] != ",":
+        return None
+    j -= 1
+    while j > start and text[j].isspace():
+        j -= 1
+    return j if j > start and text[j] == "}" else None
+
+
+class StreamingJsonSalvager:
+    """조각 단위로 입력받아 완성된 요약 객체를 점진적으로 꺼낸다.
+
+    배열 원소(또는 최상위)인 객체 중 summary 필드가 있는 것만 결과로 본다.
+    중첩 배열 안의 보조 객체(entities 등)는 summary가 없으므로 걸러진다.
+    """
+
+    def __init__(self, required_key: str = "summary") -> None:
+        self.required_key = required_key
+        self.objects: list[dict] = []
+        self.skipped = 0  # 닫혔지만 파싱에 실패한 후보 객체 수
+        # 아직 닫히지 않은 후보 객체부터의 텍스트만 보관한다
+        self._text = ""
+        self._pos = 0  # _text 안에서 다음에 스캔할 위치
+        self._stack: list[tuple[str, int]] = []  # (여는 괄호, _text 기준 시작 위치)
+        self._in_string = False
+        self._escape = False
+
+    def feed(self, chunk: str) -> list[dict]:
+        """텍스트 조각을 추가하고, 이번에 새로 완성된 객체 목록을 반환한다."""
+        if not chunk:
+            return []
+        self._text += chunk
+        text = self._text
+
+        completed: list[dict] = []
+        for i in range(self._pos, len(text)):
+            ch = text[i]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                elif ch == "{" and self._at_candidate_level():
+                    # 이스케이프 안 된 따옴표로 문자열 상태가 뒤집히면 이후 객체가 전부
+                    # 문자열 안으로 보인다. 후보 객체 경계("},{")를 만나면 거기서 재동기화한다.
+                    self._resync(text, i, completed)
+                continue
+
+            if ch == '"' and self._stack:
+                self._in_string = True
+            elif ch in "{[":
+                self._stack.append((ch, i))
+            elif ch in "}]" and self._stack:
+                opener, start = self._stack.pop()
+                if ch == "}" and opener == "{":
+                    parent = self._stack[-1][0] if self._stack else None
+                    if parent in (None, "["):
+                        obj = self._accept(text[start : i + 1])
+                        if obj is not None:
+                            completed.append(obj)
+                elif (ch == "]") != (opener == "["):
+                    # 괄호 짝이 맞지 않음 → 깊이를 복구할 수 없으므로 상태 초기화
+                    self._stack.clear()
+        self._pos = len(text)
+        self._trim()
+
+        self.objects.extend(completed)
+        return completed
+
+    def _at_candidate_level(self) -> bool:
+        """스택 맨 위가 배열 원소(또는 최상위) 객체인지."""
+        if not self._stack or self._stack[-1][0] != "{":
+            return False
+        return len(self._stack) == 1 or self._stack[-2][0] == "["
+
+    def _resync(self, text: str, i: int, completed: list[dict]) -> None:
+        start = self._stack[-1][1]
+        close = _boundary_close(text, start, i)
+        if close is None:
+            return
+        # 문자열 안에 "},{"가 그대로 들어간 정상 객체도 여기서 잘리지만,
+        # 요약 응답에서는 따옴표 누락이 훨씬 흔하므로 경계 쪽을 택한다.
+        obj = self._accept(text[start : close + 1])
+        if obj is not None:
+            completed.append(obj)
+        self._stack[-1] = ("{", i)
+        self._in_string = False
+
+    def _trim(self) -> None:
+        """열린 후보 객체 앞부분을 버려 버퍼가 응답 전체만큼 자라지 않게 한다."""
+        keep_from = next((start for opener, start in self._stack if opener == "{"), len(self._text))
+        if keep_from == 0:
+            return
+        self._text = self._text[keep_from:]
+        self._pos -= keep_from
+        self._stack = [(opener, start - keep_from) for opener, start in self._stack]
+
+    def _accept(self, text: str) -> dict | None:
+        data = _loads_tolerant(text)
+        if isinstance(data, dict) and data.get(self.required_key):
+            return data
+        if data is None and f'"{self.required_key}"' in text:
+            self.skipped += 1
+        return None
+
+    @property
+    def truncated(self) -> bool:
+        """입력이 객체 중간에서 끝났는지 여부."""
+        return bool(self._stack)
+
+
+def salvage_json_objects(raw: str, required_key: str = "summary") -> list[dict]:
+    """전체 응답 텍스트에서 복구 가능한 객체를 모두 꺼낸다."""
+    salvager = StreamingJsonSalvager(required_key)
+    salvager.feed(raw)
+    return salvager.objects
@@ -1,8 +1,19 @@
-"""Ollama LLM 클라이언트 및 시스템 프롬프트."""
+"""Ollama LLM 클라이언트 및 시스템 프롬프트.
+
+클라이언트는 base_url 단위로 프로세스 내에서 재사용한다(커넥션 풀 공유).
+요청마다 전체 데드라인을 두고, 연결 오류/5xx는 지터를 준 지수 백오프로 재시도한다.
+연속 실패가 쌓이면 서킷을 열어 일정 시간 동안 즉시 실패시킨다.
+"""
 
 from __future__ import annotations
 
+import random
+import threading
+import time
+from collections.abc import Callable
+
 from src.core.config import get_settings
+from src.utils.news_summarizer.json_salvage import StreamingJsonSalvager
 
 SYSTEM_PROMPT = """\
 뉴스 기사를 키워드별로 요약하세요.
@@ -25,37 +36,254 @@ SYSTEM_PROMPT = """\
 3. key_points는 3개 이상, 각각 한 문장
 4. tags는 인물명, 기관명, 핵심 주제어를 3~7개
 5. 입력에 없는 키워드를 추가하지 말 것
+6. "기존 요약"이 주어진 키워드는 기존 요약에 신규 기사 내용을 반영해 갱신된 요약을 작성
 """
 
 
+class LLMUnavailableError(RuntimeError):
+    """서킷이 열려 있어 LLM 요청을 보내지 않은 경우."""
+
+
+class LLMDeadlineExceeded(TimeoutError):
+    """요청 전체 데드라인을 넘긴 경우."""
+
+
+class CircuitBreaker:
+    """연속 실패 횟수 기반 서킷 브레이커.
+
+    closed → (failure_threshold회 연속 실패) → open → (reset_seconds 경과) → half-open.
+    half-open 상태에서는 요청 1건을 흘려보내고, 성공하면 closed, 실패하면 다시 open.
+    """
+
+    def __init__(self, failure_threshold: int, reset_seconds: float) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.failures = 0
+        self.opened_at: float | None = None
+        # half-open에서 흘려보낸 시험 요청이 아직 끝나지 않았는지
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_seconds:
+            return "half-open"
+        return "open"
+
+    def allow(self) -> bool:
+        with self._lock:
+            state = self.state
+            if state == "closed":
+                return True
+            if state == "open" or self._trial_in_flight:
+                return False
+            self._trial_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._trial_in_flight = False
+            self.failures = 0
+            self.opened_at = None
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._trial_in_flight = False
+            self.failures += 1
+            if self.opened_at is not None or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+
+
+_pool_lock = threading.Lock()
+_clients: dict[str, object] = {}
+_breakers: dict[str, CircuitBreaker] = {}
+_slots: dict[str, threading.BoundedSemaphore] = {}
+
+
+def _pool_key(client) -> str:
+    return str(getattr(client, "base_url", id(client)))
+
+
+def _breaker_for(client) -> CircuitBreaker:
+    key = _pool_key(client)
+    with _pool_lock:
+        if key not in _breakers:
+            settings = get_settings()
+            _breakers[key] = CircuitBreaker(
+                settings.llm_circuit_failure_threshold, settings.llm_circuit_reset_seconds
+            )
+        return _breakers[key]
+
+
+def _slot_for(client) -> threading.BoundedSemaphore:
+    key = _pool_key(client)
+    with _pool_lock:
+        if key not in _slots:
+            _slots[key] = threading.BoundedSemaphore(max(1, get_settings().llm_max_concurrency))
+        return _slots[key]
+
+
+def reset_llm_clients() -> None:
+    """풀링된 클라이언트와 서킷 상태를 초기화한다 (설정 변경/테스트용)."""
+    with _pool_lock:
+        _clients.clear()
+        _breakers.clear()
+        _slots.clear()
+
+
 def create_ollama_client(model: str | None = None) -> tuple:
-    """Ollama OpenAI-compatible 클라이언트를 생성한다.
+    """Ollama OpenAI-compatible 클라이언트를 반환한다.
+
+    같은 base_url이면 프로세스 내에서 만든 클라이언트를 재사용한다.
+    SDK 자체 재시도는 끄고 call_ollama의 재시도 정책만 적용한다.
 
     Returns:
         (client, model_name) 튜플
     """
+    import httpx
     from openai import OpenAI
 
     settings = get_settings()
     base_url = settings.ollama_base_url
     model = model or settings.ollama_default_model
-    client = OpenAI(api_key="ollama", base_url=base_url)
+    with _pool_lock:
+        client = _clients.get(base_url)
+        if client is None:
+            client = OpenAI(
+                api_key="ollama",
+                base_url=base_url,
+                timeout=httpx.Timeout(
+                    settings.llm_read_timeout_seconds,
+                    connect=settings.llm_connect_timeout_seconds,
+                ),
+                max_retries=0,
+            )
+            _clients[base_url] = client
     return client, model
 
 
-def call_ollama(client, model: str, system: str, user: str) -> tuple[str, dict]:
-    """Ollama에 요약 요청을 보낸다. (응답 텍스트, 토큰 사용량) 반환."""
-    r = client.chat.completions.create(
+def _backoff_seconds(attempt: int, base: float, cap: float = 30.0) -> float:
+    """지수 백오프 + full jitter."""
+    return random.uniform(0, min(cap, base * (2**attempt)))
+
+
+def call_ollama(
+    client,
+    model: str,
+    system: str,
+    user: str,
+    on_item: Callable[[dict], None] | None = None,
+) -> tuple[str, dict]:
+    """Ollama에 요약 요청을 보낸다. (응답 텍스트, 토큰 사용량·지표) 반환.
+
+    응답은 항상 스트리밍으로 받아 time-to-first-token과 생성 속도를 잰다.
+    on_item이 주어지면 키워드 요약 객체가 하나 완성될 때마다 생성 완료를
+    기다리지 않고 on_item을 호출한다.
+
+    반환 dict: prompt, completion, queue_ms, ttft_ms, duration_ms,
+    tokens_per_sec, attempts
+
+    Raises:
+        LLMUnavailableError: 서킷이 열려 있음
+        LLMDeadlineExceeded: 전체 데드라인 초과
+    """
+    import openai
+
+    settings = get_settings()
+    breaker = _breaker_for(client)
+    if not breaker.allow():
+        raise LLMUnavailableError(f"LLM 서킷 open ({breaker.failures}회 연속 실패)")
+
+    retryable = (openai.APIConnectionError, openai.InternalServerError, openai.RateLimitError)
+    queued_at = time.monotonic()
+    with _slot_for(client):
+        queue_ms = int((time.monotonic() - queued_at) * 1000)
+        deadline = time.monotonic() + settings.llm_request_deadline_seconds
+        attempt = 0
+        while True:
+            attempt += 1
+            emitted: list[dict] = []
+
+            def _track(item: dict, _emitted=emitted) -> None:
+                _emitted.append(item)
+                if on_item is not None:
+                    on_item(item)
+
+            try:
+                text, usage = _stream_completion(client, model, system, user, _track, deadline)
+            except retryable:
+                # 이미 요약을 흘려보낸 뒤라면 재시도 시 중복되므로 그대로 실패 처리
+                wait = _backoff_seconds(attempt - 1, settings.llm_retry_backoff_seconds)
+                if (
+                    emitted
+                    or attempt > settings.llm_max_retries
+                    or time.monotonic() + wait >= deadline
+                ):
+                    breaker.record_failure()
+                    raise
+                time.sleep(wait)
+                continue
+            except Exception:
+                breaker.record_failure()
+                raise
+            breaker.record_success()
+            usage.update(queue_ms=queue_ms, attempts=attempt)
+            return text, usage
+
+
+def _stream_completion(
+    client,
+    model: str,
+    system: str,
+    user: str,
+    on_item: Callable[[dict], None],
+    deadline: float,
+) -> tuple[str, dict]:
+    from src.utils.news_summarizer.prompt_builder import estimate_tokens
+
+    started = time.monotonic()
+    stream = client.chat.completions.create(
         model=model,
         messages=[
             {"role": "system", "content": system},
             {"role": "user", "content": user},
         ],
         temperature=0.3,
+        stream=True,
+        stream_options={"include_usage": True},
+    )
+    salvager = StreamingJsonSalvager()
+    parts: list[str] = []
+    first_token_at: float | None = None
+    usage = {"prompt": 0, "completion": 0}
+    try:
+        for event in stream:
+            if time.monotonic() > deadline:
+                raise LLMDeadlineExceeded("LLM 요청 데드라인 초과")
+            if event.choices:
+                delta = event.choices[0].delta.content or ""
+                if delta and first_token_at is None:
+                    first_token_at = time.monotonic()
+                parts.append(delta)
+                for item in salvager.feed(delta):
+                    on_item(item)
+            if getattr(event, "usage", None):
+                usage = {
+                    "prompt": event.usage.prompt_tokens,
+                    "completion": event.usage.completion_tokens,
+                }
+    finally:
+        stream.close()
+
+    finished = time.monotonic()
+    text = "".join(parts) or "{}"
+    completion = usage["completion"] or estimate_tokens(text)
+    generation = finished - (first_token_at or started)
+    usage.update(
+        ttft_ms=int(((first_token_at or finished) - started) * 1000),
+        duration_ms=int((finished - started) * 1000),
+        tokens_per_sec=round(completion / generation, 2) if generation > 0 else 0.0,
     )
-    text = r.choices[0].message.content or "{}"
-    usage = {
-        "prompt": r.usage.prompt_tokens if r.usage else 0,
-        "completion": r.usage.completion_tokens if r.usage else 0,
-    }
     return text, usage
@@ -3,12 +3,16 @@
 from __future__ import annotations
 
 import json
+import re
 from collections import defaultdict
+from dataclasses import dataclass, field
 from pathlib import Path
 
 MAX_ARTICLES_PER_KEYWORD = 3
 MAX_CONTENT_CHARS = 500
 
+_HANGUL_RE = re.compile(r"[가-힣ㄱ-ㅎㅏ-ㅣ]")
+
 
 def load_articles(input_path: str) -> list[dict]:
     """JSON 또는 JSONL 파일에서 기사 목록을 로드한다."""
@@ -53,25 +57,189 @@ def group_by_keyword(articles: list[dict]) -> dict[str, list[dict]]:
     return dict(groups)
 
 
-def build_combined_prompt(groups: dict[str, list[dict]]) -> str:
-    """모든 키워드의 기사를 하나의 프롬프트로 합친다."""
-    parts = [f"총 {len(groups)}개 키워드에 대한 뉴스 기사입니다.\n"]
+def article_key(article: dict) -> str:
+    """기사 동일성 판단 키. URL이 없으면 제목으로 대신한다."""
+    return article.get("url") or article.get("title", "")
+
+
+def select_articles(articles: list[dict]) -> list[dict]:
+    """프롬프트에 실제로 포함되는 상위 기사만 confidence 내림차순으로 고른다."""
+    ranked = sorted(articles, key=lambda a: -a.get("confidence", 0))
+    return ranked[:MAX_ARTICLES_PER_KEYWORD]
 
-    for keyword, articles in groups.items():
-        selected = articles[:MAX_ARTICLES_PER_KEYWORD]
-        parts.append(f"{'=' * 50}")
-        parts.append(f'[키워드: "{keyword}"] 관련 기사 {len(selected)}건')
-        parts.append(f"{'=' * 50}")
-
-        for i, article in enumerate(selected, 1):
-            title = article.get("title", "(제목 없음)")
-            content = article.get("content_text", "")[:MAX_CONTENT_CHARS]
-            channel = article.get("channel", "")
-            parts.append(f"\n--- 기사 {i} [{channel}] ---")
-            parts.append(f"제목: {title}")
-            if content:
-                parts.append(f"본문: {content}")
-
-        parts.append("")
 
+def estimate_tokens(text: str) -> int:
+    """토크나이저 없이 토큰 수를 근사한다.
+
+    한글은 음절당 약 1토큰, 그 외 문자는 약 4자당 1토큰으로 계산한다.
+    """
+    if not text:
+        return 0
+    hangul = len(_HANGUL_RE.findall(text))
+    return hangul + (len(text) - hangul + 3) // 4
+
+
+def _format_article(label: str, article: dict) -> list[str]:
+    title = article.get("title", "(제목 없음)")
+    content = (article.get("content_text") or "")[:MAX_CONTENT_CHARS]
+    channel = article.get("channel", "")
+    lines = [f"\n--- 기사 {label} [{channel}] ---", f"제목: {title}"]
+    if content:
+        lines.append(f"본문: {content}")
+    return lines
+
+
+def format_keyword_section(
+    keyword: str,
+    articles: list[dict],
+    previous_summary: str | None = None,
+    refs: dict[str, str] | None = None,
+) -> str:
+    """키워드 하나에 대한 프롬프트 블록을 만든다.
+
+    previous_summary가 주어지면 기존 요약을 먼저 싣고, articles는 그 이후
+    새로 추가된 기사로 취급한다 (캐시 부분 재사용).
+
+    refs가 주어지면 프롬프트 전체에서 기사 번호를 공유한다. 이미 등장한 기사는
+    본문을 다시 싣지 않고 번호만 참조하며, 새 기사는 refs에 등록된다.
+    """
+    parts = [f"{'=' * 50}"]
+    if previous_summary:
+        parts.append(f'[키워드: "{keyword}"] 기존 요약 + 신규 기사 {len(articles)}건')
+    else:
+        parts.append(f'[키워드: "{keyword}"] 관련 기사 {len(articles)}건')
+    parts.append(f"{'=' * 50}")
+
+    if previous_summary:
+        parts.append(f"기존 요약: {previous_summary}")
+
+    for i, article in enumerate(articles, 1):
+        if refs is None:
+            parts.extend(_format_article(str(i), article))
+            continue
+        key = article_key(article)
+        if key in refs:
+            parts.append(f"\n--- 기사 {refs[key]} (위 동일 기사 참조) ---")
+        else:
+            refs[key] = f"A{len(refs) + 1}"
+            parts.extend(_format_article(refs[key], article))
+
+    parts.append("")
     return "\n".join(parts)
+
+
+def _prompt_header(keyword_count: int) -> str:
+    return f"총 {keyword_count}개 키워드에 대한 뉴스 기사입니다.\n"
+
+
+@dataclass
+class PromptChunk:
+    """LLM 요청 1회 분량의 프롬프트."""
+
+    prompt: str
+    keywords: list[str]
+    estimated_tokens: int
+    dropped_articles: int = 0  # 예산 초과로 제외된 기사 수
+    trimmed_keywords: list[str] = field(default_factory=list)  # 기사가 제외된 키워드
+    dedup_saved_tokens: int = 0  # 중복 기사 참조 처리로 아낀 토큰 수
+    over_budget: bool = False  # 기사를 줄여도 단일 키워드가 예산을 넘는 경우
+
+
+def _render_chunk(
+    entries: list[tuple[str, list[dict], str | None]],
+) -> tuple[str, int]:
+    """키워드 블록들을 하나의 프롬프트로 렌더링한다. (프롬프트, 중복 절감 토큰) 반환."""
+    refs: dict[str, str] = {}
+    parts = [_prompt_header(len(entries))]
+    full_tokens = estimate_tokens(parts[0])
+    for keyword, articles, previous in entries:
+        parts.append(format_keyword_section(keyword, articles, previous, refs))
+        full_tokens += estimate_tokens(format_keyword_section(keyword, articles, previous))
+    prompt = "\n".join(parts)
+    return prompt, max(0, full_tokens - estimate_tokens(prompt))
+
+
+def pack_prompts(
+    groups: dict[str, list[dict]],
+    previous_summaries: dict[str, str] | None = None,
+    *,
+    token_budget: int | None = None,
+    reserved_tokens: int = 0,
+) -> list[PromptChunk]:
+    """키워드 블록을 토큰 예산 안에서 여러 요청으로 나눠 담는다.
+
+    - 키워드별 기사는 confidence 순으로 상위 MAX_ARTICLES_PER_KEYWORD건만 싣는다.
+    - 여러 키워드에 걸친 기사는 한 요청 안에서 한 번만 싣고 번호로 참조한다.
+    - 현재 요청에 들어가지 않는 키워드는 다음 요청으로 넘긴다.
+    - 빈 요청에도 들어가지 않으면 confidence가 낮은 기사부터 제외하고,
+      제외 건수를 dropped_articles로 남긴다.
+
+    Args:
+        groups: keyword -> 기사 목록
+        previous_summaries: 부분 캐시 적중 키워드의 기존 요약
+        token_budget: 요청당 토큰 예산. None이면 한 요청에 모두 담는다.
+        reserved_tokens: 시스템 프롬프트 등 예산에서 미리 뺄 토큰 수
+    """
+    previous_summaries = previous_summaries or {}
+    budget = None if token_budget is None else max(1, token_budget - reserved_tokens)
+
+    chunks: list[PromptChunk] = []
+    current: list[tuple[str, list[dict], str | None]] = []
+    dropped = 0
+    trimmed: list[str] = []
+
+    def _tokens(entries: list[tuple[str, list[dict], str | None]]) -> int:
+        return estimate_tokens(_render_chunk(entries)[0])
+
+    def _flush(over_budget: bool = False) -> None:
+        nonlocal current, dropped, trimmed
+        if not current:
+            return
+        prompt, saved = _render_chunk(current)
+        chunks.append(
+            PromptChunk(
+                prompt=prompt,
+                keywords=[kw for kw, _, _ in current],
+                estimated_tokens=estimate_tokens(prompt),
+                dropped_articles=dropped,
+                trimmed_keywords=trimmed,
+                dedup_saved_tokens=saved,
+                over_budget=over_budget,
+            )
+        )
+        current, dropped, trimmed = [], 0, []
+
+    for keyword, articles in groups.items():
+        entry = (keyword, select_articles(articles), previous_summaries.get(keyword))
+        if budget is None or _tokens(current + [entry]) <= budget:
+            current.append(entry)
+            continue
+
+        _flush()
+        selected = list(entry[1])
+        # 기존 요약이 있으면 기사 없이도 갱신할 내용이 남으므로 0건까지 허용
+        min_articles = 0 if entry[2] else 1
+        while len(selected) > min_articles and _tokens([(keyword, selected, entry[2])]) > budget:
+            selected.pop()
+            dropped += 1
+        if len(selected) < len(entry[1]):
+            trimmed.append(keyword)
+        current.append((keyword, selected, entry[2]))
+        if _tokens(current) > budget:
+            _flush(over_budget=True)
+
+    _flush()
+    return chunks
+
+
+def build_combined_prompt(
+    groups: dict[str, list[dict]],
+    previous_summaries: dict[str, str] | None = None,
+) -> str:
+    """모든 키워드의 기사를 하나의 프롬프트로 합친다 (예산 제한 없음).
+
+    previous_summaries에 있는 키워드는 groups의 기사를 신규 기사로 보고
+    기존 요약과 함께 싣는다.
+    """
+    chunks = pack_prompts(groups, previous_summaries)
+    return chunks[0].prompt if chunks else _prompt_header(0)
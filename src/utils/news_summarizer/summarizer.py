@@ -8,11 +8,24 @@ import uuid
 from datetime import datetime, timezone
 from pathlib import Path
 
-from src.utils.news_summarizer.llm_client import SYSTEM_PROMPT, call_ollama, create_ollama_client
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.core.config import get_settings
+from src.utils.news_summarizer.cache import CacheLookup, SummaryCache
+from src.utils.news_summarizer.json_salvage import salvage_json_objects
+from src.utils.news_summarizer.llm_client import (
+    SYSTEM_PROMPT,
+    LLMUnavailableError,
+    call_ollama,
+    create_ollama_client,
+)
 from src.utils.news_summarizer.prompt_builder import (
-    build_combined_prompt,
+    estimate_tokens,
+    format_keyword_section,
     group_by_keyword,
     load_articles,
+    pack_prompts,
+    select_articles,
 )
 
 
@@ -36,7 +49,7 @@ def _clean_json_response(raw: str) -> dict:
         for item in data:
             if isinstance(item, dict) and "keyword" in item and "summary" in item:
                 merged.append(item)
-            elif isinstance(item, dict) and "keywords" in item:
+            elif isinstance(item, dict) and isinstance(item.get("keywords"), list):
                 # [{"keywords": [...]}, ...] 중첩 배열
                 merged.extend(item["keywords"])
         return {"keywords": merged}
@@ -44,7 +57,7 @@ def _clean_json_response(raw: str) -> dict:
     # Case 2: {"keywords": [str, ...], "articles": [...]} — 키워드가 문자열 배열인 경우
     if isinstance(data, dict) and "keywords" in data:
         kw_list = data["keywords"]
-        if kw_list and isinstance(kw_list[0], str):
+        if isinstance(kw_list, list) and kw_list and isinstance(kw_list[0], str):
             # articles 배열에서 요약 정보를 추출하여 키워드와 매칭
             articles = data.get("articles", [])
             merged = []
@@ -59,60 +72,8 @@ def _clean_json_response(raw: str) -> dict:
     return data
 
 
-def run_summarize(input_path: str, output_path: str, model: str | None = None) -> dict:
-    """뉴스 기사를 요약하고 결과를 JSON으로 저장한다.
-
-    Args:
-        input_path: 뉴스 크롤링 결과 JSON/JSONL 파일 경로
-        output_path: 요약 결과 출력 JSON 경로
-        model: Ollama 모델명 (미지정 시 settings 기본값)
-
-    Returns:
-        요약 결과 dict
-    """
-    articles = load_articles(input_path)
-    if not articles:
-        print("[ERROR] 입력 파일에 기사가 없습니다.", file=sys.stderr)
-        sys.exit(1)
-
-    groups = group_by_keyword(articles)
-    client, model = create_ollama_client(model)
-
-    print(f"[INFO] {len(articles)}건 기사, {len(groups)}개 키워드 로드 완료")
-    print(f"[INFO] Ollama 모델: {model}")
-    print("[INFO] 전체 키워드를 1회 요청으로 통합 처리합니다")
-
-    combined_prompt = build_combined_prompt(groups)
-    print(f"[INFO] 통합 프롬프트 크기: {len(combined_prompt):,}자")
-    print("[API ] 요약 요청 중...", end=" ", flush=True)
-
-    raw = ""
-    try:
-        raw, usage = call_ollama(client, model, SYSTEM_PROMPT, combined_prompt)
-        parsed = _clean_json_response(raw)
-        print(f"OK ({usage['prompt']}+{usage['completion']} tokens)")
-    except json.JSONDecodeError as e:
-        print(f"JSON 파싱 실패 ({e}), 원본 저장")
-        # 디버그용: raw 응답 파일에 별도 저장
-        raw_path = Path(output_path).with_suffix(".raw.txt")
-        raw_path.write_text(raw, encoding="utf-8")
-        parsed = {"keywords": [], "_raw_response": raw[:2000]}
-        usage = {"prompt": 0, "completion": 0}
-    except Exception as exc:
-        print(f"FAIL: {exc}")
-        parsed = {"keywords": [], "error": str(exc)[:500]}
-        usage = {"prompt": 0, "completion": 0}
-
-    # LLM 응답의 키워드 요약 목록
-    llm_items = [
-        item
-        for item in parsed.get("keywords", [])
-        if isinstance(item, dict) and item.get("summary")
-    ]
-    print(f"[INFO] LLM 요약 {len(llm_items)}건 파싱됨")
-
-    # 키워드별 매핑: 정확 매칭 → 부분 매칭(포함 관계) → 순서 매칭
-    input_keywords = list(groups.keys())
+def _match_summaries(input_keywords: list[str], llm_items: list[dict]) -> dict[str, dict]:
+    """LLM 응답 항목을 입력 키워드에 매핑한다: 정확 매칭 → 부분 매칭(포함 관계) → 순서 매칭."""
     llm_summaries: dict[str, dict] = {}
 
     for item in llm_items:
@@ -146,11 +107,185 @@ def run_summarize(input_path: str, output_path: str, model: str | None = None) -
         for kw, item in zip(still_unmatched, remaining_items):
             matched[kw] = item
 
-    print(f"[INFO] 키워드 매핑: {len(matched)}/{len(input_keywords)} 성공")
-    if matched:
-        for kw in input_keywords:
-            status = "OK" if kw in matched else "MISS"
-            print(f"  [{status}] {kw}")
+    return matched
+
+
+def run_summarize(
+    input_path: str,
+    output_path: str,
+    model: str | None = None,
+    *,
+    cache: SummaryCache | None = None,
+) -> dict:
+    """뉴스 기사를 요약하고 결과를 JSON으로 저장한다.
+
+    Args:
+        input_path: 뉴스 크롤링 결과 JSON/JSONL 파일 경로
+        output_path: 요약 결과 출력 JSON 경로
+        model: Ollama 모델명 (미지정 시 settings 기본값)
+        cache: 요약 캐시. 지정 시 기사 집합이 바뀌지 않은 키워드는 LLM 호출을 생략한다.
+
+    Returns:
+        요약 결과 dict
+    """
+    import openai
+
+    # 요청 단위로 실패 처리하는 LLM 오류 (데드라인 초과는 TimeoutError 계열)
+    llm_errors = (openai.OpenAIError, LLMUnavailableError, TimeoutError)
+
+    articles = load_articles(input_path)
+    if not articles:
+        print("[ERROR] 입력 파일에 기사가 없습니다.", file=sys.stderr)
+        sys.exit(1)
+
+    groups = group_by_keyword(articles)
+    client, model = create_ollama_client(model)
+
+    print(f"[INFO] {len(articles)}건 기사, {len(groups)}개 키워드 로드 완료")
+    print(f"[INFO] Ollama 모델: {model}")
+
+    lookup = CacheLookup(misses=list(groups))
+    if cache is not None:
+        try:
+            lookup = cache.lookup(model, groups)
+            print(
+                f"[CACHE] 적중 {len(lookup.hits)}, 부분 적중 {len(lookup.partial)}, "
+                f"미스 {len(lookup.misses)} (절감 추정 {lookup.saved_tokens} tokens)"
+            )
+        except SQLAlchemyError as exc:
+            print(f"[CACHE] 조회 실패 (무시): {exc}", file=sys.stderr)
+            lookup = CacheLookup(misses=list(groups))
+
+    # 캐시 완전 적중 키워드는 제외, 부분 적중 키워드는 신규 기사만 전송
+    pending = {
+        kw: lookup.new_articles.get(kw, kw_articles)
+        for kw, kw_articles in groups.items()
+        if kw not in lookup.hits
+    }
+    previous_summaries = {kw: p.get("summary", "") for kw, p in lookup.partial.items()}
+
+    matched: dict[str, dict] = {}
+    usage = {"prompt": 0, "completion": 0}
+    chunks = pack_prompts(
+        pending,
+        previous_summaries,
+        token_budget=get_settings().summary_prompt_token_budget,
+        reserved_tokens=estimate_tokens(SYSTEM_PROMPT),
+    )
+    api_calls = len(chunks)
+    salvaged = 0
+    persisted: set[str] = set()
+    llm_calls: list[dict] = []
+
+    def _token_cost(kw: str, item: dict) -> int:
+        return estimate_tokens(
+            format_keyword_section(kw, select_articles(groups[kw]))
+        ) + estimate_tokens(json.dumps(item, ensure_ascii=False))
+
+    if chunks:
+        print(f"[INFO] {len(pending)}개 키워드를 {len(chunks)}회 요청으로 나눠 처리합니다")
+        for idx, chunk in enumerate(chunks, 1):
+            print(
+                f"[INFO] 프롬프트 {idx}/{len(chunks)}: 키워드 {len(chunk.keywords)}개, "
+                f"추정 {chunk.estimated_tokens:,} tokens "
+                f"(중복 기사 절감 {chunk.dedup_saved_tokens})"
+            )
+            if chunk.dropped_articles:
+                print(
+                    f"[WARN] 토큰 예산 초과로 기사 {chunk.dropped_articles}건 제외",
+                    file=sys.stderr,
+                )
+            if chunk.over_budget:
+                print("[WARN] 단일 키워드가 토큰 예산을 초과합니다", file=sys.stderr)
+            print("[API ] 요약 요청 중...", end=" ", flush=True)
+
+            raw = ""
+            streamed: list[dict] = []
+            on_item = None
+            if cache is not None:
+                # 스트리밍 중 완성된 요약은 생성이 끝나기 전에 캐시에 바로 저장
+                def on_item(item: dict, _chunk=chunk, _streamed=streamed) -> None:
+                    _streamed.append(item)
+                    kw = item.get("keyword", "")
+                    if kw in _chunk.keywords and kw not in _chunk.trimmed_keywords:
+                        try:
+                            cache.store_now(model, kw, groups[kw], item, _token_cost(kw, item))
+                            persisted.add(kw)
+                        except SQLAlchemyError as exc:
+                            print(f"[CACHE] 즉시 저장 실패 (무시): {exc}", file=sys.stderr)
+
+            chunk_usage = {"prompt": 0, "completion": 0}
+            parse_error: str | None = None
+            try:
+                raw, chunk_usage = call_ollama(
+                    client, model, SYSTEM_PROMPT, chunk.prompt, on_item=on_item
+                )
+                parsed = _clean_json_response(raw)
+                if not isinstance(parsed, dict) or not isinstance(parsed.get("keywords"), list):
+                    # null·스칼라·{"keywords": null} 등 JSON으로는 맞지만 형태가 다른 응답
+                    parse_error = "keywords 배열 없음"
+                else:
+                    print(
+                        f"OK ({chunk_usage['prompt']}+{chunk_usage['completion']} tokens, "
+                        f"TTFT {chunk_usage.get('ttft_ms', 0)}ms, "
+                        f"{chunk_usage.get('tokens_per_sec', 0)} tok/s)"
+                    )
+            except json.JSONDecodeError as e:
+                parse_error = str(e)
+            except llm_errors as exc:
+                print(f"FAIL: {exc}")
+                # 스트리밍 도중 끊겼다면 그때까지 완성된 요약은 살린다
+                salvaged += len(streamed)
+                parsed = {"keywords": streamed, "error": str(exc)[:500]}
+            if parse_error is not None:
+                # 응답 전체를 버리지 않고 완성된 키워드 객체만이라도 복구
+                recovered = salvage_json_objects(raw)
+                salvaged += len(recovered)
+                print(f"JSON 파싱 실패 ({parse_error}), {len(recovered)}건 복구, 원본 저장")
+                # 디버그용: raw 응답 파일에 별도 저장
+                suffix = ".raw.txt" if len(chunks) == 1 else f".raw{idx}.txt"
+                raw_path = Path(output_path).with_suffix(suffix)
+                raw_path.write_text(raw, encoding="utf-8")
+                parsed = {"keywords": recovered, "_raw_response": raw[:2000]}
+            usage["prompt"] += chunk_usage["prompt"]
+            usage["completion"] += chunk_usage["completion"]
+            if "duration_ms" in chunk_usage:
+                llm_calls.append(chunk_usage)
+
+            # LLM 응답의 키워드 요약 목록
+            llm_items = [
+                item
+                for item in parsed.get("keywords", [])
+                if isinstance(item, dict) and item.get("summary")
+            ]
+            print(f"[INFO] LLM 요약 {len(llm_items)}건 파싱됨")
+            matched.update(_match_summaries(chunk.keywords, llm_items))
+
+        print(f"[INFO] 키워드 매핑: {len(matched)}/{len(pending)} 성공")
+        if matched:
+            for kw in pending:
+                status = "OK" if kw in matched else "MISS"
+                print(f"  [{status}] {kw}")
+
+        # 예산 때문에 기사가 잘린 키워드는 전체 기사 지문으로 캐시하지 않는다
+        trimmed = {kw for chunk in chunks for kw in chunk.trimmed_keywords}
+        if cache is not None and matched:
+            entries = {
+                kw: (groups[kw], item, _token_cost(kw, item))
+                for kw, item in matched.items()
+                if kw not in trimmed and kw not in persisted
+            }
+            try:
+                cache.store(model, entries)
+            except SQLAlchemyError as exc:
+                print(f"[CACHE] 저장 실패 (무시): {exc}", file=sys.stderr)
+    else:
+        print("[INFO] 모든 키워드가 캐시 적중 — LLM 호출 생략")
+
+    # 부분 적중인데 LLM이 갱신하지 못한 키워드는 기존 요약 유지
+    for kw, previous in lookup.partial.items():
+        matched.setdefault(kw, previous)
+    matched.update(lookup.hits)
 
     # 최종 출력 구성: LLM 요약 + 원본 기사 목록 병합
     keyword_results: list[dict] = []
@@ -182,7 +317,7 @@ def run_summarize(input_path: str, output_path: str, model: str | None = None) -
         "summarized_at": datetime.now(timezone.utc).isoformat(timespec="seconds") + "Z",
         "provider": "ollama",
         "model": model,
-        "api_calls": 1,
+        "api_calls": api_calls,
         "total_keywords": len(groups),
         "total_articles": len(articles),
         "total_tokens": {
@@ -190,6 +325,20 @@ def run_summarize(input_path: str, output_path: str, model: str | None = None) -
             "completion": usage["completion"],
             "total": usage["prompt"] + usage["completion"],
         },
+        "salvaged_items": salvaged,
+        "llm": _aggregate_llm_metrics(llm_calls),
+        "prompt": {
+            "requests": len(chunks),
+            "estimated_tokens": sum(c.estimated_tokens for c in chunks),
+            "dedup_saved_tokens": sum(c.dedup_saved_tokens for c in chunks),
+            "dropped_articles": sum(c.dropped_articles for c in chunks),
+        },
+        "cache": {
+            "hits": len(lookup.hits),
+            "partial_hits": len(lookup.partial),
+            "misses": len(lookup.misses),
+            "saved_tokens": lookup.saved_tokens,
+        },
         "keywords": keyword_results,
     }
 
@@ -201,6 +350,22 @@ def run_summarize(input_path: str, output_path: str, model: str | None = None) -
     return output
 
 
+def _aggregate_llm_metrics(calls: list[dict]) -> dict:
+    """호출별 지표를 배치 단위로 합친다. 생성 속도는 전체 completion / 전체 생성 시간."""
+    if not calls:
+        return {"calls": [], "tokens_per_sec": None, "ttft_ms": None, "queue_ms": 0}
+    completion = sum(c.get("completion", 0) for c in calls)
+    generation_sec = sum(
+        max(0, c.get("duration_ms", 0) - c.get("ttft_ms", 0)) for c in calls
+    ) / 1000
+    return {
+        "calls": calls,
+        "tokens_per_sec": round(completion / generation_sec, 2) if generation_sec else None,
+        "ttft_ms": sum(c.get("ttft_ms", 0) for c in calls) // len(calls),
+        "queue_ms": sum(c.get("queue_ms", 0) for c in calls),
+    }
+
+
 # ── DB 저장 ─────────────────────────────────────────────────
 
 
@@ -209,7 +374,9 @@ def save_to_db(result: dict, db_url: str | None = None) -> str:
     from sqlalchemy import create_engine
     from sqlalchemy.orm import sessionmaker
 
-    from src.models.news_summary import NewsSummaryBatch, NewsKeywordSummary, NewsSummaryTag
+    from src.crud.summaries import SummaryService
+    from src.models.news_summary import NewsKeywordSummary, NewsSummaryBatch, NewsSummaryTag
+    from src.sql.summaries import SummaryRepository
 
     if db_url:
         engine = create_engine(db_url, pool_pre_ping=True)
@@ -228,6 +395,13 @@ def save_to_db(result: dict, db_url: str | None = None) -> str:
         total_articles=result["total_articles"],
         prompt_tokens=result["total_tokens"]["prompt"],
         completion_tokens=result["total_tokens"]["completion"],
+        cache_hits=result.get("cache", {}).get("hits", 0),
+        cache_partial_hits=result.get("cache", {}).get("partial_hits", 0),
+        cache_saved_tokens=result.get("cache", {}).get("saved_tokens", 0),
+        llm_tokens_per_sec=result.get("llm", {}).get("tokens_per_sec"),
+        llm_ttft_ms=result.get("llm", {}).get("ttft_ms"),
+        llm_queue_ms=result.get("llm", {}).get("queue_ms", 0),
+        llm_calls=result.get("llm", {}).get("calls") or None,
         summarized_at=datetime.fromisoformat(result["summarized_at"].rstrip("Z")),
         created_at=now,
     )
@@ -248,11 +422,17 @@ def save_to_db(result: dict, db_url: str | None = None) -> str:
         )
         batch.summaries.append(summary)
 
+        # ix_nst_summary_tag 유니크 제약: 공백/대소문자만 다른 태그는 하나로
+        seen_tags: set[str] = set()
         for tag_name in kw_data.get("tags", []):
+            tag_value = str(tag_name).strip()[:50]
+            if not tag_value or tag_value.lower() in seen_tags:
+                continue
+            seen_tags.add(tag_value.lower())
             tag = NewsSummaryTag(
                 id=str(uuid.uuid4()),
                 summary_id=summary_id,
-                tag=tag_name.strip()[:50],
+                tag=tag_value,
                 created_at=now,
             )
             summary.tags.append(tag)
@@ -260,6 +440,9 @@ def save_to_db(result: dict, db_url: str | None = None) -> str:
     session = SessionLocal()
     try:
         session.add(batch)
+        session.flush()
+        # 읽기 API용 최신 배치 스냅샷을 같은 트랜잭션에서 갱신
+        SummaryService(SummaryRepository(session)).refresh_latest_snapshot(batch)
         session.commit()
         print(f"[DB  ] 저장 완료: batch_id={batch_id}")
         print(
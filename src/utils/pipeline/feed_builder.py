@@ -8,13 +8,14 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from uuid import uuid4
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.orm import Session
 
 from src.core.config import get_settings
-from src.db.enums import FeedType, NotificationType, UpdateType
-from src.models.feed import EventUpdate, LiveFeedItem
-from src.models.issues import IssueKeywordState, user_tracked_issues
+from src.crud.feed_stream import publish_feed_items
+from src.db.enums import FeedInboxReason, FeedType, NotificationType, UpdateType
+from src.models.feed import EventUpdate, FeedInboxItem, LiveFeedItem
+from src.models.issues import Issue, IssueKeywordState, user_tracked_issues
 from src.models.notification import Notification, UserAlertRule
 from src.models.subscription import KeywordMatch, KeywordSubscription
 from src.utils.pipeline.update_classifier import ClassificationResult
@@ -101,6 +102,7 @@ def persist_results(results: list[ClassificationResult], db: Session) -> dict[st
     now = datetime.now(timezone.utc)
     stats = {"new": 0, "minor": 0, "major": 0, "dup": 0}
     event_update_map: dict[str, str] = {}  # article_id -> event_update.id
+    created_updates: list[EventUpdate] = []
 
     for result in results:
         # 통계 집계
@@ -142,6 +144,7 @@ def persist_results(results: list[ClassificationResult], db: Session) -> dict[st
         )
         db.add(eu)
         event_update_map[result.article_id] = eu_id
+        created_updates.append(eu)
 
         # 키워드 상태 갱신
         _update_keyword_states(result, db)
@@ -155,12 +158,17 @@ def persist_results(results: list[ClassificationResult], db: Session) -> dict[st
         db.add(item)
 
     db.flush()
+    # 커밋되면 /feed/stream 구독자에게 전달
+    publish_feed_items(db, [item.id for item in feed_items])
 
     # MAJOR_UPDATE 알림 생성: 이슈 추적자의 활성 alert_rules 조회
     _create_major_update_notifications(results, db)
 
     # 키워드 구독 매칭: 새 기사의 키워드와 활성 구독 매칭
-    _match_keyword_subscriptions(results, db)
+    keyword_matches = _match_keyword_subscriptions(results, db)
+
+    # 개인 피드 인박스: 추적자·구독자에게 새 업데이트 fan-out
+    _fan_out_to_inboxes(created_updates, keyword_matches, db)
 
     db.flush()
     return stats
@@ -247,14 +255,20 @@ def _create_major_update_notifications(results: list[ClassificationResult], db:
         db.add_all(notifications)
 
 
-def _match_keyword_subscriptions(results: list[ClassificationResult], db: Session) -> None:
-    """새 기사의 normalized_keywords와 활성 구독 키워드를 매칭한다."""
+def _match_keyword_subscriptions(
+    results: list[ClassificationResult], db: Session
+) -> list[tuple[str, str]]:
+    """새 기사의 normalized_keywords와 활성 구독 키워드를 매칭한다.
+
+    Returns:
+        매칭된 (user_id, article_id) 목록
+    """
     now = datetime.now(timezone.utc)
 
     # DUP 제외, 키워드가 있는 결과만 필터
     non_dup_results = [r for r in results if r.update_type != UpdateType.DUP]
     if not non_dup_results:
-        return
+        return []
 
     # 모든 기사의 키워드 수집
     from src.models.pipeline import RawArticle
@@ -272,7 +286,7 @@ def _match_keyword_subscriptions(results: list[ClassificationResult], db: Sessio
         all_keywords.update(kws)
 
     if not all_keywords:
-        return
+        return []
 
     # 활성 구독 조회
     active_subs = (
@@ -287,7 +301,7 @@ def _match_keyword_subscriptions(results: list[ClassificationResult], db: Sessio
     )
 
     if not active_subs:
-        return
+        return []
 
     # 키워드별 구독 맵
     keyword_subs: dict[str, list[KeywordSubscription]] = {}
@@ -328,3 +342,53 @@ def _match_keyword_subscriptions(results: list[ClassificationResult], db: Sessio
         db.add_all(matches)
     if notifications:
         db.add_all(notifications)
+    return [(notification.user_id, notification.entity_id) for notification in notifications]
+
+
+def _fan_out_to_inboxes(
+    updates: list[EventUpdate],
+    keyword_matches: list[tuple[str, str]],
+    db: Session,
+) -> None:
+    """새 업데이트를 이슈 추적자와 키워드 구독자의 인박스에 한 번에 넣는다.
+
+    추적자가 ``feed_inbox_fanout_max_trackers``보다 많은 이슈는 행 수가 추적자 수에
+    비례해 커지므로 쓰지 않고, ``/users/me/feed``가 읽을 때 병합한다.
+    """
+    settings = get_settings()
+    if not settings.feed_inbox_enabled or not updates:
+        return
+
+    rows: dict[tuple[str, str], dict] = {}
+
+    def _add(user_id: str, eu: EventUpdate, reason: FeedInboxReason) -> None:
+        rows.setdefault(
+            (user_id, eu.id),
+            {"user_id": user_id, "update_id": eu.id, "reason": reason, "created_at": eu.created_at},
+        )
+
+    issue_ids = {eu.issue_id for eu in updates if eu.issue_id}
+    if issue_ids:
+        tracker_rows = db.execute(
+            select(user_tracked_issues.c.issue_id, user_tracked_issues.c.user_id)
+            .join(Issue, Issue.id == user_tracked_issues.c.issue_id)
+            .where(
+                user_tracked_issues.c.issue_id.in_(issue_ids),
+                Issue.tracker_count <= settings.feed_inbox_fanout_max_trackers,
+            )
+        ).all()
+        trackers: dict[str, list[str]] = {}
+        for issue_id, user_id in tracker_rows:
+            trackers.setdefault(issue_id, []).append(user_id)
+        for eu in updates:
+            for user_id in trackers.get(eu.issue_id, []):
+                _add(user_id, eu, FeedInboxReason.TRACKED_ISSUE)
+
+    updates_by_article = {eu.article_id: eu for eu in updates}
+    for user_id, article_id in keyword_matches:
+        eu = updates_by_article.get(article_id)
+        if eu is not None:
+            _add(user_id, eu, FeedInboxReason.KEYWORD)
+
+    if rows:
+        db.execute(insert(FeedInboxItem), list(rows.values()))
@@ -381,7 +381,13 @@ def run_cycle(
     print(f"  [{step}/{total_steps}] 뉴스 요약 중...")
     summary_path = cycle_dir / "summary.json"
     try:
-        summary = run_summarize(str(crawl_path), str(summary_path), model)
+        if save_db:
+            from src.utils.news_summarizer.cache import open_summary_cache
+
+            with open_summary_cache() as cache:
+                summary = run_summarize(str(crawl_path), str(summary_path), model, cache=cache)
+        else:
+            summary = run_summarize(str(crawl_path), str(summary_path), model)
     except Exception as exc:
         print(f"  [요약] 실패: {exc}")
         return {
@@ -421,6 +427,7 @@ def run_cycle(
         "summaries": len(kw_summaries),
         "total_tags": total_tags,
         "tokens": summary.get("total_tokens", {}),
+        "summary_cache": summary.get("cache", {}),
         "model": summary.get("model", ""),
     }
     if classify_stats:
@@ -8,17 +8,27 @@ from __future__ import annotations
 import json
 import logging
 
+from src.utils.news_summarizer.json_salvage import salvage_json_objects
+
 logger = logging.getLogger(__name__)
 
 
 def validate_summary_json(raw: str, *, retry: bool = True) -> dict | None:
-    """요약 응답 JSON 유효성 검증. 실패 시 retry=True이면 1회 재시도."""
+    """요약 응답 JSON 유효성 검증. 실패 시 retry=True이면 1회 재시도.
+
+    전체 파싱에 실패해도 완성된 키워드 객체를 복구할 수 있으면
+    {"keywords": [...], "salvaged": True}를 반환한다.
+    """
     try:
         data = json.loads(raw)
         if not isinstance(data, dict):
             raise ValueError("JSON 최상위가 dict가 아닙니다")
         return data
     except (json.JSONDecodeError, ValueError) as exc:
+        recovered = salvage_json_objects(raw)
+        if recovered:
+            logger.warning(f"[quality_gate] 요약 JSON 일부 복구: {len(recovered)}건 ({exc})")
+            return {"keywords": recovered, "salvaged": True}
         logger.warning(f"[quality_gate] 요약 JSON 유효성 실패: {exc}")
         if retry:
             return None  # 호출부에서 재시도 결정
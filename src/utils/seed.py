@@ -21,6 +21,7 @@ from src.db.enums import (
     VerificationStatus,
 )
 from src.db.session import engine
+from src.sql.events import rebuild_event_daily_counts
 
 # 고정 ID (FK 참조용)
 ADMIN_ID = "00000000-0000-0000-0000-000000000001"
@@ -276,7 +277,7 @@ def reset_data(conn):
         "sources", "triggers",
         "issue_keyword_states", "issue_keyword_aliases", "issue_rank_snapshots",
         "issue_events", "issue_tags", "user_tracked_issues", "issues",
-        "event_tags", "user_saved_events", "events",
+        "event_tags", "user_saved_events", "event_daily_counts", "events",
         "tags", "user_social_accounts", "users",
     ]
     for table in tables:
@@ -293,6 +294,7 @@ def run_seed(*, reset: bool = False):
         seed_users(conn)
         seed_tags(conn)
         seed_events(conn)
+        rebuild_event_daily_counts(conn)
         seed_issues(conn)
         seed_triggers(conn)
         seed_sources(conn)
@@ -4,8 +4,13 @@ import os
 
 os.environ["DATABASE_URL"] = "sqlite:///test.db"
 os.environ["JWT_SECRET_KEY"] = "test-secret-key-for-jwt-testing"
+# 검색어 로그 백그라운드 flush 스레드를 띄우지 않음 (테스트는 flush를 직접 호출)
+os.environ["SEARCH_QUERY_LOG_FLUSH_SECONDS"] = "0"
+# 자동완성 색인 갱신 스레드를 띄우지 않음 (테스트는 refresh를 직접 호출)
+os.environ["SEARCH_SUGGEST_REFRESH_SECONDS"] = "0"
 
-from collections.abc import Generator
+from collections.abc import Callable, Generator, Iterator
+from contextlib import AbstractContextManager, contextmanager
 from datetime import datetime, timezone
 from uuid import uuid4
 
@@ -30,7 +35,14 @@ from src.db.enums import (
     VerificationStatus,
 )
 from src.main import app
-from src.utils.dependencies import get_db_session
+from src.crud.feed import top_stories_pointer
+from src.crud.feed_stream import feed_broadcaster
+from src.crud.home import home_snapshot_mirror
+from src.core.search_cache import search_cache
+from src.crud.search_query_log import search_query_log
+from src.crud.search_suggest import suggestion_index
+from src.db.session import ReadSession
+from src.utils.dependencies import get_db_session, get_read_session
 
 # SQLite in-memory 엔진 (StaticPool로 커넥션 공유)
 engine = create_engine(
@@ -64,6 +76,30 @@ def create_tables():
 # ── 함수 스코프: 트랜잭션 격리 ──
 
 
+@pytest.fixture(autouse=True)
+def _clear_home_snapshot_mirror():
+    """홈 스냅샷 사본·Top Stories 포인터·피드 스트림 구독자는 프로세스 전역이므로 격리한다."""
+    home_snapshot_mirror.clear()
+    top_stories_pointer.clear()
+    feed_broadcaster.clear()
+    yield
+    home_snapshot_mirror.clear()
+    top_stories_pointer.clear()
+    feed_broadcaster.clear()
+
+
+@pytest.fixture(autouse=True)
+def _clear_search_cache():
+    """검색 캐시·자동완성 색인·검색어 로그는 프로세스 전역이므로 테스트 간 격리한다."""
+    search_cache.clear()
+    suggestion_index.clear()
+    search_query_log.clear()
+    yield
+    search_cache.clear()
+    suggestion_index.clear()
+    search_query_log.clear()
+
+
 @pytest.fixture()
 def db_session() -> Generator[Session, None, None]:
     connection = engine.connect()
@@ -83,11 +119,37 @@ def client(db_session: Session) -> Generator[TestClient, None, None]:
         yield db_session
 
     app.dependency_overrides[get_db_session] = _override_get_db
+    app.dependency_overrides[get_read_session] = lambda: ReadSession(db_session)
     with TestClient(app, raise_server_exceptions=False) as c:
         yield c
     app.dependency_overrides.clear()
 
 
+@pytest.fixture()
+def capture_sql(db_session: Session) -> Callable[[], AbstractContextManager[list[str]]]:
+    """db_session 연결에서 실행된 SQL 문을 모은다.
+
+    with capture_sql() as statements:
+        client.get(...)
+    """
+
+    @contextmanager
+    def _capture() -> Iterator[list[str]]:
+        statements: list[str] = []
+        connection = db_session.connection()
+
+        def _record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(connection, "before_cursor_execute", _record)
+        try:
+            yield statements
+        finally:
+            event.remove(connection, "before_cursor_execute", _record)
+
+    return _capture
+
+
 # ── 사용자 fixture ──
 
 _TEST_PASSWORD = "TestP@ss1234"
@@ -210,6 +272,7 @@ def create_source(db_session: Session):
 def create_event(db_session: Session):
     """사건 팩토리: create_event(...) -> Event"""
     from src.models.events import Event
+    from src.sql.events import EventRepository
 
     def _factory(
         title: str = "테스트 사건",
@@ -231,6 +294,7 @@ def create_event(db_session: Session):
         )
         db_session.add(evt)
         db_session.flush()
+        EventRepository(db_session).bump_daily_count(now, importance, 1)
         return evt
 
     return _factory
@@ -377,9 +441,7 @@ def create_raw_article(db_session: Session):
             title_hash = hashlib.sha256(title.lower().encode()).hexdigest()
         if semantic_hash is None:
             content_prefix = (content_text or "")[:200].lower()
-            semantic_hash = hashlib.sha256(
-                f"{title.lower()}|{content_prefix}".encode()
-            ).hexdigest()
+            semantic_hash = hashlib.sha256(f"{title.lower()}|{content_prefix}".encode()).hexdigest()
         article = RawArticle(
             id=article_id,
             canonical_url=canonical_url,
@@ -402,6 +464,29 @@ def create_raw_article(db_session: Session):
     return _factory
 
 
+@pytest.fixture()
+def create_crawled_keyword(db_session: Session):
+    """CrawledKeyword 팩토리."""
+    from src.models.pipeline import CrawledKeyword
+
+    def _factory(keyword: str, count: int = 1, rank: int = 1) -> CrawledKeyword:
+        now = datetime.now(timezone.utc)
+        row = CrawledKeyword(
+            id=str(uuid4()),
+            keyword=keyword,
+            count=count,
+            rank=rank,
+            source_type="aggregated",
+            crawled_at=now,
+            created_at=now,
+        )
+        db_session.add(row)
+        db_session.flush()
+        return row
+
+    return _factory
+
+
 @pytest.fixture()
 def create_event_update(db_session: Session):
     """EventUpdate 팩토리."""
@@ -0,0 +1,92 @@
+"""읽기 전용 엔드포인트 async 엔진 경로 테스트 (aiosqlite)."""
+
+import asyncio
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from starlette.testclient import TestClient
+
+from src.core.config import get_settings
+from src.db import Base
+from src.db import session as db_session_module
+from src.db.enums import Importance, IssueStatus, VerificationStatus
+from src.main import app
+from src.models.events import Event
+from src.models.issues import Issue
+
+
+@pytest.fixture()
+def async_app(tmp_path, monkeypatch):
+    """파일 SQLite에 데이터를 넣고 db_async_enabled로 앱을 띄운다."""
+    path = tmp_path / "async.db"
+    sync_engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=sync_engine)
+
+    now = datetime.now(timezone.utc)
+    with Session(sync_engine) as session:
+        session.add(
+            Event(
+                id=str(uuid4()),
+                occurred_at=now,
+                title="비동기 사건",
+                summary="요약",
+                importance=Importance.HIGH,
+                verification_status=VerificationStatus.VERIFIED,
+                source_count=0,
+                created_at=now,
+                updated_at=now,
+            )
+        )
+        session.add(
+            Issue(
+                id=str(uuid4()),
+                title="비동기 이슈",
+                description="설명",
+                status=IssueStatus.ONGOING,
+                tracker_count=0,
+                created_at=now,
+                updated_at=now,
+            )
+        )
+        session.commit()
+    sync_engine.dispose()
+
+    settings = get_settings()
+    monkeypatch.setattr(settings, "db_async_enabled", True)
+    monkeypatch.setattr(settings, "async_database_url", f"sqlite+aiosqlite:///{path}")
+    monkeypatch.setattr(db_session_module, "_async_sessionmaker", None)
+
+    with TestClient(app, raise_server_exceptions=False) as c:
+        yield c
+
+    maker = db_session_module._async_sessionmaker
+    if maker is not None:
+        asyncio.run(maker.kw["bind"].dispose())
+
+
+class TestAsyncReadPath:
+    def test_event_list_and_detail(self, async_app: TestClient):
+        data = async_app.get("/api/v1/events").json()["data"]
+        assert [i["title"] for i in data["items"]] == ["비동기 사건"]
+
+        detail = async_app.get(f"/api/v1/events/{data['items'][0]['id']}")
+        assert detail.status_code == 200
+        assert detail.json()["data"]["title"] == "비동기 사건"
+
+    def test_issue_list_with_total(self, async_app: TestClient):
+        data = async_app.get("/api/v1/issues").json()["data"]
+        assert data["pagination"]["totalItems"] == 1
+        assert data["items"][0]["title"] == "비동기 이슈"
+
+    def test_home_and_search(self, async_app: TestClient):
+        breaking = async_app.get("/api/v1/home/breaking-news").json()["data"]
+        assert breaking[0]["importance"] == "high"
+
+        result = async_app.get("/api/v1/search", params={"q": "비동기"}).json()["data"]
+        assert result["pagination"]["totalItems"] == 2
+
+    def test_missing_event_still_404(self, async_app: TestClient):
+        assert async_app.get("/api/v1/events/missing").status_code == 404
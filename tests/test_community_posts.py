@@ -371,3 +371,105 @@ def test_vote_post_토큰없음_401(client: TestClient, member_user: dict, creat
     body = resp.json()
     assert body["success"] is False
     assert body["error"]["code"] == "E_AUTH_001"
+
+
+# ── 인기 점수 (hot_score) ──
+
+
+def test_vote_post_인기점수_갱신(client: TestClient, member_user: dict, create_post, db_session):
+    """추천하면 저장된 인기 점수가 즉시 올라간다"""
+    post = create_post(author_id=member_user["user"].id)
+    headers = {"Authorization": f"Bearer {member_user['token']}"}
+
+    client.post(f"/api/v1/posts/{post.id}/like", json={"type": "like"}, headers=headers)
+    db_session.refresh(post)
+    assert post.hot_score > 0
+
+
+def test_list_posts_hot탭_인기점수순(
+    client: TestClient, member_user: dict, create_post, db_session
+):
+    """tab=hot은 저장된 hot_score 내림차순, 커서로 이어진다"""
+    posts = [create_post(author_id=member_user["user"].id, title=f"게시글_{i}") for i in range(3)]
+    for post, score in zip(posts, (0.5, 2.0, 1.0)):
+        post.hot_score = score
+    db_session.flush()
+
+    first = client.get("/api/v1/posts", params={"tab": "hot", "limit": 2}).json()["data"]
+    assert [i["id"] for i in first["items"]] == [posts[1].id, posts[2].id]
+
+    rest = client.get(
+        "/api/v1/posts", params={"tab": "hot", "limit": 2, "cursor": first["cursor"]["next"]}
+    ).json()["data"]
+    assert [i["id"] for i in rest["items"]] == [posts[0].id]
+
+
+def test_hot_score_잡_감쇠와_만료(member_user: dict, create_post, db_session):
+    """잡은 최근 게시글 점수를 감쇠 반영하고 오래된 게시글은 0으로 내린다"""
+    from datetime import datetime, timedelta, timezone
+
+    from src.scheduler.jobs.community_jobs import recalculate_community_hot_score
+
+    now = datetime.now(timezone.utc)
+    fresh = create_post(author_id=member_user["user"].id, title="새 글")
+    aged = create_post(author_id=member_user["user"].id, title="하루 지난 글")
+    expired = create_post(author_id=member_user["user"].id, title="오래된 글")
+    for post in (fresh, aged):
+        post.like_count = 3
+    aged.created_at = now - timedelta(days=1)
+    expired.created_at = now - timedelta(days=10)
+    expired.hot_score = 5.0
+    db_session.flush()
+
+    _, metrics = recalculate_community_hot_score(db_session)
+
+    assert metrics["hot_expired"] == 1
+    for post in (fresh, aged, expired):
+        db_session.refresh(post)
+    assert fresh.hot_score > aged.hot_score > 0
+    assert expired.hot_score == 0
+
+
+def test_hot_score_잡_워터마크_이후_댓글만_보정(
+    member_user: dict, create_post, create_comment, db_session
+):
+    """직전 성공 실행 이후 댓글이 달린 게시글만 comment_count를 집합 UPDATE로 맞춘다"""
+    from datetime import datetime, timedelta, timezone
+
+    from src.models.scheduler import JobRun
+    from src.scheduler.jobs.community_jobs import recalculate_community_hot_score
+
+    now = datetime.now(timezone.utc)
+    author_id = member_user["user"].id
+    stale, active = create_post(author_id=author_id), create_post(author_id=author_id)
+    old_comment = create_comment(post_id=stale.id, author_id=author_id)
+    old_comment.created_at = now - timedelta(hours=1)
+    create_comment(post_id=active.id, author_id=author_id)
+    create_comment(post_id=active.id, author_id=author_id)
+    db_session.add(
+        JobRun(
+            id=str(uuid4()),
+            job_name="community_hot_score",
+            status="success",
+            started_at=now - timedelta(minutes=10),
+            finished_at=now - timedelta(minutes=10),
+        )
+    )
+    db_session.flush()
+
+    detail, metrics = recalculate_community_hot_score(db_session)
+
+    assert metrics["comment_posts_scanned"] == 1
+    assert metrics["comment_counts_updated"] == 1
+    assert "posts_updated=1" in detail
+    db_session.refresh(stale)
+    db_session.refresh(active)
+    assert active.comment_count == 2
+    assert stale.comment_count == 0  # 워터마크 이전 활동은 건드리지 않는다
+
+    # 첫 실행(워터마크 없음)은 전체 보정
+    db_session.query(JobRun).delete()
+    _, metrics = recalculate_community_hot_score(db_session)
+    db_session.refresh(stale)
+    assert metrics["watermark"] is None
+    assert stale.comment_count == 1
@@ -5,7 +5,7 @@ from uuid import uuid4
 import pytest
 from starlette.testclient import TestClient
 
-from src.db.enums import Importance
+from src.db.enums import Importance, SourceEntityType
 
 API = "/api/v1/events"
 
@@ -56,6 +56,27 @@ class TestListEvents:
         assert body["data"]["cursor"]["hasMore"] is True
         assert body["data"]["cursor"]["next"] is not None
 
+    def test_list_events_sources_constant_queries(
+        self, client: TestClient, capture_sql, create_event, create_source
+    ):
+        """출처는 페이지 단위로 한 번에 읽어 페이지 크기와 무관하게 쿼리 수가 일정하다"""
+        for i in range(8):
+            item = create_event(title=f"사건{i}")
+            create_source(entity_type=SourceEntityType.EVENT, entity_id=item.id, title=f"출처{i}-1")
+            create_source(entity_type=SourceEntityType.EVENT, entity_id=item.id, title=f"출처{i}-2")
+
+        def _get(limit: int) -> tuple[list[dict], list[str]]:
+            with capture_sql() as statements:
+                items = client.get(API, params={"limit": limit}).json()["data"]["items"]
+            return items, statements
+
+        small, small_statements = _get(2)
+        large, large_statements = _get(8)
+        assert len(small_statements) == len(large_statements)
+        assert len([sql for sql in large_statements if "FROM sources" in sql]) == 1
+        assert [len(item["sources"]) for item in large] == [2] * 8
+        assert all(item["sourceCount"] == 2 for item in small)
+
 
 # ── GET /api/v1/events/{id} ──
 
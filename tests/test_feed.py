@@ -1,8 +1,14 @@
 """Feed API 엔드포인트 테스트."""
 
+import asyncio
+import json
+
 from starlette.testclient import TestClient
 
+from src.crud.feed_stream import feed_broadcaster, sse_events
 from src.db.enums import FeedType, UpdateType
+from src.utils.pipeline.feed_builder import persist_results
+from src.utils.pipeline.update_classifier import ClassificationResult
 
 
 class TestLiveFeed:
@@ -102,6 +108,197 @@ class TestLiveFeed:
         assert resp.status_code in (400, 422)
 
 
+def _drain(subscription) -> list[dict]:
+    items = []
+    while not subscription.queue.empty():
+        items.append(subscription.queue.get_nowait())
+    return items
+
+
+class TestFeedStream:
+    def test_persist_results_publishes_to_matching_subscribers_after_commit(
+        self, db_session, create_raw_article, create_issue
+    ):
+        issue = create_issue(title="스트림 이슈")
+        major_article = create_raw_article(title="스트림 주요 기사")
+        new_article = create_raw_article(title="스트림 신규 기사")
+        results = [
+            ClassificationResult(
+                article_id=major_article.id,
+                update_type=UpdateType.MAJOR_UPDATE,
+                matched_issue_id=issue.id,
+                update_score=0.9,
+            ),
+            ClassificationResult(
+                article_id=new_article.id, update_type=UpdateType.NEW, update_score=0.4
+            ),
+        ]
+
+        async def scenario():
+            everything = feed_broadcaster.subscribe(feed_type=None, issue_ids=None)
+            breaking = feed_broadcaster.subscribe(feed_type="breaking", issue_ids=None)
+            tracked = feed_broadcaster.subscribe(feed_type="major", issue_ids={issue.id})
+
+            persist_results(results, db_session)
+            await asyncio.sleep(0)
+            # 커밋 전에는 전달하지 않는다
+            assert everything.queue.empty()
+
+            db_session.commit()
+            await asyncio.sleep(0)
+            return _drain(everything), _drain(breaking), _drain(tracked)
+
+        everything, breaking, tracked = asyncio.run(scenario())
+
+        # MAJOR(점수 0.9) → all/major/breaking, NEW → all
+        assert sorted(item["feedType"] for item in everything) == [
+            "all",
+            "all",
+            "breaking",
+            "major",
+        ]
+        assert [item["article"]["title"] for item in breaking] == ["스트림 주요 기사"]
+        assert [(item["feedType"], item["issueTitle"]) for item in tracked] == [
+            ("major", "스트림 이슈")
+        ]
+        assert feed_broadcaster.stats()["delivered"] == 6
+
+    def test_poll_delivers_items_after_watermark(
+        self, db_session, create_raw_article, create_event_update, create_live_feed_item
+    ):
+        old = create_event_update(article_id=create_raw_article(title="이전 기사").id)
+        create_live_feed_item(update_id=old.id)
+
+        async def scenario():
+            subscription = feed_broadcaster.subscribe(feed_type=None, issue_ids=None)
+            # 첫 폴링은 워터마크만 잡는다
+            assert feed_broadcaster.poll(db_session) == 0
+
+            eu = create_event_update(article_id=create_raw_article(title="새 기사").id)
+            create_live_feed_item(update_id=eu.id)
+            assert feed_broadcaster.poll(db_session) == 1
+            assert feed_broadcaster.poll(db_session) == 0
+            await asyncio.sleep(0)
+            return _drain(subscription)
+
+        items = asyncio.run(scenario())
+        assert [item["article"]["title"] for item in items] == ["새 기사"]
+
+    def test_sse_events_format_and_overflow(self):
+        item = {"id": "item-1", "feedType": "all", "issueId": None, "title": "속보"}
+
+        async def disconnected() -> bool:
+            return True
+
+        async def scenario():
+            events = sse_events(feed_type=None, issue_ids=None, is_disconnected=disconnected)
+            frames = [await anext(events)]
+            (subscription,) = feed_broadcaster._subscriptions
+            feed_broadcaster.publish([item])
+            frames.append(await anext(events))
+            # 큐가 넘치면 남은 항목을 버리고 스트림을 끝낸다
+            subscription._deliver([item] * (subscription.queue.maxsize + 1))
+            frames.extend([frame async for frame in events])
+            return subscription, frames
+
+        subscription, frames = asyncio.run(scenario())
+        assert frames[0] == "retry: 3000\n\n"
+        event_lines = frames[1].strip().split("\n")
+        assert event_lines[:2] == ["id: item-1", "event: feed"]
+        assert json.loads(event_lines[2].removeprefix("data: ")) == item
+        assert len(frames) == 2
+        assert subscription.overflowed is True
+        assert feed_broadcaster.stats()["subscribers"] == 0
+
+    def test_sse_events_subscribes_only_when_body_starts(self):
+        """본문이 시작되지 않은 스트림은 구독을 남기지 않고, 시작된 스트림은 닫힐 때 해제한다"""
+
+        async def connected() -> bool:
+            return False
+
+        async def scenario():
+            unstarted = sse_events(feed_type=None, issue_ids=None, is_disconnected=connected)
+            await unstarted.aclose()
+            counts = [feed_broadcaster.stats()["subscribers"]]
+
+            started = sse_events(feed_type=None, issue_ids=None, is_disconnected=connected)
+            await anext(started)
+            counts.append(feed_broadcaster.stats()["subscribers"])
+            await started.aclose()
+            counts.append(feed_broadcaster.stats()["subscribers"])
+            return counts
+
+        assert asyncio.run(scenario()) == [0, 1, 0]
+
+    def test_tracked_stream_requires_auth(self, client: TestClient):
+        resp = client.get("/api/v1/feed/stream?tracked=true")
+        assert resp.status_code == 401
+        assert resp.json()["error"]["code"] == "E_AUTH_001"
+
+
+class TestTopStories:
+    def test_empty_top_stories(self, client: TestClient):
+        resp = client.get("/api/v1/feed/top")
+        assert resp.status_code == 200
+        assert resp.json()["data"] == {"items": [], "calculatedAt": None}
+
+    def test_last_update_from_snapshot_single_read(
+        self,
+        client: TestClient,
+        db_session,
+        capture_sql,
+        create_issue,
+        create_raw_article,
+        create_event_update,
+    ):
+        """마지막 업데이트 시각은 스냅샷에 저장되고, 포인터가 캐시된 뒤에는 한 번의 조회로 끝난다"""
+        from src.scheduler.jobs.feed_jobs import calculate_issue_rankings
+
+        issues = [create_issue(title=f"Top 이슈 {i}") for i in range(3)]
+        for issue in issues:
+            article = create_raw_article(title=f"{issue.title} 기사")
+            update = create_event_update(article_id=article.id, issue_id=issue.id)
+        calculate_issue_rankings(db_session)
+
+        first = client.get("/api/v1/feed/top").json()["data"]
+        assert len(first["items"]) == 3
+        last_issue = next(i for i in first["items"] if i["issueId"] == issues[-1].id)
+        assert last_issue["lastUpdateAt"].startswith(update.created_at.isoformat()[:19])
+
+        with capture_sql() as statements:
+            second = client.get("/api/v1/feed/top").json()["data"]
+
+        assert second == first
+        assert len(statements) == 1
+        assert "event_updates" not in statements[0]
+
+    def test_pointer_reloads_after_ttl(
+        self, client: TestClient, db_session, create_issue, monkeypatch
+    ):
+        """새 스냅샷은 포인터 TTL(feed_top_reload_seconds)이 지난 뒤 요청부터 반영된다"""
+        import time
+
+        from src.core.config import get_settings
+        from src.scheduler.jobs.feed_jobs import calculate_issue_rankings
+
+        create_issue(title="첫 스냅샷 이슈")
+        calculate_issue_rankings(db_session)
+        before = client.get("/api/v1/feed/top").json()["data"]
+
+        create_issue(title="두 번째 스냅샷 이슈")
+        calculate_issue_rankings(db_session)
+        cached = client.get("/api/v1/feed/top").json()["data"]
+
+        elapsed = time.monotonic() + get_settings().feed_top_reload_seconds
+        monkeypatch.setattr("src.crud.feed.time.monotonic", lambda: elapsed)
+        after = client.get("/api/v1/feed/top").json()["data"]
+
+        assert len(before["items"]) == 1
+        assert cached == before
+        assert len(after["items"]) == 2
+        assert after["calculatedAt"] != before["calculatedAt"]
+
+
 class TestIssueTimeline:
     def test_timeline_404_for_nonexistent_issue(self, client: TestClient):
         resp = client.get("/api/v1/issues/nonexistent-id/timeline")
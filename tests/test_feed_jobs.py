@@ -0,0 +1,134 @@
+"""피드 스케줄러 잡 테스트 (이슈 랭킹, 인박스 정리)."""
+
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select
+from sqlalchemy.dialects import sqlite
+
+from src.core.config import get_settings
+from src.db.enums import FeedInboxReason, UpdateType
+from src.models.events import user_saved_events
+from src.models.feed import FeedInboxItem
+from src.models.issues import IssueRankSnapshot, issue_events
+from src.scheduler.jobs.feed_jobs import (
+    TOP_N,
+    calculate_issue_rankings,
+    ranking_query,
+    trim_feed_inboxes,
+)
+
+
+class TestIssueRankings:
+    def test_metrics_from_single_query(
+        self,
+        db_session,
+        member_user,
+        create_issue,
+        create_event,
+        create_raw_article,
+        create_event_update,
+    ):
+        """업데이트 수·소스 다양성·저장 수·연관 사건 수를 한 번에 집계"""
+        issue = create_issue(title="집계 이슈")
+        saved_event = create_event(title="저장된 사건")
+        db_session.execute(issue_events.insert().values(issue_id=issue.id, event_id=saved_event.id))
+        db_session.execute(
+            user_saved_events.insert().values(
+                user_id=member_user["user"].id,
+                event_id=saved_event.id,
+                saved_at=datetime.now(timezone.utc),
+            )
+        )
+        for source_name in ("가신문", "나신문", "나신문"):
+            article = create_raw_article(title=f"{source_name} 기사", source_name=source_name)
+            create_event_update(article_id=article.id, issue_id=issue.id)
+        dup = create_raw_article(title="중복 기사", source_name="다신문")
+        create_event_update(article_id=dup.id, issue_id=issue.id, update_type=UpdateType.DUP)
+
+        calculate_issue_rankings(db_session)
+
+        snapshot = db_session.execute(
+            select(IssueRankSnapshot).where(IssueRankSnapshot.period == "24h")
+        ).scalar_one()
+        assert snapshot.recent_updates == 3
+        assert snapshot.saved_count == 1  # issue_events 기준 사건 저장 수
+        assert snapshot.related_event_count == 1
+        assert snapshot.score == round(0.4 * 0.3 + 0.2 * (1 / 50) + 0.2 * (2 / 5), 4)
+
+    def test_only_top_n_written(self, db_session, create_issue):
+        """활성 이슈가 많아도 기간별 상위 TOP_N개만 저장"""
+        for i in range(TOP_N + 3):
+            create_issue(title=f"이슈 {i}")
+
+        calculate_issue_rankings(db_session)
+
+        for period in ("24h", "7d"):
+            ranks = db_session.execute(
+                select(IssueRankSnapshot.rank).where(IssueRankSnapshot.period == period)
+            ).scalars()
+            assert sorted(ranks) == list(range(1, TOP_N + 1))
+
+    def test_constant_query_count(self, db_session, capture_sql, create_issue):
+        """활성 이슈 수가 늘어도 실행 쿼리 수는 같다"""
+        create_issue(title="이슈 하나")
+        with capture_sql() as few:
+            calculate_issue_rankings(db_session)
+
+        for i in range(15):
+            create_issue(title=f"추가 이슈 {i}")
+        # 직전 스냅샷이 생긴 뒤에도 같은 쿼리 수
+        with capture_sql() as many:
+            calculate_issue_rankings(db_session)
+
+        assert len(few) == len(many)
+
+    def test_explain_has_no_correlated_subquery(self, db_session):
+        """EXPLAIN QUERY PLAN에 이슈별 상관 서브쿼리가 없다"""
+        stmt = ranking_query(since=datetime.now(timezone.utc) - timedelta(hours=24))
+        compiled = stmt.compile(dialect=sqlite.dialect(), compile_kwargs={"literal_binds": True})
+        plan = db_session.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}").all()
+
+        details = " ".join(str(row[-1]) for row in plan)
+        assert "CORRELATED" not in details
+
+
+class TestFeedInboxTrim:
+    def test_trims_only_users_over_cap_keeping_newest(
+        self,
+        db_session,
+        member_user,
+        admin_user,
+        create_raw_article,
+        create_event_update,
+        monkeypatch,
+    ):
+        monkeypatch.setattr(get_settings(), "feed_inbox_max_items", 2)
+        now = datetime.now(timezone.utc)
+        updates = [
+            create_event_update(article_id=create_raw_article(title=f"인박스 기사 {i}").id)
+            for i in range(4)
+        ]
+        rows = [
+            (member_user["user"].id, eu, now - timedelta(minutes=i)) for i, eu in enumerate(updates)
+        ] + [(admin_user["user"].id, updates[3], now - timedelta(days=1))]
+        db_session.add_all(
+            FeedInboxItem(
+                user_id=user_id,
+                update_id=eu.id,
+                reason=FeedInboxReason.TRACKED_ISSUE,
+                created_at=created_at,
+            )
+            for user_id, eu, created_at in rows
+        )
+        db_session.flush()
+
+        assert trim_feed_inboxes(db_session) == "max_items=2, deleted=2"
+
+        remaining = db_session.execute(select(FeedInboxItem.user_id, FeedInboxItem.update_id)).all()
+        assert sorted(remaining) == sorted(
+            [
+                (member_user["user"].id, updates[0].id),
+                (member_user["user"].id, updates[1].id),
+                (admin_user["user"].id, updates[3].id),
+            ]
+        )
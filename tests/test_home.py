@@ -1,5 +1,7 @@
 # 홈 도메인 API 테스트
 
+from datetime import datetime, timezone
+
 
 class TestBreakingNews:
     """GET /api/v1/home/breaking-news 테스트"""
@@ -63,6 +65,22 @@ class TestHotPosts:
         assert "commentCount" in item
         assert "isHot" in item
 
+    def test_hot_posts_period(self, client, create_post, member_user, db_session):
+        """period 밖에서 작성된 게시글은 제외, 인기 점수순 정렬"""
+        from datetime import timedelta
+
+        recent = create_post(author_id=member_user["user"].id, title="오늘 글")
+        older = create_post(author_id=member_user["user"].id, title="사흘 전 글")
+        older.created_at = datetime.now(timezone.utc) - timedelta(days=3)
+        older.hot_score = 9.0
+        db_session.flush()
+
+        daily = client.get("/api/v1/home/hot-posts").json()["data"]
+        weekly = client.get("/api/v1/home/hot-posts", params={"period": "7d"}).json()["data"]
+        assert [i["id"] for i in daily] == [recent.id]
+        assert [i["id"] for i in weekly] == [older.id, recent.id]
+        assert client.get("/api/v1/home/hot-posts", params={"period": "1y"}).status_code == 400
+
 
 class TestSearchRankings:
     """GET /api/v1/home/search-rankings 테스트"""
@@ -82,13 +100,14 @@ class TestSearchRankings:
 
         from src.models.search import SearchRanking
 
+        now = datetime.now(timezone.utc)
         for i in range(3):
             ranking = SearchRanking(
                 id=str(uuid4()),
                 keyword=f"키워드{i}",
                 rank=i + 1,
                 score=100 - i * 10,
-                calculated_at=datetime.now(timezone.utc),
+                calculated_at=now,
             )
             db_session.add(ranking)
         db_session.flush()
@@ -115,31 +134,80 @@ class TestTrending:
         assert body["success"] is True
         assert body["data"] == []
 
-    def test_trending_with_data(self, client, create_event):
-        """사건 데이터가 있으면 트렌딩 목록 반환"""
-        create_event(title="트렌딩 사건")
+    def test_trending_with_data(self, client, db_session, create_issue, create_event):
+        """최신 랭킹 스냅샷에서 연관 사건 수·추적자 수를 포함해 반환"""
+        from src.models.issues import issue_events
+        from src.scheduler.jobs.feed_jobs import calculate_issue_rankings
+
+        top, other = create_issue(title="상위 이슈"), create_issue(title="하위 이슈")
+        top.tracker_count, other.tracker_count = 80, 10
+        db_session.flush()
+        for i in range(2):
+            event = create_event(title=f"연관 사건 {i}")
+            db_session.execute(issue_events.insert().values(issue_id=top.id, event_id=event.id))
+        calculate_issue_rankings(db_session)
+
         res = client.get("/api/v1/home/trending")
         assert res.status_code == 200
-        body = res.json()
-        assert body["success"] is True
-        assert len(body["data"]) == 1
-        item = body["data"][0]
-        assert "rank" in item
-        assert "issue" in item
-        assert "id" in item["issue"]
-        assert "title" in item["issue"]
+        items = res.json()["data"]
+        assert [i["issue"]["id"] for i in items] == [top.id, other.id]
+        assert items[0] == {
+            "rank": 1,
+            "issue": {"id": top.id, "title": "상위 이슈", "status": "ongoing"},
+            "relatedEventCount": 2,
+            "trackerCount": 80,
+            "change": "new",
+        }
+
+    def test_trending_rank_change_against_previous_snapshot(self, client, db_session, create_issue):
+        """직전 스냅샷 대비 순위 변동을 +N/-N으로 표시"""
+        from src.scheduler.jobs.feed_jobs import calculate_issue_rankings
+
+        first, second = create_issue(title="이슈 A"), create_issue(title="이슈 B")
+        first.tracker_count, second.tracker_count = 50, 10
+        db_session.flush()
+        calculate_issue_rankings(db_session)
+        second.tracker_count = 90
+        db_session.flush()
+        calculate_issue_rankings(db_session)
+
+        items = client.get("/api/v1/home/trending").json()["data"]
+        assert [(i["issue"]["id"], i["change"]) for i in items] == [
+            (second.id, "+1"),
+            (first.id, "-1"),
+        ]
+
+    def test_trending_period_series(self, client, db_session, create_issue):
+        """period마다 별도 스냅샷 시리즈를 읽는다"""
+        from src.models.issues import IssueRankSnapshot
+        from src.scheduler.jobs.feed_jobs import calculate_issue_rankings
+
+        issue = create_issue(title="주간 이슈")
+        calculate_issue_rankings(db_session)
+        db_session.query(IssueRankSnapshot).filter(IssueRankSnapshot.period == "24h").delete()
+
+        assert client.get("/api/v1/home/trending").json()["data"] == []
+        weekly = client.get("/api/v1/home/trending", params={"period": "7d"}).json()["data"]
+        assert [i["issue"]["id"] for i in weekly] == [issue.id]
+
+    def test_trending_invalid_period(self, client):
+        """지원하지 않는 period는 400"""
+        res = client.get("/api/v1/home/trending", params={"period": "30d"})
+        assert res.status_code == 400
 
 
 class TestTimelineMinimap:
     """GET /api/v1/home/timeline-minimap 테스트"""
 
     def test_timeline_minimap_empty(self, client):
-        """데이터 없을 때 빈 dates 배열 반환"""
+        """데이터 없을 때도 기간 일수만큼 0건 날짜를 반환"""
         res = client.get("/api/v1/home/timeline-minimap")
         assert res.status_code == 200
         body = res.json()
         assert body["success"] is True
-        assert body["data"]["dates"] == []
+        dates = body["data"]["dates"]
+        assert len(dates) == 7
+        assert all(d["eventCount"] == 0 and d["density"] == "none" for d in dates)
 
     def test_timeline_minimap_with_data(self, client, create_event):
         """사건 데이터가 있으면 타임라인 미니맵 반환"""
@@ -149,10 +217,56 @@ class TestTimelineMinimap:
         body = res.json()
         assert body["success"] is True
         dates = body["data"]["dates"]
-        assert len(dates) == 1
-        assert "date" in dates[0]
-        assert "eventCount" in dates[0]
-        assert "density" in dates[0]
+        assert len(dates) == 7
+        assert dates[0]["eventCount"] == 1
+        assert dates[0]["maxImportance"] == "medium"
+        assert dates[0]["density"] == "medium"
+        assert dates[0]["date"] > dates[1]["date"]
+
+    def test_rollup_follows_admin_writes(self, client, admin_headers, db_session, create_source):
+        """관리자 사건 생성/중요도 수정/삭제가 일별 롤업에 반영된다"""
+        from src.models.events import EventDailyCount
+        from src.sql.events import event_day
+
+        occurred_at = datetime.now(timezone.utc)
+        res = client.post(
+            "/api/v1/events",
+            json={
+                "occurredAt": occurred_at.isoformat(),
+                "title": "롤업 사건",
+                "summary": "요약",
+                "importance": "low",
+                "verificationStatus": "verified",
+                "tagIds": [],
+                "sourceIds": [create_source().id],
+            },
+            headers=admin_headers,
+        )
+        event_id = res.json()["data"]["id"]
+        row = db_session.get(EventDailyCount, event_day(occurred_at))
+        assert (row.event_count, row.low_count, row.high_count) == (1, 1, 0)
+
+        client.patch(
+            f"/api/v1/events/{event_id}", json={"importance": "high"}, headers=admin_headers
+        )
+        db_session.refresh(row)
+        assert (row.event_count, row.low_count, row.high_count) == (1, 0, 1)
+
+        client.delete(f"/api/v1/events/{event_id}", headers=admin_headers)
+        db_session.refresh(row)
+        assert (row.event_count, row.high_count) == (0, 0)
+
+    def test_event_day_uses_seoul_timezone(self):
+        """UTC 15시 이후 사건은 서울 기준 다음 날로 집계된다"""
+        from src.sql.events import event_day
+
+        assert (
+            event_day(datetime(2026, 3, 1, 14, 59, tzinfo=timezone.utc)).isoformat() == "2026-03-01"
+        )
+        assert (
+            event_day(datetime(2026, 3, 1, 15, 0, tzinfo=timezone.utc)).isoformat() == "2026-03-02"
+        )
+        assert event_day(datetime(2026, 3, 1, 15, 0)).isoformat() == "2026-03-02"
 
 
 class TestFeaturedNews:
@@ -205,3 +319,115 @@ class TestCommunityMedia:
         assert "id" in item
         assert "title" in item
         assert "createdAt" in item
+
+
+class TestHomeSnapshot:
+    """사전 계산 홈 스냅샷 테스트"""
+
+    def test_live_fallback_without_snapshot(self, client, create_event):
+        """스냅샷이 없으면 즉석 계산하고 snapshotAt은 null"""
+        create_event(title="즉석 사건")
+        body = client.get("/api/v1/home/breaking-news").json()
+        assert body["snapshotAt"] is None
+        assert body["data"][0]["title"] == "즉석 사건"
+
+    def test_served_from_snapshot_until_rebuilt(self, client, db_session, create_event):
+        """스냅샷 이후 추가된 사건은 재생성 전까지 보이지 않는다"""
+        from src.crud.home import refresh_home_snapshot
+
+        create_event(title="스냅샷 사건")
+        refresh_home_snapshot(db_session)
+        create_event(title="나중 사건")
+
+        body = client.get("/api/v1/home/breaking-news").json()
+        assert body["snapshotAt"] is not None
+        assert [i["title"] for i in body["data"]] == ["스냅샷 사건"]
+
+        refresh_home_snapshot(db_session)
+        body = client.get("/api/v1/home/breaking-news").json()
+        assert len(body["data"]) == 2
+
+    def test_fresh_mirror_serves_without_queries(
+        self, client, db_session, capture_sql, create_event
+    ):
+        """메모리 사본이 최신이면 DB 쿼리 없이 응답"""
+        from src.crud.home import refresh_home_snapshot
+
+        for i in range(3):
+            create_event(title=f"사건 {i}")
+        refresh_home_snapshot(db_session)
+        client.get("/api/v1/home/breaking-news")  # 메모리 사본 적재
+
+        with capture_sql() as statements:
+            res = client.get("/api/v1/home/breaking-news", params={"limit": 2})
+            minimap = client.get("/api/v1/home/timeline-minimap", params={"days": 2})
+
+        assert statements == []
+        assert len(res.json()["data"]) == 2
+        assert len(minimap.json()["data"]["dates"]) == 2
+
+    def test_admin_write_rebuilds_snapshot(self, client, admin_headers, create_event):
+        """관리자 사건 삭제 직후 스냅샷에서 빠진다"""
+        keep = create_event(title="남는 사건")
+        removed = create_event(title="삭제 사건")
+        res = client.delete(f"/api/v1/events/{removed.id}", headers=admin_headers)
+        assert res.status_code == 200
+
+        body = client.get("/api/v1/home/breaking-news").json()
+        assert body["snapshotAt"] is not None
+        assert [i["id"] for i in body["data"]] == [keep.id]
+
+    def test_ranking_job_rebuilds_snapshot(self, db_session, monkeypatch, create_event):
+        """search_rankings 잡이 끝나면 홈 스냅샷이 저장된다"""
+        from src.models.home import HomeSnapshot
+        from src.scheduler.runner import run_job
+
+        monkeypatch.setattr("src.scheduler.runner.SessionLocal", lambda: db_session)
+        monkeypatch.setattr(db_session, "close", lambda: None)
+        create_event(title="랭킹 사건")
+
+        run_job("search_rankings", lambda db: "ok")
+
+        snapshot = db_session.get(HomeSnapshot, "breaking-news")
+        assert snapshot is not None
+        assert snapshot.payload[0]["title"] == "랭킹 사건"
+
+
+class TestHomeBundle:
+    """GET /api/v1/home/bundle 테스트"""
+
+    def test_bundle_contains_all_widgets(self, client, create_event):
+        """기본 요청은 7개 위젯을 한 봉투로 반환"""
+        create_event(title="번들 사건")
+        body = client.get("/api/v1/home/bundle").json()
+        assert body["success"] is True
+        assert set(body["data"]) == {
+            "breakingNews",
+            "hotPosts",
+            "searchRankings",
+            "trending",
+            "timelineMinimap",
+            "featuredNews",
+            "communityMedia",
+        }
+        assert body["data"]["breakingNews"][0]["title"] == "번들 사건"
+        assert "dates" in body["data"]["timelineMinimap"]
+
+    def test_bundle_per_widget_limits(self, client, db_session, create_event):
+        """위젯별 개수 지정, 0이면 제외. 단일 엔드포인트와 같은 항목"""
+        from src.crud.home import refresh_home_snapshot
+
+        for i in range(4):
+            create_event(title=f"사건 {i}")
+        refresh_home_snapshot(db_session)
+
+        body = client.get(
+            "/api/v1/home/bundle",
+            params={"breakingNewsLimit": 2, "hotPostsLimit": 0, "timelineDays": 3},
+        ).json()
+        single = client.get("/api/v1/home/breaking-news", params={"limit": 2}).json()
+
+        assert "hotPosts" not in body["data"]
+        assert body["data"]["breakingNews"] == single["data"]
+        assert len(body["data"]["timelineMinimap"]["dates"]) == 3
+        assert body["snapshotAt"] == single["snapshotAt"] is not None
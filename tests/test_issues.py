@@ -34,6 +34,20 @@ class TestListIssues:
         assert body["success"] is True
         assert len(body["data"]["items"]) == 2
 
+    def test_list_issues_sources_batched(
+        self, client: TestClient, capture_sql, create_issue, create_source
+    ):
+        """이슈 목록 출처는 한 번에 읽고 이슈별로 최신 발행순으로 나눈다"""
+        issues = [create_issue(title=f"이슈{i}") for i in range(4)]
+        for issue in issues:
+            create_source(entity_type=SourceEntityType.ISSUE, entity_id=issue.id, title="출처")
+
+        with capture_sql() as statements:
+            items = client.get(API).json()["data"]["items"]
+
+        assert [len(item["sources"]) for item in items] == [1] * 4
+        assert len([sql for sql in statements if "FROM sources" in sql]) == 1
+
     def test_list_issues_filter_status(self, client: TestClient, create_issue):
         """상태 필터링"""
         create_issue(title="진행 중", status=IssueStatus.ONGOING)
@@ -224,6 +238,21 @@ class TestListTriggers:
         assert body["success"] is True
         assert len(body["data"]) == 2
 
+    def test_list_triggers_sources_single_query(
+        self, client: TestClient, capture_sql, create_issue, create_trigger, create_source
+    ):
+        """트리거 출처는 트리거 수와 무관하게 한 번의 쿼리로 읽는다"""
+        issue = create_issue()
+        for i in range(5):
+            trigger = create_trigger(issue_id=issue.id, summary=f"트리거{i}")
+            create_source(entity_type=SourceEntityType.TRIGGER, entity_id=trigger.id)
+
+        with capture_sql() as statements:
+            data = client.get(f"{API}/{issue.id}/triggers").json()["data"]
+
+        assert [len(item["sources"]) for item in data] == [1] * 5
+        assert len([sql for sql in statements if "FROM sources" in sql]) == 1
+
 
 # ── POST /api/v1/issues/{id}/track ──
 
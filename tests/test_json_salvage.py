@@ -0,0 +1,97 @@
+"""LLM 요약 응답 JSON 복구 테스트."""
+
+import json
+
+from src.utils.news_summarizer.json_salvage import StreamingJsonSalvager, salvage_json_objects
+
+
+def _item(keyword: str, summary: str = "요약") -> dict:
+    return {"keyword": keyword, "summary": summary, "tags": ["태그"]}
+
+
+class TestSalvageJsonObjects:
+    def test_truncated_array_keeps_complete_objects(self):
+        raw = json.dumps([_item("경제"), _item("정치")], ensure_ascii=False)
+        truncated = raw[:-20]
+
+        recovered = salvage_json_objects(truncated)
+        assert [o["keyword"] for o in recovered] == ["경제"]
+
+    def test_malformed_object_is_skipped(self):
+        raw = (
+            '[{"keyword": "경제", "summary": "요약"},'
+            ' {"keyword": "정치", "summary": "따옴표 "누락" 요약"},'
+            ' {"keyword": "사회", "summary": "요약",}]'
+        )
+        recovered = salvage_json_objects(raw)
+        assert [o["keyword"] for o in recovered] == ["경제", "사회"]
+
+    def test_unescaped_quote_resyncs_at_next_object(self):
+        raw = (
+            '[{"keyword": "TV", "summary": "5" screen"},'
+            '{"keyword": "경제", "summary": "요약"},'
+            ' {"keyword": "정치", "summary": "요약"}]'
+        )
+        salvager = StreamingJsonSalvager()
+        salvager.feed(raw)
+        assert [o["keyword"] for o in salvager.objects] == ["경제", "정치"]
+        assert salvager.skipped == 1
+        assert not salvager.truncated
+
+    def test_wrapped_object_and_markdown_fence(self):
+        raw = "```json\n" + json.dumps({"keywords": [_item("경제")]}, ensure_ascii=False) + "\n```"
+        assert salvage_json_objects(raw) == [_item("경제")]
+
+    def test_nested_helper_objects_are_ignored(self):
+        raw = '[{"keyword": "경제", "summary": "요약", "entities": [{"name": "한국은행"}]}]'
+        recovered = salvage_json_objects(raw)
+        assert len(recovered) == 1
+        assert recovered[0]["entities"] == [{"name": "한국은행"}]
+
+    def test_braces_inside_strings(self):
+        raw = '[{"keyword": "경제", "summary": "괄호 } 와 \\" 따옴표"}]'
+        assert salvage_json_objects(raw)[0]["summary"] == '괄호 } 와 " 따옴표'
+
+    def test_raw_newline_in_string(self):
+        raw = '[{"keyword": "경제", "summary": "첫 줄\n둘째 줄"}]'
+        assert salvage_json_objects(raw)[0]["summary"] == "첫 줄\n둘째 줄"
+
+
+class TestStreamingJsonSalvager:
+    def test_emits_objects_as_chunks_arrive(self):
+        raw = json.dumps([_item("경제"), _item("정치")], ensure_ascii=False)
+        salvager = StreamingJsonSalvager()
+
+        emitted: list[list[str]] = []
+        for i in range(0, len(raw), 7):
+            emitted.append([o["keyword"] for o in salvager.feed(raw[i : i + 7])])
+
+        flat = [kw for batch in emitted for kw in batch]
+        assert flat == ["경제", "정치"]
+        # 첫 객체는 전체 응답이 끝나기 전에 나온다
+        first_at = next(i for i, batch in enumerate(emitted) if batch)
+        assert first_at < len(emitted) - 1
+        assert not salvager.truncated
+
+    def test_resync_across_chunks(self):
+        raw = '[{"keyword": "TV", "summary": "5" screen"}, {"keyword": "경제", "summary": "요약"}]'
+        salvager = StreamingJsonSalvager()
+        for ch in raw:
+            salvager.feed(ch)
+        assert [o["keyword"] for o in salvager.objects] == ["경제"]
+
+    def test_buffer_keeps_only_open_object(self):
+        salvager = StreamingJsonSalvager()
+        salvager.feed("[")
+        for i in range(200):
+            salvager.feed(json.dumps(_item(f"키워드{i}"), ensure_ascii=False) + ",")
+        salvager.feed('{"keyword": "마지막", "sum')
+        assert len(salvager.objects) == 200
+        assert salvager._text == '{"keyword": "마지막", "sum'
+        assert salvager.truncated
+
+    def test_truncated_flag(self):
+        salvager = StreamingJsonSalvager()
+        salvager.feed('[{"keyword": "경제", "summary": "요')
+        assert salvager.truncated
+        assert salvager.objects == []
@@ -0,0 +1,170 @@
+"""LLM 클라이언트 재시도/서킷/지표 테스트."""
+
+import json
+import threading
+from types import SimpleNamespace
+
+import httpx
+import openai
+import pytest
+
+from src.utils.news_summarizer import llm_client
+from src.utils.news_summarizer.llm_client import (
+    CircuitBreaker,
+    LLMUnavailableError,
+    call_ollama,
+    create_ollama_client,
+    reset_llm_clients,
+)
+
+
+class _Stream:
+    def __init__(self, deltas: list[str], usage: tuple[int, int] | None = (10, 5)) -> None:
+        self._events = [
+            SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=d))], usage=None)
+            for d in deltas
+        ]
+        if usage:
+            self._events.append(
+                SimpleNamespace(
+                    choices=[],
+                    usage=SimpleNamespace(prompt_tokens=usage[0], completion_tokens=usage[1]),
+                )
+            )
+        self.closed = False
+
+    def __iter__(self):
+        return iter(self._events)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class _FakeClient:
+    """chat.completions.create 응답을 순서대로 돌려주는 가짜 클라이언트."""
+
+    def __init__(self, responses: list) -> None:
+        self.base_url = f"http://fake-{id(self)}/v1"
+        self.requests: list[dict] = []
+        self._responses = list(responses)
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    def _create(self, **kwargs):
+        self.requests.append(kwargs)
+        response = self._responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+def _connection_error() -> openai.APIConnectionError:
+    return openai.APIConnectionError(request=httpx.Request("POST", "http://fake/v1"))
+
+
+@pytest.fixture(autouse=True)
+def _reset_pool(monkeypatch):
+    reset_llm_clients()
+    monkeypatch.setattr(llm_client.time, "sleep", lambda _: None)
+    yield
+    reset_llm_clients()
+
+
+class TestCallOllama:
+    def test_streams_and_records_metrics(self):
+        body = json.dumps([{"keyword": "경제", "summary": "요약"}], ensure_ascii=False)
+        client = _FakeClient([_Stream([body[:10], body[10:]])])
+
+        items: list[dict] = []
+        text, usage = call_ollama(client, "m", "sys", "user", on_item=items.append)
+
+        assert text == body
+        assert items == [{"keyword": "경제", "summary": "요약"}]
+        assert usage["prompt"] == 10 and usage["completion"] == 5
+        assert usage["attempts"] == 1
+        assert {"ttft_ms", "duration_ms", "queue_ms", "tokens_per_sec"} <= usage.keys()
+        assert client.requests[0]["stream"] is True
+
+    def test_retries_connection_errors(self):
+        client = _FakeClient([_connection_error(), _Stream(["[]"])])
+
+        text, usage = call_ollama(client, "m", "sys", "user")
+        assert text == "[]"
+        assert usage["attempts"] == 2
+
+    def test_gives_up_after_max_retries(self):
+        client = _FakeClient([_connection_error() for _ in range(5)])
+
+        with pytest.raises(openai.APIConnectionError):
+            call_ollama(client, "m", "sys", "user")
+        # 기본 설정: 최초 1회 + 재시도 2회
+        assert len(client.requests) == 3
+
+    def test_circuit_opens_after_consecutive_failures(self):
+        client = _FakeClient([ValueError("bad") for _ in range(3)])
+        for _ in range(3):
+            with pytest.raises(ValueError):
+                call_ollama(client, "m", "sys", "user")
+
+        with pytest.raises(LLMUnavailableError):
+            call_ollama(client, "m", "sys", "user")
+        assert len(client.requests) == 3
+
+
+class TestCircuitBreaker:
+    def test_half_open_after_reset(self, monkeypatch):
+        now = [100.0]
+        monkeypatch.setattr(llm_client.time, "monotonic", lambda: now[0])
+        breaker = CircuitBreaker(failure_threshold=2, reset_seconds=30)
+
+        breaker.record_failure()
+        assert breaker.state == "closed"
+        breaker.record_failure()
+        assert breaker.state == "open" and not breaker.allow()
+
+        now[0] += 31
+        assert breaker.state == "half-open" and breaker.allow()
+        # half-open에서 실패하면 곧바로 다시 open
+        breaker.record_failure()
+        assert breaker.state == "open"
+        now[0] += 31
+        breaker.record_success()
+        assert breaker.state == "closed"
+
+    def test_half_open_allows_single_trial(self, monkeypatch):
+        now = [100.0]
+        monkeypatch.setattr(llm_client.time, "monotonic", lambda: now[0])
+        breaker = CircuitBreaker(failure_threshold=1, reset_seconds=30)
+        breaker.record_failure()
+        now[0] += 31
+
+        barrier = threading.Barrier(2)
+        results: list[bool] = []
+
+        def _allow() -> None:
+            barrier.wait()
+            results.append(breaker.allow())
+
+        threads = [threading.Thread(target=_allow) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert sorted(results) == [False, True]
+
+        # 시험 요청이 끝나기 전에는 계속 거절, 실패하면 다시 open
+        assert not breaker.allow()
+        breaker.record_failure()
+        assert breaker.state == "open" and not breaker.allow()
+        now[0] += 31
+        assert breaker.allow()
+        breaker.record_success()
+        assert breaker.allow() and breaker.allow()
+
+
+class TestClientPool:
+    def test_client_is_reused(self):
+        first, _ = create_ollama_client()
+        second, model = create_ollama_client("llama3:8b")
+        assert first is second
+        assert model == "llama3:8b"
+        assert first.max_retries == 0
@@ -0,0 +1,116 @@
+"""keyset 커서 페이지네이션 테스트."""
+
+from datetime import datetime, timedelta, timezone
+
+from starlette.testclient import TestClient
+
+from src.core.pagination import (
+    decode_keyset_cursor,
+    encode_cursor,
+    encode_keyset_cursor,
+)
+from src.sql.issues import IssueRepository
+
+EVENTS_API = "/api/v1/events"
+
+
+def _collect(client: TestClient, url: str, limit: int) -> list[str]:
+    seen: list[str] = []
+    cursor = None
+    while True:
+        params = {"limit": limit}
+        if cursor:
+            params["cursor"] = cursor
+        data = client.get(url, params=params).json()["data"]
+        seen.extend(i["id"] for i in data["items"])
+        cursor = data["cursor"]["next"]
+        if not data["cursor"]["hasMore"]:
+            return seen
+
+
+class TestKeysetCursor:
+    def test_roundtrip_preserves_datetime(self):
+        at = datetime(2026, 1, 1, 9, 30, tzinfo=timezone.utc)
+        cursor = encode_keyset_cursor([at, "id-1"], signature="-createdAt,-id")
+        assert decode_keyset_cursor(cursor, signature="-createdAt,-id") == [at, "id-1"]
+
+    def test_tampered_or_foreign_cursor_rejected(self):
+        cursor = encode_keyset_cursor([1, "id-1"], signature="-likeCount,-id")
+        prefix, payload, sig = cursor.split(".")
+        forged = encode_keyset_cursor([999, "id-1"], signature="-likeCount,-id").split(".")[1]
+
+        assert decode_keyset_cursor(f"{prefix}.{forged}.{sig}", signature="-likeCount,-id") is None
+        assert decode_keyset_cursor(cursor, signature="-createdAt,-id") is None
+        assert decode_keyset_cursor("k1.garbage", signature="-likeCount,-id") is None
+
+
+class TestKeysetPaging:
+    def test_walks_all_events_without_duplicates(self, client: TestClient, create_event):
+        ids = {create_event(title=f"사건{i}").id for i in range(5)}
+        seen = _collect(client, EVENTS_API, limit=2)
+        assert len(seen) == 5 and set(seen) == ids
+
+    def test_new_rows_between_pages_do_not_shift(self, client: TestClient, create_event):
+        for i in range(4):
+            create_event(title=f"사건{i}")
+        first = client.get(EVENTS_API, params={"limit": 2}).json()["data"]
+
+        # 첫 페이지 조회 후 최신 항목이 추가돼도 두 번째 페이지는 밀리지 않는다
+        create_event(title="새 사건")
+        second = client.get(
+            EVENTS_API, params={"limit": 2, "cursor": first["cursor"]["next"]}
+        ).json()["data"]
+
+        first_ids = {i["id"] for i in first["items"]}
+        assert len(second["items"]) == 2
+        assert first_ids.isdisjoint(i["id"] for i in second["items"])
+
+    def test_legacy_offset_cursor_still_accepted(self, client: TestClient, create_event):
+        for i in range(5):
+            create_event(title=f"사건{i}")
+        full = [i["id"] for i in client.get(EVENTS_API, params={"limit": 5}).json()["data"]["items"]]
+
+        data = client.get(EVENTS_API, params={"limit": 2, "cursor": encode_cursor(2)}).json()["data"]
+        assert [i["id"] for i in data["items"]] == full[2:4]
+        # 다음 커서부터는 keyset
+        assert data["cursor"]["next"].startswith("k1.")
+
+    def test_tampered_cursor_falls_back_to_first_page(self, client: TestClient, create_event):
+        for i in range(3):
+            create_event(title=f"사건{i}")
+        first = client.get(EVENTS_API, params={"limit": 2}).json()["data"]
+        prefix, payload, _ = first["cursor"]["next"].split(".")
+
+        data = client.get(
+            EVENTS_API, params={"limit": 2, "cursor": f"{prefix}.{payload}.AAAAAAAAAAAAAAAAAAAAAA"}
+        ).json()["data"]
+        assert [i["id"] for i in data["items"]] == [i["id"] for i in first["items"]]
+
+    def test_nullable_sort_key_pages_nulls_last(self, db_session, create_issue):
+        base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        triggered = []
+        for i in range(3):
+            issue = create_issue(title=f"이슈{i}")
+            issue.latest_trigger_at = base + timedelta(hours=i)
+            triggered.append(issue.id)
+        untriggered = [create_issue(title=f"무트리거{i}").id for i in range(2)]
+        db_session.flush()
+
+        repository = IssueRepository(db_session)
+        seen: list[str] = []
+        cursor = None
+        while True:
+            items, cursor = repository.list_issues(
+                size=2,
+                cursor=cursor,
+                sort="-latestTriggerAt",
+                status=None,
+                from_at=None,
+                to_at=None,
+            )
+            seen.extend(i.id for i in items)
+            if cursor is None:
+                break
+
+        assert seen[:3] == list(reversed(triggered))
+        assert sorted(seen[3:]) == sorted(untriggered)
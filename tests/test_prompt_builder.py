@@ -0,0 +1,90 @@
+"""요약 프롬프트 패킹 테스트."""
+
+from src.utils.news_summarizer.prompt_builder import (
+    build_combined_prompt,
+    estimate_tokens,
+    pack_prompts,
+)
+
+
+def _article(url: str, keywords: list[str], confidence: float = 0.9, content: str = "본문") -> dict:
+    return {
+        "title": f"제목 {url}",
+        "url": url,
+        "content_text": content,
+        "channel": "테스트",
+        "matched_keywords": keywords,
+        "confidence": confidence,
+    }
+
+
+class TestEstimateTokens:
+    def test_hangul_counts_per_syllable(self):
+        assert estimate_tokens("가나다") == 3
+        assert estimate_tokens("abcd") == 1
+        assert estimate_tokens("") == 0
+
+
+class TestPackPrompts:
+    def test_shared_article_is_included_once(self):
+        shared = _article("https://a.com/1", ["경제", "금리"], content="공유 기사 본문")
+        groups = {"경제": [shared], "금리": [shared]}
+
+        chunks = pack_prompts(groups)
+        assert len(chunks) == 1
+        prompt = chunks[0].prompt
+        assert prompt.count("공유 기사 본문") == 1
+        assert "기사 A1 (위 동일 기사 참조)" in prompt
+        assert chunks[0].dedup_saved_tokens > 0
+
+    def test_articles_ranked_by_confidence(self):
+        groups = {
+            "경제": [
+                _article("https://a.com/low", ["경제"], confidence=0.1),
+                _article("https://a.com/high", ["경제"], confidence=0.9),
+                _article("https://a.com/mid", ["경제"], confidence=0.5),
+                _article("https://a.com/min", ["경제"], confidence=0.05),
+            ]
+        }
+        prompt = pack_prompts(groups)[0].prompt
+        assert prompt.index("a.com/high") < prompt.index("a.com/mid") < prompt.index("a.com/low")
+        assert "a.com/min" not in prompt
+
+    def test_splits_when_over_budget(self):
+        body = "가" * 400
+        groups = {
+            f"키워드{i}": [_article(f"https://a.com/{i}", [f"키워드{i}"], content=body)]
+            for i in range(4)
+        }
+        chunks = pack_prompts(groups, token_budget=1000)
+
+        assert len(chunks) > 1
+        assert [kw for c in chunks for kw in c.keywords] == list(groups)
+        assert all(c.estimated_tokens <= 1000 for c in chunks)
+        assert sum(c.dropped_articles for c in chunks) == 0
+
+    def test_drops_low_confidence_articles_when_single_keyword_too_large(self):
+        body = "가" * 500
+        groups = {
+            "경제": [
+                _article(f"https://a.com/{i}", ["경제"], confidence=1 - i / 10, content=body)
+                for i in range(3)
+            ]
+        }
+        chunks = pack_prompts(groups, token_budget=700)
+
+        assert len(chunks) == 1
+        assert chunks[0].dropped_articles == 2
+        assert chunks[0].trimmed_keywords == ["경제"]
+        assert "a.com/0" in chunks[0].prompt
+
+    def test_reserved_tokens_reduce_budget(self):
+        groups = {"경제": [_article("https://a.com/1", ["경제"], content="가" * 300)]}
+        assert not pack_prompts(groups, token_budget=600)[0].dropped_articles
+        assert pack_prompts(groups, token_budget=600, reserved_tokens=400)[0].over_budget
+
+    def test_build_combined_prompt_keeps_previous_summary(self):
+        groups = {"경제": [_article("https://a.com/1", ["경제"])]}
+        prompt = build_combined_prompt(groups, {"경제": "이전 요약"})
+        assert prompt.startswith("총 1개 키워드")
+        assert "기존 요약: 이전 요약" in prompt
@@ -174,3 +174,518 @@ def test_search_posts_검색성공(client: TestClient, member_user, create_post)
     assert len(items) >= 1
     assert all(item["type"] == "post" for item in items)
     assert any("특정 게시글 검색" in item["title"] for item in items)
+
+
+# ── 검색 백엔드 ──
+
+
+def test_search_폴백_highlight_null(client: TestClient, create_event):
+    """SQLite(ILIKE 폴백)에서는 highlight가 null"""
+    create_event(title="폴백 하이라이트 사건", summary="요약")
+
+    resp = client.get("/api/v1/search/events", params={"q": "폴백 하이라이트"})
+    assert resp.status_code == 200
+
+    items = resp.json()["data"]["items"]
+    assert len(items) == 1
+    assert items[0]["highlight"] is None
+
+
+def test_search_postgres_전문검색_쿼리():
+    """PostgreSQL 백엔드는 tsvector 매칭, ts_rank 정렬, 페이지 행에만 ts_headline 발췌"""
+    from sqlalchemy.dialects import postgresql
+
+    from src.sql.search import search_query
+
+    stmt = search_query(
+        keyword="대한민국",
+        entity_types=["event", "issue", "post"],
+        sort="-relevance",
+        limit=11,
+        offset=20,
+        postgres=True,
+    )
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    for table in ("events", "issues", "posts"):
+        assert f"{table}.search_vector @@ websearch_to_tsquery" in sql
+    assert sql.count("UNION ALL") == 2
+    assert "ts_rank(" in sql
+    assert "similarity(" in sql
+    assert sql.count("ts_headline(") == 1
+    assert "ts_headline(" in sql.split("FROM (")[0]
+    assert "LIMIT" in sql and "OFFSET" in sql
+
+
+def test_search_postgres_create_all_검색컬럼_생성():
+    """create_all만으로 만든 PostgreSQL 스키마에도 search_vector 컬럼과 GIN 인덱스가 생긴다"""
+    from sqlalchemy import create_mock_engine
+
+    from src.db import Base
+
+    statements: list[str] = []
+    engine = create_mock_engine(
+        "postgresql+psycopg://",
+        lambda sql, *args, **kwargs: statements.append(str(sql.compile(dialect=engine.dialect))),
+    )
+    Base.metadata.create_all(engine, checkfirst=False)
+
+    ddl = "\n".join(statements)
+    assert "CREATE EXTENSION IF NOT EXISTS pg_trgm" in ddl
+    for table in ("events", "issues", "posts"):
+        assert f"ALTER TABLE {table} ADD COLUMN search_vector tsvector GENERATED ALWAYS" in ddl
+        assert f"CREATE INDEX ix_{table}_search_vector ON {table} USING gin" in ddl
+    assert "ix_events_summary_trgm" in ddl
+
+
+def test_search_통합_DB_페이지네이션(client: TestClient, capture_sql, create_event, create_issue):
+    """UNION ALL 결과를 DB에서 정렬·절단하고 totalItems는 엔티티별 상한 없이 정확"""
+    for idx in range(120):
+        create_event(title=f"페이지 사건 {idx:03d}", summary="요약")
+    for idx in range(110):
+        create_issue(title=f"페이지 이슈 {idx:03d}", description="설명")
+
+    with capture_sql() as statements:
+        resp = client.get("/api/v1/search", params={"q": "페이지", "page": 23, "limit": 10})
+    assert resp.status_code == 200
+
+    data = resp.json()["data"]
+    assert data["pagination"]["totalItems"] == 230
+    assert data["pagination"]["totalPages"] == 23
+    assert data["pagination"]["hasNext"] is False
+    assert len(data["items"]) == 10
+
+    # 페이지 쿼리 한 번 + 탭 배지용 엔티티 종류별 COUNT 한 번
+    searches = [sql for sql in statements if "UNION ALL" in sql]
+    assert len(searches) == 2
+    assert sum("LIMIT" in sql for sql in searches) == 1
+    assert sum("GROUP BY" in sql for sql in searches) == 1
+    assert data["typeCounts"] == {"events": 120, "issues": 110, "community": 0}
+
+
+def test_search_통합_중간페이지_정렬(client: TestClient, create_event, create_issue):
+    """관련도(제목 접두 일치 우선) 정렬이 페이지 간에 이어지고 중복이 없다"""
+    for idx in range(8):
+        create_event(title=f"정렬키워드 사건 {idx}", summary="요약")
+        create_issue(title=f"이슈 정렬키워드 {idx}", description="설명")
+
+    seen: list[tuple[str, str]] = []
+    for page in (1, 2, 3, 4):
+        resp = client.get("/api/v1/search", params={"q": "정렬키워드", "page": page, "limit": 5})
+        data = resp.json()["data"]
+        assert data["pagination"]["totalItems"] == 16
+        seen.extend((item["type"], item["id"]) for item in data["items"])
+
+    assert len(seen) == len(set(seen)) == 16
+    # 제목이 검색어로 시작하는 사건이 먼저
+    assert {entity for entity, _ in seen[:8]} == {"event"}
+
+
+# ── 검색 결과 캐시 ──
+
+
+def test_search_캐시_적중(client: TestClient, capture_sql, create_event):
+    """같은 검색어(대소문자·앞뒤 공백 무관) 재요청은 DB를 다시 읽지 않는다"""
+    from src.core.search_cache import search_cache
+
+    create_event(title="Cache 적중 사건", summary="요약")
+    first = client.get("/api/v1/search", params={"q": "cache 적중"}).json()
+
+    with capture_sql() as statements:
+        second = client.get("/api/v1/search", params={"q": "  CACHE 적중 "}).json()
+
+    assert second["data"] == first["data"]
+    assert len(second["data"]["items"]) == 1
+    assert not [sql for sql in statements if "FROM events" in sql]
+    stats = search_cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hitRatio"] == 0.5
+
+
+def test_search_캐시_쓰기후_무효화(client: TestClient, member_user: dict, create_post):
+    """게시글 수정이 커밋되면 게시글 검색 캐시가 무효화된다"""
+    post = create_post(author_id=member_user["user"].id, title="무효화 원본 제목")
+    headers = {"Authorization": f"Bearer {member_user['token']}"}
+
+    before = client.get("/api/v1/search/posts", params={"q": "무효화"}).json()
+    assert before["data"]["items"][0]["title"] == "무효화 원본 제목"
+
+    resp = client.patch(
+        f"/api/v1/posts/{post.id}", json={"title": "무효화 수정 제목"}, headers=headers
+    )
+    assert resp.status_code == 200
+
+    after = client.get("/api/v1/search/posts", params={"q": "무효화"}).json()
+    assert after["data"]["items"][0]["title"] == "무효화 수정 제목"
+
+
+def test_search_캐시_다른엔티티_쓰기는_유지(db_session, create_event):
+    """사건 검색 결과는 게시글 쓰기 세대와 무관하게 유지된다"""
+    from src.core.search_cache import mark_search_written, search_cache
+    from src.crud.search import SearchService
+    from src.sql.search import SearchRepository
+
+    create_event(title="세대 분리 사건", summary="요약")
+    service = SearchService(SearchRepository(db_session))
+    search = lambda: service.search(  # noqa: E731
+        q="세대 분리", entity_type="event", sort="-relevance", size=10, cursor=None
+    )
+
+    search()
+    mark_search_written(db_session, "post", "post-1")
+    db_session.commit()
+    search()
+    assert search_cache.stats()["hits"] == 1
+
+    mark_search_written(db_session, "event", "event-1")
+    db_session.commit()
+    search()
+    assert search_cache.stats()["misses"] == 2
+
+
+def test_search_캐시_롤백시_세대유지(db_session):
+    """롤백된 쓰기는 세대를 올리지 않는다"""
+    from src.core.search_cache import mark_search_written, search_cache
+
+    mark_search_written(db_session, "event", "event-1")
+    db_session.rollback()
+    assert search_cache.backend.get("search:gen:event") is None
+
+
+def test_local_cache_backend_LRU_TTL(monkeypatch):
+    """로컬 저장소는 최대 항목 수를 넘으면 가장 오래 안 쓴 항목부터, 만료 항목은 조회 시 제거"""
+    from src.core import search_cache as module
+
+    backend = module.LocalCacheBackend(max_entries=2)
+    backend.set("a", b"1")
+    backend.set("b", b"2")
+    assert backend.get("a") == b"1"
+    backend.set("c", b"3")
+    assert backend.get("b") is None
+    assert backend.mget(["a", "c"]) == [b"1", b"3"]
+
+    # 세대 카운터는 축출되지 않는다
+    assert backend.incr("gen") == 1
+    backend.set("d", b"4")
+    backend.set("e", b"5")
+    assert backend.get("gen") == b"1"
+
+    now = module.time.monotonic()
+    backend.set("ttl", b"x", ex=10)
+    monkeypatch.setattr(module.time, "monotonic", lambda: now + 11)
+    assert backend.get("ttl") is None
+
+
+def test_search_cache_stats_관리자전용(client: TestClient, auth_headers, admin_headers):
+    """캐시 지표는 관리자만 조회"""
+    assert client.get("/api/v1/search/cache-stats", headers=auth_headers).status_code == 403
+
+    resp = client.get("/api/v1/search/cache-stats", headers=admin_headers)
+    assert resp.status_code == 200
+    data = resp.json()["data"]
+    assert data["backend"] == "local"
+    assert set(data) >= {"hits", "misses", "hitRatio", "entries"}
+
+
+# ── GET /api/v1/search/suggestions ──
+
+
+def test_decompose_자모분해():
+    """음절은 초성·중성·종성으로, 겹모음·겹받침은 입력 순서대로 풀린다"""
+    from src.crud.search_suggest import decompose, initials
+
+    assert decompose("트럼프") == "ㅌㅡㄹㅓㅁㅍㅡ"
+    assert decompose("과") == "ㄱㅗㅏ"
+    assert decompose("닭") == "ㄷㅏㄹㄱ"
+    assert decompose("AI 반도체") == "ai ㅂㅏㄴㄷㅗㅊㅔ"
+    assert initials("트럼프 관세") == "ㅌㄹㅍ ㄱㅅ"
+
+
+def _refresh_suggestions(db_session) -> None:
+    from src.crud.search_suggest import suggestion_index
+    from src.sql.search import SearchRepository
+
+    suggestion_index.refresh(SearchRepository(db_session))
+
+
+def test_search_suggestions_자모_초성_접두(
+    client: TestClient, db_session, create_event, create_issue, create_crawled_keyword
+):
+    """입력 중인 자모("트러", "틀")와 초성("ㅌㄹ")도 "트럼프"에 일치한다"""
+    create_event(title="트럼프 관세 발표", summary="요약")
+    create_issue(title="미중 무역 갈등", description="설명")
+    create_crawled_keyword(keyword="트럼프", count=50)
+    _refresh_suggestions(db_session)
+
+    for q in ("트러", "틀", "ㅌㄹ", "트럼프"):
+        resp = client.get("/api/v1/search/suggestions", params={"q": q})
+        assert resp.status_code == 200
+        # 급상승 키워드(언급 50)가 사건 제목보다 먼저
+        assert resp.json()["data"] == ["트럼프", "트럼프 관세 발표"], q
+
+    # 단어 시작 위치에서도 일치
+    resp = client.get("/api/v1/search/suggestions", params={"q": "관세"})
+    assert resp.json()["data"] == ["트럼프 관세 발표"]
+    resp = client.get("/api/v1/search/suggestions", params={"q": "무역"})
+    assert resp.json()["data"] == ["미중 무역 갈등"]
+
+
+def test_search_suggestions_DB_미접근(
+    client: TestClient, db_session, capture_sql, create_event
+):
+    """자동완성 요청은 DB 세션을 열지도, 쿼리를 실행하지도 않는다"""
+    from src.main import app
+    from src.utils.dependencies import get_db_session, get_read_session
+
+    def _no_session():
+        raise AssertionError("자동완성 요청이 DB 세션을 열었다")
+
+    create_event(title="반도체 수출 회복", summary="요약")
+    _refresh_suggestions(db_session)
+    app.dependency_overrides[get_db_session] = _no_session
+    app.dependency_overrides[get_read_session] = _no_session
+    assert client.get("/api/v1/search/suggestions", params={"q": "ㅂ"}).json()["data"] == [
+        "반도체 수출 회복"
+    ]
+
+    with capture_sql() as statements:
+        for q in ("바", "반ㄷ", "반도체 수", "ㅅㅊ"):
+            resp = client.get("/api/v1/search/suggestions", params={"q": q})
+            assert resp.json()["data"] == ["반도체 수출 회복"], q
+
+    assert statements == []
+
+
+def test_suggestion_index_증분갱신(db_session, create_event, create_post, member_user):
+    """증분 갱신은 워터마크 이후 수정분만 읽어 기존 색인에 병합하고 인기순을 다시 매긴다"""
+    from datetime import datetime, timedelta, timezone
+
+    from src.crud.search_suggest import SuggestionIndex
+    from src.sql.search import SearchRepository
+
+    repository = SearchRepository(db_session)
+    index = SuggestionIndex()
+    create_event(title="경제 성장률 전망", summary="요약")
+    index.refresh(repository)
+    assert index.lookup("경제") == ["경제 성장률 전망"]
+
+    post = create_post(author_id=member_user["user"].id, title="경제 뉴스 모음")
+    post.like_count = 10
+    db_session.flush()
+    index.refresh(repository, now=datetime.now(timezone.utc) + timedelta(seconds=1))
+
+    assert index.lookup("경제") == ["경제 뉴스 모음", "경제 성장률 전망"]
+    assert index.lookup("경제", limit=1) == ["경제 뉴스 모음"]
+    assert index.lookup("ㄱㅈ ㄴ") == ["경제 뉴스 모음"]
+    assert index.lookup("없는말") == []
+
+
+def test_suggestion_index_병합_결과가_재구성과_같다():
+    """점수 변경·추가·삭제를 병합한 배열은 같은 점수로 새로 만든 배열과 같은 결과를 낸다"""
+    from src.crud.search_suggest import SUGGEST_MAX_LIMIT, _build_arrays, _merge_arrays
+
+    old = {f"경제 뉴스 {i}": i for i in range(40)}
+    old.update({"트럼프": 50, "트럼프 관세 발표": 5, "반도체 수출": 3})
+    new = dict(old)
+    new["경제 뉴스 3"] = 100  # 상위로
+    new["경제 뉴스 39"] = 0  # 상위에서 탈락
+    new["경제 전망 보고서"] = 20  # 추가
+    del new["트럼프"]  # 삭제
+    new["트럼프 관세 철회"] = 1
+
+    merged = _merge_arrays(_build_arrays(old), old, new)
+    rebuilt = _build_arrays(new)
+    assert merged is not None
+
+    def _results(arrays, query):
+        from src.crud.search_suggest import SuggestionIndex
+
+        index = SuggestionIndex()
+        index._arrays = arrays
+        return index.lookup(query, limit=SUGGEST_MAX_LIMIT)
+
+    for query in ("ㄱ", "경", "경제", "경제 뉴", "ㄱㅈ", "트", "트럼프", "ㅌㄹ", "관세", "ㅂ"):
+        assert _results(merged, query) == _results(rebuilt, query), query
+    assert _results(merged, "트럼") == ["트럼프 관세 발표", "트럼프 관세 철회"]
+
+
+def test_suggestion_index_변경이_많으면_재구성():
+    from src.crud.search_suggest import _build_arrays, _merge_arrays
+
+    old = {f"키워드 {i}": i for i in range(10)}
+    new = {f"키워드 {i}": i + 1 for i in range(10)}
+    assert _merge_arrays(_build_arrays(old), old, new) is None
+
+
+# ── Elasticsearch 검색 모드 ──
+
+
+class _FakeEsClient:
+    """client.search 호출 인자를 기록하고 고정 응답을 돌려주는 대체 클라이언트."""
+
+    def __init__(self, response: dict) -> None:
+        self.response = response
+        self.calls: list[dict] = []
+
+    def search(self, **kwargs):
+        self.calls.append(kwargs)
+        return self.response
+
+
+def test_es_build_search_body():
+    """제목 가중 multi_match, 하이라이트, 엔티티 종류 집계를 한 요청에 담는다"""
+    from src.utils.elasticsearch.content_index import build_search_body
+
+    body = build_search_body(keyword="금리 인상", sort="-relevance", size=10, offset=20)
+    assert body["query"]["multi_match"]["fields"] == ["title^2", "body"]
+    assert body["highlight"]["pre_tags"] == ["<mark>"]
+    assert body["aggs"] == {"entity_types": {"terms": {"field": "entity_type"}}}
+    assert (body["from_"], body["size"]) == (20, 10)
+    assert body["sort"][0] == "_score"
+
+    latest = build_search_body(keyword="금리", sort="-createdAt", size=10, offset=0)
+    assert latest["sort"][0] == {"date": "desc"}
+
+
+def test_search_es_미설정시_SQL_폴백(client: TestClient, monkeypatch, create_event):
+    """ES 모드라도 클라이언트가 없으면 SQL 검색 결과를 반환한다"""
+    from src.core.config import get_settings
+
+    monkeypatch.setattr(get_settings(), "search_es_enabled", True)
+    monkeypatch.setattr(get_settings(), "elasticsearch_url", "")
+    create_event(title="폴백 사건", summary="요약")
+
+    data = client.get("/api/v1/search", params={"q": "폴백"}).json()["data"]
+    assert [item["title"] for item in data["items"]] == ["폴백 사건"]
+    assert data["typeCounts"]["events"] == 1
+
+
+def test_search_es_하이라이트_집계(client: TestClient, monkeypatch):
+    """ES 응답의 하이라이트와 엔티티 종류별 집계가 그대로 응답에 실린다"""
+    from src.core.config import get_settings
+    from src.utils.elasticsearch import content_index
+
+    fake = _FakeEsClient(
+        {
+            "hits": {
+                "total": {"value": 3},
+                "hits": [
+                    {
+                        "_id": "event-1",
+                        "_source": {
+                            "entity_type": "event",
+                            "title": "기준금리 인상",
+                            "body": "한국은행이 기준금리를 인상했다",
+                            "date": "2026-10-01T09:00:00+00:00",
+                        },
+                        "highlight": {"body": ["한국은행이 기준<mark>금리</mark>를 인상했다"]},
+                    }
+                ],
+            },
+            "aggregations": {
+                "entity_types": {
+                    "buckets": [{"key": "event", "doc_count": 2}, {"key": "post", "doc_count": 1}]
+                }
+            },
+        }
+    )
+    monkeypatch.setattr(get_settings(), "search_es_enabled", True)
+    monkeypatch.setattr(content_index, "get_es_client", lambda: fake)
+
+    data = client.get("/api/v1/search", params={"q": "금리", "limit": 1}).json()["data"]
+    assert data["items"][0]["id"] == "event-1"
+    assert data["items"][0]["highlight"] == "한국은행이 기준<mark>금리</mark>를 인상했다"
+    assert data["typeCounts"] == {"events": 2, "issues": 0, "community": 1}
+    assert data["pagination"]["totalItems"] == 3
+    assert fake.calls[0]["index"] == "trend_korea_events,trend_korea_issues,trend_korea_posts"
+
+
+def test_search_es_커밋시_증분색인(client: TestClient, monkeypatch, member_user: dict, create_post):
+    """ES 모드에서 게시글 수정·삭제가 커밋되면 해당 문서를 재색인·삭제한다"""
+    from src.core.config import get_settings
+    from src.utils.elasticsearch import content_index
+
+    actions: list[dict] = []
+
+    def _bulk(client, batch, **kwargs):
+        actions.extend(batch)
+        return len(batch), []
+
+    monkeypatch.setattr(get_settings(), "search_es_enabled", True)
+    monkeypatch.setattr(content_index, "get_es_client", lambda: object())
+    monkeypatch.setattr(content_index, "bulk", _bulk)
+    post = create_post(author_id=member_user["user"].id, title="색인 원본 제목")
+    headers = {"Authorization": f"Bearer {member_user['token']}"}
+
+    client.patch(f"/api/v1/posts/{post.id}", json={"title": "색인 수정 제목"}, headers=headers)
+    assert actions[-1]["_index"] == "trend_korea_posts"
+    assert actions[-1]["_id"] == post.id
+    assert actions[-1]["_source"]["title"] == "색인 수정 제목"
+
+    client.delete(f"/api/v1/posts/{post.id}", headers=headers)
+    assert actions[-1] == {"_op_type": "delete", "_index": "trend_korea_posts", "_id": post.id}
+
+
+# ── 검색어 로그 ──
+
+
+def test_search_검색어로그_첫페이지만_기록(client: TestClient, db_session):
+    """검색어는 정규화해 버퍼에 넣고, 다음 페이지 조회는 기록하지 않는다"""
+    import time
+
+    from sqlalchemy import select
+
+    from src.crud.search_query_log import search_query_log
+    from src.models.search import SearchQueryBucket
+
+    client.get("/api/v1/search", params={"q": "  금리   인상 "})
+    client.get("/api/v1/search/events", params={"q": "금리 인상", "page": 2})
+    client.get("/api/v1/search/posts", params={"q": "환율"})
+    assert search_query_log.stats()["buffered"] == 2
+
+    # 현재 버킷은 아직 열려 있으므로 저장하지 않는다
+    assert search_query_log.flush(db_session) == 0
+    assert search_query_log.stats()["openBuckets"] == 1
+
+    assert search_query_log.flush(db_session, now=time.time() + 600) == 2
+    rows = db_session.execute(select(SearchQueryBucket.query, SearchQueryBucket.count)).all()
+    assert dict(rows) == {"금리 인상": 1, "환율": 1}
+    assert search_query_log.stats()["openBuckets"] == 0
+
+
+def test_search_query_log_버퍼_상한(monkeypatch):
+    """버퍼가 가득 차면 초과 검색어는 버리고 dropped로 센다"""
+    from src.core.config import get_settings
+    from src.crud.search_query_log import SearchQueryLog
+
+    monkeypatch.setattr(get_settings(), "search_query_log_buffer_size", 3)
+    log = SearchQueryLog()
+    for idx in range(5):
+        log.record(f"검색어{idx}")
+
+    assert log.stats()["buffered"] == 3
+    assert log.stats()["dropped"] == 2
+
+
+def test_count_min_sketch_heavy_hitters():
+    """스케치 추정치는 실제 빈도 이상이고, 상위 후보는 용량을 넘지 않으면서 빈발 검색어를 유지"""
+    from src.crud.search_query_log import CountMinSketch, QueryBucket
+
+    sketch = CountMinSketch(width=64, depth=4)
+    for idx in range(500):
+        sketch.add(f"꼬리{idx}")
+    sketch.add("속보", 40)
+    assert sketch.estimate("속보") >= 40
+    assert sketch.estimate("꼬리1") >= 1
+
+    bucket = QueryBucket(top_k=3)
+    for idx in range(300):
+        bucket.add(f"꼬리{idx}")
+        if idx % 10 == 0:
+            bucket.add("속보")
+        if idx % 20 == 0:
+            bucket.add("환율")
+    top = bucket.heavy_hitters.top()
+    assert len(top) == 3
+    assert [query for query, _ in top[:2]] == ["속보", "환율"]
+    assert dict(top)["속보"] >= 30
@@ -0,0 +1,106 @@
+"""검색어 랭킹 스케줄러 잡 테스트."""
+
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select
+
+from src.models.search import SearchRanking, SearchTokenBucket
+from src.scheduler.jobs.search_jobs import bucket_of, recalculate_search_rankings
+
+
+def _rankings(db_session, period: str) -> dict[str, int]:
+    rows = db_session.execute(
+        select(SearchRanking.keyword, SearchRanking.score).where(SearchRanking.period == period)
+    ).all()
+    return dict(rows)
+
+
+class TestSearchRankingsJob:
+    def test_bucket_of(self):
+        at = datetime(2026, 3, 1, 9, 27, 41, 5, tzinfo=timezone.utc)
+        assert bucket_of(at) == datetime(2026, 3, 1, 9, 20, tzinfo=timezone.utc)
+        assert bucket_of(at.replace(tzinfo=None)) == bucket_of(at)
+
+    def test_daily_and_weekly_from_buckets(self, db_session, create_event, create_issue):
+        """닫힌 버킷을 토큰화해 일간/주간 랭킹을 버킷 합계로 계산"""
+        now = datetime.now(timezone.utc)
+        recent = create_event(title="반도체 수출 호조")
+        recent.created_at = now - timedelta(minutes=30)
+        older = create_event(title="반도체 공급망")
+        older.created_at = now - timedelta(days=3)
+        issue = create_issue(title="반도체 협상")
+        issue.updated_at = now - timedelta(hours=2)
+        db_session.flush()
+
+        _, metrics = recalculate_search_rankings(db_session)
+
+        assert metrics["bucket_rows_inserted"] > 0
+        assert _rankings(db_session, "daily")["반도체"] == 2
+        assert _rankings(db_session, "weekly")["반도체"] == 3
+        assert "공급망" not in _rankings(db_session, "daily")
+
+    def test_incremental_run_does_not_recount(self, db_session, create_event):
+        """이미 쌓인 버킷은 다시 토큰화하지 않는다"""
+        item = create_event(title="금리 인상")
+        item.created_at = datetime.now(timezone.utc) - timedelta(minutes=40)
+        db_session.flush()
+
+        recalculate_search_rankings(db_session)
+        _, metrics = recalculate_search_rankings(db_session)
+
+        assert metrics["bucket_rows_inserted"] == 0
+        total = db_session.execute(
+            select(SearchTokenBucket.count).where(SearchTokenBucket.token == "금리")
+        ).scalar_one()
+        assert total == 1
+
+    def test_streams_title_columns_only(self, db_session, capture_sql, member_user, create_post):
+        """게시글 본문 등 제목 외 컬럼은 읽지 않는다"""
+        post = create_post(author_id=member_user["user"].id, title="커뮤니티 제목")
+        post.created_at = datetime.now(timezone.utc) - timedelta(minutes=30)
+        db_session.flush()
+
+        with capture_sql() as statements:
+            recalculate_search_rankings(db_session)
+
+        assert not any("posts.content" in statement for statement in statements)
+        assert "커뮤니티" in _rankings(db_session, "daily")
+
+    def test_home_weekly_period(self, client, db_session, create_event):
+        """/home/search-rankings?period=weekly는 주간 시리즈를 읽는다"""
+        older = create_event(title="선거 공약")
+        older.created_at = datetime.now(timezone.utc) - timedelta(days=2)
+        db_session.flush()
+        recalculate_search_rankings(db_session)
+
+        daily = client.get("/api/v1/home/search-rankings").json()["data"]
+        weekly = client.get("/api/v1/home/search-rankings", params={"period": "weekly"}).json()
+        assert daily == []
+        assert {i["keyword"] for i in weekly["data"]} == {"선거", "공약"}
+
+    def test_query_log_rankings_with_rank_change(self, client, db_session, create_event):
+        """검색어 로그가 있으면 그것으로 랭킹을 만들고 직전 스냅샷 대비 순위 변동을 저장"""
+        from src.sql.search import SearchRepository
+
+        item = create_event(title="콘텐츠 제목 토큰")
+        item.created_at = datetime.now(timezone.utc) - timedelta(minutes=30)
+        bucket = bucket_of(datetime.now(timezone.utc) - timedelta(minutes=20))
+        repository = SearchRepository(db_session)
+        repository.add_query_counts(bucket_start=bucket, counts={"금리 인상": 5, "환율": 3})
+        db_session.flush()
+
+        _, metrics = recalculate_search_rankings(db_session)
+        assert metrics["source_daily"] == "queries"
+        assert _rankings(db_session, "daily") == {"금리 인상": 5, "환율": 3}
+
+        # 다른 워커가 같은 버킷에 더한 횟수는 합산된다
+        repository.add_query_counts(bucket_start=bucket, counts={"환율": 4, "전세": 1})
+        db_session.flush()
+        recalculate_search_rankings(db_session)
+
+        data = client.get("/api/v1/home/search-rankings", params={"limit": 3}).json()["data"]
+        assert [(i["keyword"], i["count"], i["change"]) for i in data] == [
+            ("환율", 7, "+1"),
+            ("금리 인상", 5, "-1"),
+            ("전세", 1, "new"),
+        ]
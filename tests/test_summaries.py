@@ -0,0 +1,177 @@
+"""Summaries API 엔드포인트 테스트."""
+
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+from starlette.testclient import TestClient
+
+from src.crud.summaries import SummaryService
+from src.models.news_summary import NewsKeywordSummary, NewsSummaryBatch, NewsSummaryTag
+from src.sql.summaries import SummaryRepository
+from src.utils.news_summarizer import summarizer
+
+
+def _result(keywords: list[tuple[str, list[str]]], summarized_at: datetime) -> dict:
+    return {
+        "provider": "ollama",
+        "model": "gemma3:4b",
+        "summarized_at": summarized_at.isoformat(timespec="seconds") + "Z",
+        "total_keywords": len(keywords),
+        "total_articles": len(keywords),
+        "total_tokens": {"prompt": 10, "completion": 5, "total": 15},
+        "keywords": [
+            {
+                "keyword": kw,
+                "summary": f"{kw} 요약",
+                "key_points": ["포인트"],
+                "sentiment": "neutral",
+                "category": "economy",
+                "tags": tags,
+                "article_count": 1,
+                "articles": [{"title": "기사", "url": "https://a.com", "channel": "", "confidence": 1}],
+            }
+            for kw, tags in keywords
+        ],
+    }
+
+
+@pytest.fixture()
+def save_result(db_session, monkeypatch):
+    monkeypatch.setattr("src.db.session.SessionLocal", lambda: db_session)
+    monkeypatch.setattr(db_session, "close", lambda: None)
+    return summarizer.save_to_db
+
+
+@pytest.fixture()
+def create_summary(db_session):
+    """스냅샷 없이 배치/요약만 직접 생성."""
+
+    def _factory(keyword: str, created_at: datetime, batch: NewsSummaryBatch | None = None):
+        if batch is None:
+            batch = NewsSummaryBatch(
+                id=str(uuid4()),
+                provider="ollama",
+                model="gemma3:4b",
+                total_keywords=1,
+                total_articles=1,
+                prompt_tokens=0,
+                completion_tokens=0,
+                summarized_at=created_at,
+                created_at=created_at,
+            )
+            db_session.add(batch)
+        summary = NewsKeywordSummary(
+            id=str(uuid4()),
+            batch_id=batch.id,
+            keyword=keyword,
+            summary=f"{keyword} {created_at:%H%M}",
+            sentiment="neutral",
+            category="society",
+            article_count=0,
+            created_at=created_at,
+        )
+        db_session.add(summary)
+        db_session.flush()
+        return summary
+
+    return _factory
+
+
+class TestLatestSummaries:
+    def test_empty(self, client: TestClient):
+        resp = client.get("/api/v1/summaries/latest")
+        assert resp.status_code == 200
+        assert resp.json()["data"]["items"] == []
+
+    def test_served_from_snapshot_refreshed_on_save(self, client: TestClient, save_result):
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        save_result(_result([("경제", ["금리", "금리 ", "한국은행"])], now - timedelta(minutes=10)))
+        latest_id = save_result(_result([("정치", ["국회"]), ("경제", ["환율"])], now))
+
+        resp = client.get("/api/v1/summaries/latest")
+        data = resp.json()["data"]
+        assert data["batch"]["id"] == latest_id
+        assert data["refreshedAt"] is not None
+        assert [i["keyword"] for i in data["items"]] == ["정치", "경제"]
+        assert data["items"][1]["tags"] == ["환율"]
+
+    def test_older_batch_does_not_replace_snapshot(self, client: TestClient, save_result):
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        latest_id = save_result(_result([("정치", [])], now))
+        save_result(_result([("경제", [])], now - timedelta(hours=1)))
+
+        data = client.get("/api/v1/summaries/latest").json()["data"]
+        assert data["batch"]["id"] == latest_id
+
+    def test_tags_deduplicated(self, db_session):
+        summary = NewsKeywordSummary(
+            id="s1",
+            batch_id="b1",
+            keyword="경제",
+            summary="요약",
+            sentiment="neutral",
+            category="economy",
+            article_count=0,
+            created_at=datetime.now(timezone.utc),
+        )
+        summary.tags = [
+            NewsSummaryTag(id="t1", summary_id="s1", tag="금리", created_at=summary.created_at),
+            NewsSummaryTag(id="t2", summary_id="s1", tag="금리 ", created_at=summary.created_at),
+            NewsSummaryTag(id="t3", summary_id="s1", tag="KOSPI", created_at=summary.created_at),
+            NewsSummaryTag(id="t4", summary_id="s1", tag="kospi", created_at=summary.created_at),
+        ]
+        service = SummaryService(SummaryRepository(db_session))
+        assert service._aggregate_tags(summary) == ["금리", "KOSPI"]
+
+    def test_falls_back_to_latest_batch_without_snapshot(self, client: TestClient, create_summary):
+        now = datetime.now(timezone.utc)
+        create_summary("경제", now)
+
+        data = client.get("/api/v1/summaries/latest").json()["data"]
+        assert data["refreshedAt"] is None
+        assert data["items"][0]["keyword"] == "경제"
+
+    def test_category_filter(self, client: TestClient, save_result):
+        save_result(_result([("경제", [])], datetime.now(timezone.utc).replace(tzinfo=None)))
+        resp = client.get("/api/v1/summaries/latest?category=politics")
+        assert resp.json()["data"]["items"] == []
+
+
+class TestSummaryHistory:
+    def test_keyword_history_keyset_pagination(self, client: TestClient, create_summary):
+        base = datetime(2026, 1, 1, 9, 0, tzinfo=timezone.utc)
+        for i in range(5):
+            create_summary("경제", base + timedelta(minutes=10 * i))
+        create_summary("정치", base)
+
+        seen: list[str] = []
+        cursor = None
+        while True:
+            url = "/api/v1/summaries/keywords/경제?limit=2"
+            if cursor:
+                url += f"&cursor={cursor}"
+            data = client.get(url).json()["data"]
+            seen.extend(i["summary"] for i in data["items"])
+            cursor = data["cursor"]["next"]
+            if not data["cursor"]["hasMore"]:
+                break
+
+        assert seen == ["경제 0940", "경제 0930", "경제 0920", "경제 0910", "경제 0900"]
+
+    def test_batches_list(self, client: TestClient, create_summary):
+        base = datetime(2026, 1, 1, 9, 0, tzinfo=timezone.utc)
+        for i in range(3):
+            create_summary("경제", base + timedelta(minutes=10 * i))
+
+        first = client.get("/api/v1/summaries/batches?limit=2").json()["data"]
+        assert len(first["items"]) == 2
+        second = client.get(
+            f"/api/v1/summaries/batches?limit=2&cursor={first['cursor']['next']}"
+        ).json()["data"]
+        assert len(second["items"]) == 1
+        assert second["cursor"]["hasMore"] is False
+
+    def test_batch_detail_not_found(self, client: TestClient):
+        resp = client.get("/api/v1/summaries/batches/missing")
+        assert resp.status_code == 404
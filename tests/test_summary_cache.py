@@ -0,0 +1,206 @@
+"""뉴스 요약 캐시 테스트."""
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+from src.utils.news_summarizer import summarizer
+from src.utils.news_summarizer.cache import SummaryCache, article_signature
+
+MODEL = "gemma3:4b"
+
+
+def _article(url: str, keyword: str, content: str = "본문", confidence: float = 0.9) -> dict:
+    return {
+        "title": f"{keyword} 기사 {url[-1]}",
+        "url": url,
+        "content_text": content,
+        "channel": "테스트",
+        "matched_keywords": [keyword],
+        "confidence": confidence,
+    }
+
+
+def _payload(keyword: str) -> dict:
+    return {
+        "keyword": keyword,
+        "summary": f"{keyword} 요약",
+        "key_points": ["포인트"],
+        "sentiment": "neutral",
+        "category": "society",
+        "tags": ["태그"],
+    }
+
+
+class TestSummaryCache:
+    def test_miss_then_hit(self, db_session):
+        cache = SummaryCache(db_session)
+        groups = {
+            "경제": [_article("https://a.com/1", "경제"), _article("https://a.com/2", "경제")]
+        }
+
+        first = cache.lookup(MODEL, groups)
+        assert first.misses == ["경제"]
+
+        cache.store(MODEL, {"경제": (groups["경제"], _payload("경제"), 120)})
+        second = cache.lookup(MODEL, groups)
+        assert second.hits["경제"]["summary"] == "경제 요약"
+        assert second.saved_tokens == 120
+
+    def test_article_order_does_not_matter(self, db_session):
+        cache = SummaryCache(db_session)
+        a1, a2 = _article("https://a.com/1", "경제"), _article("https://a.com/2", "경제")
+        cache.store(MODEL, {"경제": ([a1, a2], _payload("경제"), 10)})
+
+        result = cache.lookup(MODEL, {"경제": [a2, a1]})
+        assert "경제" in result.hits
+
+    def test_changed_content_is_not_exact_hit(self, db_session):
+        cache = SummaryCache(db_session, partial_min_overlap=1.0)
+        a1 = _article("https://a.com/1", "경제", content="처음 본문")
+        cache.store(MODEL, {"경제": ([a1], _payload("경제"), 10)})
+
+        edited = _article("https://a.com/1", "경제", content="수정된 본문")
+        assert article_signature(edited) != article_signature(a1)
+        result = cache.lookup(MODEL, {"경제": [edited]})
+        assert result.misses == ["경제"]
+
+    def test_partial_hit_returns_only_new_articles(self, db_session):
+        cache = SummaryCache(db_session, partial_min_overlap=0.5)
+        a1, a2 = _article("https://a.com/1", "경제"), _article("https://a.com/2", "경제")
+        cache.store(MODEL, {"경제": ([a1, a2], _payload("경제"), 50)})
+
+        a3 = _article("https://a.com/3", "경제", confidence=0.5)
+        result = cache.lookup(MODEL, {"경제": [a1, a2, a3]})
+        assert result.partial["경제"]["summary"] == "경제 요약"
+        assert [a["url"] for a in result.new_articles["경제"]] == ["https://a.com/3"]
+        assert result.saved_tokens > 0
+
+    def test_model_is_part_of_key(self, db_session):
+        cache = SummaryCache(db_session)
+        groups = {"경제": [_article("https://a.com/1", "경제")]}
+        cache.store(MODEL, {"경제": (groups["경제"], _payload("경제"), 10)})
+
+        assert cache.lookup("llama3:8b", groups).misses == ["경제"]
+
+
+class TestRunSummarizeWithCache:
+    @pytest.fixture()
+    def fake_llm(self, monkeypatch):
+        calls: list[str] = []
+
+        def _call(client, model, system, user, on_item=None):
+            calls.append(user)
+            keywords = [
+                line.split('"')[1] for line in user.splitlines() if line.startswith("[키워드:")
+            ]
+            items = [_payload(kw) for kw in keywords]
+            for item in items if on_item else []:
+                on_item(item)
+            return json.dumps(items), {"prompt": 100, "completion": 50}
+
+        monkeypatch.setattr(summarizer, "create_ollama_client", lambda model: (None, MODEL))
+        monkeypatch.setattr(summarizer, "call_ollama", _call)
+        return calls
+
+    def test_second_run_skips_llm(self, db_session, tmp_path, fake_llm):
+        articles = [_article("https://a.com/1", "경제"), _article("https://b.com/1", "정치")]
+        input_path = tmp_path / "crawl.json"
+        input_path.write_text(json.dumps(articles, ensure_ascii=False), encoding="utf-8")
+        cache = SummaryCache(db_session)
+
+        first = summarizer.run_summarize(str(input_path), str(tmp_path / "s1.json"), cache=cache)
+        assert first["api_calls"] == 1
+        assert first["cache"]["misses"] == 2
+
+        second = summarizer.run_summarize(str(input_path), str(tmp_path / "s2.json"), cache=cache)
+        assert len(fake_llm) == 1
+        assert second["api_calls"] == 0
+        assert second["cache"]["hits"] == 2
+        assert second["cache"]["saved_tokens"] > 0
+        assert {kw["summary"] for kw in second["keywords"]} == {"경제 요약", "정치 요약"}
+
+    def test_partial_hit_sends_previous_summary(self, db_session, tmp_path, fake_llm):
+        base = [_article("https://a.com/1", "경제"), _article("https://a.com/2", "경제")]
+        input_path = tmp_path / "crawl.json"
+        input_path.write_text(json.dumps(base, ensure_ascii=False), encoding="utf-8")
+        cache = SummaryCache(db_session)
+        summarizer.run_summarize(str(input_path), str(tmp_path / "s1.json"), cache=cache)
+
+        grown = base + [_article("https://a.com/3", "경제", confidence=0.5)]
+        input_path.write_text(json.dumps(grown, ensure_ascii=False), encoding="utf-8")
+        result = summarizer.run_summarize(str(input_path), str(tmp_path / "s2.json"), cache=cache)
+
+        assert result["cache"]["partial_hits"] == 1
+        assert "기존 요약: 경제 요약" in fake_llm[-1]
+        assert "https://a.com/1" not in fake_llm[-1]
+
+    def test_save_to_db_records_cache_metrics(self, db_session, tmp_path, fake_llm, monkeypatch):
+        from sqlalchemy import select
+
+        from src.models.news_summary import NewsSummaryBatch
+
+        articles = [_article("https://a.com/1", "경제")]
+        input_path = tmp_path / "crawl.json"
+        input_path.write_text(json.dumps(articles, ensure_ascii=False), encoding="utf-8")
+        cache = SummaryCache(db_session)
+        summarizer.run_summarize(str(input_path), str(tmp_path / "s1.json"), cache=cache)
+        result = summarizer.run_summarize(str(input_path), str(tmp_path / "s2.json"), cache=cache)
+
+        monkeypatch.setattr("src.db.session.SessionLocal", lambda: db_session)
+        monkeypatch.setattr(db_session, "close", lambda: None)
+        batch_id = summarizer.save_to_db(result)
+
+        batch = db_session.execute(
+            select(NewsSummaryBatch).where(NewsSummaryBatch.id == batch_id)
+        ).scalar_one()
+        assert batch.cache_hits == 1
+        assert batch.cache_saved_tokens == result["cache"]["saved_tokens"]
+
+    def test_streamed_items_survive_failure(self, db_session, tmp_path, monkeypatch):
+        def _call(client, model, system, user, on_item=None):
+            on_item(_payload("경제"))
+            raise TimeoutError("generation aborted")
+
+        monkeypatch.setattr(summarizer, "create_ollama_client", lambda model: (None, MODEL))
+        monkeypatch.setattr(summarizer, "call_ollama", _call)
+        articles = [_article("https://a.com/1", "경제"), _article("https://b.com/1", "정치")]
+        input_path = tmp_path / "crawl.json"
+        input_path.write_text(json.dumps(articles, ensure_ascii=False), encoding="utf-8")
+        cache = SummaryCache(db_session)
+
+        result = summarizer.run_summarize(str(input_path), str(tmp_path / "s.json"), cache=cache)
+        summaries = {kw["keyword"]: kw["summary"] for kw in result["keywords"]}
+        assert summaries == {"경제": "경제 요약", "정치": ""}
+        assert result["salvaged_items"] == 1
+        assert "경제" in cache.lookup(MODEL, {"경제": articles[:1]}).hits
+
+    @pytest.mark.parametrize("raw", ["null", "5", '{"keywords": null}', '{"keywords": 5}'])
+    def test_unexpected_json_shape_does_not_abort_batch(self, tmp_path, monkeypatch, raw):
+        def _call(client, model, system, user, on_item=None):
+            return raw, {"prompt": 1, "completion": 1}
+
+        monkeypatch.setattr(summarizer, "create_ollama_client", lambda model: (None, MODEL))
+        monkeypatch.setattr(summarizer, "call_ollama", _call)
+        input_path = tmp_path / "crawl.json"
+        input_path.write_text(
+            json.dumps([_article("https://a.com/1", "경제")], ensure_ascii=False),
+            encoding="utf-8",
+        )
+
+        result = summarizer.run_summarize(str(input_path), str(tmp_path / "s.json"))
+        assert [kw["summary"] for kw in result["keywords"]] == [""]
+        assert (tmp_path / "s.raw.txt").read_text(encoding="utf-8") == raw
+
+
+class TestSummarizerImports:
+    def test_cli_module_imports_in_fresh_interpreter(self):
+        # 모델 모듈이 먼저 로드되지 않은 상태에서도 순환 import 없이 열려야 한다
+        result = subprocess.run(
+            [sys.executable, "-c", "import src.utils.news_summarizer.cli"],
+            capture_output=True,
+            text=True,
+        )
+        assert result.returncode == 0, result.stderr
@@ -1,9 +1,19 @@
 """users 도메인 테스트"""
 
+from datetime import datetime, timezone
 from uuid import uuid4
 
+from sqlalchemy import select
 from starlette.testclient import TestClient
 
+from src.core.config import get_settings
+from src.db.enums import UpdateType
+from src.models.feed import FeedInboxItem
+from src.models.subscription import KeywordSubscription
+from src.sql.issues import IssueRepository
+from src.utils.pipeline.feed_builder import persist_results
+from src.utils.pipeline.update_classifier import ClassificationResult
+
 
 # ── GET /api/v1/users/me ──
 
@@ -196,6 +206,105 @@ def test_activity_조회_성공(client: TestClient, auth_headers: dict):
     assert body["data"]["pagination"]["totalItems"] == 0
 
 
+# ── GET /api/v1/users/me/feed ──
+
+
+def _persist_feed_fixture(db_session, member_user, create_issue, create_raw_article):
+    """추적 이슈 업데이트 1건, 구독 키워드 기사 1건, 무관한 기사 1건을 저장한다."""
+    user_id = member_user["user"].id
+    issue = create_issue(title="추적 이슈")
+    IssueRepository(db_session).track_for_user(user_id=user_id, issue_id=issue.id)
+    db_session.add(
+        KeywordSubscription(
+            id=str(uuid4()),
+            user_id=user_id,
+            keyword="반도체",
+            is_active=True,
+            created_at=datetime.now(timezone.utc),
+        )
+    )
+    tracked = create_raw_article(title="추적 이슈 기사")
+    keyword = create_raw_article(title="반도체 기사", normalized_keywords=["반도체"])
+    unrelated = create_raw_article(title="무관한 기사", normalized_keywords=["날씨"])
+    persist_results(
+        [
+            ClassificationResult(
+                article_id=tracked.id,
+                update_type=UpdateType.MINOR_UPDATE,
+                matched_issue_id=issue.id,
+                update_score=0.5,
+            ),
+            ClassificationResult(article_id=keyword.id, update_type=UpdateType.NEW),
+            ClassificationResult(article_id=unrelated.id, update_type=UpdateType.NEW),
+        ],
+        db_session,
+    )
+    return issue
+
+
+def test_내피드_추적이슈와_키워드_fanout(
+    client: TestClient,
+    db_session,
+    member_user: dict,
+    auth_headers: dict,
+    create_issue,
+    create_raw_article,
+):
+    """업데이트 저장 시 추적자·구독자 인박스에 쓰이고 /users/me/feed로 조회된다"""
+    issue = _persist_feed_fixture(db_session, member_user, create_issue, create_raw_article)
+
+    inbox = db_session.execute(select(FeedInboxItem)).scalars().all()
+    assert sorted(row.reason.value for row in inbox) == ["keyword", "tracked_issue"]
+
+    resp = client.get("/api/v1/users/me/feed", headers=auth_headers)
+    assert resp.status_code == 200
+    items = resp.json()["data"]["items"]
+    by_reason = {item["reason"]: item for item in items}
+    assert set(by_reason) == {"tracked_issue", "keyword"}
+    assert by_reason["tracked_issue"]["issueId"] == issue.id
+    assert by_reason["tracked_issue"]["issueTitle"] == "추적 이슈"
+    assert by_reason["keyword"]["article"]["title"] == "반도체 기사"
+
+    # keyset 페이지네이션
+    first = client.get("/api/v1/users/me/feed?limit=1", headers=auth_headers).json()["data"]
+    assert first["cursor"]["hasMore"] is True
+    second = client.get(
+        f"/api/v1/users/me/feed?limit=1&cursor={first['cursor']['next']}",
+        headers=auth_headers,
+    ).json()["data"]
+    assert second["cursor"]["hasMore"] is False
+    assert {first["items"][0]["updateId"], second["items"][0]["updateId"]} == {
+        item["updateId"] for item in items
+    }
+
+
+def test_내피드_대형이슈는_읽기시_병합(
+    client: TestClient,
+    db_session,
+    member_user: dict,
+    auth_headers: dict,
+    create_issue,
+    create_raw_article,
+    monkeypatch,
+):
+    """추적자가 상한을 넘는 이슈는 인박스에 쓰지 않고 조회 시 합친다"""
+    monkeypatch.setattr(get_settings(), "feed_inbox_fanout_max_trackers", 0)
+    _persist_feed_fixture(db_session, member_user, create_issue, create_raw_article)
+
+    inbox = db_session.execute(select(FeedInboxItem)).scalars().all()
+    assert [row.reason.value for row in inbox] == ["keyword"]
+
+    resp = client.get("/api/v1/users/me/feed", headers=auth_headers)
+    items = resp.json()["data"]["items"]
+    assert sorted(item["reason"] for item in items) == ["keyword", "tracked_issue"]
+    assert {item["article"]["title"] for item in items} == {"추적 이슈 기사", "반도체 기사"}
+
+
+def test_내피드_토큰없음_401(client: TestClient):
+    resp = client.get("/api/v1/users/me/feed")
+    assert resp.status_code == 401
+
+
 # ── GET /api/v1/users/{user_id} ──
 
 